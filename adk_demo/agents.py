@@ -12,10 +12,18 @@ Message Types:
     SummarizerAgent:
         Receives: 'summarize' with payload {'data': str, 'original_sender': str}
         Sends: 'summary_result' with payload {'summary': str}
+
+Replies stay in the conversation of the request they answer, so
+run_conversations can push many queries through the pipeline at once.
 """
 
+from __future__ import annotations
+
+import threading
+import time
+
 from adk.agent import Agent
-from adk.communication import Message
+from adk.communication import AgentCommunicator, Message
 from adk.memory import SimpleMemory
 from adk.skill import Skill
 
@@ -52,15 +60,17 @@ class DataGathererAgent(Agent):
         Sends: 'summarize' with payload {'data': str, 'original_sender': str}
     """
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, summarizer: str = "summarizer") -> None:
         """
         Initialize the data gatherer agent.
 
         Args:
             name (str): The name of the agent
+            summarizer (str): The name of the agent gathered data is sent to
 
         """
         super().__init__(name)
+        self.summarizer = summarizer
         self.memory = SimpleMemory()
         self.add_skill("gather", DataGathererSkill())
 
@@ -76,9 +86,9 @@ class DataGathererAgent(Agent):
             data = self.skills["gather"].run(message.payload["query"])
             # Send gathered data to SummarizerAgent
             self.communicator.send(
-                Message(
+                message.reply(
                     sender=self.name,
-                    receiver="summarizer",
+                    receiver=self.summarizer,
                     type="summarize",
                     payload={"data": data, "original_sender": message.sender},
                 )
@@ -147,10 +157,75 @@ class SummarizerAgent(Agent):
             summary = self.skills["summarize"].run(message.payload["data"])
             # Return summary to original requester (user)
             self.communicator.send(
-                Message(
+                message.reply(
                     sender=self.name,
                     receiver=message.payload["original_sender"],
                     type="summary_result",
                     payload={"summary": summary},
                 )
             )
+
+
+def run_conversations(
+    queries: list[str],
+    *,
+    workers: int = 4,
+    timeout: float = 30.0,
+    communicator: AgentCommunicator | None = None,
+) -> list[str | None]:
+    """
+    Run the gather and summarize pipeline for many queries concurrently.
+
+    Each query is its own conversation. Both agents handle messages on
+    ``workers`` threads, and queries are sent from a separate thread while
+    summaries are collected, so a full mailbox slows the sender down instead
+    of stalling the pipeline.
+
+    Args:
+        queries (list[str]): The research queries
+        workers (int): Worker threads per agent
+        timeout (float): Seconds to wait for all summaries
+        communicator (Optional[AgentCommunicator]): The message bus to use
+
+    Returns:
+        list[Optional[str]]: The summary of each query, in order, or None if
+        it did not arrive in time
+
+    """
+    communicator = communicator or AgentCommunicator()
+    user_name = "user"
+    gatherer = DataGathererAgent(name="gatherer")
+    summarizer = SummarizerAgent(name="summarizer")
+    for agent in (gatherer, summarizer):
+        agent.set_communicator(communicator)
+        agent.start(workers)
+
+    def send_queries() -> None:
+        for index, query in enumerate(queries):
+            communicator.send(
+                Message(
+                    sender=user_name,
+                    receiver=gatherer.name,
+                    type="gather",
+                    payload={"query": query},
+                    conversation_id=str(index),
+                )
+            )
+
+    sender = threading.Thread(target=send_queries, name="user-sender", daemon=True)
+    summaries: dict[str, str] = {}
+    deadline = time.monotonic() + timeout
+    try:
+        sender.start()
+        while len(summaries) < len(queries):
+            remaining = deadline - time.monotonic()
+            msg = communicator.receive(user_name, timeout=max(remaining, 0))
+            if msg is None:
+                break
+            if msg.type == "summary_result":
+                summaries[msg.conversation_id] = msg.payload["summary"]
+    finally:
+        sender.join(max(deadline - time.monotonic(), 0))
+        gatherer.stop()
+        summarizer.stop()
+    return [summaries.get(str(index)) for index in range(len(queries))]
@@ -21,7 +21,15 @@ Requirements:
 from __future__ import annotations
 
 import logging
-from typing import Any
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from common_utils.memory_buffer import WriteBehindMemory
+from common_utils.memory_prefetch import MemoryPrefetcher
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # Import ADK components
 mem0_available = False  # Initialize mem0_available here
@@ -122,6 +130,47 @@ logger = logging.getLogger(__name__)
 # Note: ADK_AVAILABLE and MEM0_AVAILABLE are already defined above
 
 
+@dataclass
+class _SharedMemory:
+    """A mem0 store and its write buffer, shared by the agents using it."""
+
+    memory: Any
+    writer: WriteBehindMemory
+    agents: int = 0
+
+
+# Shared stores by Memory factory: the agents of a process use one store and
+# one write buffer, so each user's writes reach mem0 in the order they were
+# made, whichever agent made them
+_SHARED_MEMORIES: dict[Any, _SharedMemory] = {}
+_SHARED_MEMORIES_LOCK = threading.Lock()
+
+
+def _acquire_memory(factory: Any) -> _SharedMemory:  # noqa: ANN401
+    """Return the shared store made by ``factory``, creating it on first use."""
+    with _SHARED_MEMORIES_LOCK:
+        shared = _SHARED_MEMORIES.get(factory)
+        if shared is None:
+            memory = factory()
+            shared = _SharedMemory(memory, WriteBehindMemory(memory))
+            _SHARED_MEMORIES[factory] = shared
+        shared.agents += 1
+        return shared
+
+
+def _release_memory(factory: Any, shared: _SharedMemory, timeout: float | None) -> None:  # noqa: ANN401
+    """Persist an agent's writes; close the buffer once no agent uses it."""
+    with _SHARED_MEMORIES_LOCK:
+        shared.agents -= 1
+        last = shared.agents == 0
+        if last and _SHARED_MEMORIES.get(factory) is shared:
+            del _SHARED_MEMORIES[factory]
+    if last:
+        shared.writer.close(timeout)
+    else:
+        shared.writer.flush(timeout)
+
+
 class MemoryEnhancedAgent(Agent):  # type: ignore[reportGeneralTypeIssues]
     """
     Base class for memory-enhanced ADK agents.
@@ -131,8 +180,19 @@ class MemoryEnhancedAgent(Agent):  # type: ignore[reportGeneralTypeIssues]
     - Message processing
     - Skill execution
     - Response generation
+
+    Memory writes are buffered and persisted in the background (see
+    WriteBehindMemory), so they do not add to response latency; retrieval
+    also searches writes not yet persisted. The agents of a process share
+    one mem0 store and one buffer, which is closed when the last of them
+    stops. When the agent starts, the retrievals for the messages already
+    waiting in its mailbox are prefetched (see prefetch_for_messages), so
+    handling them does not wait for a search.
     """
 
+    # Results fetched per prefetched query
+    prefetch_limit = 5
+
     def __init__(self, name: str, user_id: str) -> None:
         """
         Initialize a memory-enhanced agent.
@@ -150,14 +210,25 @@ class MemoryEnhancedAgent(Agent):  # type: ignore[reportGeneralTypeIssues]
         # Initialize ADK SimpleMemory for compatibility
         self.simple_memory = SimpleMemory()
 
-        # Initialize mem0 memory if available
+        # Initialize mem0 memory if available; writes are buffered so they
+        # are persisted off the message path
+        self._memory_factory = Memory
+        self._shared_memory: _SharedMemory | None = None
+        self.memory_writer: WriteBehindMemory | None = None
         if MEM0_AVAILABLE and Memory is not None:
-            self.memory = Memory()
+            self._shared_memory = _acquire_memory(Memory)
+            self.memory = self._shared_memory.memory
+            self.memory_writer = self._shared_memory.writer
             logger.info("mem0 memory initialized for agent %s", name)
         else:
             self.memory = None
             logger.warning("mem0 not available. Install with: uv pip install mem0ai")
 
+        # Run foreseeable retrievals ahead of the messages that need them
+        self.memory_prefetcher = (
+            MemoryPrefetcher(self._search_memories) if self.memory is not None else None
+        )
+
         # Set user ID for memory operations
         self.user_id = user_id
 
@@ -281,27 +352,77 @@ class MemoryEnhancedAgent(Agent):  # type: ignore[reportGeneralTypeIssues]
         metadata: dict[str, str] | None = None,
     ) -> None:
         """
-        Store a memory using mem0.
+        Queue a memory for storage in mem0.
+
+        The write is persisted in the background; errors are logged there.
 
         Args:
             content: The content to store (string or conversation messages)
             metadata: Optional metadata for the memory
 
         """
-        if self.memory is None:
+        if self.memory_writer is None:
             return
 
         try:
-            self.memory.add(content, user_id=self.user_id, metadata=metadata or {})
+            self.memory_writer.add(
+                content, user_id=self.user_id, metadata=metadata or {}
+            )
             logger.debug(
-                "Memory stored: %s",
-                content[:50] + "..."
-                if isinstance(content, str)
-                else "Conversation stored",
+                "Memory queued: %s",
+                content[:50] + "..." if isinstance(content, str) else "Conversation",
             )
         except Exception:
             logger.exception("Error storing memory")
 
+    def flush_memories(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued memory write has been persisted.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits until done)
+
+        Returns:
+            True if all writes were persisted within the timeout
+
+        """
+        if self.memory_writer is None:
+            return True
+        return self.memory_writer.flush(timeout)
+
+    def start(self, workers: int = 1) -> None:
+        """
+        Prefetch the retrievals for queued messages, then start handling them.
+
+        Args:
+            workers: Number of messages handled at once
+
+        """
+        communicator = getattr(self, "communicator", None)
+        pending = getattr(communicator, "pending", None)
+        if pending is not None:
+            self.prefetch_for_messages(pending(self.name))
+        start = getattr(super(), "start", None)
+        if start is not None:
+            start(workers)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop handling messages, then persist the queued memory writes.
+
+        The shared write buffer is closed when the last agent using it stops.
+
+        Args:
+            timeout: Maximum seconds to wait for each step
+
+        """
+        stop = getattr(super(), "stop", None)
+        if stop is not None:
+            stop(timeout)
+        shared, self._shared_memory = self._shared_memory, None
+        if shared is not None:
+            _release_memory(self._memory_factory, shared, timeout)
+
     def _retrieve_relevant_memories(
         self, query: str, limit: int = 5
     ) -> list[dict[str, Any]]:
@@ -319,18 +440,68 @@ class MemoryEnhancedAgent(Agent):  # type: ignore[reportGeneralTypeIssues]
         if self.memory is None or not query:
             return []
 
+        # Writes still queued are not in mem0 yet; search them too
+        pending = self.memory_writer.search_pending(query, self.user_id, limit)
+
         try:
-            # Search for relevant memories
-            search_result = self.memory.search(
-                query=query, user_id=self.user_id, limit=limit
+            # Use the prefetched result if there is one, else search now
+            search_result = (
+                self.memory_prefetcher.take(query)
+                if limit <= self.prefetch_limit
+                else None
             )
+            if search_result is None:
+                search_result = self.memory.search(
+                    query=query, user_id=self.user_id, limit=limit
+                )
+            elif isinstance(search_result, list):
+                search_result = search_result[:limit]
             # Ensure we return a list of dictionaries
             if isinstance(search_result, list):
-                return search_result
-            return []
+                return (pending + search_result)[:limit]
+            return pending
         except Exception:
             logger.exception("Error retrieving memories")
-            return []
+            return pending
+
+    def _search_memories(self, query: str) -> Any:  # noqa: ANN401
+        """Search mem0 for a prefetched query."""
+        return self.memory.search(
+            query=query, user_id=self.user_id, limit=self.prefetch_limit
+        )
+
+    def prefetch_memories(self, queries: Iterable[str]) -> int:
+        """
+        Start retrieving memories for queries in the background.
+
+        Args:
+            queries: The queries later messages will retrieve
+
+        Returns:
+            The number of retrievals started
+
+        """
+        if self.memory_prefetcher is None:
+            return 0
+        return self.memory_prefetcher.prefetch(queries)
+
+    def prefetch_for_messages(self, messages: Iterable[Message]) -> int:
+        """
+        Prefetch the retrievals for messages this agent is about to handle.
+
+        start calls this with the messages queued in the agent's mailbox;
+        call it directly for other messages known to be coming.
+
+        Args:
+            messages: The upcoming messages
+
+        Returns:
+            The number of retrievals started
+
+        """
+        return self.prefetch_memories(
+            self._extract_query_from_message(message) for message in messages
+        )
 
 
 class MemoryEnhancedDataGathererAgent(MemoryEnhancedAgent):
@@ -11,7 +11,10 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Optional, Protocol, Union, runtime_checkable
+from typing import Protocol, Union, runtime_checkable
+
+from agent_team.tool_execution import ToolCall, ToolExecutor, ToolOutcome
+from common_utils.tooling import select_tool
 
 
 # Protocols for type safety
@@ -32,10 +35,10 @@ class TaskProtocol(Protocol):
     """Protocol for CrewAI Task."""
 
     description: str
-    agent: Optional[AgentProtocol]
+    agent: AgentProtocol | None
 
     def __init__(
-        self, description: str = "", agent: Optional[AgentProtocol] = None
+        self, description: str = "", agent: AgentProtocol | None = None
     ) -> None:
         """Initialize the Task with description and optional agent."""
 
@@ -49,8 +52,8 @@ class CrewProtocol(Protocol):
 
     def __init__(
         self,
-        agents: Optional[list[AgentProtocol]] = None,
-        tasks: Optional[list[TaskProtocol]] = None,
+        agents: list[AgentProtocol] | None = None,
+        tasks: list[TaskProtocol] | None = None,
     ) -> None:
         """Initialize the Crew with agents and tasks."""
 
@@ -63,8 +66,6 @@ class CrewProtocol(Protocol):
 
 crewai_available = False
 
-from common_utils.tooling import list_tools
-
 try:
     from crewai import Agent as RealAgent
     from crewai import Crew as RealCrew
@@ -106,8 +107,8 @@ except ImportError:
 
         def __init__(
             self,
-            agents: Optional[list[AgentProtocol]] = None,
-            tasks: Optional[list[TaskProtocol]] = None,
+            agents: list[AgentProtocol] | None = None,
+            tasks: list[TaskProtocol] | None = None,
         ) -> None:
             """Initialize the placeholder Crew with agents and tasks."""
             self.agents = agents or []
@@ -219,18 +220,35 @@ class CrewAIAgentTeam:
 
     """
 
-    def __init__(self, llm_provider: object = None) -> None:
+    # Separates a task's own description from the tool results added by run()
+    TOOL_CONTEXT_HEADER = "\n\nTool results:"
+
+    def __init__(
+        self,
+        llm_provider: object = None,
+        *,
+        max_tool_workers: int | None = None,
+        tool_timeout: float | None = 30.0,
+    ) -> None:
         """
         Initialize a CrewAI Agent Team with agentic reasoning and logging.
 
         Args:
             llm_provider: The LLM provider to use for agent interactions
+            max_tool_workers: Maximum tool calls run at once (default: one per
+                task, up to 8)
+            tool_timeout: Seconds a tool call may take unless the tool was
+                registered with its own timeout (None for no limit)
 
         """
         self.llm_provider = llm_provider
         self.agents: list[object] = []
         self.tasks: list[object] = []
         self.api_client: object | None = None
+        self.tool_executor = ToolExecutor(
+            max_workers=max_tool_workers, default_timeout=tool_timeout
+        )
+        self.tool_outcomes: list[ToolOutcome] = []
 
         # Dedicated logger for agentic reasoning
         # Note: Logger configuration is deferred to the application
@@ -290,8 +308,10 @@ class CrewAIAgentTeam:
         """
         Select a tool based on task description using extensible heuristic matching.
 
-        This method uses a more generic tool registration mechanism that leverages
-        tool metadata including keywords and custom input preprocessors.
+        Every registered tool's name and keywords are matched in a single pass
+        over the description by the precompiled router in
+        :mod:`common_utils.tooling`; the highest-scoring tool wins, with name
+        matches outweighing keyword matches.
 
         Args:
             description: The task description
@@ -300,39 +320,148 @@ class CrewAIAgentTeam:
             (tool_name, tool_metadata) if found, else (None, None)
 
         """
-        # Gather all registered tools with their metadata
-        available_tools = list_tools()
-        description_lower = description.lower()
         self.logger.info("Considering tools for task: '%s'", description)
+        match = select_tool(description)
+        if match is None:
+            self.logger.info("No tool matched by heuristic.")
+            return None, None
 
-        # Enhanced heuristic: Use tool metadata for better matching
-        for tool_name, tool_metadata in available_tools.items():
-            # Check if tool name appears in description
-            if tool_name.lower() in description_lower:
-                self.logger.info("Tool '%s' matched by name in description.", tool_name)
-                return tool_name, tool_metadata
-
-            # Check keywords if available in tool metadata
-            keywords = tool_metadata.get("keywords", [])
-            if keywords and any(
-                keyword.lower() in description_lower for keyword in keywords
-            ):
-                self.logger.info(
-                    "Tool '%s' matched by keyword in description.", tool_name
-                )
-                return tool_name, tool_metadata
+        if match.name.lower() in match.terms:
+            self.logger.info("Tool '%s' matched by name in description.", match.name)
+        else:
+            self.logger.info("Tool '%s' matched by keyword in description.", match.name)
+        self.logger.debug(
+            "Matched terms %s (score %d).",
+            ", ".join(repr(term) for term in match.terms),
+            match.score,
+        )
+        return match.name, match.metadata
+
+    def _task_description(self, task: object) -> str:
+        """Return a task's description without tool results from earlier runs."""
+        description = getattr(task, "description", "")
+        return description.split(self.TOOL_CONTEXT_HEADER, 1)[0]
+
+    def _plan_tool_call(self, index: int, task: object) -> ToolCall | None:
+        """
+        Select a tool for a task and prepare its input.
 
-        self.logger.info("No tool matched by heuristic.")
-        return None, None
+        Args:
+            index: Position of the task in the team
+            task: The task
+
+        Returns:
+            The planned call, or None if no tool matched
+
+        """
+        description = self._task_description(task)
+        self.logger.info("---\nEvaluating task: '%s'", description)
+        tool_name, tool_metadata = self._heuristic_tool_selection(description)
+        if not (tool_name and tool_metadata):
+            self.logger.info("No tool selected for this task. Proceeding without tool.")
+            return None
+
+        # Use input preprocessor if available, otherwise use description
+        input_preprocessor = tool_metadata.get("input_preprocessor")
+        if input_preprocessor:
+            tool_input = input_preprocessor(description)
+        else:
+            # Fallback: try to extract expression for calculator-like tools
+            tool_input = description
+            if tool_name == "calculator":
+                # NOTE: This regex is intentionally simple for demonstration
+                # and will match the first contiguous block of math-like
+                # characters, which may include extra spaces. For more robust
+                # extraction in production, consider improving this to handle
+                # more complex/natural language task descriptions.
+                match = re.search(r"([0-9\+\-\*\/\.\s\%\(\)]+)", description)
+                if match:
+                    tool_input = match.group(1)
+
+        self.logger.info("Invoking tool '%s' with input: %r", tool_name, tool_input)
+        return ToolCall(
+            index=index,
+            tool_name=tool_name,
+            # Strip whitespace from the input to avoid indentation errors
+            tool_input=tool_input.strip()
+            if isinstance(tool_input, str)
+            else tool_input,
+            func=tool_metadata["func"],
+            timeout=tool_metadata.get("timeout"),
+        )
+
+    def _task_dependencies(self) -> dict[int, list[int]]:
+        """
+        Map each task to the tasks it depends on.
+
+        Dependencies come from a task's ``context`` (the CrewAI way of feeding
+        one task's output to another); tasks outside the team are ignored.
+
+        Returns:
+            Task indices, keyed by the index of the dependent task
+
+        """
+        positions = {id(task): index for index, task in enumerate(self.tasks)}
+        dependencies = {}
+        for index, task in enumerate(self.tasks):
+            context = getattr(task, "context", None)
+            if isinstance(context, (list, tuple)):
+                dependencies[index] = [
+                    positions[id(other)] for other in context if id(other) in positions
+                ]
+        return dependencies
+
+    def _log_tool_outcome(self, outcome: ToolOutcome) -> None:
+        """Log the result of a tool call."""
+        if outcome.timed_out:
+            self.logger.error(
+                "Tool '%s' timed out after %.1fs", outcome.tool_name, outcome.duration
+            )
+        elif outcome.error is not None:
+            self.logger.error(
+                "Error invoking tool '%s'", outcome.tool_name, exc_info=outcome.error
+            )
+        else:
+            self.logger.info(
+                "Tool '%s' returned: %r", outcome.tool_name, outcome.result
+            )
+
+    def _apply_tool_context(self, outcomes: list[ToolOutcome]) -> None:
+        """
+        Add tool results to the descriptions of their tasks.
+
+        The agent working on a task then sees what its tool produced. Results
+        from an earlier run are replaced, not accumulated.
+
+        Args:
+            outcomes: The tool outcomes of this run
+
+        """
+        results = {outcome.index: outcome for outcome in outcomes if outcome.ok}
+        for index, task in enumerate(self.tasks):
+            if not hasattr(task, "description"):
+                continue
+            description = self._task_description(task)
+            outcome = results.get(index)
+            if outcome is not None:
+                description += (
+                    f"{self.TOOL_CONTEXT_HEADER}\n"
+                    f"- {outcome.tool_name}: {outcome.result}"
+                )
+            if description != task.description:
+                task.description = description
 
     def run(self) -> object:
         """
         Run the agent team workflow with agentic reasoning and logging.
 
         For each task:
-            - Attempts to select and invoke a tool if heuristics match.
+            - Attempts to select a tool if heuristics match.
             - Logs all reasoning, tool consideration, invocation, and results.
-            - Proceeds with standard CrewAI workflow.
+        The selected tools then run concurrently on a bounded thread pool; a
+        task whose ``context`` lists other tasks has its tool run after
+        theirs. Results are logged in task order and added to the task
+        descriptions before proceeding with the standard CrewAI workflow.
 
         Returns:
             The result of the workflow
@@ -342,45 +471,16 @@ class CrewAIAgentTeam:
             error_msg = "CrewAI is not installed. Install with: pip install '.[agents]'"
             raise ImportError(error_msg)
 
-        # For each task, perform agentic reasoning/tool selection
-        for task in self.tasks:
-            description = getattr(task, "description", "")
-            self.logger.info("---\nEvaluating task: '%s'", description)
-            tool_name, tool_metadata = self._heuristic_tool_selection(description)
-            if tool_name and tool_metadata:
-                # Use input preprocessor if available, otherwise use description
-                input_preprocessor = tool_metadata.get("input_preprocessor")
-                if input_preprocessor:
-                    tool_input = input_preprocessor(description)
-                else:
-                    # Fallback: try to extract expression for calculator-like tools
-                    tool_input = description
-                    if tool_name == "calculator":
-                        # NOTE: This regex is intentionally simple for demonstration
-                        # and will match the first contiguous block of math-like
-                        # characters, which may include extra spaces. For more robust
-                        # extraction in production, consider improving this to handle
-                        # more complex/natural language task descriptions.
-                        match = re.search(r"([0-9\+\-\*\/\.\s\%\(\)]+)", description)
-                        if match:
-                            tool_input = match.group(1)
-
-                self.logger.info(
-                    "Invoking tool '%s' with input: %r", tool_name, tool_input
-                )
-                try:
-                    # Get the actual function from the tool metadata
-                    func = tool_metadata["func"]
-                    # Strip whitespace from the input to avoid indentation errors
-                    result = func(tool_input.strip())
-                    self.logger.info("Tool '%s' returned: %r", tool_name, result)
-                    # Optionally, set as context for agent (not implemented here)
-                except Exception:
-                    self.logger.exception("Error invoking tool '%s'", tool_name)
-            else:
-                self.logger.info(
-                    "No tool selected for this task. Proceeding without tool."
-                )
+        # Plan tool calls in task order, then run them concurrently
+        calls = []
+        for index, task in enumerate(self.tasks):
+            call = self._plan_tool_call(index, task)
+            if call is not None:
+                calls.append(call)
+        self.tool_outcomes = self.tool_executor.run(
+            calls, self._task_dependencies(), on_outcome=self._log_tool_outcome
+        )
+        self._apply_tool_context(self.tool_outcomes)
 
         # Create and run the crew as usual
         crew = self._create_crew()
@@ -28,7 +28,7 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any, Optional, Union
+from typing import Any, Union
 
 # Import CrewAI components
 try:
@@ -49,6 +49,10 @@ except ImportError:
 # Import base CrewAI agent team
 from agent_team.crewai_agents import AgentProtocol, CrewAIAgentTeam, TaskProtocol
 
+# Import write-behind buffering for memory writes and retrieval prefetching
+from common_utils.memory_buffer import WriteBehindMemory
+from common_utils.memory_prefetch import MemoryPrefetcher
+
 # Import MemoryRAGCoordinator for unified memory/RAG retrieval
 from services.memory_rag_coordinator import MemoryRAGCoordinator
 
@@ -65,9 +69,14 @@ class MemoryEnhancedCrewAIAgentTeam(CrewAIAgentTeam):
     - Agent initialization
     - Task assignment
     - Team execution
+
+    Memory writes are buffered and persisted in the background (see
+    WriteBehindMemory); retrieval also searches writes not yet persisted.
+    When the team runs, the retrievals it makes for its context are
+    prefetched concurrently (see MemoryPrefetcher).
     """
 
-    def __init__(self, llm_provider: object = None, user_id: Optional[str] = None) -> None:
+    def __init__(self, llm_provider: object = None, user_id: str | None = None) -> None:
         """
         Initialize a memory-enhanced CrewAI Agent Team.
 
@@ -86,12 +95,18 @@ class MemoryEnhancedCrewAIAgentTeam(CrewAIAgentTeam):
             self.memory = None
             logger.warning("mem0 not available. Install with: pip install mem0ai")
 
+        # Buffer memory writes so they are persisted off the request path
+        self.memory_writer = WriteBehindMemory(self.memory) if self.memory is not None else None
+
         # Set user ID for memory operations
         self.user_id = user_id or "default_user"
 
         # Initialize the MemoryRAGCoordinator for unified memory & RAG retrieval
         self.rag_coordinator = MemoryRAGCoordinator()
 
+        # Run foreseeable retrievals ahead of the steps that need them
+        self.memory_prefetcher = MemoryPrefetcher(self._query_memory_store)
+
         # Store team creation in memory
         self._store_memory(f"Agent team created with user ID: {self.user_id}")
 
@@ -165,15 +180,19 @@ class MemoryEnhancedCrewAIAgentTeam(CrewAIAgentTeam):
             error_msg = "CrewAI is not installed. Install with: pip install '.[agents]'"
             raise ImportError(error_msg)
 
-        # Retrieve relevant memories for context enhancement
         context_query = f"Information about team with {len(self.agents)} agents and {len(self.tasks)} tasks"
+        workflow_description = f"Starting memory-enhanced workflow with {len(self.agents)} agents and {len(self.tasks)} tasks"
+
+        # Start every retrieval this run can foresee, so they overlap
+        self.prefetch_memories(self._foreseeable_queries(context_query, workflow_description))
+
+        # Retrieve relevant memories for context enhancement
         memories = self._retrieve_relevant_memories(query=context_query)
         logger.info(
             "Retrieved %d relevant memories for context enhancement", len(memories)
         )
 
         # Log the start of the workflow
-        workflow_description = f"Starting memory-enhanced workflow with {len(self.agents)} agents and {len(self.tasks)} tasks"
         logger.info(workflow_description)
         self._store_memory(workflow_description)
 
@@ -210,29 +229,45 @@ class MemoryEnhancedCrewAIAgentTeam(CrewAIAgentTeam):
         else:
             return result
 
-    def _store_memory(self, content: Union[str, list[dict[str, str]]], metadata: Optional[dict[str, str]] = None) -> None:
+    def _store_memory(self, content: Union[str, list[dict[str, str]]], metadata: dict[str, str] | None = None) -> None:
         """
-        Store a memory using mem0.
+        Queue a memory for storage in mem0.
+
+        The write is persisted in the background; errors are logged there.
 
         Args:
             content: The content to store (string or conversation messages)
             metadata: Optional metadata for the memory
 
         """
-        if self.memory is None:
+        if self.memory_writer is None:
             return
 
         try:
-            self.memory.add(content, user_id=self.user_id, metadata=metadata or {})
+            self.memory_writer.add(content, user_id=self.user_id, metadata=metadata or {})
             logger.debug(
-                f"Memory stored: {content[:50]}..."
-                if isinstance(content, str)
-                else "Conversation stored"
+                "Memory queued: %s",
+                content[:50] + "..." if isinstance(content, str) else "Conversation",
             )
         except Exception:
             logger.exception("Error storing memory")
 
-    def _retrieve_relevant_memories(self, query: Optional[str] = None, limit: int = 5) -> list[dict[str, Any]]:
+    def flush_memories(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued memory write has been persisted.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits until done)
+
+        Returns:
+            True if all writes were persisted within the timeout
+
+        """
+        if self.memory_writer is None:
+            return True
+        return self.memory_writer.flush(timeout)
+
+    def _retrieve_relevant_memories(self, query: str | None = None, limit: int = 5) -> list[dict[str, Any]]:
         """
         Retrieve relevant memories and RAG results for the current context.
 
@@ -250,19 +285,80 @@ class MemoryEnhancedCrewAIAgentTeam(CrewAIAgentTeam):
         """
         # If no query provided, create one based on team information
         if query is None:
-            agent_roles = [getattr(agent, "role", "unknown") for agent in self.agents]
-            query = f"Information about agents with roles: {', '.join(agent_roles)}"
+            query = self._agent_roles_query()
+
+        # Writes still queued are not in mem0 yet; search them too
+        pending = (
+            self.memory_writer.search_pending(query, self.user_id, limit)
+            if self.memory_writer is not None
+            else []
+        )
 
         try:
-            # Query the unified memory/RAG coordinator
-            # This works even when mem0 is not available (will use only ChromaDB)
-            unified_response = self.rag_coordinator.query(query, self.user_id)
-            memories = unified_response.get("merged_results", [])
+            # Use the prefetched result if there is one, else query now
+            results = self.memory_prefetcher.take(query)
+            if results is None:
+                results = self._query_memory_store(query)
+            memories = pending + results
             # Optionally apply a limit to the number of returned results
             return memories[:limit] if limit else memories
         except Exception:
             logger.exception("Error retrieving unified memories")
-            return []
+            return pending
+
+    def _query_memory_store(self, query: str) -> list[dict[str, Any]]:
+        """
+        Query mem0 and ChromaDB through the MemoryRAGCoordinator.
+
+        This works even when mem0 is not available (will use only ChromaDB).
+
+        Args:
+            query: The query string
+
+        Returns:
+            The merged and deduplicated results
+
+        """
+        unified_response = self.rag_coordinator.query(query, self.user_id)
+        return unified_response.get("merged_results", [])
+
+    def _agent_roles_query(self) -> str:
+        """Return the default retrieval query, built from the agent roles."""
+        agent_roles = [getattr(agent, "role", "unknown") for agent in self.agents]
+        return f"Information about agents with roles: {', '.join(agent_roles)}"
+
+    def _foreseeable_queries(self, context_query: str, workflow_description: str) -> list[str]:
+        """
+        List the retrievals a run makes.
+
+        Args:
+            context_query: The query for the team context
+            workflow_description: The description the context is enhanced for
+
+        Returns:
+            The context query, and the workflow description when mem0 is
+            available (only then is the context enhanced with memories)
+
+        """
+        queries = [context_query]
+        if self.memory is not None:
+            queries.append(workflow_description)
+        return queries
+
+    def prefetch_memories(self, queries: list[str]) -> int:
+        """
+        Start retrieving memories for queries in the background.
+
+        Later retrievals with the same query use the prefetched results.
+
+        Args:
+            queries: The queries to retrieve
+
+        Returns:
+            The number of retrievals started
+
+        """
+        return self.memory_prefetcher.prefetch(queries)
 
     def _enhance_context_with_memories(self, context: str) -> str:
         """
@@ -308,7 +404,7 @@ Original context:
     def store_memory(
         self,
         content: Union[str, list[dict[str, str]]],
-        metadata: Optional[dict[str, str]] = None,
+        metadata: dict[str, str] | None = None,
     ) -> None:
         """
         Store memory content with optional metadata.
@@ -321,7 +417,7 @@ Original context:
         self._store_memory(content, metadata)
 
     def retrieve_relevant_memories(
-        self, query: Optional[str] = None, limit: int = 5
+        self, query: str | None = None, limit: int = 5
     ) -> list[dict[str, Any]]:
         """
         Retrieve relevant memories based on a query and limit.
@@ -0,0 +1,397 @@
+"""
+tool_execution - Module for agent_team.tool_execution.
+
+Concurrent, dependency-aware execution of the tool calls planned for a team's
+tasks.
+
+:class:`ToolExecutor` runs every call whose dependencies have finished on a
+bounded thread pool, so independent calls overlap instead of waiting on each
+other. Coroutine tools run on their own event loop in a worker thread and are
+cancelled at their timeout. Plain Python threads cannot be cancelled, so a
+synchronous call that overruns is reported as timed out and its eventual
+result is discarded; its thread runs on until the call returns, but gives its
+worker slot to the next queued call, so hanging tools cannot stall the rest.
+
+Outcomes are delivered in call order, whatever order the calls finish in, so
+logs and results are the same on every run.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# Third-party imports
+# Local imports
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Upper bound on worker threads when none is configured
+DEFAULT_MAX_WORKERS = 8
+
+
+class ToolDependencyCycleError(ValueError):
+    """Raised when task dependencies form a cycle."""
+
+    MESSAGE_TEMPLATE = "Task dependencies form a cycle through task {index}"
+
+    def __init__(self, index: int) -> None:
+        """
+        Initialize the ToolDependencyCycleError.
+
+        Args:
+            index: A task on the cycle
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(index=index))
+        self.index = index
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when the executor stops a coroutine tool at its timeout."""
+
+    MESSAGE_TEMPLATE = "Tool '{tool_name}' did not finish within {timeout}s"
+
+    def __init__(self, tool_name: str, timeout: float) -> None:
+        """
+        Initialize the ToolTimeoutError.
+
+        Args:
+            tool_name: The registered tool name
+            timeout: The timeout in seconds
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(tool_name=tool_name, timeout=timeout)
+        )
+        self.tool_name = tool_name
+        self.timeout = timeout
+
+
+@dataclass(frozen=True)
+class ToolCall:
+    """
+    A tool invocation planned for one task.
+
+    Attributes:
+        index: Position of the task in the team
+        tool_name: The registered tool name
+        tool_input: The argument passed to the tool
+        func: The tool function (plain or coroutine function)
+        timeout: Seconds the call may take, or None for no limit
+
+    """
+
+    index: int
+    tool_name: str
+    tool_input: Any
+    func: Callable[..., Any]
+    timeout: float | None = None
+
+
+@dataclass(frozen=True)
+class ToolOutcome:
+    """
+    The result of a tool call.
+
+    Attributes:
+        index: Position of the task in the team
+        tool_name: The registered tool name
+        result: What the tool returned (None on failure)
+        error: The exception raised, if the call failed
+        timed_out: Whether the call exceeded its timeout
+        duration: Seconds from start to completion or timeout
+
+    """
+
+    index: int
+    tool_name: str
+    result: Any = None
+    error: BaseException | None = None
+    timed_out: bool = False
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call returned normally."""
+        return self.error is None and not self.timed_out
+
+
+def resolve_dependencies(
+    indices: Sequence[int], dependencies: Mapping[int, Sequence[int]]
+) -> dict[int, set[int]]:
+    """
+    Reduce a task dependency graph to dependencies between tool calls.
+
+    Tasks without a tool call pass their own dependencies through, so a call
+    still waits for calls reached through tasks that have none.
+
+    Args:
+        indices: The tasks with a tool call
+        dependencies: Each task's direct dependencies
+
+    Returns:
+        For each tool call, the calls it must wait for
+
+    Raises:
+        ToolDependencyCycleError: If the dependencies form a cycle
+
+    """
+    calls = set(indices)
+    resolved: dict[int, set[int]] = {}
+    visiting: set[int] = set()
+
+    def upstream(index: int) -> set[int]:
+        """Return the calls a task depends on, directly or through others."""
+        if index in resolved:
+            return resolved[index]
+        if index in visiting:
+            raise ToolDependencyCycleError(index)
+        visiting.add(index)
+        found: set[int] = set()
+        for dependency in dependencies.get(index, ()):
+            if dependency in calls:
+                found.add(dependency)
+                upstream(dependency)
+            else:
+                found |= upstream(dependency)
+        visiting.discard(index)
+        resolved[index] = found
+        return found
+
+    return {index: upstream(index) for index in indices}
+
+
+class ToolExecutor:
+    """
+    Run tool calls concurrently in dependency order.
+
+    Usage:
+        executor = ToolExecutor(max_workers=4, default_timeout=30)
+        outcomes = executor.run(calls, dependencies={2: [0, 1]})
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        default_timeout: float | None = None,
+    ) -> None:
+        """
+        Initialize the ToolExecutor.
+
+        Args:
+            max_workers: Maximum concurrent calls (default: one per call, up to
+                DEFAULT_MAX_WORKERS)
+            default_timeout: Timeout for calls that do not set one, in seconds
+                (None for no limit)
+
+        """
+        if max_workers is not None and max_workers < 1:
+            error_msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(error_msg)
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+
+    def timeout_for(self, call: ToolCall) -> float | None:
+        """Return the effective timeout of a call."""
+        return self.default_timeout if call.timeout is None else call.timeout
+
+    def invoke(self, call: ToolCall, started: dict[int, float]) -> Any:  # noqa: ANN401
+        """
+        Run one call in a worker thread, recording when it started.
+
+        Raises:
+            ToolTimeoutError: If a coroutine tool is stopped at its timeout
+                (a TimeoutError raised by the tool itself passes through)
+
+        """
+        started[call.index] = time.monotonic()
+        if inspect.iscoroutinefunction(call.func):
+            return asyncio.run(self._await_call(call))
+        return call.func(call.tool_input)
+
+    async def _await_call(self, call: ToolCall) -> Any:  # noqa: ANN401
+        """Await a coroutine tool, cancelling it at its timeout."""
+        timeout = self.timeout_for(call)
+        task = asyncio.ensure_future(call.func(call.tool_input))
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if not done:
+            task.cancel()
+            await asyncio.wait({task})
+            raise ToolTimeoutError(call.tool_name, timeout)
+        return task.result()
+
+    def run(
+        self,
+        calls: Sequence[ToolCall],
+        dependencies: Mapping[int, Sequence[int]] | None = None,
+        on_outcome: Callable[[ToolOutcome], None] | None = None,
+    ) -> list[ToolOutcome]:
+        """
+        Run tool calls, each once the calls it depends on have finished.
+
+        A call runs even if one it depends on failed; the dependency only
+        orders the calls.
+
+        Args:
+            calls: The calls to run
+            dependencies: Each task's direct dependencies, by task index
+            on_outcome: Called with each outcome in call order, as soon as all
+                earlier calls have finished too
+
+        Returns:
+            The outcomes, in call order
+
+        Raises:
+            ToolDependencyCycleError: If the dependencies form a cycle
+
+        """
+        if not calls:
+            return []
+        workers = self.max_workers or min(len(calls), DEFAULT_MAX_WORKERS)
+        schedule = _Schedule(self, calls, dependencies or {}, on_outcome, workers)
+        schedule.submit(schedule.initial())
+        while schedule.running:
+            done, _ = wait(
+                schedule.running,
+                timeout=schedule.next_wait(),
+                return_when=FIRST_COMPLETED,
+            )
+            schedule.submit(schedule.collect(done) + schedule.expire())
+        return schedule.outcomes()
+
+
+class _Schedule:
+    """Bookkeeping for one :meth:`ToolExecutor.run`."""
+
+    def __init__(
+        self,
+        executor: ToolExecutor,
+        calls: Sequence[ToolCall],
+        dependencies: Mapping[int, Sequence[int]],
+        on_outcome: Callable[[ToolOutcome], None] | None,
+        workers: int,
+    ) -> None:
+        """Resolve the dependencies between calls."""
+        self.executor = executor
+        self.on_outcome = on_outcome
+        self.workers = workers
+        self.order = sorted(call.index for call in calls)
+        self.calls = {call.index: call for call in calls}
+        waits_on = resolve_dependencies(self.order, dependencies)
+        self.dependents: dict[int, list[int]] = {index: [] for index in self.order}
+        for index, upstream in waits_on.items():
+            for dependency in upstream:
+                self.dependents[dependency].append(index)
+        self.remaining = {index: len(upstream) for index, upstream in waits_on.items()}
+        self.ready: list[int] = []
+        self.started: dict[int, float] = {}
+        self.running: dict[Future[Any], int] = {}
+        self.finished: dict[int, ToolOutcome] = {}
+        self.emitted = 0
+
+    def initial(self) -> list[int]:
+        """Return the calls without dependencies."""
+        return [index for index in self.order if self.remaining[index] == 0]
+
+    def submit(self, indices: Sequence[int]) -> None:
+        """Queue calls and start them in index order while workers are free."""
+        self.ready = sorted([*self.ready, *indices], reverse=True)
+        while self.ready and len(self.running) < self.workers:
+            index = self.ready.pop()
+            future: Future[Any] = Future()
+            future.set_running_or_notify_cancel()
+            threading.Thread(
+                target=self._invoke,
+                args=(self.calls[index], future),
+                name=f"tool-{index}",
+                daemon=True,
+            ).start()
+            self.running[future] = index
+
+    def _invoke(self, call: ToolCall, future: Future[Any]) -> None:
+        """Run a call in its worker thread and settle its future."""
+        try:
+            result = self.executor.invoke(call, self.started)
+        except BaseException as e:  # noqa: BLE001
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def next_wait(self) -> float | None:
+        """Return how long to wait before the next running call times out."""
+        now = time.monotonic()
+        # A queued call's deadline is at least a full timeout away
+        deadlines = [
+            self.started.get(index, now) + timeout
+            for index in self.running.values()
+            if (timeout := self.executor.timeout_for(self.calls[index])) is not None
+        ]
+        return max(0.0, min(deadlines) - now) if deadlines else None
+
+    def collect(self, done: set[Future[Any]]) -> list[int]:
+        """Record finished calls and return the calls they unblock."""
+        now = time.monotonic()
+        unblocked: list[int] = []
+        for future in sorted(done, key=self.running.__getitem__):
+            index = self.running.pop(future)
+            name = self.calls[index].tool_name
+            duration = now - self.started.get(index, now)
+            error = future.exception()
+            if isinstance(error, ToolTimeoutError):
+                outcome = ToolOutcome(index, name, timed_out=True, duration=duration)
+            elif error is not None:
+                outcome = ToolOutcome(index, name, error=error, duration=duration)
+            else:
+                outcome = ToolOutcome(index, name, future.result(), duration=duration)
+            unblocked += self.finish(outcome)
+        return unblocked
+
+    def expire(self) -> list[int]:
+        """Abandon calls past their timeout and return the calls they unblock."""
+        now = time.monotonic()
+        unblocked: list[int] = []
+        for future, index in sorted(self.running.items(), key=lambda item: item[1]):
+            timeout = self.executor.timeout_for(self.calls[index])
+            started = self.started.get(index)
+            if timeout is None or started is None or now - started < timeout:
+                continue
+            del self.running[future]
+            logger.debug("Abandoning tool call %d after timeout", index)
+            name = self.calls[index].tool_name
+            unblocked += self.finish(
+                ToolOutcome(index, name, timed_out=True, duration=now - started)
+            )
+        return unblocked
+
+    def finish(self, outcome: ToolOutcome) -> list[int]:
+        """Record an outcome, deliver ready ones and return unblocked calls."""
+        self.finished[outcome.index] = outcome
+        while (
+            self.emitted < len(self.order) and self.order[self.emitted] in self.finished
+        ):
+            if self.on_outcome is not None:
+                self.on_outcome(self.finished[self.order[self.emitted]])
+            self.emitted += 1
+        unblocked = []
+        for dependent in self.dependents[outcome.index]:
+            self.remaining[dependent] -= 1
+            if self.remaining[dependent] == 0:
+                unblocked.append(dependent)
+        return unblocked
+
+    def outcomes(self) -> list[ToolOutcome]:
+        """Return the outcomes in call order."""
+        return [self.finished[index] for index in self.order]
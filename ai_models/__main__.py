@@ -1,7 +1,11 @@
 """__main__ - Module for ai_models.__main__."""
 
 # Standard library imports
+import sys
 
 # Third-party imports
-
 # Local imports
+from ai_models.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
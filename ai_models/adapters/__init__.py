@@ -18,6 +18,7 @@ OpenAICompatibleAdapter: Any | None = None
 LMStudioAdapter: Any | None = None
 TensorRTAdapter: Any | None = None
 MCPAdapter: Any | None = None
+FakeAdapter: Any | None = None
 
 
 # Helper function to safely import an adapter
@@ -57,3 +58,4 @@ OpenAICompatibleAdapter = _safe_import(
 LMStudioAdapter = _safe_import("lmstudio_adapter", "LMStudioAdapter")
 TensorRTAdapter = _safe_import("tensorrt_adapter", "TensorRTAdapter")
 MCPAdapter = _safe_import("mcp_adapter", "MCPAdapter")
+FakeAdapter = _safe_import("fake_adapter", "FakeAdapter")
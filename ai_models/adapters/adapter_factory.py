@@ -7,9 +7,10 @@ import logging
 from typing import Any, cast
 
 # Third-party imports
+# Local imports
+from .fake_adapter import FakeAdapter
 
 
-# Local imports
 # Import placeholders for adapters
 # These will be properly implemented in their respective files
 class OllamaAdapter:
@@ -157,6 +158,8 @@ def get_adapter(
         return LMStudioAdapter(host, port, **kwargs)
     if server_type == "tensorrt":
         return TensorRTAdapter(host, port, **kwargs)
+    if server_type == "fake":
+        return FakeAdapter(host, port, **kwargs)
     if server_type == "mcp":
         if MCPAdapter is None:
             raise MCPAdapterNotAvailableError
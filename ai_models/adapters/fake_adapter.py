@@ -0,0 +1,187 @@
+"""
+fake_adapter - Module for ai_models/adapters.fake_adapter.
+
+Deterministic in-process adapter for tests, CI and offline benchmarking.
+
+Outputs and simulated latencies are derived from a hash of the input, so the
+same prompt always yields the same text, embedding and delay. No network or
+model weights are needed.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import hashlib
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+# Third-party imports
+
+# Local imports
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Vocabulary used to build deterministic generations
+_WORDS = (
+    "alpha",
+    "bravo",
+    "charlie",
+    "delta",
+    "echo",
+    "foxtrot",
+    "golf",
+    "hotel",
+    "india",
+    "juliet",
+    "kilo",
+    "lima",
+    "mike",
+    "november",
+    "oscar",
+    "papa",
+)
+
+
+def _digest(*parts: object) -> bytes:
+    """Return a SHA-256 digest of the given parts."""
+    return hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).digest()
+
+
+class FakeAdapter:
+    """Adapter that simulates a model server deterministically."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 0,
+        *,
+        latency_ms: float = 0.0,
+        per_token_ms: float = 0.0,
+        embedding_dim: int = 8,
+        fail_every: int = 0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the fake adapter.
+
+        Args:
+            host: Ignored; accepted for factory compatibility
+            port: Ignored; accepted for factory compatibility
+            latency_ms: Fixed simulated latency per call
+            per_token_ms: Additional simulated latency per generated token
+            embedding_dim: Dimension of returned embeddings
+            fail_every: Raise on every Nth call (0 never fails)
+            seed: Seed mixed into every output
+
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.per_token_ms = per_token_ms
+        self.embedding_dim = embedding_dim
+        self.fail_every = fail_every
+        self.seed = seed
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _tick(self, tokens: int) -> None:
+        """Count a call, simulate its latency and apply failure injection."""
+        with self._lock:
+            self.calls += 1
+            call_number = self.calls
+        delay = (self.latency_ms + self.per_token_ms * tokens) / 1000
+        if delay > 0:
+            time.sleep(delay)
+        if self.fail_every and call_number % self.fail_every == 0:
+            error_msg = f"Simulated failure on call {call_number}"
+            raise RuntimeError(error_msg)
+
+    def generate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 16,
+        **_kwargs: Any,  # noqa: ANN401
+    ) -> dict[str, Any]:
+        """
+        Generate a deterministic completion for a prompt.
+
+        Args:
+            prompt: The prompt
+            max_tokens: Number of tokens to generate
+            **_kwargs: Other generation parameters (ignored)
+
+        Returns:
+            A dict with "text" and OpenAI-style "usage" token counts
+
+        """
+        digest = _digest(self.seed, prompt)
+        words = [
+            _WORDS[digest[i % len(digest)] % len(_WORDS)] for i in range(max_tokens)
+        ]
+        self._tick(max_tokens)
+        return {
+            "text": " ".join(words),
+            "usage": {
+                "prompt_tokens": len(prompt.split()),
+                "completion_tokens": max_tokens,
+            },
+        }
+
+    def stream_text(
+        self,
+        prompt: str,
+        max_tokens: int = 16,
+        **_kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[str]:
+        """
+        Stream the completion of :meth:`generate_text` token by token.
+
+        Args:
+            prompt: The prompt
+            max_tokens: Number of tokens to generate
+            **_kwargs: Other generation parameters (ignored)
+
+        Yields:
+            One token at a time, with per-token latency applied to each
+
+        """
+        digest = _digest(self.seed, prompt)
+        self._tick(0)
+        for i in range(max_tokens):
+            if self.per_token_ms:
+                time.sleep(self.per_token_ms / 1000)
+            token = _WORDS[digest[i % len(digest)] % len(_WORDS)]
+            yield token if i == 0 else f" {token}"
+
+    def embed(self, texts: list[str] | str) -> list[list[float]]:
+        """
+        Return deterministic unit-length embeddings.
+
+        Args:
+            texts: A text or list of texts
+
+        Returns:
+            One embedding per text
+
+        """
+        batch = [texts] if isinstance(texts, str) else list(texts)
+        vectors = []
+        for text in batch:
+            raw: list[float] = []
+            counter = 0
+            while len(raw) < self.embedding_dim:
+                block = _digest(self.seed, text, counter)
+                raw.extend(v / 2**31 - 1.0 for v in struct.unpack("<8I", block))
+                counter += 1
+            raw = raw[: self.embedding_dim]
+            norm = sum(v * v for v in raw) ** 0.5 or 1.0
+            vectors.append([v / norm for v in raw])
+        self._tick(sum(len(t.split()) for t in batch))
+        return vectors
+
+    def send_message(self, message: str) -> str:
+        """Return a deterministic reply, matching the MCP adapter interface."""
+        return self.generate_text(message)["text"]
@@ -7,19 +7,102 @@ This is a scaffold for further expansion.
 
 from __future__ import annotations
 
-from typing import Any
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar
 
 from common_utils import tooling
 
+# Longest run of arithmetic characters in a prompt
+_CALCULATOR_PATTERN = re.compile(r"[\d\+\-\*/\(\)\.\s]+")
+# Fenced code blocks, optionally tagged as Python
+_CODE_BLOCK_PATTERN = re.compile(r"```(?:python|py)?\s*(.*?)```", re.DOTALL)
+
+
+def extract_calculator_expression(prompt: str) -> str:
+    """Extract mathematical expression from prompt for calculator tool."""
+    matches = _CALCULATOR_PATTERN.findall(prompt)
+    if matches:
+        # Return the longest match that looks like a math expression
+        return max(matches, key=len).strip()
+    return prompt
+
+
+def extract_code_block(prompt: str) -> str:
+    """Extract code to execute from prompt for code executor tool."""
+    match = _CODE_BLOCK_PATTERN.search(prompt)
+    if match:
+        return match.group(1).strip()
+    return prompt
+
+
+@dataclass(frozen=True)
+class ToolRoute:
+    """
+    A dispatch table entry: prompts containing any keyword go to the tool.
+
+    Attributes:
+        tool: The registered tool name
+        keywords: Substrings that select the tool (case-insensitive)
+
+    """
+
+    tool: str
+    keywords: tuple[str, ...]
+
 
 class ArtistAgent:
-    """Agent that selects and uses tools based on user prompts."""
+    """
+    Agent that selects and uses tools based on user prompts.
+
+    Tools are chosen from a declarative dispatch table: the first route with
+    a keyword in the prompt wins. Subclasses declare their own
+    ``dispatch_table`` and ``extractors``; each class's table is compiled to
+    one regular expression per route the first time it is used.
+    """
+
+    dispatch_table: ClassVar[tuple[ToolRoute, ...]] = (
+        ToolRoute(
+            "calculator",
+            ("calculate", "add", "subtract", "multiply", "divide", "+", "-", "*", "/"),
+        ),
+    )
+    # Tool name -> function extracting the tool input from the prompt
+    extractors: ClassVar[dict[str, Callable[[str], str]]] = {
+        "calculator": extract_calculator_expression,
+        "code_executor": extract_code_block,
+    }
+    # Extracted inputs shorter than this are discarded
+    min_expression_length: ClassVar[int] = 3
 
     def __init__(self) -> None:
         """Initialize the agent with available tools."""
         # Discover available tools at initialization
         self.tools: dict[str, dict[str, Any]] = tooling.list_tools()
 
+    @classmethod
+    def compiled_dispatch(cls) -> tuple[tuple[str, re.Pattern[str]], ...]:
+        """
+        Return the class's dispatch table compiled to (tool, pattern) pairs.
+
+        Returns:
+            One case-insensitive keyword alternation per route, in order
+
+        """
+        compiled = cls.__dict__.get("_compiled_dispatch")
+        if compiled is None:
+            compiled = tuple(
+                (
+                    route.tool,
+                    re.compile("|".join(map(re.escape, route.keywords)), re.IGNORECASE),
+                )
+                for route in cls.dispatch_table
+            )
+            cls._compiled_dispatch = compiled
+        return compiled
+
     def decide_tool(self, prompt: str) -> str:
         """
         Select appropriate tool based on prompt keywords.
@@ -33,78 +116,22 @@ class ArtistAgent:
             str: Name of the tool to use.
 
         """
-        if any(
-            k in prompt.lower()
-            for k in [
-                "calculate",
-                "add",
-                "subtract",
-                "multiply",
-                "divide",
-                "+",
-                "-",
-                "*",
-                "/",
-            ]
-        ):
-            return "calculator"
-        # Add more heuristics for other tools here
+        for tool_name, pattern in self.compiled_dispatch():
+            if pattern.search(prompt):
+                return tool_name
         return ""
 
     def extract_relevant_expression(self, prompt: str, tool_name: str) -> str:
         """Extract the relevant expression from the prompt based on the tool."""
-        min_expression_length = 3
-        # Refactored to reduce return statements and complexity
         if not prompt or not tool_name:
             return ""
-        expression = ""
-        if tool_name == "calculator":
-            expression = self._extract_calculator_expression(prompt)
-        elif tool_name == "text_analyzer":
-            expression = self._extract_text_analyzer_expression(prompt)
-        elif tool_name == "code_executor":
-            expression = self._extract_code_executor_expression(prompt)
-        else:
-            expression = self._extract_generic_expression(prompt)
-        if len(expression) < min_expression_length:
+        extractor = self.extractors.get(tool_name)
+        # Tools without an extractor (e.g. text_analyzer) get the full prompt
+        expression = extractor(prompt) if extractor else prompt
+        if len(expression) < self.min_expression_length:
             return ""
         return expression
 
-    def _extract_calculator_expression(self, prompt: str) -> str:
-        """Extract mathematical expression from prompt for calculator tool."""
-        # Simple extraction - look for mathematical expressions
-        import re
-
-        # Find mathematical expressions with numbers and operators
-        pattern = r"[\d\+\-\*/\(\)\.\s]+"
-        matches = re.findall(pattern, prompt)
-        if matches:
-            # Return the longest match that looks like a math expression
-            return max(matches, key=len).strip()
-        return prompt
-
-    def _extract_text_analyzer_expression(self, prompt: str) -> str:
-        """Extract text to analyze from prompt for text analyzer tool."""
-        # For text analysis, return the full prompt
-        return prompt
-
-    def _extract_code_executor_expression(self, prompt: str) -> str:
-        """Extract code to execute from prompt for code executor tool."""
-        # Look for code blocks or return the full prompt
-        import re
-
-        # Look for code blocks marked with ```
-        code_pattern = r"```(?:python|py)?\s*(.*?)```"
-        matches = re.findall(code_pattern, prompt, re.DOTALL)
-        if matches:
-            return matches[0].strip()
-        return prompt
-
-    def _extract_generic_expression(self, prompt: str) -> str:
-        """Extract generic expression from prompt for unknown tools."""
-        # For unknown tools, return the full prompt
-        return prompt
-
     def run(self, prompt: str) -> str:
         """
         Process a prompt, select a tool, and return the tool's output.
@@ -125,6 +152,68 @@ class ArtistAgent:
             return str(result)  # Ensure we return a string
         return "No suitable tool found for this prompt."
 
+    def run_many(self, prompts: list[str], max_workers: int | None = None) -> list[str]:
+        """
+        Process many prompts concurrently on a thread pool.
+
+        Args:
+            prompts (list[str]): The prompts.
+            max_workers (Optional[int]): Worker threads (default: the
+                ThreadPoolExecutor default).
+
+        Returns:
+            list[str]: The output for each prompt, in order.
+
+        """
+        if len(prompts) < 2 or max_workers == 1:  # noqa: PLR2004
+            return [self.run(prompt) for prompt in prompts]
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="artist"
+        ) as pool:
+            return list(pool.map(self.run, prompts))
+
+
+def benchmark_throughput(
+    agent: ArtistAgent,
+    prompts: list[str],
+    *,
+    rounds: int = 3,
+    max_workers: int | None = None,
+) -> dict[str, float]:
+    """
+    Measure how many prompts per second an agent dispatches and runs.
+
+    Each figure is the best of ``rounds`` passes over the prompts.
+
+    Args:
+        agent: The agent
+        prompts: The prompts
+        rounds: Passes per measurement
+        max_workers: Worker threads for run_many
+
+    Returns:
+        Prompts per second for decide_tool alone, sequential run and
+        run_many
+
+    """
+
+    def best_rate(work: Callable[[], object]) -> float:
+        best = min(_timed(work) for _ in range(rounds))
+        return len(prompts) / best if best > 0 else float("inf")
+
+    return {
+        "decide_tool": best_rate(lambda: [agent.decide_tool(p) for p in prompts]),
+        "run": best_rate(lambda: [agent.run(p) for p in prompts]),
+        "run_many": best_rate(lambda: agent.run_many(prompts, max_workers)),
+    }
+
+
+def _timed(work: Callable[[], object]) -> float:
+    """Return the seconds a call takes."""
+    started = time.perf_counter()
+    work()
+    return time.perf_counter() - started
+
 
 def main() -> None:
     """Run example usage of ArtistAgent."""
@@ -139,6 +228,8 @@ def main() -> None:
     test_prompt = "Calculate 2 + 3 * 4"
     logger.info("Prompt: %s", test_prompt)
     logger.info("Agent output: %s", agent.run("2 + 3 * 4"))
+    prompts = [f"Calculate {i} + {i} * 2" for i in range(1000)]
+    logger.info("Prompts per second: %s", benchmark_throughput(agent, prompts))
 
 
 if __name__ == "__main__":
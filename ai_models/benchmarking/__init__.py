@@ -5,3 +5,28 @@
 # Third-party imports
 
 # Local imports
+from .benchmark_config import (
+    BenchmarkConfig,
+    BenchmarkConfigError,
+    BenchmarkType,
+    load_prompts,
+)
+from .benchmark_result import BenchmarkResult, LevelResult, find_regressions
+from .benchmark_runner import (
+    BenchmarkRunner,
+    UnsupportedAdapterOperationError,
+    run_benchmark,
+)
+
+__all__ = [
+    "BenchmarkConfig",
+    "BenchmarkConfigError",
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "BenchmarkType",
+    "LevelResult",
+    "UnsupportedAdapterOperationError",
+    "find_regressions",
+    "load_prompts",
+    "run_benchmark",
+]
@@ -1,7 +1,144 @@
-"""benchmark_config - Module for ai_models/benchmarking.benchmark_config."""
+"""
+benchmark_config - Module for ai_models/benchmarking.benchmark_config.
+
+Configuration for adapter benchmarks.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+DEFAULT_PROMPTS = [
+    "Summarize the benefits of passive income in one sentence.",
+    "Write a product description for a budgeting app.",
+    "List three niche markets for digital templates.",
+    "Explain what an API rate limit is.",
+]
+
+
+class BenchmarkType(str, Enum):
+    """Kind of benchmark to run; all kinds collect every metric."""
+
+    LATENCY = "latency"
+    THROUGHPUT = "throughput"
+    MEMORY = "memory"
+
+
+class BenchmarkConfigError(ValueError):
+    """Raised when a benchmark configuration is invalid."""
+
+    MESSAGE_TEMPLATE = "Invalid benchmark configuration: {detail}"
+
+    def __init__(self, detail: str) -> None:
+        """
+        Initialize the BenchmarkConfigError.
+
+        Args:
+            detail: Description of the invalid setting
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(detail=detail))
+
+
+@dataclass
+class BenchmarkConfig:
+    """
+    Configuration for a benchmark run.
+
+    Every concurrency level in ``concurrency_levels`` runs ``warmup_runs``
+    untimed requests followed by ``num_runs`` timed requests, cycling through
+    the prompt corpus.
+    """
+
+    adapter: str = "fake"
+    model_id: str = "default"
+    host: str = "localhost"
+    port: int = 0
+    adapter_options: dict[str, Any] = field(default_factory=dict)
+    benchmark_type: BenchmarkType = BenchmarkType.LATENCY
+    operation: str = "generate"
+    prompts: list[str] = field(default_factory=lambda: list(DEFAULT_PROMPTS))
+    prompt_file: str | None = None
+    num_runs: int = 20
+    warmup_runs: int = 2
+    concurrency_levels: list[int] = field(default_factory=lambda: [1])
+    max_tokens: int = 32
+    memory_sample_interval: float = 0.01
+    output_path: str | None = None
+    output_format: str = "json"
+
+    OPERATIONS = ("generate", "embed")
+    OUTPUT_FORMATS = ("json", "csv")
+
+    def __post_init__(self) -> None:
+        """Normalize and validate the configuration."""
+        self.benchmark_type = BenchmarkType(self.benchmark_type)
+        if self.prompt_file:
+            self.prompts = load_prompts(self.prompt_file)
+
+        detail = None
+        if self.operation not in self.OPERATIONS:
+            detail = f"operation must be one of {self.OPERATIONS}"
+        elif self.output_format not in self.OUTPUT_FORMATS:
+            detail = f"output_format must be one of {self.OUTPUT_FORMATS}"
+        elif not self.prompts:
+            detail = "the prompt corpus is empty"
+        elif self.num_runs < 1:
+            detail = "num_runs must be at least 1"
+        elif self.warmup_runs < 0:
+            detail = "warmup_runs must not be negative"
+        elif not self.concurrency_levels or min(self.concurrency_levels) < 1:
+            detail = "concurrency_levels must be positive integers"
+        if detail:
+            raise BenchmarkConfigError(detail)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the configuration to a dictionary.
+
+        Returns:
+            Dictionary representation without the prompt texts
+
+        """
+        data = asdict(self)
+        data["benchmark_type"] = self.benchmark_type.value
+        data["num_prompts"] = len(data.pop("prompts"))
+        return data
+
+
+def load_prompts(path: str) -> list[str]:
+    """
+    Load a prompt corpus from a file.
+
+    ``.json`` files must contain a list of strings; ``.jsonl`` files one JSON
+    string or ``{"prompt": ...}`` object per line; any other file one prompt
+    per non-empty line.
+
+    Args:
+        path: Path to the prompt file
+
+    Returns:
+        The list of prompts
+
+    """
+    file_path = Path(path)
+    text = file_path.read_text(encoding="utf-8")
+    if file_path.suffix == ".json":
+        return [str(p) for p in json.loads(text)]
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if file_path.suffix == ".jsonl":
+        prompts = []
+        for line in lines:
+            item = json.loads(line)
+            prompts.append(item["prompt"] if isinstance(item, dict) else str(item))
+        return prompts
+    return lines
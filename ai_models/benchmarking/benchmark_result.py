@@ -1,7 +1,342 @@
-"""benchmark_result - Module for ai_models/benchmarking.benchmark_result."""
+"""
+benchmark_result - Module for ai_models/benchmarking.benchmark_result.
+
+Benchmark results and their JSON/CSV serialization.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import csv
+import io
+import json
+import platform
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+# Flattened CSV columns, in output order
+CSV_FIELDS = [
+    "adapter",
+    "model_id",
+    "operation",
+    "concurrency",
+    "requests",
+    "errors",
+    "error_rate",
+    "duration_s",
+    "requests_per_sec",
+    "tokens_per_sec",
+    "latency_mean_ms",
+    "latency_min_ms",
+    "latency_max_ms",
+    "latency_p50_ms",
+    "latency_p90_ms",
+    "latency_p95_ms",
+    "latency_p99_ms",
+    "peak_rss_bytes",
+    "rss_delta_bytes",
+]
+
+
+@dataclass
+class LevelResult:
+    """Metrics for one concurrency level."""
+
+    concurrency: int
+    latency: dict[str, Any]
+    throughput: dict[str, Any]
+    memory: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the level result to a dictionary.
+
+        Returns:
+            Dictionary representation
+
+        """
+        return {
+            "concurrency": self.concurrency,
+            "latency_ms": dict(self.latency),
+            "throughput": dict(self.throughput),
+            "memory": dict(self.memory),
+        }
+
+    def to_row(self) -> dict[str, Any]:
+        """
+        Flatten the level result into a CSV row (without run identifiers).
+
+        Returns:
+            Dictionary keyed by a subset of ``CSV_FIELDS``
+
+        """
+        row: dict[str, Any] = {"concurrency": self.concurrency}
+        for key in (
+            "requests",
+            "errors",
+            "error_rate",
+            "duration_s",
+            "requests_per_sec",
+            "tokens_per_sec",
+        ):
+            row[key] = self.throughput.get(key)
+        for key, value in self.latency.items():
+            row[f"latency_{key}_ms"] = value
+        row["peak_rss_bytes"] = self.memory.get("peak_rss_bytes")
+        row["rss_delta_bytes"] = self.memory.get("rss_delta_bytes")
+        return row
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of a benchmark run across one or more concurrency levels."""
+
+    config: dict[str, Any]
+    levels: list[LevelResult] = field(default_factory=list)
+    started_at: float = field(default_factory=time.time)
+    environment: dict[str, Any] = field(
+        default_factory=lambda: {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        }
+    )
+
+    def get_level(self, concurrency: int) -> LevelResult | None:
+        """
+        Get the result for a concurrency level.
+
+        Args:
+            concurrency: The concurrency level
+
+        Returns:
+            The level result, or None if that level was not run
+
+        """
+        for level in self.levels:
+            if level.concurrency == concurrency:
+                return level
+        return None
+
+    def get_latency_stats(self, concurrency: int | None = None) -> dict[str, Any]:
+        """
+        Get latency statistics in milliseconds.
+
+        Args:
+            concurrency: Level to report (the first level run if None)
+
+        Returns:
+            Dictionary with mean, min, max and p50/p90/p95/p99
+
+        """
+        level = self._select(concurrency)
+        return dict(level.latency) if level else {}
+
+    def get_throughput_stats(self, concurrency: int | None = None) -> dict[str, Any]:
+        """
+        Get throughput statistics.
+
+        Args:
+            concurrency: Level to report (the first level run if None)
+
+        Returns:
+            Dictionary with requests_per_sec, tokens_per_sec and counts
+
+        """
+        level = self._select(concurrency)
+        return dict(level.throughput) if level else {}
+
+    @property
+    def throughput(self) -> float:
+        """Best tokens/second across all concurrency levels."""
+        return max(
+            (level.throughput.get("tokens_per_sec", 0.0) for level in self.levels),
+            default=0.0,
+        )
+
+    @property
+    def peak_rss_bytes(self) -> int | None:
+        """Highest sampled RSS across all concurrency levels."""
+        peaks = [
+            level.memory["peak_rss_bytes"]
+            for level in self.levels
+            if level.memory.get("peak_rss_bytes") is not None
+        ]
+        return max(peaks) if peaks else None
+
+    def _select(self, concurrency: int | None) -> LevelResult | None:
+        """Return the requested level, or the first one."""
+        if concurrency is not None:
+            return self.get_level(concurrency)
+        return self.levels[0] if self.levels else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to a dictionary.
+
+        Returns:
+            Dictionary representation
+
+        """
+        return {
+            "config": dict(self.config),
+            "started_at": self.started_at,
+            "environment": self.environment,
+            "levels": [level.to_dict() for level in self.levels],
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """
+        Serialize the result to JSON.
+
+        Args:
+            indent: JSON indentation
+
+        Returns:
+            The JSON document
+
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_csv(self) -> str:
+        """
+        Serialize the result to CSV with one row per concurrency level.
+
+        Returns:
+            The CSV document
+
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for level in self.levels:
+            row = level.to_row()
+            row["adapter"] = self.config.get("adapter")
+            row["model_id"] = self.config.get("model_id")
+            row["operation"] = self.config.get("operation")
+            writer.writerow(row)
+        return buffer.getvalue()
+
+    def save(self, path: str, output_format: str | None = None) -> Path:
+        """
+        Write the result to a file.
+
+        Args:
+            path: Output file path
+            output_format: "json" or "csv" (inferred from the suffix if None)
+
+        Returns:
+            The path written
+
+        """
+        output = Path(path)
+        fmt = output_format or ("csv" if output.suffix == ".csv" else "json")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        content = self.to_csv() if fmt == "csv" else self.to_json()
+        output.write_text(content, encoding="utf-8")
+        return output
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkResult:
+        """
+        Create a result from its dictionary representation.
+
+        Args:
+            data: Dictionary produced by :meth:`to_dict`
+
+        Returns:
+            The benchmark result
+
+        """
+        return cls(
+            config=data["config"],
+            levels=[
+                LevelResult(
+                    concurrency=level["concurrency"],
+                    latency=level["latency_ms"],
+                    throughput=level["throughput"],
+                    memory=level["memory"],
+                )
+                for level in data["levels"]
+            ],
+            started_at=data.get("started_at", 0.0),
+            environment=data.get("environment", {}),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> BenchmarkResult:
+        """
+        Load a result previously saved as JSON.
+
+        Args:
+            path: Path to the JSON file
+
+        Returns:
+            The benchmark result
+
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def find_regressions(
+    baseline: BenchmarkResult,
+    current: BenchmarkResult,
+    tolerance: float = 0.2,
+    error_tolerance: float = 0.01,
+) -> list[str]:
+    """
+    Compare two results level by level and describe any regressions.
+
+    A regression is a p50/p99 latency more than ``tolerance`` above the
+    baseline, a requests/sec more than ``tolerance`` below it, an error rate
+    more than ``error_tolerance`` above it, or a level in which no request
+    succeeded. Levels that only exist in one result are skipped.
+
+    Args:
+        baseline: The reference result
+        current: The result to check
+        tolerance: Allowed relative latency/throughput change (0.2 means 20%)
+        error_tolerance: Allowed absolute error-rate increase (0.01 means one
+            percentage point)
+
+    Returns:
+        Human-readable descriptions of each regression (empty if none)
+
+    """
+    regressions = []
+    for level in current.levels:
+        base = baseline.get_level(level.concurrency)
+        if base is None:
+            continue
+        requests = level.throughput.get("requests", 0)
+        if requests and level.throughput.get("errors", 0) >= requests:
+            regressions.append(
+                f"concurrency={level.concurrency}: all {requests} requests failed"
+            )
+        before = base.throughput.get("error_rate", 0.0)
+        after = level.throughput.get("error_rate", 0.0)
+        if after > before + error_tolerance:
+            regressions.append(
+                f"concurrency={level.concurrency}: error rate "
+                f"{before:.1%} -> {after:.1%}"
+            )
+        for key in ("p50", "p99"):
+            before, after = base.latency.get(key, 0.0), level.latency.get(key, 0.0)
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(
+                    f"concurrency={level.concurrency}: latency {key} "
+                    f"{before:.2f}ms -> {after:.2f}ms"
+                )
+        before = base.throughput.get("requests_per_sec", 0.0)
+        after = level.throughput.get("requests_per_sec", 0.0)
+        if before > 0 and after < before * (1 - tolerance):
+            regressions.append(
+                f"concurrency={level.concurrency}: requests/sec "
+                f"{before:.2f} -> {after:.2f}"
+            )
+    return regressions
@@ -1,7 +1,199 @@
-"""benchmark_runner - Module for ai_models/benchmarking.benchmark_runner."""
+"""
+benchmark_runner - Module for ai_models/benchmarking.benchmark_runner.
+
+Drive a model adapter with a prompt corpus and collect latency, throughput
+and memory metrics across a concurrency sweep.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import itertools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 # Third-party imports
-
 # Local imports
+from ai_models.adapters.adapter_factory import get_adapter
+
+from .benchmark_config import BenchmarkConfig
+from .benchmark_result import BenchmarkResult, LevelResult
+from .metrics import LatencyMetric, MemoryMetric, ThroughputMetric
+from .utils import count_tokens
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Adapter methods tried, in order, for each operation
+OPERATION_METHODS = {
+    "generate": ("generate_text", "generate", "send_message"),
+    "embed": ("embed", "create_embedding", "get_embeddings"),
+}
+
+
+class UnsupportedAdapterOperationError(TypeError):
+    """Raised when an adapter has no method for the benchmarked operation."""
+
+    MESSAGE_TEMPLATE = "{adapter} has none of the methods {methods} for '{operation}'"
+
+    def __init__(self, adapter: object, operation: str) -> None:
+        """
+        Initialize the UnsupportedAdapterOperationError.
+
+        Args:
+            adapter: The adapter instance
+            operation: The requested operation
+
+        """
+        message = self.MESSAGE_TEMPLATE.format(
+            adapter=type(adapter).__name__,
+            methods=OPERATION_METHODS.get(operation, ()),
+            operation=operation,
+        )
+        super().__init__(message)
+
+
+def resolve_call(
+    adapter: object, operation: str, max_tokens: int
+) -> Callable[[str], Any]:
+    """
+    Build a one-argument callable that runs ``operation`` on ``adapter``.
+
+    Args:
+        adapter: The adapter instance
+        operation: "generate" or "embed"
+        max_tokens: Tokens to request for generation
+
+    Returns:
+        A callable taking a prompt and returning the adapter response
+
+    Raises:
+        UnsupportedAdapterOperationError: If the adapter lacks a suitable method
+
+    """
+    for name in OPERATION_METHODS.get(operation, ()):
+        method = getattr(adapter, name, None)
+        if not callable(method):
+            continue
+        if name == "send_message":
+            return method
+        if operation == "embed":
+            return lambda prompt, m=method: m([prompt])
+        return lambda prompt, m=method: m(prompt, max_tokens=max_tokens)
+    raise UnsupportedAdapterOperationError(adapter, operation)
+
+
+class BenchmarkRunner:
+    """Run a benchmark described by a :class:`BenchmarkConfig`."""
+
+    def __init__(self, config: BenchmarkConfig, adapter: object | None = None) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            config: The benchmark configuration
+            adapter: Adapter instance to benchmark (created from the config's
+                adapter type, host and port if None)
+
+        """
+        self.config = config
+        self.adapter = adapter or get_adapter(
+            config.adapter, config.host, config.port, **config.adapter_options
+        )
+        self._call = resolve_call(self.adapter, config.operation, config.max_tokens)
+
+    def _timed_call(self, prompt: str) -> tuple[float, int, bool]:
+        """Run one request and return (latency seconds, tokens, failed)."""
+        started = time.perf_counter()
+        try:
+            response = self._call(prompt)
+        except Exception:
+            logger.debug("Benchmark request failed", exc_info=True)
+            return time.perf_counter() - started, 0, True
+        return time.perf_counter() - started, count_tokens(response), False
+
+    def run_level(self, concurrency: int) -> LevelResult:
+        """
+        Run the warm-up and timed requests for one concurrency level.
+
+        Args:
+            concurrency: Number of requests kept in flight
+
+        Returns:
+            The metrics for this level
+
+        """
+        config = self.config
+        prompts = itertools.cycle(config.prompts)
+        latency = LatencyMetric()
+        throughput = ThroughputMetric()
+        memory = MemoryMetric(config.memory_sample_interval)
+        metrics = (latency, throughput, memory)
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="benchmark"
+        ) as pool:
+            warmup = [next(prompts) for _ in range(config.warmup_runs)]
+            list(pool.map(self._timed_call, warmup))
+
+            timed = [next(prompts) for _ in range(config.num_runs)]
+            for metric in metrics:
+                metric.start()
+            futures = [pool.submit(self._timed_call, prompt) for prompt in timed]
+            for future in futures:
+                elapsed, tokens, failed = future.result()
+                for metric in metrics:
+                    metric.record(elapsed, tokens, error=failed)
+            for metric in metrics:
+                metric.stop()
+
+        return LevelResult(
+            concurrency=concurrency,
+            latency=latency.compute(),
+            throughput=throughput.compute(),
+            memory=memory.compute(),
+        )
+
+    def run(self) -> BenchmarkResult:
+        """
+        Run every concurrency level and optionally save the result.
+
+        Returns:
+            The benchmark result
+
+        """
+        result = BenchmarkResult(config=self.config.to_dict())
+        for concurrency in self.config.concurrency_levels:
+            level = self.run_level(concurrency)
+            logger.info(
+                "concurrency=%d p50=%.2fms p99=%.2fms %.1f req/s %.1f tok/s",
+                concurrency,
+                level.latency["p50"],
+                level.latency["p99"],
+                level.throughput["requests_per_sec"],
+                level.throughput["tokens_per_sec"],
+            )
+            result.levels.append(level)
+        if self.config.output_path:
+            result.save(self.config.output_path, self.config.output_format)
+        return result
+
+
+def run_benchmark(
+    adapter: object | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> BenchmarkResult:
+    """
+    Run a benchmark with a configuration built from keyword arguments.
+
+    Args:
+        adapter: Adapter instance to benchmark (built from the config if None)
+        **kwargs: :class:`BenchmarkConfig` fields
+
+    Returns:
+        The benchmark result
+
+    """
+    return BenchmarkRunner(BenchmarkConfig(**kwargs), adapter=adapter).run()
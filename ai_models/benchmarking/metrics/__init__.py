@@ -5,3 +5,9 @@
 # Third-party imports
 
 # Local imports
+from .base_metric import BaseMetric
+from .latency_metric import LatencyMetric
+from .memory_metric import MemoryMetric
+from .throughput_metric import ThroughputMetric
+
+__all__ = ["BaseMetric", "LatencyMetric", "MemoryMetric", "ThroughputMetric"]
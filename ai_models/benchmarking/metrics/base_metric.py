@@ -1,7 +1,55 @@
-"""base_metric - Module for ai_models/benchmarking/metrics.base_metric."""
+"""
+base_metric - Module for ai_models/benchmarking/metrics.base_metric.
+
+Base class for benchmark metrics.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from abc import ABC, abstractmethod
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+
+class BaseMetric(ABC):
+    """
+    Base class for metrics collected during one benchmark phase.
+
+    The runner calls :meth:`start` before the timed requests, :meth:`record`
+    once per completed request (from worker threads), :meth:`stop` afterwards
+    and then :meth:`compute`.
+    """
+
+    name = "base"
+
+    def start(self) -> None:  # noqa: B027
+        """Start measuring."""
+
+    def stop(self) -> None:  # noqa: B027
+        """Stop measuring."""
+
+    @abstractmethod
+    def record(self, latency: float, tokens: int, *, error: bool = False) -> None:
+        """
+        Record one completed request.
+
+        Args:
+            latency: Request latency in seconds
+            tokens: Output tokens produced by the request
+            error: Whether the request failed
+
+        """
+
+    @abstractmethod
+    def compute(self) -> dict[str, Any]:
+        """
+        Compute the metric values.
+
+        Returns:
+            Dictionary of metric values
+
+        """
@@ -1,7 +1,64 @@
-"""latency_metric - Module for ai_models/benchmarking/metrics.latency_metric."""
+"""
+latency_metric - Module for ai_models/benchmarking/metrics.latency_metric.
+
+Request latency distribution.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import threading
+from typing import Any
 
 # Third-party imports
-
 # Local imports
+from ai_models.benchmarking.utils import percentile
+
+from .base_metric import BaseMetric
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LatencyMetric(BaseMetric):
+    """Collect successful request latencies and report percentiles in ms."""
+
+    name = "latency"
+
+    def __init__(self) -> None:
+        """Initialize the latency metric."""
+        self._lock = threading.Lock()
+        self.samples: list[float] = []
+
+    def record(self, latency: float, tokens: int, *, error: bool = False) -> None:  # noqa: ARG002
+        """
+        Record one completed request; failed requests are ignored.
+
+        Args:
+            latency: Request latency in seconds
+            tokens: Output tokens produced by the request
+            error: Whether the request failed
+
+        """
+        if error:
+            return
+        with self._lock:
+            self.samples.append(latency * 1000)
+
+    def compute(self) -> dict[str, Any]:
+        """
+        Compute latency statistics in milliseconds.
+
+        Returns:
+            Dictionary with mean, min, max and p50/p90/p95/p99
+
+        """
+        with self._lock:
+            samples = list(self.samples)
+        stats: dict[str, Any] = {
+            "mean": sum(samples) / len(samples) if samples else 0.0,
+            "min": min(samples, default=0.0),
+            "max": max(samples, default=0.0),
+        }
+        for pct in PERCENTILES:
+            stats[f"p{pct}"] = percentile(samples, pct)
+        return stats
@@ -1,7 +1,93 @@
-"""memory_metric - Module for ai_models/benchmarking/metrics.memory_metric."""
+"""
+memory_metric - Module for ai_models/benchmarking/metrics.memory_metric.
+
+Peak resident set size during a benchmark phase.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import threading
+from typing import Any
 
 # Third-party imports
-
 # Local imports
+from ai_models.benchmarking.utils import get_peak_rss_bytes, get_rss_bytes
+
+from .base_metric import BaseMetric
+
+
+class MemoryMetric(BaseMetric):
+    """
+    Sample process RSS on a background thread and keep the peak.
+
+    Sampling catches the peak of the phase itself; the process-lifetime peak
+    from ``getrusage`` is reported alongside it.
+    """
+
+    name = "memory"
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """
+        Initialize the memory metric.
+
+        Args:
+            interval: Seconds between RSS samples
+
+        """
+        self.interval = interval
+        self.start_rss: int | None = None
+        self.peak_rss: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        """Take one RSS sample and update the peak."""
+        rss = get_rss_bytes()
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+    def _loop(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        """Start the sampler thread."""
+        self.start_rss = get_rss_bytes()
+        self.peak_rss = self.start_rss
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="benchmark-rss-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampler thread and take a final sample."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+
+    def record(self, latency: float, tokens: int, *, error: bool = False) -> None:
+        """Memory is sampled independently of requests."""
+
+    def compute(self) -> dict[str, Any]:
+        """
+        Compute memory statistics.
+
+        Returns:
+            Dictionary with start_rss_bytes, peak_rss_bytes, rss_delta_bytes
+            and process_peak_rss_bytes (None where unavailable)
+
+        """
+        delta = None
+        if self.start_rss is not None and self.peak_rss is not None:
+            delta = self.peak_rss - self.start_rss
+        return {
+            "start_rss_bytes": self.start_rss,
+            "peak_rss_bytes": self.peak_rss,
+            "rss_delta_bytes": delta,
+            "process_peak_rss_bytes": get_peak_rss_bytes(),
+        }
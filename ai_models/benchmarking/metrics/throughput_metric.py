@@ -1,7 +1,78 @@
-"""throughput_metric - Module for ai_models/benchmarking/metrics.throughput_metric."""
+"""
+throughput_metric - Module for ai_models/benchmarking/metrics.throughput_metric.
+
+Request and token throughput over a benchmark phase.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import threading
+import time
+from typing import Any
 
 # Third-party imports
-
 # Local imports
+from .base_metric import BaseMetric
+
+
+class ThroughputMetric(BaseMetric):
+    """Count requests, errors and tokens over wall-clock time."""
+
+    name = "throughput"
+
+    def __init__(self) -> None:
+        """Initialize the throughput metric."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.tokens = 0
+        self._started = 0.0
+        self._elapsed = 0.0
+
+    def start(self) -> None:
+        """Start the wall clock."""
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop the wall clock."""
+        self._elapsed = time.perf_counter() - self._started
+
+    def record(self, latency: float, tokens: int, *, error: bool = False) -> None:  # noqa: ARG002
+        """
+        Record one completed request.
+
+        Args:
+            latency: Request latency in seconds
+            tokens: Output tokens produced by the request
+            error: Whether the request failed
+
+        """
+        with self._lock:
+            self.requests += 1
+            if error:
+                self.errors += 1
+            else:
+                self.tokens += tokens
+
+    def compute(self) -> dict[str, Any]:
+        """
+        Compute throughput over the elapsed wall-clock time.
+
+        Returns:
+            Dictionary with requests, errors, tokens, duration_s,
+            requests_per_sec, tokens_per_sec and error_rate
+
+        """
+        elapsed = self._elapsed or (time.perf_counter() - self._started)
+        with self._lock:
+            requests, errors, tokens = self.requests, self.errors, self.tokens
+        return {
+            "requests": requests,
+            "errors": errors,
+            "tokens": tokens,
+            "duration_s": elapsed,
+            "requests_per_sec": requests / elapsed if elapsed > 0 else 0.0,
+            "tokens_per_sec": tokens / elapsed if elapsed > 0 else 0.0,
+            "error_rate": errors / requests if requests else 0.0,
+        }
@@ -1,7 +1,119 @@
-"""utils - Module for ai_models/benchmarking.utils."""
+"""
+utils - Module for ai_models/benchmarking.utils.
+
+Helpers shared by benchmark metrics.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Any, Sequence
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 # Third-party imports
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Local imports
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Compute a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: The samples (need not be sorted)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The percentile, or 0.0 for no samples
+
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(ordered[low])
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def count_tokens(response: Any) -> int:  # noqa: ANN401, PLR0911
+    """
+    Count the tokens produced by an adapter response.
+
+    Uses OpenAI-style ``usage.completion_tokens`` when present and falls back
+    to a whitespace split of the response text. Embedding responses count one
+    token per input vector.
+
+    Args:
+        response: The adapter response
+
+    Returns:
+        Number of output tokens
+
+    """
+    if isinstance(response, dict):
+        usage = response.get("usage") or {}
+        if "completion_tokens" in usage:
+            return int(usage["completion_tokens"])
+        for key in ("text", "response", "content"):
+            if isinstance(response.get(key), str):
+                return len(response[key].split())
+        choices = response.get("choices")
+        if choices:
+            first = choices[0]
+            text = first.get("text") or first.get("message", {}).get("content", "")
+            return len(text.split())
+        return 0
+    if isinstance(response, str):
+        return len(response.split())
+    if isinstance(response, (list, tuple)):
+        return len(response)
+    return 0
+
+
+def get_rss_bytes() -> int | None:
+    """
+    Return the current resident set size of this process.
+
+    Uses psutil when installed, then ``/proc/self/statm`` on Linux.
+
+    Returns:
+        RSS in bytes, or None if it cannot be determined
+
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with Path("/proc/self/statm").open(encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def get_peak_rss_bytes() -> int | None:
+    """
+    Return the peak resident set size of this process so far.
+
+    Returns:
+        Peak RSS in bytes, or None on platforms without ``resource``
+
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -5,3 +5,41 @@
 # Third-party imports
 
 # Local imports
+from .cache_backends import (
+    CacheBackend,
+    CacheStats,
+    DiskCache,
+    MemoryCache,
+    RedisCache,
+    SQLiteCache,
+)
+from .cache_config import CacheConfig, CacheConfigError
+from .cache_integration import (
+    CoalescingCache,
+    cache_model_call,
+    cached_embed_batch,
+    get_coalescing_cache,
+)
+from .cache_key import generate_cache_key, is_deterministic
+from .cache_manager import CacheManager
+from .single_flight import AsyncSingleFlight, SingleFlight
+
+__all__ = [
+    "AsyncSingleFlight",
+    "CacheBackend",
+    "CacheConfig",
+    "CacheConfigError",
+    "CacheManager",
+    "CacheStats",
+    "CoalescingCache",
+    "DiskCache",
+    "MemoryCache",
+    "RedisCache",
+    "SQLiteCache",
+    "SingleFlight",
+    "cache_model_call",
+    "cached_embed_batch",
+    "generate_cache_key",
+    "get_coalescing_cache",
+    "is_deterministic",
+]
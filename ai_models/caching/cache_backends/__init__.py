@@ -5,3 +5,27 @@
 # Third-party imports
 
 # Local imports
+from .base import (
+    CacheBackend,
+    CacheEncodingError,
+    CacheStats,
+    decode_value,
+    encode_value,
+)
+from .disk_cache import DiskCache
+from .memory_cache import MemoryCache
+from .redis_cache import RedisCache, RedisNotAvailableError
+from .sqlite_cache import SQLiteCache
+
+__all__ = [
+    "CacheBackend",
+    "CacheEncodingError",
+    "CacheStats",
+    "DiskCache",
+    "MemoryCache",
+    "RedisCache",
+    "RedisNotAvailableError",
+    "SQLiteCache",
+    "decode_value",
+    "encode_value",
+]
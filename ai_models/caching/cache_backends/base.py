@@ -1,7 +1,358 @@
-"""base - Module for ai_models/caching/cache_backends.base."""
+"""
+base - Module for ai_models/caching/cache_backends.base.
+
+Shared pieces for cache backends: the abstract backend interface, per-tier
+statistics and the compact value encoding used by every tier.
+
+Values are stored as bytes. Float vectors and matrices (embeddings) are packed
+as raw IEEE-754 arrays, which is several times smaller than JSON and avoids
+float parsing on every hit; everything else is stored as UTF-8 JSON.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 # Third-party imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Local imports
+
+# Encoding tags (first byte of every stored value)
+TAG_JSON = b"J"
+TAG_VECTOR = b"V"
+TAG_MATRIX = b"M"
+TAG_NDARRAY = b"N"
+TAG_BYTES = b"B"
+
+_MATRIX_HEADER = struct.Struct("<cII")
+_NDARRAY_HEADER = struct.Struct("<H")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+# Callback invoked with (key, value, expires_at) when a backend evicts an entry
+EvictionCallback = Callable[[str, bytes, Optional[float]], None]
+
+
+class CacheEncodingError(TypeError):
+    """Raised when a value cannot be encoded for the cache."""
+
+    MESSAGE_TEMPLATE = "Cannot encode value of type {type_name} for caching"
+
+    def __init__(self, type_name: str) -> None:
+        """
+        Initialize the CacheEncodingError.
+
+        Args:
+            type_name: Name of the type that could not be encoded
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(type_name=type_name))
+
+
+def _is_float_vector(value: Any) -> bool:  # noqa: ANN401
+    """Return True if value is a non-empty list/tuple of Python floats."""
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and all(type(v) is float for v in value)
+    )
+
+
+def _pack_floats(values: Any, typecode: str) -> bytes:  # noqa: ANN401
+    """Pack floats into little-endian bytes using the given array typecode."""
+    arr = array(typecode, values)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _unpack_floats(data: bytes | memoryview, typecode: str) -> array:
+    """Unpack little-endian bytes into an array of the given typecode."""
+    arr = array(typecode)
+    arr.frombytes(data)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr
+
+
+def encode_value(value: Any, vector_dtype: str = "d") -> bytes:  # noqa: ANN401
+    """
+    Encode a value into the compact cache representation.
+
+    Args:
+        value: The value to encode
+        vector_dtype: Array typecode for float vectors ("d" is lossless, "f" halves
+            the size at float32 precision)
+
+    Returns:
+        The encoded bytes
+
+    Raises:
+        CacheEncodingError: If the value is not JSON-serializable and not a vector,
+            or is an ndarray of Python objects
+
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return TAG_BYTES + bytes(value)
+    if np is not None and isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            # The buffer of an object array holds pointers, not the objects
+            type_name = f"ndarray of dtype {value.dtype}"
+            raise CacheEncodingError(type_name)
+        arr = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<"))
+        header = json.dumps(
+            {"dtype": arr.dtype.str, "shape": list(arr.shape)}, separators=(",", ":")
+        ).encode("ascii")
+        return TAG_NDARRAY + _NDARRAY_HEADER.pack(len(header)) + header + arr.tobytes()
+    if _is_float_vector(value):
+        return (
+            TAG_VECTOR
+            + vector_dtype.encode("ascii")
+            + _pack_floats(value, vector_dtype)
+        )
+    if (
+        isinstance(value, (list, tuple))
+        and value
+        and _is_float_vector(value[0])
+        and all(_is_float_vector(row) and len(row) == len(value[0]) for row in value)
+    ):
+        header = _MATRIX_HEADER.pack(
+            vector_dtype.encode("ascii"), len(value), len(value[0])
+        )
+        flat = [v for row in value for v in row]
+        return TAG_MATRIX + header + _pack_floats(flat, vector_dtype)
+    try:
+        payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        raise CacheEncodingError(type(value).__name__) from e
+    return TAG_JSON + payload.encode("utf-8")
+
+
+def decode_value(data: bytes) -> Any:  # noqa: ANN401
+    """
+    Decode a value produced by :func:`encode_value`.
+
+    Args:
+        data: The encoded bytes
+
+    Returns:
+        The decoded value (vectors and matrices decode to lists of floats)
+
+    Raises:
+        ValueError: If the data has an unknown tag
+
+    """
+    tag, body = data[:1], memoryview(data)[1:]
+    if tag == TAG_JSON:
+        return json.loads(bytes(body).decode("utf-8"))
+    if tag == TAG_VECTOR:
+        typecode = chr(body[0])
+        return _unpack_floats(body[1:], typecode).tolist()
+    if tag == TAG_MATRIX:
+        typecode_byte, rows, cols = _MATRIX_HEADER.unpack_from(body)
+        flat = _unpack_floats(body[_MATRIX_HEADER.size :], typecode_byte.decode())
+        return [flat[i * cols : (i + 1) * cols].tolist() for i in range(rows)]
+    if tag == TAG_NDARRAY:
+        if np is None:
+            error_msg = "numpy is required to decode cached ndarray values"
+            raise ValueError(error_msg)
+        (header_len,) = _NDARRAY_HEADER.unpack_from(body)
+        start = _NDARRAY_HEADER.size
+        header = json.loads(bytes(body[start : start + header_len]))
+        raw = bytes(body[start + header_len :])
+        return np.frombuffer(raw, dtype=np.dtype(header["dtype"])).reshape(
+            header["shape"]
+        )
+    if tag == TAG_BYTES:
+        return bytes(body)
+    error_msg = f"Unknown cache value tag: {tag!r}"
+    raise ValueError(error_msg)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss/byte counters for a single cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    deletes: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "deletes": self.deletes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Abstract base class for cache tiers.
+
+    Backends store encoded ``bytes`` values with an optional absolute expiry
+    time (``time.time()`` seconds). Each backend is bounded by entry count and
+    encoded bytes and evicts least-recently-used entries when either bound is
+    exceeded. Evicted entries are passed to the eviction callback so a
+    higher tier can demote them to a lower one.
+    """
+
+    name = "base"
+
+    def __init__(self, max_entries: int, max_bytes: int | None = None) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of entries to keep
+            max_bytes: Maximum total encoded bytes to keep (None for no limit)
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        self._on_evict: EvictionCallback | None = None
+
+    def set_eviction_callback(self, callback: EvictionCallback | None) -> None:
+        """
+        Set the callback invoked for entries evicted by size bounds.
+
+        Expired entries are dropped without invoking the callback.
+
+        Args:
+            callback: Function called with (key, value, expires_at), or None
+
+        """
+        self._on_evict = callback
+
+    def _over_limit(self, entries: int, size: int) -> bool:
+        """Return True if the given totals exceed this backend's bounds."""
+        if entries > self.max_entries:
+            return True
+        return self.max_bytes is not None and size > self.max_bytes
+
+    def _notify_evicted(self, evicted: list[tuple[str, bytes, float | None]]) -> None:
+        """Invoke the eviction callback outside of the backend lock."""
+        if self._on_evict is None:
+            return
+        for key, value, expires_at in evicted:
+            self._on_evict(key, value, expires_at)
+
+    @staticmethod
+    def _is_expired(expires_at: float | None, now: float | None = None) -> bool:
+        """Return True if an expiry time has passed."""
+        if expires_at is None:
+            return False
+        return (now if now is not None else time.time()) >= expires_at
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a value and mark it as recently used.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The encoded value, or None on a miss or expired entry
+
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    @abstractmethod
+    def get_entry(self, key: str) -> tuple[bytes, float | None] | None:
+        """
+        Get a value together with its absolute expiry time.
+
+        Marks the entry as recently used and updates hit/miss statistics.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A (value, expires_at) tuple, or None on a miss or expired entry
+
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, expires_at: float | None = None) -> None:
+        """
+        Store a value, evicting least-recently-used entries if needed.
+
+        Args:
+            key: The cache key
+            value: The encoded value
+            expires_at: Absolute expiry time in ``time.time()`` seconds, or None
+
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            True if the key was present
+
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if the key is present, without updating statistics."""
+        with self._lock:
+            hits, misses = self.stats.hits, self.stats.misses
+            found = self.get_entry(key) is not None
+            self.stats.hits, self.stats.misses = hits, misses
+            return found
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return this tier's statistics."""
+        with self._lock:
+            stats = self.stats.to_dict()
+        stats["backend"] = self.name
+        stats["max_entries"] = self.max_entries
+        stats["max_bytes"] = self.max_bytes
+        return stats
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend."""
@@ -1,7 +1,233 @@
-"""disk_cache - Module for ai_models/caching/cache_backends.disk_cache."""
+"""
+disk_cache - Module for ai_models/caching/cache_backends.disk_cache.
+
+File-per-entry persistent cache tier.
+
+Each entry is stored as ``<cache_dir>/<key[:2]>/<key>.bin`` with an 8-byte
+expiry header followed by the encoded value. An in-memory LRU index of
+``key -> size`` is rebuilt from file modification times on startup (hits
+touch the file), so lookups and eviction never need to list the directory.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import contextlib
+import logging
+import math
+import os
+import re
+import struct
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
 
 # Third-party imports
-
 # Local imports
+from .base import CacheBackend
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Header: absolute expiry time as a little-endian double (NaN means no expiry)
+_HEADER = struct.Struct("<d")
+_FILE_SUFFIX = ".bin"
+_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_-]{3,128}$")
+
+
+class InvalidCacheKeyError(ValueError):
+    """Raised when a key cannot be used as a cache file name."""
+
+    MESSAGE = "Disk cache keys must be 3-128 characters of [A-Za-z0-9_-]"
+
+    def __init__(self) -> None:
+        """Initialize the error with a standard message."""
+        super().__init__(self.MESSAGE)
+
+
+class DiskCache(CacheBackend):
+    """Persistent LRU cache tier storing one file per entry."""
+
+    name = "disk"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_entries: int = 100_000,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory to store cache files in
+            max_entries: Maximum number of entries to keep
+            max_bytes: Maximum total encoded bytes to keep (None for no limit)
+
+        """
+        super().__init__(max_entries, max_bytes)
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._load_index()
+
+    def get_entry(self, key: str) -> tuple[bytes, float | None] | None:
+        """
+        Get a value together with its absolute expiry time.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A (value, expires_at) tuple, or None on a miss or expired entry
+
+        """
+        with self._lock:
+            if key not in self._index:
+                self.stats.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+            except OSError:
+                # File removed behind our back; drop it from the index
+                self._forget(key)
+                self.stats.misses += 1
+                return None
+            (expiry,) = _HEADER.unpack_from(data)
+            expires_at = None if math.isnan(expiry) else expiry
+            if self._is_expired(expires_at):
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._index.move_to_end(key)
+            with contextlib.suppress(OSError):
+                os.utime(path)
+            self.stats.hits += 1
+            return data[_HEADER.size :], expires_at
+
+    def set(self, key: str, value: bytes, expires_at: float | None = None) -> None:
+        """
+        Store a value, evicting least-recently-used entries if needed.
+
+        The file is written to a temporary name and atomically renamed, so a
+        crash never leaves a truncated entry behind.
+
+        Args:
+            key: The cache key
+            value: The encoded value
+            expires_at: Absolute expiry time in ``time.time()`` seconds, or None
+
+        Raises:
+            InvalidCacheKeyError: If the key is not a safe file name
+
+        """
+        if not _KEY_PATTERN.match(key):
+            raise InvalidCacheKeyError
+        evicted: list[tuple[str, bytes, float | None]] = []
+        header = _HEADER.pack(float("nan") if expires_at is None else expires_at)
+        with self._lock:
+            path = self._path(key)
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(header)
+                    f.write(value)
+                Path(tmp_name).replace(path)
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+                logger.exception("Failed to write disk cache entry")
+                raise
+            self._forget(key)
+            self._index[key] = len(value)
+            self.stats.bytes += len(value)
+            self.stats.entries = len(self._index)
+            self.stats.sets += 1
+            while len(self._index) > 1 and self._over_limit(
+                len(self._index), self.stats.bytes
+            ):
+                old_key = next(iter(self._index))
+                entry = self._read_for_eviction(old_key)
+                self._remove(old_key)
+                self.stats.evictions += 1
+                if entry is not None and not self._is_expired(entry[1]):
+                    evicted.append((old_key, entry[0], entry[1]))
+        self._notify_evicted(evicted)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            True if the key was present
+
+        """
+        with self._lock:
+            if key not in self._index:
+                return False
+            self._remove(key)
+            self.stats.deletes += 1
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            return len(self._index)
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for a key."""
+        return self.cache_dir / key[:2] / f"{key}{_FILE_SUFFIX}"
+
+    def _forget(self, key: str) -> None:
+        """Drop a key from the index without touching the file."""
+        size = self._index.pop(key, None)
+        if size is not None:
+            self.stats.bytes -= size
+            self.stats.entries = len(self._index)
+
+    def _remove(self, key: str) -> None:
+        """Remove a key from the index and delete its file."""
+        self._forget(key)
+        try:
+            self._path(key).unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Failed to delete disk cache file", exc_info=True)
+
+    def _read_for_eviction(self, key: str) -> tuple[bytes, float | None] | None:
+        """Read an entry being evicted so it can be handed to the eviction callback."""
+        if self._on_evict is None:
+            return None
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+        (expiry,) = _HEADER.unpack_from(data)
+        return data[_HEADER.size :], (None if math.isnan(expiry) else expiry)
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from the files on disk, oldest access first."""
+        found: list[tuple[float, str, int]] = []
+        for path in self.cache_dir.glob(f"*/*{_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            size = stat.st_size - _HEADER.size
+            if size < 0:
+                continue
+            found.append((stat.st_mtime, path.stem, size))
+        for _, key, size in sorted(found):
+            self._index[key] = size
+            self.stats.bytes += size
+        self.stats.entries = len(self._index)
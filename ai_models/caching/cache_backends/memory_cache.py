@@ -1,7 +1,155 @@
-"""memory_cache - Module for ai_models/caching/cache_backends.memory_cache."""
+"""
+memory_cache - Module for ai_models/caching/cache_backends.memory_cache.
+
+In-process LRU cache tier.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from collections import OrderedDict
 
 # Third-party imports
-
 # Local imports
+from .base import CacheBackend
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process LRU cache bounded by entry count and bytes."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int | None = None) -> None:
+        """
+        Initialize the memory cache.
+
+        Args:
+            max_entries: Maximum number of entries to keep
+            max_bytes: Maximum total encoded bytes to keep (None for no limit)
+
+        """
+        super().__init__(max_entries, max_bytes)
+        self._data: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+
+    def get_entry(self, key: str) -> tuple[bytes, float | None] | None:
+        """
+        Get a value together with its absolute expiry time.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A (value, expires_at) tuple, or None on a miss or expired entry
+
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if self._is_expired(entry[1]):
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def set(self, key: str, value: bytes, expires_at: float | None = None) -> None:
+        """
+        Store a value, evicting least-recently-used entries if needed.
+
+        Args:
+            key: The cache key
+            value: The encoded value
+            expires_at: Absolute expiry time in ``time.time()`` seconds, or None
+
+        """
+        evicted: list[tuple[str, bytes, float | None]] = []
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, expires_at)
+            self.stats.bytes += len(value)
+            self.stats.entries = len(self._data)
+            self.stats.sets += 1
+            # Never evict the entry that was just written, even if it alone is
+            # larger than max_bytes.
+            while len(self._data) > 1 and self._over_limit(
+                len(self._data), self.stats.bytes
+            ):
+                old_key, (old_value, old_expires) = next(iter(self._data.items()))
+                self._remove(old_key)
+                self.stats.evictions += 1
+                if not self._is_expired(old_expires):
+                    evicted.append((old_key, old_value, old_expires))
+        self._notify_evicted(evicted)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            True if the key was present
+
+        """
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._remove(key)
+            self.stats.deletes += 1
+            return True
+
+    def pop_entry(self, key: str) -> tuple[bytes, float | None] | None:
+        """
+        Remove and return an entry without updating hit/miss statistics.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The (value, expires_at) tuple, or None if absent
+
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._remove(key)
+            return entry
+
+    def items(self) -> list[tuple[str, bytes, float | None]]:
+        """
+        Return a snapshot of all unexpired entries, least recently used first.
+
+        Returns:
+            A list of (key, value, expires_at) tuples
+
+        """
+        with self._lock:
+            return [
+                (key, value, expires_at)
+                for key, (value, expires_at) in self._data.items()
+                if not self._is_expired(expires_at)
+            ]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            return len(self._data)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and update size counters; caller holds the lock."""
+        value, _ = self._data.pop(key)
+        self.stats.bytes -= len(value)
+        self.stats.entries = len(self._data)
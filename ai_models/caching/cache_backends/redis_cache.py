@@ -1,7 +1,156 @@
-"""redis_cache - Module for ai_models/caching/cache_backends.redis_cache."""
+"""
+redis_cache - Module for ai_models/caching/cache_backends.redis_cache.
+
+Redis-backed shared cache tier.
+
+Size bounds are enforced by the Redis server itself; configure
+``maxmemory`` with ``maxmemory-policy allkeys-lru`` on the instance. Entry
+and byte counters here track only this process's writes.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+import math
+import time
+from typing import Any
 
 # Third-party imports
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # Local imports
+from .base import CacheBackend
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class RedisNotAvailableError(ImportError):
+    """Raised when the redis package is not installed."""
+
+    MESSAGE = "redis is not installed. Please install it with `uv pip install redis`."
+
+    def __init__(self) -> None:
+        """Initialize the error with a standard message."""
+        super().__init__(self.MESSAGE)
+
+
+class RedisCache(CacheBackend):
+    """Cache tier stored in Redis, shared between processes and hosts."""
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "ai_models:cache:",
+        max_entries: int = 100_000,
+        max_bytes: int | None = None,
+        client: Any | None = None,  # noqa: ANN401
+    ) -> None:
+        """
+        Initialize the Redis cache.
+
+        Args:
+            url: Redis connection URL
+            prefix: Prefix applied to every key
+            max_entries: Informational entry bound (Redis enforces eviction)
+            max_bytes: Informational byte bound (Redis enforces eviction)
+            client: Pre-configured Redis client to use instead of ``url``
+
+        Raises:
+            RedisNotAvailableError: If no client is given and redis is not installed
+
+        """
+        super().__init__(max_entries, max_bytes)
+        if client is None:
+            if redis is None:
+                raise RedisNotAvailableError
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self.prefix = prefix
+
+    def get_entry(self, key: str) -> tuple[bytes, float | None] | None:
+        """
+        Get a value together with its absolute expiry time.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A (value, expires_at) tuple, or None on a miss
+
+        """
+        pipe = self._client.pipeline()
+        pipe.get(self.prefix + key)
+        pipe.pttl(self.prefix + key)
+        value, pttl = pipe.execute()
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        expires_at = time.time() + pttl / 1000 if pttl and pttl > 0 else None
+        return bytes(value), expires_at
+
+    def set(self, key: str, value: bytes, expires_at: float | None = None) -> None:
+        """
+        Store a value with an optional expiry.
+
+        Args:
+            key: The cache key
+            value: The encoded value
+            expires_at: Absolute expiry time in ``time.time()`` seconds, or None
+
+        """
+        if expires_at is None:
+            self._client.set(self.prefix + key, value)
+        else:
+            ttl_ms = math.ceil((expires_at - time.time()) * 1000)
+            if ttl_ms <= 0:
+                return
+            self._client.set(self.prefix + key, value, px=ttl_ms)
+        with self._lock:
+            self.stats.sets += 1
+            self.stats.bytes += len(value)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            True if the key was present
+
+        """
+        deleted = bool(self._client.delete(self.prefix + key))
+        if deleted:
+            with self._lock:
+                self.stats.deletes += 1
+        return deleted
+
+    def clear(self) -> None:
+        """Remove all entries under this cache's prefix."""
+        for redis_key in self._client.scan_iter(match=f"{self.prefix}*", count=500):
+            self._client.delete(redis_key)
+        with self._lock:
+            self.stats.bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries under this cache's prefix."""
+        return sum(
+            1 for _ in self._client.scan_iter(match=f"{self.prefix}*", count=500)
+        )
+
+    def close(self) -> None:
+        """Close the Redis connection pool."""
+        try:
+            self._client.close()
+        except Exception:
+            logger.exception("Error closing Redis connection")
@@ -1,7 +1,234 @@
-"""sqlite_cache - Module for ai_models/caching/cache_backends.sqlite_cache."""
+"""
+sqlite_cache - Module for ai_models/caching/cache_backends.sqlite_cache.
+
+SQLite-backed persistent cache tier.
+
+Values are stored as BLOBs in a single table with an index on last access
+time, so finding eviction candidates is an index scan rather than a sort of
+the whole table. Running
+entry and byte totals are kept in memory to avoid ``COUNT``/``SUM`` queries on
+every write.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+import sqlite3
+import time
+from pathlib import Path
 
 # Third-party imports
-
 # Local imports
+from .base import CacheBackend
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_last_access
+    ON cache_entries (last_access);
+"""
+
+# Number of least-recently-used rows fetched per eviction round
+_EVICTION_BATCH = 64
+
+
+class SQLiteCache(CacheBackend):
+    """Persistent LRU cache tier stored in a SQLite database file."""
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        max_entries: int = 100_000,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize the SQLite cache.
+
+        Args:
+            db_path: Path to the database file (":memory:" for a private in-memory DB)
+            max_entries: Maximum number of entries to keep
+            max_bytes: Maximum total encoded bytes to keep (None for no limit)
+
+        """
+        super().__init__(max_entries, max_bytes)
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._purge_expired()
+        self._reload_totals()
+
+    def get_entry(self, key: str) -> tuple[bytes, float | None] | None:
+        """
+        Get a value together with its absolute expiry time.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A (value, expires_at) tuple, or None on a miss or expired entry
+
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = bytes(row[0]), row[1]
+            if self._is_expired(expires_at):
+                self._delete_row(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self.stats.hits += 1
+            return value, expires_at
+
+    def set(self, key: str, value: bytes, expires_at: float | None = None) -> None:
+        """
+        Store a value, evicting least-recently-used entries if needed.
+
+        Args:
+            key: The cache key
+            value: The encoded value
+            expires_at: Absolute expiry time in ``time.time()`` seconds, or None
+
+        """
+        evicted: list[tuple[str, bytes, float | None]] = []
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete_row(key)
+                self._conn.execute(
+                    "INSERT INTO cache_entries (key, value, size, expires_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, sqlite3.Binary(value), len(value), expires_at, time.time()),
+                )
+                self.stats.entries += 1
+                self.stats.bytes += len(value)
+                self.stats.sets += 1
+                evicted = self._evict(protect=key)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                self._reload_totals()
+                logger.exception("Failed to write SQLite cache entry")
+                raise
+        self._notify_evicted(evicted)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            True if the key was present
+
+        """
+        with self._lock:
+            deleted = self._delete_row(key)
+            if deleted:
+                self.stats.deletes += 1
+            return deleted
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            return self.stats.entries
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _delete_row(self, key: str) -> bool:
+        """Delete a row and update totals; caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT size FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False
+        self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        self.stats.entries -= 1
+        self.stats.bytes -= int(row[0])
+        return True
+
+    def _evict(self, protect: str) -> list[tuple[str, bytes, float | None]]:
+        """
+        Evict least-recently-used rows until the bounds are satisfied.
+
+        Args:
+            protect: Key that must not be evicted (the entry just written)
+
+        Returns:
+            The evicted, unexpired entries
+
+        """
+        evicted: list[tuple[str, bytes, float | None]] = []
+        now = time.time()
+        while self.stats.entries > 1 and self._over_limit(
+            self.stats.entries, self.stats.bytes
+        ):
+            rows = self._conn.execute(
+                "SELECT key, value, size, expires_at FROM cache_entries"
+                " WHERE key != ? ORDER BY last_access LIMIT ?",
+                (protect, _EVICTION_BATCH),
+            ).fetchall()
+            if not rows:
+                break
+            for key, value, size, expires_at in rows:
+                if not self._over_limit(self.stats.entries, self.stats.bytes):
+                    break
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self.stats.entries -= 1
+                self.stats.bytes -= int(size)
+                self.stats.evictions += 1
+                if not self._is_expired(expires_at, now):
+                    evicted.append((key, bytes(value), expires_at))
+        return evicted
+
+    def _purge_expired(self) -> None:
+        """Delete all expired rows."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            self.stats.expirations += max(cursor.rowcount, 0)
+
+    def _reload_totals(self) -> None:
+        """Recompute entry and byte totals from the database."""
+        row = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        self.stats.entries, self.stats.bytes = int(row[0]), int(row[1])
@@ -1,7 +1,142 @@
-"""cache_config - Module for ai_models/caching.cache_config."""
+"""
+cache_config - Module for ai_models/caching.cache_config.
+
+Configuration for the model response cache.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from dataclasses import dataclass, field
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+# Constants
+SUPPORTED_BACKENDS = ("memory", "disk", "sqlite", "redis")
+SUPPORTED_EVICTION_POLICIES = ("lru",)
+SUPPORTED_VECTOR_DTYPES = ("f", "d")
+
+
+class CacheConfigError(ValueError):
+    """Raised when a cache configuration value is invalid."""
+
+    MESSAGE_TEMPLATE = "Invalid cache configuration: {detail}"
+
+    def __init__(self, detail: str) -> None:
+        """
+        Initialize the CacheConfigError.
+
+        Args:
+            detail: Description of the invalid value
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(detail=detail))
+
+
+@dataclass
+class CacheConfig:
+    """
+    Configuration for the tiered model response cache.
+
+    The first tier is always an in-process LRU. ``backend`` selects the second
+    tier that entries are demoted to when they fall out of memory; use
+    ``"memory"`` to run with a single in-process tier.
+
+    Attributes:
+        enabled: Whether caching is enabled at all
+        backend: Second-tier backend ("memory", "disk", "sqlite" or "redis")
+        ttl: Default time-to-live in seconds (None for no expiry)
+        max_size: Maximum number of entries in the memory tier
+        max_bytes: Maximum encoded bytes in the memory tier (None for no limit)
+        eviction_policy: Eviction policy for all tiers (only "lru" is supported)
+        cache_dir: Directory used by the disk and SQLite backends
+        backend_max_size: Maximum number of entries in the second tier
+        backend_max_bytes: Maximum encoded bytes in the second tier
+        write_through: Also write new entries to the second tier immediately
+        deterministic_only: Only cache calls whose parameters are deterministic
+        vector_dtype: Array typecode used to store float vectors ("f" or "d")
+        models: Model IDs to cache (empty for all models)
+        operations: Operations to cache (empty for all operations)
+        backend_options: Extra keyword arguments for the second-tier backend
+
+    """
+
+    enabled: bool = True
+    backend: str = "memory"
+    ttl: float | None = 3600
+    max_size: int = 1000
+    max_bytes: int | None = 256 * 1024 * 1024
+    eviction_policy: str = "lru"
+    cache_dir: str = ".cache/ai_models"
+    backend_max_size: int = 100_000
+    backend_max_bytes: int | None = 2 * 1024 * 1024 * 1024
+    write_through: bool = False
+    deterministic_only: bool = True
+    vector_dtype: str = "d"
+    models: list[str] = field(default_factory=list)
+    operations: list[str] = field(default_factory=list)
+    backend_options: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the configuration.
+
+        Raises:
+            CacheConfigError: If a value is out of range or unsupported
+
+        """
+        self.backend = self.backend.lower()
+        detail = None
+        if self.backend not in SUPPORTED_BACKENDS:
+            detail = f"unsupported backend '{self.backend}'"
+        elif self.eviction_policy not in SUPPORTED_EVICTION_POLICIES:
+            detail = f"unsupported eviction policy '{self.eviction_policy}'"
+        elif self.vector_dtype not in SUPPORTED_VECTOR_DTYPES:
+            detail = f"unsupported vector dtype '{self.vector_dtype}'"
+        elif self.max_size < 1 or self.backend_max_size < 1:
+            detail = "max_size values must be at least 1"
+        elif self.ttl is not None and self.ttl <= 0:
+            detail = "ttl must be positive or None"
+        if detail is not None:
+            raise CacheConfigError(detail)
+
+    def should_cache(self, model_id: str, operation: str) -> bool:
+        """
+        Check whether calls for a model and operation should be cached.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name (e.g. "embed", "generate")
+
+        Returns:
+            True if the call passes the enabled flag and the model/operation filters
+
+        """
+        if not self.enabled:
+            return False
+        if self.models and model_id not in self.models:
+            return False
+        return not (self.operations and operation not in self.operations)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the configuration as a dictionary."""
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend,
+            "ttl": self.ttl,
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+            "eviction_policy": self.eviction_policy,
+            "cache_dir": self.cache_dir,
+            "backend_max_size": self.backend_max_size,
+            "backend_max_bytes": self.backend_max_bytes,
+            "write_through": self.write_through,
+            "deterministic_only": self.deterministic_only,
+            "vector_dtype": self.vector_dtype,
+            "models": list(self.models),
+            "operations": list(self.operations),
+            "backend_options": dict(self.backend_options),
+        }
@@ -1,7 +1,354 @@
-"""cache_integration - Module for ai_models/caching.cache_integration."""
+"""
+cache_integration - Module for ai_models/caching.cache_integration.
+
+Helpers for putting a :class:`CacheManager` in front of model calls.
+
+:class:`CoalescingCache` adds request coalescing on top of the cache: when
+many callers miss on the same key at once, one of them runs the model call
+and the rest wait for its result instead of hitting the backend themselves.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import asyncio
+import functools
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar, Union
 
 # Third-party imports
-
 # Local imports
+from .cache_key import generate_cache_key
+from .cache_manager import CACHE_MISS, CacheManager
+from .single_flight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+EMBED_OPERATION = "embed"
+
+_coalescing_caches: weakref.WeakKeyDictionary[CacheManager, CoalescingCache] = (
+    weakref.WeakKeyDictionary()
+)
+_coalescing_lock = threading.Lock()
+
+
+class CoalescingCache:
+    """
+    Cache front-end that coalesces concurrent misses on the same key.
+
+    Uncacheable calls (non-deterministic generations, filtered models) are
+    neither cached nor coalesced, since identical inputs are expected to give
+    different outputs. Errors raised by the shared call propagate to every
+    waiting caller and nothing is cached, so the next call retries.
+    """
+
+    def __init__(
+        self, cache_manager: CacheManager, executor: Executor | None = None
+    ) -> None:
+        """
+        Initialize the coalescing cache.
+
+        Args:
+            cache_manager: Cache manager to store responses in
+            executor: Executor for blocking calls made from asyncio callers
+                (the event loop's default executor if None)
+
+        """
+        self.cache_manager = cache_manager
+        self.executor = executor
+        self.single_flight: SingleFlight[Any] = SingleFlight()
+        self.async_single_flight: AsyncSingleFlight[Any] = AsyncSingleFlight()
+
+    def _lookup(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        parameters: dict[str, Any] | None,
+    ) -> tuple[str | None, Any]:
+        """
+        Compute the cache key and look it up.
+
+        Returns:
+            (key, value); key is None for uncacheable calls and value is
+            CACHE_MISS on a miss
+
+        """
+        if not self.cache_manager.is_cacheable(model_id, operation, parameters):
+            return None, CACHE_MISS
+        key = generate_cache_key(model_id, operation, inputs, parameters)
+        return key, self.cache_manager.get_by_key(key, CACHE_MISS)
+
+    def _store(self, key: str, value: Any, ttl: float | None) -> Any:  # noqa: ANN401
+        """Cache a freshly computed value and return it."""
+        self.cache_manager.set_by_key(key, value, ttl)
+        return value
+
+    def _load(self, key: str, compute: Callable[[], Any], ttl: float | None) -> Any:  # noqa: ANN401
+        """
+        Compute and cache a value, unless a previous flight already cached it.
+
+        A caller can miss just before the previous leader stores its result
+        and releases the key, and then lead a new flight; looking again here
+        keeps it from calling the backend for a value that is already cached.
+        """
+        cached = self.cache_manager.get_by_key(key, CACHE_MISS)
+        if cached is not CACHE_MISS:
+            return cached
+        return self._store(key, compute(), ttl)
+
+    def get_or_compute(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        compute: Callable[[], Any],
+        parameters: dict[str, Any] | None = None,
+        *,
+        ttl: float | None = None,
+        timeout: float | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Return a cached response, or compute it once for all concurrent callers.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name
+            inputs: The call inputs
+            compute: Zero-argument blocking callable that runs the model call
+            parameters: Generation parameters
+            ttl: Time-to-live in seconds (defaults to the configured TTL)
+            timeout: Maximum seconds to wait for another caller's in-flight call
+
+        Returns:
+            The cached or freshly computed response
+
+        """
+        key, cached = self._lookup(model_id, operation, inputs, parameters)
+        if key is None:
+            return compute()
+        if cached is not CACHE_MISS:
+            return cached
+        return self.single_flight.do(
+            key, lambda: self._load(key, compute, ttl), timeout
+        )
+
+    async def aget_or_compute(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        compute: Union[Callable[[], Awaitable[Any]], Callable[[], Any]],
+        parameters: dict[str, Any] | None = None,
+        *,
+        ttl: float | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Async variant of :meth:`get_or_compute`.
+
+        Coroutine functions are coalesced within the event loop. Blocking
+        callables run in the executor and share their in-flight call with
+        thread-based callers of :meth:`get_or_compute`.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name
+            inputs: The call inputs
+            compute: Coroutine function or blocking callable running the model call
+            parameters: Generation parameters
+            ttl: Time-to-live in seconds (defaults to the configured TTL)
+
+        Returns:
+            The cached or freshly computed response
+
+        """
+        is_coroutine = asyncio.iscoroutinefunction(compute)
+        key, cached = self._lookup(model_id, operation, inputs, parameters)
+        if key is None:
+            if is_coroutine:
+                return await compute()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, compute)
+        if cached is not CACHE_MISS:
+            return cached
+        if is_coroutine:
+
+            async def load() -> Any:  # noqa: ANN401
+                cached = self.cache_manager.get_by_key(key, CACHE_MISS)
+                if cached is not CACHE_MISS:
+                    return cached
+                return self._store(key, await compute(), ttl)
+
+            return await self.async_single_flight.do(key, load)
+        return await self.single_flight.do_async(
+            key, lambda: self._load(key, compute, ttl), self.executor
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache statistics plus coalescing counters."""
+        stats = self.cache_manager.get_stats()
+        threaded = self.single_flight.get_stats()
+        asynchronous = self.async_single_flight.get_stats()
+        stats["coalescing"] = {
+            name: threaded[name] + asynchronous[name]
+            for name in ("leaders", "coalesced", "in_flight")
+        }
+        return stats
+
+
+def get_coalescing_cache(cache_manager: CacheManager) -> CoalescingCache:
+    """
+    Return the shared :class:`CoalescingCache` for a cache manager.
+
+    All helpers in this module use the same instance per manager, so calls
+    made through different decorators still coalesce on equal keys.
+
+    Args:
+        cache_manager: The cache manager
+
+    Returns:
+        The coalescing front-end bound to ``cache_manager``
+
+    """
+    with _coalescing_lock:
+        coalescing = _coalescing_caches.get(cache_manager)
+        if coalescing is None:
+            coalescing = CoalescingCache(cache_manager)
+            _coalescing_caches[cache_manager] = coalescing
+        return coalescing
+
+
+def cache_model_call(
+    cache_manager: CacheManager,
+    model_id: str,
+    operation: str,
+    *,
+    ttl: float | None = None,
+    coalesce: bool = True,
+) -> Callable[[F], F]:
+    """
+    Cache a model-call function of the form ``func(inputs, **parameters)``.
+
+    Works for both regular and ``async`` functions. With ``coalesce`` enabled,
+    concurrent calls with identical inputs share one backend call.
+
+    Args:
+        cache_manager: Cache manager to store responses in
+        model_id: The model identifier used in cache keys
+        operation: The operation name used in cache keys
+        ttl: Time-to-live in seconds (defaults to the configured TTL)
+        coalesce: Coalesce concurrent identical calls
+
+    Returns:
+        A decorator that wraps the function with the cache
+
+    """
+
+    def decorator(func: F) -> F:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(inputs: Any, **parameters: Any) -> Any:  # noqa: ANN401
+                if coalesce:
+                    return await get_coalescing_cache(cache_manager).aget_or_compute(
+                        model_id,
+                        operation,
+                        inputs,
+                        functools.partial(func, inputs, **parameters),
+                        parameters,
+                        ttl=ttl,
+                    )
+                if not cache_manager.is_cacheable(model_id, operation, parameters):
+                    return await func(inputs, **parameters)
+                key = generate_cache_key(model_id, operation, inputs, parameters)
+                cached = cache_manager.get_by_key(key, CACHE_MISS)
+                if cached is not CACHE_MISS:
+                    return cached
+                response = await func(inputs, **parameters)
+                cache_manager.set_by_key(key, response, ttl)
+                return response
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(inputs: Any, **parameters: Any) -> Any:  # noqa: ANN401
+            target = get_coalescing_cache(cache_manager) if coalesce else cache_manager
+            return target.get_or_compute(
+                model_id,
+                operation,
+                inputs,
+                lambda: func(inputs, **parameters),
+                parameters,
+                ttl=ttl,
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def cached_embed_batch(
+    cache_manager: CacheManager,
+    model_id: str,
+    texts: list[str],
+    embed_fn: Callable[[list[str]], list[Any]],
+    parameters: dict[str, Any] | None = None,
+) -> list[Any]:
+    """
+    Embed a batch of texts, computing only the texts that are not cached.
+
+    Each text is cached under its own key, so overlapping batches (the same
+    chunks re-embedded as part of different documents or queries) reuse
+    earlier results. Duplicate texts within a batch are embedded once.
+
+    Args:
+        cache_manager: Cache manager to store embeddings in
+        model_id: The embedding model identifier
+        texts: Texts to embed
+        embed_fn: Function embedding a list of texts, returning vectors in order
+        parameters: Embedding parameters that affect the output
+
+    Returns:
+        One embedding per input text, in input order
+
+    """
+    if not cache_manager.is_cacheable(model_id, EMBED_OPERATION, parameters):
+        return list(embed_fn(list(texts)))
+
+    positions: dict[str, list[int]] = {}
+    for i, text in enumerate(texts):
+        positions.setdefault(text, []).append(i)
+
+    results: list[Any] = [None] * len(texts)
+    keys: dict[str, str] = {}
+    missing: list[str] = []
+    for text, indexes in positions.items():
+        key = generate_cache_key(model_id, EMBED_OPERATION, text, parameters)
+        cached = cache_manager.get_by_key(key, CACHE_MISS)
+        if cached is CACHE_MISS:
+            keys[text] = key
+            missing.append(text)
+            continue
+        for i in indexes:
+            results[i] = cached
+
+    if missing:
+        vectors = embed_fn(missing)
+        for text, vector in zip(missing, vectors):
+            cache_manager.set_by_key(keys[text], vector)
+            for i in positions[text]:
+                results[i] = vector
+    return results
+
+
+__all__ = [
+    "EMBED_OPERATION",
+    "CoalescingCache",
+    "cache_model_call",
+    "cached_embed_batch",
+    "get_coalescing_cache",
+]
@@ -1,7 +1,123 @@
-"""cache_key - Module for ai_models/caching.cache_key."""
+"""
+cache_key - Module for ai_models/caching.cache_key.
+
+Stable cache keys for model calls.
+
+Keys are SHA-256 digests of a canonical JSON encoding of
+``(model_id, operation, inputs, parameters)``, so the same call always maps to
+the same key across processes and restarts.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import hashlib
+import json
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+# Parameters that do not change the model output and are excluded from keys
+_IGNORED_PARAMETERS = frozenset({"stream", "timeout", "request_id", "user"})
+
+# Operations whose output does not depend on sampling parameters
+DETERMINISTIC_OPERATIONS = frozenset({"embed", "embedding", "embeddings", "classify"})
+
+
+def _canonicalize(value: Any) -> Any:  # noqa: ANN401, PLR0911
+    """
+    Convert a value into a JSON-compatible structure with a stable ordering.
+
+    Args:
+        value: The value to convert
+
+    Returns:
+        A JSON-compatible representation of the value
+
+    """
+    if isinstance(value, dict):
+        return {str(k): _canonicalize(v) for k, v in sorted(value.items(), key=str)}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonicalize(v) for v in value), key=repr)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if hasattr(value, "tolist"):
+        # numpy arrays and scalars
+        return _canonicalize(value.tolist())
+    if hasattr(value, "model_dump"):
+        # pydantic models
+        return _canonicalize(value.model_dump())
+    return repr(value)
+
+
+def generate_cache_key(
+    model_id: str,
+    operation: str,
+    inputs: Any,  # noqa: ANN401
+    parameters: dict[str, Any] | None = None,
+) -> str:
+    """
+    Generate a stable cache key for a model call.
+
+    Args:
+        model_id: The model identifier
+        operation: The operation name (e.g. "embed", "generate")
+        inputs: The call inputs (prompt, list of texts, messages, ...)
+        parameters: Generation parameters; output-neutral ones are ignored
+
+    Returns:
+        A 64-character hexadecimal SHA-256 digest
+
+    """
+    params = {
+        k: v for k, v in (parameters or {}).items() if k not in _IGNORED_PARAMETERS
+    }
+    payload = json.dumps(
+        [model_id, operation, _canonicalize(inputs), _canonicalize(params)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_deterministic(operation: str, parameters: dict[str, Any] | None = None) -> bool:
+    """
+    Check whether a model call is deterministic and therefore safe to cache.
+
+    Embedding and classification calls are always deterministic. Generation
+    calls are deterministic when temperature is zero (greedy decoding) or when
+    a fixed seed is supplied.
+
+    Args:
+        operation: The operation name
+        parameters: Generation parameters
+
+    Returns:
+        True if repeating the call is expected to return the same output
+
+    """
+    if operation in DETERMINISTIC_OPERATIONS:
+        return True
+    params = parameters or {}
+    if params.get("seed") is not None:
+        return True
+    temperature = params.get("temperature")
+    if temperature is None:
+        # Most backends default to sampling when temperature is unspecified
+        return False
+    try:
+        return float(temperature) == 0.0
+    except (TypeError, ValueError):
+        return False
+
+
+__all__ = [
+    "DETERMINISTIC_OPERATIONS",
+    "generate_cache_key",
+    "is_deterministic",
+]
@@ -1,7 +1,381 @@
-"""cache_manager - Module for ai_models/caching.cache_manager."""
+"""
+cache_manager - Module for ai_models/caching.cache_manager.
+
+Tiered cache for deterministic model calls.
+
+The first tier is an in-process :class:`MemoryCache`. When ``backend`` is
+"disk", "sqlite" or "redis", entries evicted from memory are demoted to that
+second tier, and second-tier hits are promoted back into memory. Only
+deterministic calls (embeddings, classification, temperature-0 or seeded
+generation) are cached unless ``deterministic_only`` is disabled.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable
 
 # Third-party imports
-
 # Local imports
+from .cache_backends import (
+    CacheBackend,
+    CacheEncodingError,
+    DiskCache,
+    MemoryCache,
+    RedisCache,
+    SQLiteCache,
+    decode_value,
+    encode_value,
+)
+from .cache_config import CacheConfig
+from .cache_key import generate_cache_key, is_deterministic
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Sentinel distinguishing "not cached" from a cached None
+CACHE_MISS = object()
+
+
+class CacheManager:
+    """Two-tier (memory -> persistent) cache for model responses."""
+
+    def __init__(self, config: CacheConfig | None = None) -> None:
+        """
+        Initialize the cache manager.
+
+        Args:
+            config: Cache configuration (defaults to a memory-only cache)
+
+        """
+        self.config = config or CacheConfig()
+        self.memory = MemoryCache(self.config.max_size, self.config.max_bytes)
+        self.backend: CacheBackend | None = self._create_backend(self.config)
+        if self.backend is not None:
+            self.memory.set_eviction_callback(self._demote)
+        self._skipped = 0
+
+    @staticmethod
+    def _create_backend(config: CacheConfig) -> CacheBackend | None:
+        """
+        Create the second-tier backend selected by the configuration.
+
+        Args:
+            config: Cache configuration
+
+        Returns:
+            The backend, or None for a memory-only cache
+
+        """
+        options = dict(config.backend_options)
+        if config.backend == "disk":
+            return DiskCache(
+                options.pop("cache_dir", Path(config.cache_dir) / "entries"),
+                max_entries=config.backend_max_size,
+                max_bytes=config.backend_max_bytes,
+            )
+        if config.backend == "sqlite":
+            return SQLiteCache(
+                options.pop("db_path", Path(config.cache_dir) / "cache.sqlite3"),
+                max_entries=config.backend_max_size,
+                max_bytes=config.backend_max_bytes,
+            )
+        if config.backend == "redis":
+            return RedisCache(
+                max_entries=config.backend_max_size,
+                max_bytes=config.backend_max_bytes,
+                **options,
+            )
+        return None
+
+    def _demote(self, key: str, value: bytes, expires_at: float | None) -> None:
+        """Write an entry evicted from memory into the second tier."""
+        if self.backend is None:
+            return
+        try:
+            self.backend.set(key, value, expires_at)
+        except Exception:
+            logger.exception("Failed to demote cache entry to %s", self.backend.name)
+
+    def _expires_at(self, ttl: float | None) -> float | None:
+        """Return the absolute expiry time for a TTL, falling back to the config."""
+        ttl = self.config.ttl if ttl is None else ttl
+        return time.time() + ttl if ttl else None
+
+    def is_cacheable(
+        self,
+        model_id: str,
+        operation: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Check whether a call should go through the cache.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name
+            parameters: Generation parameters
+
+        Returns:
+            True if the call passes the config filters and determinism check
+
+        """
+        if not self.config.should_cache(model_id, operation):
+            return False
+        return not (
+            self.config.deterministic_only
+            and not is_deterministic(operation, parameters)
+        )
+
+    def get_by_key(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        """
+        Look up a value by precomputed cache key.
+
+        Args:
+            key: Cache key from :func:`generate_cache_key`
+            default: Value returned on a miss
+
+        Returns:
+            The cached value, or ``default`` on a miss
+
+        """
+        entry = self.memory.get_entry(key)
+        if entry is None and self.backend is not None:
+            try:
+                entry = self.backend.get_entry(key)
+            except Exception:
+                logger.exception("Cache lookup failed in %s", self.backend.name)
+                entry = None
+            if entry is not None:
+                # Promote into memory; the second tier keeps its copy
+                self.memory.set(key, entry[0], entry[1])
+        if entry is None:
+            return default
+        try:
+            return decode_value(entry[0])
+        except Exception:
+            # An entry that cannot be decoded would fail every later lookup
+            logger.exception("Dropping undecodable cache entry %s", key)
+            self._delete_key(key)
+            return default
+
+    def set_by_key(
+        self,
+        key: str,
+        value: Any,  # noqa: ANN401
+        ttl: float | None = None,
+    ) -> bool:
+        """
+        Store a value under a precomputed cache key.
+
+        Args:
+            key: Cache key from :func:`generate_cache_key`
+            value: The value to cache
+            ttl: Time-to-live in seconds (defaults to the configured TTL)
+
+        Returns:
+            True if the value was stored, False if it could not be encoded
+
+        """
+        try:
+            data = encode_value(value, self.config.vector_dtype)
+        except CacheEncodingError:
+            logger.warning("Skipping cache write for unencodable value")
+            self._skipped += 1
+            return False
+        expires_at = self._expires_at(ttl)
+        self.memory.set(key, data, expires_at)
+        if self.config.write_through and self.backend is not None:
+            self._demote(key, data, expires_at)
+        return True
+
+    def get(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        parameters: dict[str, Any] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Get a cached model response.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name (e.g. "embed", "generate")
+            inputs: The call inputs
+            parameters: Generation parameters
+
+        Returns:
+            The cached response, or None on a miss or for uncacheable calls
+
+        """
+        if not self.is_cacheable(model_id, operation, parameters):
+            return None
+        key = generate_cache_key(model_id, operation, inputs, parameters)
+        return self.get_by_key(key)
+
+    def set(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        response: Any,  # noqa: ANN401
+        parameters: dict[str, Any] | None = None,
+        *,
+        ttl: float | None = None,
+    ) -> bool:
+        """
+        Cache a model response.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name (e.g. "embed", "generate")
+            inputs: The call inputs
+            response: The model response to cache
+            parameters: Generation parameters
+            ttl: Time-to-live in seconds (defaults to the configured TTL)
+
+        Returns:
+            True if the response was cached
+
+        """
+        if not self.is_cacheable(model_id, operation, parameters):
+            self._skipped += 1
+            return False
+        key = generate_cache_key(model_id, operation, inputs, parameters)
+        return self.set_by_key(key, response, ttl)
+
+    def get_or_compute(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        compute: Callable[[], Any],
+        parameters: dict[str, Any] | None = None,
+        *,
+        ttl: float | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Return a cached response, computing and caching it on a miss.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name
+            inputs: The call inputs
+            compute: Zero-argument callable that runs the model call
+            parameters: Generation parameters
+            ttl: Time-to-live in seconds (defaults to the configured TTL)
+
+        Returns:
+            The cached or freshly computed response
+
+        """
+        if not self.is_cacheable(model_id, operation, parameters):
+            self._skipped += 1
+            return compute()
+        key = generate_cache_key(model_id, operation, inputs, parameters)
+        cached = self.get_by_key(key, CACHE_MISS)
+        if cached is not CACHE_MISS:
+            return cached
+        response = compute()
+        self.set_by_key(key, response, ttl)
+        return response
+
+    def delete(
+        self,
+        model_id: str,
+        operation: str,
+        inputs: Any,  # noqa: ANN401
+        parameters: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Remove a cached response from all tiers.
+
+        Args:
+            model_id: The model identifier
+            operation: The operation name
+            inputs: The call inputs
+            parameters: Generation parameters
+
+        Returns:
+            True if the response was present in any tier
+
+        """
+        key = generate_cache_key(model_id, operation, inputs, parameters)
+        return self._delete_key(key)
+
+    def _delete_key(self, key: str) -> bool:
+        """Remove a key from all tiers; return True if any tier held it."""
+        deleted = self.memory.delete(key)
+        if self.backend is not None:
+            deleted = self.backend.delete(key) or deleted
+        return deleted
+
+    def clear(self) -> None:
+        """Remove all entries from all tiers."""
+        self.memory.clear()
+        if self.backend is not None:
+            self.backend.clear()
+
+    def flush(self) -> int:
+        """
+        Write every in-memory entry to the second tier.
+
+        Returns:
+            The number of entries written
+
+        """
+        if self.backend is None:
+            return 0
+        entries = self.memory.items()
+        for key, value, expires_at in entries:
+            self._demote(key, value, expires_at)
+        return len(entries)
+
+    def close(self) -> None:
+        """Flush memory to the second tier and release backend resources."""
+        self.flush()
+        if self.backend is not None:
+            self.backend.close()
+
+    def __enter__(self) -> CacheManager:  # noqa: PYI034
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the cache on exit."""
+        self.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get aggregated and per-tier cache statistics.
+
+        ``hits`` counts lookups answered by any tier; ``misses`` counts lookups
+        that missed every tier.
+
+        Returns:
+            A dictionary with overall counters and a ``tiers`` breakdown
+
+        """
+        memory_stats = self.memory.get_stats()
+        tiers = {"memory": memory_stats}
+        hits = memory_stats["hits"]
+        misses = memory_stats["misses"]
+        if self.backend is not None:
+            backend_stats = self.backend.get_stats()
+            tiers[self.backend.name] = backend_stats
+            hits += backend_stats["hits"]
+            misses = backend_stats["misses"]
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "skipped": self._skipped,
+            "entries": sum(t["entries"] for t in tiers.values()),
+            "bytes": sum(t["bytes"] for t in tiers.values()),
+            "tiers": tiers,
+        }
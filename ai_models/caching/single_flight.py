@@ -0,0 +1,248 @@
+"""
+single_flight - Module for ai_models/caching.single_flight.
+
+Request coalescing for identical in-flight calls.
+
+When several callers ask for the same key at the same time, only the first
+(the leader) runs the underlying function; the others wait on the leader's
+future and receive the same result or exception. The key is released as soon
+as the call finishes, so later callers start a fresh call (or, when used with
+the cache, hit the value the leader stored).
+
+:class:`SingleFlight` coalesces blocking functions for both thread and
+asyncio callers. :class:`AsyncSingleFlight` coalesces coroutine functions
+within an event loop.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Executor, Future
+from typing import Awaitable, Callable, Generic, TypeVar
+
+# Third-party imports
+
+# Local imports
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls of blocking functions by key."""
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[T]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def _join(self, key: str) -> tuple[Future[T], bool]:
+        """
+        Join the in-flight call for a key, or register a new one.
+
+        Args:
+            key: The coalescing key
+
+        Returns:
+            The shared future and whether the caller is the leader
+
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            self.leaders += 1
+            return future, True
+
+    def _run(self, key: str, future: Future[T], fn: Callable[[], T]) -> None:
+        """Run the leader's call and publish its outcome to all waiters."""
+        try:
+            result = fn()
+        except BaseException as e:
+            self._release(key)
+            future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._release(key)
+            future.set_result(result)
+
+    def _release(self, key: str) -> None:
+        """Forget the in-flight call so later callers start a new one."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def do(self, key: str, fn: Callable[[], T], timeout: float | None = None) -> T:
+        """
+        Run ``fn`` once for all concurrent callers using the same key.
+
+        The leader runs ``fn`` in the calling thread. A follower that gives up
+        after ``timeout`` raises ``concurrent.futures.TimeoutError``; the
+        leader's call is not affected.
+
+        Args:
+            key: The coalescing key (e.g. a cache key)
+            fn: Zero-argument function to run
+            timeout: Maximum seconds a follower waits for the leader
+
+        Returns:
+            The result of the leader's call
+
+        Raises:
+            Exception: Whatever the leader's call raised
+
+        """
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, fn)
+        return future.result(timeout)
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        executor: Executor | None = None,
+    ) -> T:
+        """
+        Run blocking ``fn`` once for all concurrent callers, awaiting the result.
+
+        The leader's call runs in ``executor`` (the loop's default executor if
+        None). Cancelling an awaiting caller does not cancel the shared call,
+        which may also have thread-based waiters.
+
+        Args:
+            key: The coalescing key
+            fn: Zero-argument blocking function to run
+            executor: Executor to run the leader's call in
+
+        Returns:
+            The result of the leader's call
+
+        """
+        future, leader = self._join(key)
+        if leader:
+            loop = asyncio.get_running_loop()
+            loop.run_in_executor(executor, self._run, key, future, fn)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def in_flight(self) -> int:
+        """Return the number of keys with a call in progress."""
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return leader/coalesced counters and the current in-flight count."""
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class _AsyncCall(Generic[T]):
+    """Shared task for a coalesced coroutine call and its waiter count."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    Coalesce concurrent coroutine calls by key.
+
+    Calls are tracked per event loop. The shared call runs as its own task, so
+    cancelling one waiter does not affect the others; the task itself is
+    cancelled only when every waiter has been cancelled, and later callers
+    then start a new call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, _AsyncCall[T]]
+        ] = weakref.WeakKeyDictionary()
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn()`` once for all concurrent callers using the same key.
+
+        Args:
+            key: The coalescing key (e.g. a cache key)
+            fn: Zero-argument function returning an awaitable
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+            asyncio.CancelledError: If this waiter, or the shared call, is cancelled
+
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        call = calls.get(key)
+        if call is None:
+            call = _AsyncCall(loop.create_task(_await(fn)))
+            calls[key] = call
+            call.task.add_done_callback(
+                lambda _task, c=call: (
+                    calls.pop(key, None) if calls.get(key) is c else None
+                )
+            )
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        cancelled = False
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            cancelled = not call.task.cancelled()
+            raise
+        finally:
+            call.waiters -= 1
+            if cancelled and call.waiters == 0 and not call.task.done():
+                # Forget the call before it is torn down, so a caller arriving
+                # meanwhile starts a fresh one instead of joining a cancelled task
+                if calls.get(key) is call:
+                    del calls[key]
+                call.task.cancel()
+
+    def in_flight(self) -> int:
+        """Return the number of keys with a call in progress on the running loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return 0
+        return len(self._calls.get(loop, {}))
+
+    def get_stats(self) -> dict[str, int]:
+        """Return leader/coalesced counters and the current in-flight count."""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight(),
+        }
+
+
+async def _await(fn: Callable[[], Awaitable[T]]) -> T:
+    """Await the result of ``fn()``."""
+    return await fn()
+
+
+__all__ = ["AsyncSingleFlight", "SingleFlight"]
@@ -5,3 +5,6 @@
 # Third-party imports
 
 # Local imports
+from .cli import create_parser, main
+
+__all__ = ["create_parser", "main"]
@@ -1,7 +1,48 @@
-"""base - Module for ai_models/cli.base."""
+"""
+base - Module for ai_models/cli.base.
+
+Base class for ``python -m ai_models`` subcommands.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 # Third-party imports
 
 # Local imports
+
+if TYPE_CHECKING:
+    import argparse
+
+
+class BaseCommand(ABC):
+    """A CLI subcommand: declares its arguments and runs with parsed args."""
+
+    name = ""
+    help = ""
+
+    @abstractmethod
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Add the command's arguments to its subparser.
+
+        Args:
+            parser: The subcommand's argument parser
+
+        """
+
+    @abstractmethod
+    def run(self, args: argparse.Namespace) -> int:
+        """
+        Run the command.
+
+        Args:
+            args: Parsed command-line arguments
+
+        Returns:
+            Process exit code
+
+        """
@@ -1,7 +1,57 @@
-"""cli - Module for ai_models/cli.cli."""
+"""
+cli - Module for ai_models/cli.cli.
+
+Entry point for ``python -m ai_models``.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import argparse
+import logging
 
 # Third-party imports
-
 # Local imports
+from .commands import COMMANDS
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser with one subparser per command.
+
+    Returns:
+        The argument parser
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_models", description="AI model utilities"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable debug logging"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, command_class in COMMANDS.items():
+        command = command_class()
+        subparser = subparsers.add_parser(name, help=command.help)
+        command.add_arguments(subparser)
+        subparser.set_defaults(handler=command)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Parse arguments and run the selected command.
+
+    Args:
+        argv: Command-line arguments (``sys.argv[1:]`` if None)
+
+    Returns:
+        Process exit code
+
+    """
+    args = create_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+    return args.handler.run(args)
@@ -5,3 +5,14 @@
 # Third-party imports
 
 # Local imports
+from .benchmark import BenchmarkCommand
+from .download import DownloadCommand
+from .optimize import OptimizeCommand
+
+# Available subcommands, keyed by name
+COMMANDS = {
+    command.name: command
+    for command in (BenchmarkCommand, DownloadCommand, OptimizeCommand)
+}
+
+__all__ = ["COMMANDS", "BenchmarkCommand", "DownloadCommand", "OptimizeCommand"]
@@ -1,7 +1,165 @@
-"""benchmark - Module for ai_models/cli/commands.benchmark."""
+"""
+benchmark - Module for ai_models/cli/commands.benchmark.
+
+``python -m ai_models benchmark``: run the adapter benchmark harness.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+import sys
+from typing import TYPE_CHECKING
 
 # Third-party imports
-
 # Local imports
+from ai_models.benchmarking import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    BenchmarkRunner,
+    BenchmarkType,
+    find_regressions,
+)
+from ai_models.cli.base import BaseCommand
+
+if TYPE_CHECKING:
+    import argparse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _int_list(value: str) -> list[int]:
+    """Parse a comma-separated list of integers such as ``1,2,4``."""
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+class BenchmarkCommand(BaseCommand):
+    """Benchmark a model adapter."""
+
+    name = "benchmark"
+    help = "Benchmark latency, throughput and memory of a model adapter"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Add benchmark arguments.
+
+        Args:
+            parser: The subcommand's argument parser
+
+        """
+        parser.add_argument(
+            "--adapter",
+            default="fake",
+            help="Adapter type (fake, ollama, openai, lmstudio, tensorrt, mcp)",
+        )
+        parser.add_argument("--model-id", default="default", help="Model to query")
+        parser.add_argument("--host", default="localhost", help="Server host")
+        parser.add_argument("--port", type=int, default=0, help="Server port")
+        parser.add_argument(
+            "--benchmark-type",
+            choices=[t.value for t in BenchmarkType],
+            default=BenchmarkType.LATENCY.value,
+            help="Benchmark type recorded in the result",
+        )
+        parser.add_argument(
+            "--operation", choices=BenchmarkConfig.OPERATIONS, default="generate"
+        )
+        parser.add_argument(
+            "--prompts-file", help="Prompt corpus (.txt, .json or .jsonl)"
+        )
+        parser.add_argument("--num-runs", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2, help="Warm-up requests")
+        parser.add_argument(
+            "--concurrency",
+            type=_int_list,
+            default=[1],
+            help="Comma-separated concurrency levels, e.g. 1,2,4,8",
+        )
+        parser.add_argument("--max-tokens", type=int, default=32)
+        parser.add_argument("--output", help="Write the result to this file")
+        parser.add_argument(
+            "--format", choices=BenchmarkConfig.OUTPUT_FORMATS, default="json"
+        )
+        parser.add_argument(
+            "--baseline",
+            help="JSON result to compare against; exit 1 on regression",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed relative regression against the baseline",
+        )
+        parser.add_argument(
+            "--error-tolerance",
+            type=float,
+            default=0.01,
+            help="Allowed error-rate increase against the baseline",
+        )
+        parser.add_argument(
+            "--fake-latency-ms",
+            type=float,
+            default=0.0,
+            help="Simulated per-call latency for the fake adapter",
+        )
+        parser.add_argument(
+            "--fake-per-token-ms",
+            type=float,
+            default=0.0,
+            help="Simulated per-token latency for the fake adapter",
+        )
+
+    def run(self, args: argparse.Namespace) -> int:
+        """
+        Run the benchmark and print the result.
+
+        Args:
+            args: Parsed command-line arguments
+
+        Returns:
+            0 on success, 1 if a regression against the baseline was found
+
+        """
+        adapter_options = {}
+        if args.adapter == "fake":
+            adapter_options = {
+                "latency_ms": args.fake_latency_ms,
+                "per_token_ms": args.fake_per_token_ms,
+            }
+        config = BenchmarkConfig(
+            adapter=args.adapter,
+            model_id=args.model_id,
+            host=args.host,
+            port=args.port,
+            adapter_options=adapter_options,
+            benchmark_type=args.benchmark_type,
+            operation=args.operation,
+            prompt_file=args.prompts_file,
+            num_runs=args.num_runs,
+            warmup_runs=args.warmup,
+            concurrency_levels=args.concurrency,
+            max_tokens=args.max_tokens,
+            output_path=args.output,
+            output_format=args.format,
+        )
+        result = BenchmarkRunner(config).run()
+        if args.output:
+            logger.info("Benchmark result written to %s", args.output)
+        else:
+            sys.stdout.write(
+                result.to_csv() if args.format == "csv" else result.to_json() + "\n"
+            )
+
+        if args.baseline:
+            regressions = find_regressions(
+                BenchmarkResult.load(args.baseline),
+                result,
+                args.tolerance,
+                args.error_tolerance,
+            )
+            for regression in regressions:
+                logger.error("Regression: %s", regression)
+            if regressions:
+                return 1
+        return 0
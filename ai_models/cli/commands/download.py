@@ -1,7 +1,107 @@
-"""download - Module for ai_models/cli/commands.download."""
+"""
+download - Module for ai_models/cli/commands.download.
+
+``python -m ai_models download``: fetch a model file into the model directory.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+import logging
+import sys
+from typing import TYPE_CHECKING
 
 # Third-party imports
-
 # Local imports
+from ai_models.cli.base import BaseCommand
+from ai_models.model_downloader import (
+    HF_URL_TEMPLATE,
+    DownloadError,
+    MiB,
+    ModelDownloader,
+)
+
+if TYPE_CHECKING:
+    import argparse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class DownloadCommand(BaseCommand):
+    """Download a model file."""
+
+    name = "download"
+    help = "Download a model file with parallel, resumable range requests"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Add download arguments.
+
+        Args:
+            parser: The subcommand's argument parser
+
+        """
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--url", help="URL of the file")
+        source.add_argument(
+            "--hf",
+            nargs=2,
+            metavar=("REPO_ID", "FILE"),
+            help="Hugging Face Hub repository and file",
+        )
+        parser.add_argument("--revision", default="main", help="Hub revision")
+        parser.add_argument(
+            "--model-id", help="Model directory name (from the source if omitted)"
+        )
+        parser.add_argument("--file-name", help="File name in the model directory")
+        parser.add_argument("--sha256", help="Expected SHA-256 of the file")
+        parser.add_argument(
+            "--connections", type=int, default=8, help="Parallel range requests"
+        )
+        parser.add_argument(
+            "--part-size-mb", type=int, default=8, help="Size of each range request"
+        )
+        parser.add_argument("--models-dir", help="Directory of model files")
+        parser.add_argument("--cache-dir", help="Directory of the blob store")
+
+    def run(self, args: argparse.Namespace) -> int:
+        """
+        Download the file and print its path and progress.
+
+        Args:
+            args: Parsed command-line arguments
+
+        Returns:
+            0 on success, 1 if the download failed
+
+        """
+        with ModelDownloader(
+            cache_dir=args.cache_dir,
+            models_dir=args.models_dir,
+            num_connections=args.connections,
+            part_size=args.part_size_mb * MiB,
+        ) as downloader:
+            url = args.url
+            model_id = args.model_id or "default"
+            file_name = args.file_name
+            if args.hf:
+                repo_id, hub_file = args.hf
+                url = HF_URL_TEMPLATE.format(
+                    repo_id=repo_id, revision=args.revision, file_name=hub_file
+                )
+                model_id = args.model_id or repo_id.replace("/", "--")
+                file_name = file_name or hub_file
+            task = downloader.download_from_url(
+                url, model_id, file_name=file_name, sha256=args.sha256
+            )
+            try:
+                path = task.wait()
+            except DownloadError:
+                logger.exception("Download of %s failed", task.url)
+                return 1
+        sys.stdout.write(
+            json.dumps({"path": str(path), **task.progress.to_dict()}) + "\n"
+        )
+        return 0
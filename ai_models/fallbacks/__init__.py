@@ -5,3 +5,28 @@
 # Third-party imports
 
 # Local imports
+from .fallback_strategy import (
+    AllBackendsUnavailableError,
+    Backend,
+    CircuitBreaker,
+    CircuitState,
+    DeadlineExceededError,
+    FallbackError,
+    FallbackExhaustedError,
+    FallbackStrategy,
+)
+from .schemas import AttemptOutcome, FallbackAttempt, FallbackResult
+
+__all__ = [
+    "AllBackendsUnavailableError",
+    "AttemptOutcome",
+    "Backend",
+    "CircuitBreaker",
+    "CircuitState",
+    "DeadlineExceededError",
+    "FallbackAttempt",
+    "FallbackError",
+    "FallbackExhaustedError",
+    "FallbackResult",
+    "FallbackStrategy",
+]
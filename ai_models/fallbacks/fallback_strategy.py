@@ -1,7 +1,580 @@
-"""fallback_strategy - Module for ai_models/fallbacks.fallback_strategy."""
+"""
+fallback_strategy - Module for ai_models/fallbacks.fallback_strategy.
+
+Latency-aware fallback across model backends.
+
+:class:`FallbackStrategy` ranks its backends by live latency and error-rate
+statistics, skips backends whose circuit breaker is open, and walks the chain
+within one deadline. While a backend is slow, a hedged request is fired at the
+next backend once the first has been outstanding for its observed p95
+latency; whichever answers first wins. A stalled backend therefore costs at
+most its per-attempt timeout (or p95, when hedging) rather than hanging the
+caller.
+
+Calls run on a bounded thread pool. Python threads cannot be cancelled, so a
+stalled call keeps its worker until it returns; its result is discarded.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
 
 # Third-party imports
-
 # Local imports
+from ai_models.metrics.enhanced_metrics import ModelStats
+
+from .schemas import AttemptOutcome, FallbackAttempt, FallbackResult
+
+if TYPE_CHECKING:
+    from ai_models.performance_monitor import PerformanceMonitor
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class FallbackError(Exception):
+    """Base class for fallback errors."""
+
+
+class AllBackendsUnavailableError(FallbackError):
+    """Raised when every backend's circuit breaker is open."""
+
+    MESSAGE = "All fallback backends are unavailable (circuit breakers open)"
+
+    def __init__(self) -> None:
+        """Initialize the AllBackendsUnavailableError with a standard message."""
+        super().__init__(self.MESSAGE)
+
+
+class FallbackExhaustedError(FallbackError):
+    """Raised when every backend in the chain failed."""
+
+    MESSAGE_TEMPLATE = "All {count} fallback attempts failed: {summary}"
+
+    def __init__(self, attempts: list[FallbackAttempt]) -> None:
+        """
+        Initialize the FallbackExhaustedError.
+
+        Args:
+            attempts: The attempts made
+
+        """
+        self.attempts = attempts
+        summary = ", ".join(f"{a.backend}={a.outcome.value}" for a in attempts)
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(count=len(attempts), summary=summary)
+        )
+
+
+class DeadlineExceededError(FallbackExhaustedError):
+    """Raised when the chain's deadline expires before any backend answers."""
+
+    MESSAGE_TEMPLATE = "Fallback deadline exceeded after {count} attempts: {summary}"
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Per-backend circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused for ``reset_timeout`` seconds. It then half-opens and
+    lets a single trial request through: success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the timeout passes."""
+        with self._lock:
+            if (
+                self._state == CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = CircuitState.HALF_OPEN
+                self._trial_in_flight = False
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent, reserving the half-open trial.
+
+        Returns:
+            True if the request may proceed
+
+        """
+        state = self.state
+        with self._lock:
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._state = CircuitState.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class Backend:
+    """A named callable in a fallback chain, with its health statistics."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        timeout: float | None = None,
+        stats: ModelStats | None = None,
+        breaker: CircuitBreaker | None = None,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            name: Backend name used in results and statistics
+            func: The function to call
+            timeout: Per-attempt timeout in seconds (None for the chain deadline)
+            stats: Rolling-window statistics to record into (new if None)
+            breaker: Circuit breaker (a default breaker if None)
+            ewma_alpha: Smoothing factor for the latency and error averages
+
+        """
+        self.name = name
+        self.func = func
+        self.timeout = timeout
+        self.stats = stats or ModelStats()
+        self.breaker = breaker or CircuitBreaker()
+        self.ewma_alpha = ewma_alpha
+        self.ewma_latency: float | None = None
+        self.ewma_error_rate = 0.0
+        self._p95: float | None = None
+        self._p95_samples = 0
+        self._p95_refreshed = -math.inf
+
+    @classmethod
+    def from_adapter(
+        cls,
+        name: str,
+        adapter: object,
+        method: str = "generate_text",
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Backend:
+        """
+        Create a backend that calls a method of an adapter.
+
+        Args:
+            name: Backend name
+            adapter: The adapter instance
+            method: Name of the adapter method to call
+            **kwargs: Other :class:`Backend` arguments
+
+        Returns:
+            The backend
+
+        """
+        return cls(name, getattr(adapter, method), **kwargs)
+
+    def observe(self, latency: float, *, error: bool) -> None:
+        """
+        Record the outcome of one call.
+
+        Args:
+            latency: Call latency in seconds
+            error: Whether the call failed or timed out
+
+        """
+        self.stats.record(latency, error=error)
+        alpha = self.ewma_alpha
+        if not error:
+            self.ewma_latency = (
+                latency
+                if self.ewma_latency is None
+                else alpha * latency + (1 - alpha) * self.ewma_latency
+            )
+        self.ewma_error_rate = alpha * float(error) + (1 - alpha) * self.ewma_error_rate
+        if error:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def p95(self, min_samples: int, refresh_interval: float) -> float | None:
+        """
+        Get the rolling p95 latency in seconds.
+
+        The snapshot is cached for ``refresh_interval`` seconds so ranking and
+        hedging stay cheap.
+
+        Args:
+            min_samples: Samples required before a p95 is reported
+            refresh_interval: Seconds between snapshot refreshes
+
+        Returns:
+            The p95 latency, or None with too few samples
+
+        """
+        now = time.monotonic()
+        if now - self._p95_refreshed >= refresh_interval:
+            snapshot = self.stats.snapshot()
+            self._p95 = snapshot["latency_ms"]["p95"] / 1000
+            self._p95_samples = snapshot["requests"] - snapshot["errors"]
+            self._p95_refreshed = now
+        return self._p95 if self._p95_samples >= min_samples else None
+
+    def score(self, error_penalty: float) -> float | None:
+        """
+        Score the backend for ranking; lower is better.
+
+        Args:
+            error_penalty: Weight of the error rate relative to latency
+
+        Returns:
+            Expected latency inflated by the error rate, or None if unmeasured
+
+        """
+        if self.ewma_latency is None:
+            return None
+        return self.ewma_latency * (1 + error_penalty * self.ewma_error_rate)
+
+
+class _Attempt:
+    """A call in flight; settled exactly once by its worker or by a timeout."""
+
+    __slots__ = (
+        "backend",
+        "future",
+        "hedged",
+        "lock",
+        "settled",
+        "started",
+        "timeout_at",
+    )
+
+    def __init__(self, backend: Backend, hedged: bool, deadline_at: float) -> None:
+        self.backend = backend
+        self.hedged = hedged
+        self.started = time.monotonic()
+        self.timeout_at = (
+            deadline_at
+            if backend.timeout is None
+            else min(deadline_at, self.started + backend.timeout)
+        )
+        self.future: Future[Any] = Future()
+        self.lock = threading.Lock()
+        self.settled = False
+
+    def settle(self) -> bool:
+        """Mark the attempt settled; return False if it already was."""
+        with self.lock:
+            if self.settled:
+                return False
+            self.settled = True
+            return True
+
+
+class FallbackStrategy:
+    """Call the best available backend, hedging and failing over within a deadline."""
+
+    def __init__(
+        self,
+        backends: list[Backend],
+        *,
+        deadline: float | None = 30.0,
+        hedge: bool = True,
+        hedge_min_samples: int = 20,
+        hedge_delay: float | None = None,
+        max_parallel: int = 2,
+        error_penalty: float = 4.0,
+        stats_refresh_interval: float = 1.0,
+        max_workers: int = 16,
+        monitor: PerformanceMonitor | None = None,
+    ) -> None:
+        """
+        Initialize the fallback strategy.
+
+        Args:
+            backends: Backends in preference order (used to break ties)
+            deadline: Seconds allowed for the whole chain (None for no limit)
+            hedge: Whether to fire hedged requests at slow backends
+            hedge_min_samples: Samples needed before a backend's p95 is trusted
+            hedge_delay: Hedge delay in seconds while a backend has too few
+                samples (None to not hedge until then)
+            max_parallel: Maximum attempts in flight at once
+            error_penalty: Weight of the error rate when ranking backends
+            stats_refresh_interval: Seconds between p95 snapshot refreshes
+            max_workers: Size of the thread pool running backend calls
+            monitor: Performance monitor to record backend calls into
+
+        """
+        if monitor is not None:
+            for backend in backends:
+                backend.stats = monitor.get_model_stats(backend.name)
+        self.backends = list(backends)
+        self.deadline = deadline
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_delay = hedge_delay
+        self.max_parallel = max(1, max_parallel)
+        self.error_penalty = error_penalty
+        self.stats_refresh_interval = stats_refresh_interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fallback"
+        )
+
+    def rank_backends(self) -> list[Backend]:
+        """
+        Order backends by score, best first.
+
+        Unmeasured backends are scored like the best measured one, so the
+        configured order decides between them until they have data.
+
+        Returns:
+            The backends, best first
+
+        """
+        scores = [b.score(self.error_penalty) for b in self.backends]
+        known = [s for s in scores if s is not None]
+        default = min(known) if known else 0.0
+        ranked = sorted(
+            range(len(self.backends)),
+            key=lambda i: (default if scores[i] is None else scores[i], i),
+        )
+        return [self.backends[i] for i in ranked]
+
+    def _hedge_delay(self, backend: Backend) -> float | None:
+        """Return how long to wait on a backend before hedging, if at all."""
+        if not self.hedge:
+            return None
+        p95 = backend.p95(self.hedge_min_samples, self.stats_refresh_interval)
+        return self.hedge_delay if p95 is None else p95
+
+    def _launch(
+        self,
+        backend: Backend,
+        hedged: bool,
+        deadline_at: float,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> _Attempt:
+        """Submit one backend call to the pool."""
+        attempt = _Attempt(backend, hedged, deadline_at)
+
+        def run() -> None:
+            try:
+                value = backend.func(*args, **kwargs)
+            except Exception as e:  # noqa: BLE001 - delivered to the caller
+                if attempt.settle():
+                    backend.observe(time.monotonic() - attempt.started, error=True)
+                attempt.future.set_exception(e)
+            else:
+                if attempt.settle():
+                    backend.observe(time.monotonic() - attempt.started, error=False)
+                attempt.future.set_result(value)
+
+        logger.debug("Calling backend %s (hedged=%s)", backend.name, hedged)
+        self._executor.submit(run)
+        return attempt
+
+    def call(self, *args: Any, **kwargs: Any) -> FallbackResult:  # noqa: ANN401, C901, PLR0915
+        """
+        Call the backends until one succeeds, within the deadline.
+
+        Args:
+            *args: Positional arguments for the backend function
+            **kwargs: Keyword arguments for the backend function
+
+        Returns:
+            The winning value, backend and the attempts made
+
+        Raises:
+            AllBackendsUnavailableError: If every circuit breaker is open
+            DeadlineExceededError: If the deadline expires first
+            FallbackExhaustedError: If every available backend failed
+
+        """
+        started = time.monotonic()
+        deadline_at = math.inf if self.deadline is None else started + self.deadline
+        queue = self.rank_backends()
+        attempts: list[FallbackAttempt] = []
+        pending: dict[Future[Any], _Attempt] = {}
+        hedge_at = math.inf
+        launched_any = False
+
+        def launch_next(hedged: bool) -> None:
+            nonlocal hedge_at, launched_any
+            while queue:
+                backend = queue.pop(0)
+                if not backend.breaker.allow_request():
+                    logger.debug("Skipping backend %s: circuit open", backend.name)
+                    continue
+                attempt = self._launch(backend, hedged, deadline_at, args, kwargs)
+                pending[attempt.future] = attempt
+                launched_any = True
+                delay = self._hedge_delay(backend)
+                hedge_at = math.inf if delay is None else attempt.started + delay
+                return
+            hedge_at = math.inf
+
+        launch_next(hedged=False)
+        if not launched_any:
+            raise AllBackendsUnavailableError
+
+        while pending:
+            now = time.monotonic()
+            can_hedge = bool(queue) and len(pending) < self.max_parallel
+            wake_at = min(
+                *(a.timeout_at for a in pending.values()),
+                hedge_at if can_hedge else math.inf,
+            )
+            timeout = None if wake_at == math.inf else max(0.0, wake_at - now)
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                attempt = pending.pop(future)
+                latency = time.monotonic() - attempt.started
+                error = future.exception()
+                if error is None:
+                    attempts.append(
+                        FallbackAttempt(
+                            attempt.backend.name,
+                            AttemptOutcome.SUCCESS,
+                            latency,
+                            attempt.hedged,
+                        )
+                    )
+                    attempts.extend(
+                        FallbackAttempt(
+                            other.backend.name,
+                            AttemptOutcome.SUPERSEDED,
+                            hedged=other.hedged,
+                        )
+                        for other in pending.values()
+                    )
+                    return FallbackResult(
+                        value=future.result(),
+                        backend=attempt.backend.name,
+                        elapsed=time.monotonic() - started,
+                        attempts=attempts,
+                    )
+                attempts.append(
+                    FallbackAttempt(
+                        attempt.backend.name,
+                        AttemptOutcome.ERROR,
+                        latency,
+                        attempt.hedged,
+                        repr(error),
+                    )
+                )
+
+            now = time.monotonic()
+            for future, attempt in list(pending.items()):
+                if now < attempt.timeout_at:
+                    continue
+                pending.pop(future)
+                expired = attempt.timeout_at >= deadline_at
+                if attempt.settle():
+                    attempt.backend.observe(now - attempt.started, error=True)
+                attempts.append(
+                    FallbackAttempt(
+                        attempt.backend.name,
+                        AttemptOutcome.DEADLINE if expired else AttemptOutcome.TIMEOUT,
+                        now - attempt.started,
+                        attempt.hedged,
+                    )
+                )
+
+            if now >= deadline_at:
+                break
+            if not pending:
+                launch_next(hedged=False)
+            elif queue and len(pending) < self.max_parallel and now >= hedge_at:
+                launch_next(hedged=True)
+
+        if now >= deadline_at:
+            attempts.extend(
+                FallbackAttempt(
+                    a.backend.name, AttemptOutcome.DEADLINE, hedged=a.hedged
+                )
+                for a in pending.values()
+            )
+            raise DeadlineExceededError(attempts)
+        raise FallbackExhaustedError(attempts)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get per-backend health information.
+
+        Returns:
+            Dictionary mapping backend names to circuit state, averages and
+            rolling-window statistics
+
+        """
+        return {
+            backend.name: {
+                "circuit": backend.breaker.state.value,
+                "ewma_latency": backend.ewma_latency,
+                "ewma_error_rate": backend.ewma_error_rate,
+                "window": backend.stats.snapshot(),
+            }
+            for backend in self.backends
+        }
+
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for stalled calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> FallbackStrategy:  # noqa: PYI034
+        """Return the strategy for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Shut down the worker pool."""
+        self.close()
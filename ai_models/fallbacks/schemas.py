@@ -1,7 +1,88 @@
-"""schemas - Module for ai_models/fallbacks.schemas."""
+"""
+schemas - Module for ai_models/fallbacks.schemas.
+
+Records describing the attempts and outcome of a fallback call.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+
+class AttemptOutcome(str, Enum):
+    """How one backend attempt ended."""
+
+    SUCCESS = "success"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+    SUPERSEDED = "superseded"  # still running when another backend won
+    DEADLINE = "deadline"  # still running when the chain deadline expired
+
+
+@dataclass
+class FallbackAttempt:
+    """One call made to a backend during a fallback chain."""
+
+    backend: str
+    outcome: AttemptOutcome
+    latency: float | None = None
+    hedged: bool = False
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the attempt to a dictionary.
+
+        Returns:
+            Dictionary representation
+
+        """
+        return {
+            "backend": self.backend,
+            "outcome": self.outcome.value,
+            "latency": self.latency,
+            "hedged": self.hedged,
+            "error": self.error,
+        }
+
+
+@dataclass
+class FallbackResult:
+    """Value returned by the winning backend and the attempts made."""
+
+    value: Any
+    backend: str
+    elapsed: float
+    attempts: list[FallbackAttempt] = field(default_factory=list)
+
+    @property
+    def hedged(self) -> bool:
+        """Whether the winning attempt was a hedged request."""
+        return any(
+            a.hedged
+            and a.backend == self.backend
+            and a.outcome == AttemptOutcome.SUCCESS
+            for a in self.attempts
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to a dictionary, without the value.
+
+        Returns:
+            Dictionary representation
+
+        """
+        return {
+            "backend": self.backend,
+            "elapsed": self.elapsed,
+            "hedged": self.hedged,
+            "attempts": [a.to_dict() for a in self.attempts],
+        }
@@ -1,7 +1,34 @@
 """__init__ - Module for ai_models/fine_tuning.__init__."""
 
-# Standard library imports
+from __future__ import annotations
 
+# Standard library imports
 # Third-party imports
-
 # Local imports
+from .data_collector import (
+    BloomFilter,
+    CollectionStats,
+    DataCollectionConfig,
+    DataCollectionConfigError,
+    DataCollector,
+    DatasetFormat,
+    PyArrowNotAvailableError,
+    ShardedWriter,
+    iter_records,
+)
+from .workflows import build_training_set, record_from_team_run, run_and_collect
+
+__all__ = [
+    "BloomFilter",
+    "CollectionStats",
+    "DataCollectionConfig",
+    "DataCollectionConfigError",
+    "DataCollector",
+    "DatasetFormat",
+    "PyArrowNotAvailableError",
+    "ShardedWriter",
+    "build_training_set",
+    "iter_records",
+    "record_from_team_run",
+    "run_and_collect",
+]
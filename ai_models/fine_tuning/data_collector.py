@@ -1,7 +1,879 @@
-"""data_collector - Module for ai_models/fine_tuning.data_collector."""
+"""
+data_collector - Module for ai_models/fine_tuning.data_collector.
+
+Stream interaction records into sharded, compressed fine-tuning datasets.
+
+Records (any JSON-serializable dictionaries, such as agent runs) are written
+one at a time, so memory use does not grow with the dataset:
+
+- Each record is reduced to its content (volatile keys such as timestamps
+  removed) and hashed. Duplicates are dropped using a Bloom filter of fixed
+  size, which is saved next to the shards so later runs skip records already
+  collected. A Bloom filter can mistake a new record for a duplicate at the
+  configured error rate; it never lets a duplicate through.
+- Records go to gzip-compressed JSONL or to Parquet (with pyarrow) shards.
+  A shard is closed and a new one started after a number of records, of
+  bytes, or of seconds, whichever comes first. Shards are written under a
+  temporary name and renamed when complete, so readers never see a
+  partial shard.
+- Optional validation and test splits are assigned from the content hash,
+  so a record always lands in the same split and duplicates cannot leak
+  between splits.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, ClassVar
 
 # Third-party imports
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
 # Local imports
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+DEDUPE_STATE_FILE = "dedupe.npz"
+MANIFEST_FILE = "manifest.json"
+SPLITS = ("train", "validation", "test")
+_DIGEST_SIZE = 16
+
+
+class DatasetFormat(str, Enum):
+    """Shard file formats."""
+
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+
+class DataCollectionConfigError(ValueError):
+    """Raised when a data collection configuration is invalid."""
+
+    MESSAGE_TEMPLATE = "Invalid data collection configuration: {detail}"
+
+    def __init__(self, detail: str) -> None:
+        """
+        Initialize the DataCollectionConfigError.
+
+        Args:
+            detail: What is wrong
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(detail=detail))
+
+
+class PyArrowNotAvailableError(ImportError):
+    """Raised when writing or reading Parquet without pyarrow installed."""
+
+    MESSAGE = "pyarrow is required for Parquet datasets: uv pip install pyarrow"
+
+    def __init__(self) -> None:
+        """Initialize the PyArrowNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+@dataclass
+class DataCollectionConfig:
+    """
+    Configuration for data collection.
+
+    Attributes:
+        output_dir: Directory for the shards (one subdirectory per split when
+            validation or test splits are configured)
+        output_format: Shard format
+        compression: "gzip" or None for JSONL; "zstd", "snappy", "gzip" or
+            None for Parquet
+        shard_prefix: Shard file name prefix
+        shard_max_records: Records per shard
+        shard_max_bytes: Uncompressed bytes per shard
+        shard_max_seconds: Age after which a shard is closed on the next
+            write (None for no limit)
+        row_group_size: Records buffered per Parquet row group
+        dedupe: Drop records whose content was already collected
+        dedupe_keys: Keys forming a record's content (all keys except
+            ``ignore_keys`` if None)
+        ignore_keys: Keys left out of the content
+        dedupe_capacity: Records the duplicate filter is sized for
+        dedupe_error_rate: Chance that a new record is taken for a duplicate
+            once ``dedupe_capacity`` records were collected
+        min_length: Fewest characters of content text to keep a record
+        max_length: Most characters of content text to keep a record
+        filter_function: Keep a record only if this returns True
+        transform_function: Applied to each record before anything else
+            (return None to drop the record)
+        validation_split: Fraction of records for the validation split
+        test_split: Fraction of records for the test split
+        sources: JSONL(.gz) or Parquet files or directories to collect from
+        metadata: Extra information written to the manifest
+
+    """
+
+    output_dir: str = "fine_tuning_data"
+    output_format: DatasetFormat = DatasetFormat.JSONL
+    compression: str | None = "gzip"
+    shard_prefix: str = "part"
+    shard_max_records: int = 100_000
+    shard_max_bytes: int = 256 * MiB
+    shard_max_seconds: float | None = 3600.0
+    row_group_size: int = 10_000
+    dedupe: bool = True
+    dedupe_keys: list[str] | None = None
+    ignore_keys: list[str] = field(
+        default_factory=lambda: ["id", "timestamp", "created_at", "metadata"]
+    )
+    dedupe_capacity: int = 1_000_000
+    dedupe_error_rate: float = 1e-4
+    min_length: int | None = None
+    max_length: int | None = None
+    filter_function: Callable[[dict[str, Any]], bool] | None = None
+    transform_function: Callable[[dict[str, Any]], dict[str, Any] | None] | None = None
+    validation_split: float = 0.0
+    test_split: float = 0.0
+    sources: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    COMPRESSIONS: ClassVar[dict[DatasetFormat, tuple[str | None, ...]]] = {
+        DatasetFormat.JSONL: (None, "gzip"),
+        DatasetFormat.PARQUET: (None, "zstd", "snappy", "gzip"),
+    }
+
+    def __post_init__(self) -> None:
+        """
+        Normalize and validate the configuration.
+
+        Raises:
+            DataCollectionConfigError: If a setting is out of range
+
+        """
+        self.output_format = DatasetFormat(self.output_format)
+        detail = None
+        if self.compression not in self.COMPRESSIONS[self.output_format]:
+            detail = (
+                f"compression for {self.output_format.value} must be one of "
+                f"{self.COMPRESSIONS[self.output_format]}"
+            )
+        elif min(self.shard_max_records, self.shard_max_bytes, self.row_group_size) < 1:
+            detail = "shard limits and row_group_size must be positive"
+        elif self.dedupe_capacity < 1 or not 0.0 < self.dedupe_error_rate < 1.0:
+            detail = "dedupe_capacity must be positive and dedupe_error_rate in (0, 1)"
+        elif (
+            min(self.validation_split, self.test_split) < 0.0
+            or self.validation_split + self.test_split >= 1.0
+        ):
+            detail = "validation_split and test_split must leave room for training"
+        if detail:
+            raise DataCollectionConfigError(detail)
+
+    @property
+    def splits(self) -> tuple[str, ...]:
+        """Splits written by this configuration (empty if unsplit)."""
+        if not self.validation_split and not self.test_split:
+            return ()
+        return SPLITS
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the serializable settings as a dictionary."""
+        data = asdict(self)
+        data["output_format"] = self.output_format.value
+        data.pop("filter_function")
+        data.pop("transform_function")
+        return data
+
+
+@dataclass
+class CollectionStats:
+    """Counts of records seen and written by a collector."""
+
+    seen: int = 0
+    written: int = 0
+    duplicates: int = 0
+    filtered: int = 0
+    invalid: int = 0
+    splits: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counts as a dictionary."""
+        return asdict(self)
+
+
+class BloomFilter:
+    """
+    Fixed-size set membership with false positives and no false negatives.
+
+    Memory is about ``-capacity * ln(error_rate) / ln(2) ** 2`` bits:
+    2.3 MiB per million records at a 1e-4 error rate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Items the filter is sized for
+            error_rate: False positive rate at ``capacity`` items
+
+        """
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def add(self, digest: bytes) -> bool:
+        """
+        Add an item.
+
+        Bit positions come from double hashing: ``first + i * second`` for
+        the two halves of the digest.
+
+        Args:
+            digest: At least 16 bytes of the item's hash
+
+        Returns:
+            True if the item was not in the filter before
+
+        """
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        bits = self.bits
+        new = False
+        for i in range(self.num_hashes):
+            position = (first + i * second) % self.num_bits
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                new = True
+        return new
+
+    def save(self, path: Path) -> None:
+        """Write the filter atomically."""
+        tmp = path.with_name(f"{path.name}.tmp")
+        with tmp.open("wb") as file:
+            np.savez(
+                file,
+                bits=np.frombuffer(self.bits, dtype=np.uint8),
+                num_hashes=self.num_hashes,
+            )
+        tmp.replace(path)
+
+    def load(self, path: Path) -> bool:
+        """
+        Restore a filter saved with the same size.
+
+        Args:
+            path: The saved filter
+
+        Returns:
+            True if it was loaded, False if it is missing or differently sized
+
+        """
+        if not path.is_file():
+            return False
+        with np.load(path) as data:
+            if (
+                data["bits"].size != len(self.bits)
+                or int(data["num_hashes"]) != self.num_hashes
+            ):
+                logger.warning("Ignoring %s: sized for another capacity", path)
+                return False
+            self.bits[:] = data["bits"].tobytes()
+        return True
+
+
+def content_of(record: dict[str, Any], config: DataCollectionConfig) -> dict[str, Any]:
+    """
+    Get the part of a record that identifies it.
+
+    Args:
+        record: The record
+        config: Selects ``dedupe_keys`` or drops ``ignore_keys``
+
+    Returns:
+        The content keys and values
+
+    """
+    if config.dedupe_keys is not None:
+        return {key: record.get(key) for key in config.dedupe_keys}
+    return {k: v for k, v in record.items() if k not in config.ignore_keys}
+
+
+def content_hash(content: dict[str, Any]) -> bytes:
+    """
+    Hash record content independently of key order.
+
+    Args:
+        content: The content
+
+    Returns:
+        A 16-byte digest
+
+    """
+    canonical = json.dumps(
+        content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=_DIGEST_SIZE).digest()
+
+
+def _text_length(value: Any) -> int:  # noqa: ANN401
+    """Count the characters of the strings in a value."""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_text_length(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_text_length(v) for v in value)
+    return 0
+
+
+def _split_of(digest: bytes, config: DataCollectionConfig) -> str:
+    """Assign a split from the content hash."""
+    fraction = int.from_bytes(digest[8:16], "little") / 2**64
+    if fraction < config.test_split:
+        return "test"
+    if fraction < config.test_split + config.validation_split:
+        return "validation"
+    return "train"
+
+
+def _kind(value: Any) -> str | None:  # noqa: ANN401
+    """Classify a value for a Parquet column (None for nulls)."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    return "json"
+
+
+class _JSONLShard:
+    """One JSONL shard, optionally gzip-compressed."""
+
+    def __init__(self, path: Path, compression: str | None, **_: Any) -> None:  # noqa: ANN401
+        """Open the shard under a temporary name."""
+        self.path = path
+        self.tmp = path.with_name(f"{path.name}.tmp")
+        self._file: IO[str] = (
+            gzip.open(self.tmp, "wt", encoding="utf-8")  # noqa: SIM115
+            if compression == "gzip"
+            else self.tmp.open("w", encoding="utf-8")
+        )
+
+    def accepts(self, _record: dict[str, Any]) -> bool:
+        """JSONL shards take records of any shape."""
+        return True
+
+    def write(self, record: dict[str, Any]) -> int:
+        """Write a record and return its uncompressed size."""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        self._file.write(line)
+        return len(line.encode())
+
+    def close(self) -> None:
+        """Finish the shard and give it its final name."""
+        self._file.close()
+        self.tmp.replace(self.path)
+
+
+class _ParquetShard:
+    """
+    One Parquet shard with a schema fixed by its first row group.
+
+    Nested values are stored as JSON strings; the names of those columns are
+    kept in the schema metadata under ``json_columns``. A record with new keys
+    or values of another type does not fit the shard and starts a new one.
+    """
+
+    def __init__(
+        self, path: Path, compression: str | None, row_group_size: int
+    ) -> None:
+        """Prepare the shard; the file is created with the first row group."""
+        if pa is None:
+            raise PyArrowNotAvailableError
+        self.path = path
+        self.tmp = path.with_name(f"{path.name}.tmp")
+        self.compression = compression or "none"
+        self.row_group_size = row_group_size
+        self.kinds: dict[str, str | None] = {}
+        self.rows: list[dict[str, Any]] = []
+        self._writer: Any = None
+
+    def accepts(self, record: dict[str, Any]) -> bool:
+        """Whether the record fits the shard's columns."""
+        for key, value in record.items():
+            kind = _kind(value)
+            if kind is None:
+                continue
+            if self._writer is None:
+                known = self.kinds.get(key)
+                if known not in {None, kind} and {known, kind} != {"int", "float"}:
+                    return False
+            elif key not in self.kinds:
+                return False
+            else:
+                column = self.kinds[key] or "str"
+                if column != kind and (column, kind) != ("float", "int"):
+                    return False
+        return True
+
+    def write(self, record: dict[str, Any]) -> int:
+        """Buffer a record and return its approximate size."""
+        row = {}
+        for key, value in record.items():
+            kind = _kind(value)
+            if self._writer is None:
+                known = self.kinds.get(key)
+                self.kinds[key] = (
+                    known or kind if kind is None or known in {None, kind} else "float"
+                )
+            row[key] = json.dumps(value, default=str) if kind == "json" else value
+        self.rows.append(row)
+        if len(self.rows) >= self.row_group_size:
+            self._flush()
+        return len(json.dumps(row, default=str))
+
+    def _schema(self) -> Any:  # noqa: ANN401
+        """Build the Arrow schema from the column kinds."""
+        types = {
+            "bool": pa.bool_(),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "str": pa.string(),
+            "json": pa.string(),
+            None: pa.string(),
+        }
+        json_columns = [k for k, kind in self.kinds.items() if kind == "json"]
+        return pa.schema(
+            [(key, types[kind]) for key, kind in self.kinds.items()],
+            metadata={"json_columns": json.dumps(json_columns)},
+        )
+
+    def _flush(self) -> None:
+        """Write the buffered records as a row group."""
+        if not self.rows:
+            return
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                str(self.tmp), self._schema(), compression=self.compression
+            )
+        schema = self._writer.schema
+        table = pa.Table.from_pylist(self.rows, schema=schema)
+        self._writer.write_table(table)
+        self.rows = []
+
+    def close(self) -> None:
+        """Finish the shard and give it its final name."""
+        self._flush()
+        self._writer.close()
+        self.tmp.replace(self.path)
+
+
+class ShardedWriter:
+    """Write records to a sequence of shards in one directory."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        output_format: DatasetFormat = DatasetFormat.JSONL,
+        compression: str | None = "gzip",
+        prefix: str = "part",
+        max_records: int = 100_000,
+        max_bytes: int = 256 * MiB,
+        max_seconds: float | None = None,
+        row_group_size: int = 10_000,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Shard numbering continues after the shards already in the directory,
+        so collection can resume in a later run.
+
+        Args:
+            directory: Directory for the shards
+            output_format: Shard format
+            compression: Shard compression
+            prefix: Shard file name prefix
+            max_records: Records per shard
+            max_bytes: Uncompressed bytes per shard
+            max_seconds: Shard age after which the next write starts a new one
+            row_group_size: Records per Parquet row group
+
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.output_format = DatasetFormat(output_format)
+        self.compression = compression
+        self.prefix = prefix
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.row_group_size = row_group_size
+        self.shards: list[Path] = []
+        self._shard: _JSONLShard | _ParquetShard | None = None
+        self._records = 0
+        self._bytes = 0
+        self._opened = 0.0
+        self._index = self._next_index()
+
+    @property
+    def suffix(self) -> str:
+        """File name suffix of the shards."""
+        if self.output_format == DatasetFormat.PARQUET:
+            return ".parquet"
+        return ".jsonl.gz" if self.compression == "gzip" else ".jsonl"
+
+    def _next_index(self) -> int:
+        """Return the number after the highest existing shard."""
+        pattern = re.compile(rf"^{re.escape(self.prefix)}-(\d+)\.")
+        indices = [
+            int(match.group(1))
+            for path in self.directory.iterdir()
+            if (match := pattern.match(path.name)) and not path.name.endswith(".tmp")
+        ]
+        return max(indices, default=-1) + 1
+
+    def _open(self) -> None:
+        """Start a new shard."""
+        path = self.directory / f"{self.prefix}-{self._index:05d}{self.suffix}"
+        self._index += 1
+        shard_type = (
+            _ParquetShard
+            if self.output_format == DatasetFormat.PARQUET
+            else _JSONLShard
+        )
+        self._shard = shard_type(
+            path, self.compression, row_group_size=self.row_group_size
+        )
+        self._records = 0
+        self._bytes = 0
+        self._opened = time.monotonic()
+
+    def _due(self) -> bool:
+        """Whether the open shard reached a limit."""
+        return (
+            self._records >= self.max_records
+            or self._bytes >= self.max_bytes
+            or (
+                self.max_seconds is not None
+                and time.monotonic() - self._opened >= self.max_seconds
+            )
+        )
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Write a record, starting a new shard when the current one is full.
+
+        Args:
+            record: The record
+
+        """
+        if self._shard is not None and (self._due() or not self._shard.accepts(record)):
+            self.roll()
+        if self._shard is None:
+            self._open()
+        self._bytes += self._shard.write(record)
+        self._records += 1
+
+    def roll(self) -> Path | None:
+        """
+        Close the current shard.
+
+        Returns:
+            The finished shard, or None if none was open
+
+        """
+        if self._shard is None:
+            return None
+        self._shard.close()
+        path = self._shard.path
+        self.shards.append(path)
+        self._shard = None
+        logger.debug("Finished shard %s (%d records)", path, self._records)
+        return path
+
+    def close(self) -> list[Path]:
+        """
+        Close the current shard.
+
+        Returns:
+            All shards finished by this writer
+
+        """
+        self.roll()
+        return list(self.shards)
+
+
+def _iter_parquet(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream the records of a Parquet file one row group at a time."""
+    if pq is None:
+        raise PyArrowNotAvailableError
+    parquet_file = pq.ParquetFile(str(path))
+    metadata = parquet_file.schema_arrow.metadata or {}
+    json_columns = set(json.loads(metadata.get(b"json_columns", b"[]")))
+    for batch in parquet_file.iter_batches():
+        for row in batch.to_pylist():
+            for key in json_columns:
+                if row.get(key) is not None:
+                    row[key] = json.loads(row[key])
+            yield row
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any] | None]:
+    """Stream the records of a JSONL file; malformed lines yield None."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping malformed line %d of %s", number, path)
+                yield None
+                continue
+            yield record if isinstance(record, dict) else None
+
+
+def iter_records(source: str | Path) -> Iterator[dict[str, Any] | None]:
+    """
+    Stream records from a file or a directory of shards.
+
+    Args:
+        source: A .jsonl, .jsonl.gz or .parquet file, or a directory searched
+            recursively for them in name order
+
+    Yields:
+        Records; None for lines that are not JSON objects
+
+    """
+    path = Path(source)
+    if path.is_dir():
+        files = sorted(
+            p
+            for p in path.rglob("*")
+            if p.is_file() and p.name.endswith((".jsonl", ".jsonl.gz", ".parquet"))
+        )
+    else:
+        files = [path]
+    for file in files:
+        if file.suffix == ".parquet":
+            yield from _iter_parquet(file)
+        else:
+            yield from _iter_jsonl(file)
+
+
+class DataCollector:
+    """
+    Collect records into a deduplicated, sharded dataset.
+
+    The collector is thread-safe, so concurrent agent runs can share one.
+    Use it as a context manager, or call :meth:`close` to finish the open
+    shards and write the manifest.
+    """
+
+    def __init__(self, config: DataCollectionConfig | None = None) -> None:
+        """
+        Initialize the collector.
+
+        Args:
+            config: Configuration for data collection (defaults if None)
+
+        """
+        self.config = config or DataCollectionConfig()
+        self.output_dir = Path(self.config.output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = CollectionStats()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._seen: BloomFilter | None = None
+        if self.config.dedupe:
+            self._seen = BloomFilter(
+                self.config.dedupe_capacity, self.config.dedupe_error_rate
+            )
+            if self._seen.load(self.output_dir / DEDUPE_STATE_FILE):
+                logger.info("Resumed duplicate filter from %s", self.output_dir)
+        self._writers = {
+            split: self._make_writer(
+                self.output_dir / split if split else self.output_dir
+            )
+            for split in (self.config.splits or ("",))
+        }
+
+    def _make_writer(self, directory: Path) -> ShardedWriter:
+        """Create the shard writer for one split."""
+        config = self.config
+        return ShardedWriter(
+            directory,
+            output_format=config.output_format,
+            compression=config.compression,
+            prefix=config.shard_prefix,
+            max_records=config.shard_max_records,
+            max_bytes=config.shard_max_bytes,
+            max_seconds=config.shard_max_seconds,
+            row_group_size=config.row_group_size,
+        )
+
+    def __enter__(self) -> DataCollector:  # noqa: PYI034
+        """Return the collector."""
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Close the collector."""
+        self.close()
+
+    def _accept(self, record: dict[str, Any]) -> bytes | None:
+        """Apply filters; return the content hash if the record is kept."""
+        config = self.config
+        if config.filter_function is not None and not config.filter_function(record):
+            return None
+        content = content_of(record, config)
+        length = _text_length(content)
+        if (config.min_length is not None and length < config.min_length) or (
+            config.max_length is not None and length > config.max_length
+        ):
+            return None
+        return content_hash(content)
+
+    def add(self, record: dict[str, Any] | None) -> bool:
+        """
+        Collect one record.
+
+        Args:
+            record: The record (None counts as invalid)
+
+        Returns:
+            True if the record was written
+
+        Raises:
+            RuntimeError: If the collector was closed
+
+        """
+        kept = record
+        if self.config.transform_function is not None and isinstance(record, dict):
+            kept = self.config.transform_function(record)
+        digest = self._accept(kept) if isinstance(kept, dict) else None
+
+        with self._lock:
+            if self._closed:
+                error_msg = "DataCollector is closed"
+                raise RuntimeError(error_msg)
+            self.stats.seen += 1
+            if not isinstance(record, dict):
+                self.stats.invalid += 1
+                return False
+            if digest is None:
+                self.stats.filtered += 1
+                return False
+            if self._seen is not None and not self._seen.add(digest):
+                self.stats.duplicates += 1
+                return False
+            split = _split_of(digest, self.config) if self.config.splits else ""
+            self._writers[split].write(kept)
+            self.stats.written += 1
+            name = split or "train"
+            self.stats.splits[name] = self.stats.splits.get(name, 0) + 1
+        return True
+
+    def add_many(self, records: Iterable[dict[str, Any] | None]) -> int:
+        """
+        Collect records from an iterable, one at a time.
+
+        Args:
+            records: The records
+
+        Returns:
+            Number of records written
+
+        """
+        return sum(self.add(record) for record in records)
+
+    def collect(self, sources: Iterable[str | Path] | None = None) -> int:
+        """
+        Collect records from files without loading them into memory.
+
+        Args:
+            sources: Files or directories (the configured sources if None)
+
+        Returns:
+            Number of records written
+
+        """
+        written = 0
+        for source in sources if sources is not None else self.config.sources:
+            logger.info("Collecting records from %s", source)
+            written += self.add_many(iter_records(source))
+        return written
+
+    def roll(self) -> None:
+        """Close the open shards, e.g. from a timer while records are sparse."""
+        with self._lock:
+            for writer in self._writers.values():
+                writer.roll()
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finish the open shards, save the duplicate filter and write the manifest.
+
+        Returns:
+            The manifest: statistics, configuration and shards per split
+
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                for writer in self._writers.values():
+                    writer.close()
+                if self._seen is not None:
+                    self._seen.save(self.output_dir / DEDUPE_STATE_FILE)
+            manifest = {
+                "stats": self.stats.to_dict(),
+                "config": self.config.to_dict(),
+                "shards": {
+                    split or "train": [
+                        str(path.relative_to(self.output_dir)) for path in writer.shards
+                    ]
+                    for split, writer in self._writers.items()
+                },
+                "created_at": time.time(),
+            }
+        tmp = self.output_dir / f"{MANIFEST_FILE}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2, default=str))
+        tmp.replace(self.output_dir / MANIFEST_FILE)
+        logger.info(
+            "Collected %d of %d records (%d duplicates, %d filtered) into %s",
+            self.stats.written,
+            self.stats.seen,
+            self.stats.duplicates,
+            self.stats.filtered,
+            self.output_dir,
+        )
+        return manifest
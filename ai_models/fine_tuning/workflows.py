@@ -1,7 +1,125 @@
-"""workflows - Module for ai_models/fine_tuning.workflows."""
+"""
+workflows - Module for ai_models/fine_tuning.workflows.
+
+Workflows that turn agent runs and interaction logs into training data.
+
+:func:`run_and_collect` runs an agent team (such as
+``MemoryEnhancedCrewAIAgentTeam``) and streams the run into a
+:class:`DataCollector`; :func:`build_training_set` rebuilds a deduplicated,
+sharded dataset from any amount of JSONL or Parquet logs without loading
+them into memory.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+import time
+from typing import TYPE_CHECKING, Any
 
 # Third-party imports
-
 # Local imports
+from .data_collector import DataCollectionConfig, DataCollector
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _role(agent: object) -> str:
+    """Return an agent's role, or "unknown"."""
+    return str(getattr(agent, "role", None) or "unknown")
+
+
+def record_from_team_run(
+    team: object,
+    result: Any,  # noqa: ANN401
+    **metadata: Any,  # noqa: ANN401
+) -> dict[str, Any]:
+    """
+    Build an interaction record from an agent team run.
+
+    The prompt is made of the team's task descriptions and the completion is
+    the run result, so records pair what was asked with what was produced.
+
+    Args:
+        team: The agent team (anything with ``agents`` and ``tasks``)
+        result: What the team's ``run`` returned
+        **metadata: Extra information stored under "metadata"
+
+    Returns:
+        The record
+
+    """
+    tasks = [
+        {
+            "description": str(getattr(task, "description", "")),
+            "agent_role": _role(getattr(task, "agent", None)),
+        }
+        for task in getattr(team, "tasks", [])
+    ]
+    user_id = getattr(team, "user_id", None)
+    if user_id is not None:
+        metadata.setdefault("user_id", user_id)
+    return {
+        "prompt": "\n".join(task["description"] for task in tasks),
+        "completion": result if isinstance(result, str) else str(result),
+        "tasks": tasks,
+        "agents": [_role(agent) for agent in getattr(team, "agents", [])],
+        "timestamp": time.time(),
+        "metadata": metadata,
+    }
+
+
+def run_and_collect(
+    team: Any,  # noqa: ANN401
+    collector: DataCollector,
+    **metadata: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """
+    Run an agent team and collect the run as a training record.
+
+    Failed runs (a None result) are not collected.
+
+    Args:
+        team: The agent team
+        collector: Receives the record
+        **metadata: Extra information stored with the record
+
+    Returns:
+        The result of ``team.run()``
+
+    """
+    result = team.run()
+    if result is not None:
+        collector.add(record_from_team_run(team, result, **metadata))
+    return result
+
+
+def build_training_set(
+    sources: Iterable[str | Path],
+    config: DataCollectionConfig | None = None,
+) -> dict[str, Any]:
+    """
+    Build a deduplicated, sharded dataset from interaction logs.
+
+    Records are streamed from the sources one at a time, so memory use does
+    not depend on how many logs there are.
+
+    Args:
+        sources: JSONL(.gz) or Parquet files, or directories of them
+        config: Configuration for data collection (defaults if None)
+
+    Returns:
+        The collection manifest (statistics and shards per split)
+
+    """
+    collector = DataCollector(config)
+    try:
+        collector.collect(sources)
+    finally:
+        manifest = collector.close()
+    return manifest
@@ -5,3 +5,7 @@
 # Third-party imports
 
 # Local imports
+from .api import get_metrics, to_prometheus
+from .enhanced_metrics import ModelStats, StreamingHistogram
+
+__all__ = ["ModelStats", "StreamingHistogram", "get_metrics", "to_prometheus"]
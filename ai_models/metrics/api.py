@@ -1,7 +1,86 @@
-"""api - Module for ai_models/metrics.api."""
+"""
+api - Module for ai_models/metrics.api.
+
+Functions for reading performance monitor statistics as JSON-ready
+dictionaries or Prometheus text exposition format.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import time
+from typing import TYPE_CHECKING, Any
 
 # Third-party imports
-
 # Local imports
+# Imported as a module: performance_monitor imports this package in turn
+from ai_models import performance_monitor
+
+if TYPE_CHECKING:
+    from ai_models.performance_monitor import PerformanceMonitor
+
+PROMETHEUS_PREFIX = "ai_models"
+
+
+def get_metrics(
+    monitor: PerformanceMonitor | None = None,
+    model_id: str | None = None,
+    window_seconds: float | None = None,
+) -> dict[str, Any]:
+    """
+    Get rolling-window metrics for all models or one model.
+
+    Args:
+        monitor: Monitor to read (the process-wide monitor if None)
+        model_id: Report only this model (all models if None)
+        window_seconds: Window to report (the monitor's full window if None)
+
+    Returns:
+        Dictionary with a timestamp and per-model snapshots
+
+    """
+    monitor = monitor or performance_monitor.get_performance_monitor()
+    return {
+        "timestamp": time.time(),
+        "models": monitor.get_stats(model_id, window_seconds),
+    }
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(metrics: dict[str, Any]) -> str:
+    """
+    Render metrics from :func:`get_metrics` in Prometheus text format.
+
+    Window statistics are exported as gauges; lifetime totals as counters.
+
+    Args:
+        metrics: Output of :func:`get_metrics`
+
+    Returns:
+        The exposition text
+
+    """
+    gauges: dict[str, list[str]] = {}
+    counters: dict[str, list[str]] = {}
+    for model_id, snapshot in metrics["models"].items():
+        label = f'model="{_escape_label(model_id)}"'
+        for key, value in snapshot["latency_ms"].items():
+            gauges.setdefault("latency_ms", []).append(
+                f'{{{label},stat="{key}"}} {value}'
+            )
+        for key in ("requests_per_sec", "tokens_per_sec", "error_rate"):
+            gauges.setdefault(key, []).append(f"{{{label}}} {snapshot[key]}")
+        for key, value in snapshot["totals"].items():
+            counters.setdefault(f"{key}_total", []).append(f"{{{label}}} {value}")
+
+    lines = []
+    for kind, families in (("gauge", gauges), ("counter", counters)):
+        for name, samples in families.items():
+            full_name = f"{PROMETHEUS_PREFIX}_{name}"
+            lines.append(f"# TYPE {full_name} {kind}")
+            lines.extend(f"{full_name}{sample}" for sample in samples)
+    return "\n".join(lines) + "\n" if lines else ""
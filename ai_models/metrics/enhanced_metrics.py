@@ -1,7 +1,374 @@
-"""enhanced_metrics - Module for ai_models/metrics.enhanced_metrics."""
+"""
+enhanced_metrics - Module for ai_models/metrics.enhanced_metrics.
+
+Fixed-memory streaming histograms and rolling-window model statistics.
+
+:class:`StreamingHistogram` uses HDR-style log-linear buckets: values below
+``2 ** (SUB_BUCKET_BITS + 1)`` are counted exactly, and every larger power of
+two is split into ``2 ** SUB_BUCKET_BITS`` equal buckets, bounding the
+relative error of any percentile to about ``2 ** -SUB_BUCKET_BITS`` (3%).
+Bucket lookup is a ``bit_length`` and a shift, so recording is O(1) and
+memory does not grow with the number of samples.
+
+:class:`ModelStats` keeps a ring of such histograms, one per time slot, so
+percentiles and throughput can be reported over a rolling window.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import math
+import threading
+import time
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+_monotonic = time.monotonic
+
+SUB_BUCKET_BITS = 5
+MAX_VALUE_BITS = 36  # about 19 hours when recording microseconds
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_EXACT_LIMIT = _SUB_BUCKETS << 1
+NUM_BUCKETS = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) << SUB_BUCKET_BITS
+MAX_TRACKABLE_VALUE = (1 << MAX_VALUE_BITS) - 1
+
+
+def bucket_index(value: int) -> int:
+    """
+    Return the histogram bucket for a non-negative integer value.
+
+    Args:
+        value: The value (clamped to ``MAX_TRACKABLE_VALUE``)
+
+    Returns:
+        The bucket index
+
+    """
+    if value < _EXACT_LIMIT:
+        return max(value, 0)
+    value = min(value, MAX_TRACKABLE_VALUE)
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """
+    Return the value range ``[low, high)`` covered by a bucket.
+
+    Args:
+        index: The bucket index
+
+    Returns:
+        The lower (inclusive) and upper (exclusive) bounds
+
+    """
+    if index < _EXACT_LIMIT:
+        return index, index + 1
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    low = (index - (shift << SUB_BUCKET_BITS)) << shift
+    return low, low + (1 << shift)
+
+
+class StreamingHistogram:
+    """Fixed-size log-linear histogram of non-negative integers."""
+
+    __slots__ = ("count", "counts", "max", "min", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Record one value.
+
+        Args:
+            value: The value to record
+
+        """
+        self.counts[bucket_index(value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: StreamingHistogram) -> None:
+        """
+        Add another histogram's samples into this one.
+
+        Args:
+            other: The histogram to merge
+
+        """
+        if not other.count:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def reset(self) -> None:
+        """Remove all samples."""
+        self.counts = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @property
+    def mean(self) -> float:
+        """Mean of recorded values (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            pct: Percentile in [0, 100]
+
+        Returns:
+            The midpoint of the bucket holding the percentile, clamped to the
+            observed min and max (0.0 when empty)
+
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            if seen >= target:
+                low, high = bucket_bounds(index)
+                return min(max((low + high - 1) / 2, self.min), self.max)
+        return float(self.max)
+
+
+class _Slot:
+    """Samples recorded during one time slot of a rolling window."""
+
+    __slots__ = (
+        "epoch",
+        "errors",
+        "histogram",
+        "input_tokens",
+        "output_tokens",
+        "requests",
+    )
+
+    def __init__(self) -> None:
+        self.epoch = -1
+        # Created on first use, so idle slots cost no bucket array
+        self.histogram: StreamingHistogram | None = None
+        self.requests = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def reset(self, epoch: int) -> None:
+        """Clear the slot and assign it to a new epoch."""
+        self.epoch = epoch
+        if self.histogram is None:
+            self.histogram = StreamingHistogram()
+        else:
+            self.histogram.reset()
+        self.requests = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+
+class _Shard:
+    """
+    Ring of slots shared by the threads striped onto it.
+
+    Lifetime totals only include retired slots; add the live slots' counters
+    to get the full totals. This keeps the recording path to one set of
+    increments.
+    """
+
+    __slots__ = (
+        "errors",
+        "input_tokens",
+        "lock",
+        "output_tokens",
+        "requests",
+        "slots",
+    )
+
+    def __init__(self, num_slots: int) -> None:
+        self.slots = [_Slot() for _ in range(num_slots)]
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def retire(self, slot: _Slot) -> None:
+        """Fold a slot's counters into the lifetime totals before reuse."""
+        self.requests += slot.requests
+        self.errors += slot.errors
+        self.input_tokens += slot.input_tokens
+        self.output_tokens += slot.output_tokens
+
+
+class ModelStats:
+    """
+    Rolling-window latency, token and error statistics for one model.
+
+    Latencies are stored in microseconds in a ring of ``slots`` histograms
+    covering ``window_seconds``. Lifetime request, error and token totals are
+    kept alongside the window.
+
+    Recording threads are striped over a fixed set of ``shards`` by thread
+    id, so memory does not grow with the number of threads and concurrent
+    :meth:`record` calls rarely wait on the same shard lock;
+    :meth:`snapshot` merges the shards. A snapshot taken while another
+    thread is recording may miss that thread's in-progress sample.
+    """
+
+    PERCENTILES = (50, 90, 95, 99)
+
+    def __init__(
+        self, window_seconds: float = 60.0, slots: int = 12, shards: int = 8
+    ) -> None:
+        """
+        Initialize the statistics.
+
+        Args:
+            window_seconds: Length of the rolling window
+            slots: Number of time slots the window is divided into
+            shards: Number of shards recording threads are striped over
+
+        """
+        self.window_seconds = window_seconds
+        self.slot_seconds = window_seconds / slots
+        self._num_slots = slots
+        self._slots_per_second = 1 / self.slot_seconds
+        self._shards = [_Shard(slots) for _ in range(max(1, shards))]
+        self._created = time.monotonic()
+
+    def record(
+        self,
+        latency: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        *,
+        error: bool = False,
+    ) -> None:
+        """
+        Record one call.
+
+        Args:
+            latency: Call latency in seconds
+            input_tokens: Prompt tokens
+            output_tokens: Generated tokens
+            error: Whether the call failed
+
+        """
+        shards = self._shards
+        shard = shards[threading.get_native_id() % len(shards)]
+        micros = int(latency * 1_000_000)
+        index = micros if 0 <= micros < _EXACT_LIMIT else bucket_index(micros)
+        epoch = int(_monotonic() * self._slots_per_second)
+        with shard.lock:
+            slot = shard.slots[epoch % self._num_slots]
+            if slot.epoch != epoch:
+                shard.retire(slot)
+                slot.reset(epoch)
+            hist = slot.histogram
+            hist.counts[index] += 1
+            # Plain comparisons are cheaper than max()/min() on this hot path
+            if micros > hist.max:  # noqa: PLR1730
+                hist.max = micros
+            if micros < hist.min or not hist.count:
+                hist.min = micros
+            hist.count += 1
+            hist.total += micros
+            slot.requests += 1
+            if input_tokens:
+                slot.input_tokens += input_tokens
+            if output_tokens:
+                slot.output_tokens += output_tokens
+            if error:
+                slot.errors += 1
+
+    def snapshot(self, window_seconds: float | None = None) -> dict[str, Any]:
+        """
+        Summarize the most recent ``window_seconds`` of calls.
+
+        Args:
+            window_seconds: Window to report (the full window if None; values
+                are rounded up to whole slots)
+
+        Returns:
+            Dictionary with request/error/token counts, error rate, latency
+            percentiles in milliseconds, throughput and lifetime totals
+
+        """
+        window = min(window_seconds or self.window_seconds, self.window_seconds)
+        num_slots = max(1, math.ceil(window / self.slot_seconds))
+        now = time.monotonic()
+        epoch = int(now * self._slots_per_second)
+        oldest = epoch - num_slots + 1
+
+        merged = StreamingHistogram()
+        requests = errors = input_tokens = output_tokens = 0
+        totals = dict.fromkeys(
+            ("requests", "errors", "input_tokens", "output_tokens"), 0
+        )
+        for shard in self._shards:
+            for slot in shard.slots:
+                totals["requests"] += slot.requests
+                totals["errors"] += slot.errors
+                totals["input_tokens"] += slot.input_tokens
+                totals["output_tokens"] += slot.output_tokens
+                if slot.histogram is not None and oldest <= slot.epoch <= epoch:
+                    merged.merge(slot.histogram)
+                    requests += slot.requests
+                    errors += slot.errors
+                    input_tokens += slot.input_tokens
+                    output_tokens += slot.output_tokens
+            totals["requests"] += shard.requests
+            totals["errors"] += shard.errors
+            totals["input_tokens"] += shard.input_tokens
+            totals["output_tokens"] += shard.output_tokens
+
+        span = min(now - oldest * self.slot_seconds, now - self._created)
+        span = max(span, 1e-9)
+        latency_ms = {
+            "mean": merged.mean / 1000,
+            "min": merged.min / 1000,
+            "max": merged.max / 1000,
+        }
+        for pct in self.PERCENTILES:
+            latency_ms[f"p{pct}"] = merged.percentile(pct) / 1000
+        return {
+            "window_seconds": num_slots * self.slot_seconds,
+            "requests": requests,
+            "errors": errors,
+            "error_rate": errors / requests if requests else 0.0,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_ms": latency_ms,
+            "requests_per_sec": requests / span,
+            "tokens_per_sec": output_tokens / span,
+            "totals": totals,
+        }
+
+    def reset(self) -> None:
+        """Remove all samples and totals."""
+        self._shards = [_Shard(self._num_slots) for _ in self._shards]
+        self._created = time.monotonic()
@@ -1,7 +1,168 @@
-"""model_base_types - Module for ai_models.model_base_types."""
+"""
+model_base_types - Module for ai_models.model_base_types.
+
+Types shared by the model manager and the model type implementations.
+
+:class:`ModelInfo` describes a registered model; :class:`LoadableModel` is the
+base class of the model types in :mod:`ai_models.model_types`, which hold
+their weights only between ``load()`` and ``unload()``.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+
+def estimate_path_bytes(path: str) -> int:
+    """
+    Estimate the memory a model needs from its size on disk.
+
+    Args:
+        path: A model file, or a directory whose files are summed
+
+    Returns:
+        The size in bytes (0 if the path does not exist)
+
+    """
+    target = Path(path)
+    if target.is_file():
+        return target.stat().st_size
+    if not target.is_dir():
+        return 0
+    total = 0
+    for root, _, files in os.walk(target):
+        for name in files:
+            total += (Path(root) / name).stat().st_size
+    return total
+
+
+@dataclass
+class ModelInfo:
+    """
+    Metadata for a registered model.
+
+    Attributes:
+        id: Unique model identifier
+        name: Display name
+        type: Model type, a key of ``ai_models.model_types.MODEL_TYPES``
+        path: Model file or directory
+        description: Free-form description
+        format: Weight format (e.g. "onnx", "pytorch", "gguf")
+        memory_bytes: Expected resident size (None to estimate from ``path``)
+        metadata: Extra keyword arguments for the model type
+
+    """
+
+    id: str
+    name: str = ""
+    type: str = ""
+    path: str = ""
+    description: str = ""
+    format: str = ""
+    memory_bytes: int | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Default the display name to the ID."""
+        self.name = self.name or self.id
+
+    def estimated_bytes(self) -> int:
+        """
+        Get the expected resident size of the model.
+
+        Returns:
+            ``memory_bytes`` if set, otherwise the size of ``path`` on disk
+
+        """
+        if self.memory_bytes is not None:
+            return self.memory_bytes
+        return estimate_path_bytes(self.path) if self.path else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the model information as a dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "path": self.path,
+            "description": self.description,
+            "format": self.format,
+            "memory_bytes": self.memory_bytes,
+            "metadata": dict(self.metadata),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModelInfo:
+        """
+        Create model information from :meth:`to_dict` output.
+
+        Args:
+            data: The model information dictionary
+
+        Returns:
+            The model information
+
+        """
+        return cls(**data)
+
+
+class LoadableModel(ABC):
+    """A model whose weights are held only while it is loaded."""
+
+    def __init__(self, model_path: str, model_type: str = "", **options: Any) -> None:  # noqa: ANN401
+        """
+        Initialize the model without loading it.
+
+        Args:
+            model_path: Model file or directory
+            model_type: Task of the model (e.g. "image-classification")
+            **options: Options for the concrete model type
+
+        """
+        self.model_path = model_path
+        self.model_type = model_type
+        self.options = options
+        self.model: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the weights are resident."""
+        return self.model is not None
+
+    @abstractmethod
+    def _load(self) -> Any:  # noqa: ANN401
+        """Load and return the underlying model object."""
+
+    def load(self) -> LoadableModel:
+        """
+        Load the weights if they are not resident.
+
+        Returns:
+            This model
+
+        """
+        with self._lock:
+            if self.model is None:
+                self.model = self._load()
+        return self
+
+    def unload(self) -> None:
+        """Release the weights."""
+        with self._lock:
+            self.model = None
+
+    @property
+    def memory_bytes(self) -> int:
+        """Resident size of the weights, estimated from their size on disk."""
+        return estimate_path_bytes(self.model_path) if self.is_loaded else 0
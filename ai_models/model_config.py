@@ -1,7 +1,126 @@
-"""model_config - Module for ai_models.model_config."""
+"""
+model_config - Module for ai_models.model_config.
+
+Configuration for the model manager.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from dataclasses import dataclass, field
+from typing import Any
 
 # Third-party imports
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Local imports
+
+# Constants
+SUPPORTED_DEVICES = ("auto", "cpu", "cuda", "mps")
+
+
+class ModelConfigError(ValueError):
+    """Raised when a model configuration value is invalid."""
+
+    MESSAGE_TEMPLATE = "Invalid model configuration: {detail}"
+
+    def __init__(self, detail: str) -> None:
+        """
+        Initialize the ModelConfigError.
+
+        Args:
+            detail: Description of the invalid value
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(detail=detail))
+
+
+@dataclass
+class ModelConfig:
+    """
+    Configuration for :class:`~ai_models.model_manager.ModelManager`.
+
+    Attributes:
+        models_dir: Directory scanned by ``discover_models``
+        cache_dir: Directory for downloaded and converted models
+        cache_enabled: Whether model responses may be cached
+        default_device: Device models are loaded on ("auto", "cpu", "cuda", "mps")
+        memory_budget_bytes: RAM that resident models may use (None to derive
+            it from ``memory_budget_fraction``)
+        memory_budget_fraction: Fraction of system RAM used as the budget when
+            ``memory_budget_bytes`` is None
+        pinned_models: Model IDs that are never evicted once loaded
+        model_options: Extra keyword arguments for model loaders, by model ID
+
+    """
+
+    models_dir: str = "models"
+    cache_dir: str = ".cache/ai_models"
+    cache_enabled: bool = True
+    default_device: str = "auto"
+    memory_budget_bytes: int | None = None
+    memory_budget_fraction: float = 0.5
+    pinned_models: list[str] = field(default_factory=list)
+    model_options: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the configuration.
+
+        Raises:
+            ModelConfigError: If a value is out of range or unsupported
+
+        """
+        detail = None
+        if self.default_device not in SUPPORTED_DEVICES:
+            detail = f"unsupported device '{self.default_device}'"
+        elif self.memory_budget_bytes is not None and self.memory_budget_bytes <= 0:
+            detail = "memory_budget_bytes must be positive or None"
+        elif not 0 < self.memory_budget_fraction <= 1:
+            detail = "memory_budget_fraction must be in (0, 1]"
+        if detail is not None:
+            raise ModelConfigError(detail)
+
+    def get_memory_budget(self) -> int | None:
+        """
+        Get the RAM budget for resident models.
+
+        Returns:
+            The budget in bytes, or None for no limit when it cannot be derived
+
+        """
+        if self.memory_budget_bytes is not None:
+            return self.memory_budget_bytes
+        if psutil is None:
+            return None
+        return int(psutil.virtual_memory().total * self.memory_budget_fraction)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the configuration as a dictionary."""
+        return {
+            "models_dir": self.models_dir,
+            "cache_dir": self.cache_dir,
+            "cache_enabled": self.cache_enabled,
+            "default_device": self.default_device,
+            "memory_budget_bytes": self.memory_budget_bytes,
+            "memory_budget_fraction": self.memory_budget_fraction,
+            "pinned_models": list(self.pinned_models),
+            "model_options": {k: dict(v) for k, v in self.model_options.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModelConfig:
+        """
+        Create a configuration from :meth:`to_dict` output.
+
+        Args:
+            data: The configuration dictionary
+
+        Returns:
+            The configuration
+
+        """
+        return cls(**data)
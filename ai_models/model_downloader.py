@@ -1,7 +1,927 @@
-"""model_downloader - Module for ai_models.model_downloader."""
+"""
+model_downloader - Module for ai_models.model_downloader.
+
+Parallel, resumable, content-addressed model downloads.
+
+Large files are fetched as byte ranges over several connections and written
+straight into a preallocated file. A manifest next to the partial file records
+the finished parts, so an interrupted download resumes where it stopped. The
+SHA-256 digest is computed while the download runs, over the contiguous prefix
+of finished parts, and is ready as soon as the last part lands.
+
+Finished files are stored once under their digest (``blobs/sha256/<digest>``)
+and hard-linked into each model's directory, so models sharing a file (a
+tokenizer, a base checkpoint) share one copy on disk and one download.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 # Third-party imports
+import httpx
 
 # Local imports
+from ai_models.caching.single_flight import SingleFlight
+from ai_models.model_base_types import ModelInfo
+from ai_models.model_config import ModelConfig
+
+if TYPE_CHECKING:
+    from ai_models.model_manager import ModelManager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+HF_URL_TEMPLATE = "https://huggingface.co/{repo_id}/resolve/{revision}/{file_name}"
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes \d+-\d+/(\d+)")
+_HASH_READ_SIZE = MiB
+
+
+def _etag_digest(etag: str | None) -> str | None:
+    """Return the SHA-256 digest an ETag carries, if it is one."""
+    value = (etag or "").strip()
+    if value[:2].lower() == "w/":
+        value = value[2:]
+    value = value.strip('"').lower()
+    return value if _SHA256_PATTERN.match(value) else None
+
+
+class DownloadStatus(str, Enum):
+    """State of a download."""
+
+    PENDING = "pending"
+    DOWNLOADING = "downloading"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class DownloadError(RuntimeError):
+    """Raised when a download fails."""
+
+
+class DownloadCancelledError(DownloadError):
+    """Raised when a download is cancelled."""
+
+    MESSAGE = "Download cancelled"
+
+    def __init__(self) -> None:
+        """Initialize the DownloadCancelledError."""
+        super().__init__(self.MESSAGE)
+
+
+class ChecksumMismatchError(DownloadError):
+    """Raised when downloaded content does not match the expected digest."""
+
+    MESSAGE_TEMPLATE = "SHA-256 mismatch for {url}: expected {expected}, got {actual}"
+
+    def __init__(self, url: str, expected: str, actual: str) -> None:
+        """
+        Initialize the ChecksumMismatchError.
+
+        Args:
+            url: The downloaded URL
+            expected: The expected digest
+            actual: The digest of the downloaded content
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(url=url, expected=expected, actual=actual)
+        )
+
+
+@dataclass
+class DownloadProgress:
+    """Progress of one download, updated from the worker threads."""
+
+    status: DownloadStatus = DownloadStatus.PENDING
+    total_bytes: int = 0
+    downloaded_bytes: int = 0
+    resumed_bytes: int = 0
+    deduplicated: bool = False
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, size: int) -> None:
+        """Count ``size`` more bytes as downloaded."""
+        with self._lock:
+            self.downloaded_bytes += size
+
+    @property
+    def percentage(self) -> float:
+        """Completion in percent."""
+        if not self.total_bytes:
+            return 100.0 if self.status == DownloadStatus.COMPLETED else 0.0
+        return 100.0 * self.downloaded_bytes / self.total_bytes
+
+    @property
+    def speed(self) -> float:
+        """Bytes per second transferred in this session (excluding resumed bytes)."""
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        transferred = self.downloaded_bytes - self.resumed_bytes
+        return transferred / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the progress as a dictionary."""
+        return {
+            "status": self.status.value,
+            "total_bytes": self.total_bytes,
+            "downloaded_bytes": self.downloaded_bytes,
+            "resumed_bytes": self.resumed_bytes,
+            "deduplicated": self.deduplicated,
+            "percentage": self.percentage,
+            "speed": self.speed,
+            "error": self.error,
+        }
+
+
+@dataclass
+class _Part:
+    """A byte range of a file (``end`` inclusive) and the next byte to fetch."""
+
+    start: int
+    end: int
+    pos: int = -1
+
+    def __post_init__(self) -> None:
+        """Start fetching at the beginning of the range."""
+        if self.pos < 0:
+            self.pos = self.start
+
+
+@dataclass
+class _Manifest:
+    """Resume state of a partial download."""
+
+    url: str
+    size: int
+    etag: str | None
+    part_size: int
+    completed: set[int] = field(default_factory=set)
+
+    def matches(self, other: _Manifest) -> bool:
+        """Whether a saved manifest describes the same remote file and layout."""
+        return (self.url, self.size, self.etag, self.part_size) == (
+            other.url,
+            other.size,
+            other.etag,
+            other.part_size,
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the manifest atomically."""
+        tmp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        data = {
+            "url": self.url,
+            "size": self.size,
+            "etag": self.etag,
+            "part_size": self.part_size,
+            "completed": sorted(self.completed),
+        }
+        tmp.write_text(json.dumps(data))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> _Manifest | None:
+        """Read a manifest, returning None if missing or unreadable."""
+        try:
+            data = json.loads(path.read_text())
+            return cls(
+                data["url"],
+                data["size"],
+                data["etag"],
+                data["part_size"],
+                set(data["completed"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+class _PrefixHasher:
+    """SHA-256 over the contiguous prefix of finished parts of a file."""
+
+    def __init__(self, path: Path, size: int, part_size: int) -> None:
+        """Start hashing ``path`` from the beginning."""
+        self.path = path
+        self.size = size
+        self.part_size = part_size
+        self.offset = 0
+        self._sha = hashlib.sha256()
+
+    def advance(self, completed: set[int]) -> None:
+        """Hash every finished part that follows the hashed prefix."""
+        if self.offset >= self.size or self.offset // self.part_size not in completed:
+            return
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            while (
+                self.offset < self.size and self.offset // self.part_size in completed
+            ):
+                end = min(self.offset + self.part_size, self.size)
+                while self.offset < end:
+                    chunk = f.read(min(_HASH_READ_SIZE, end - self.offset))
+                    self._sha.update(chunk)
+                    self.offset += len(chunk)
+
+    def hexdigest(self) -> str:
+        """Return the digest of the whole file (all parts must be finished)."""
+        return self._sha.hexdigest()
+
+
+class BlobStore:
+    """Content-addressed storage of downloaded files."""
+
+    def __init__(self, root: str) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding ``sha256/``, ``partial/`` and ``urls/``
+
+        """
+        self.root = Path(root)
+        for sub in ("sha256", "partial", "urls"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+
+    def blob_path(self, digest: str) -> Path:
+        """Return the path of the blob with ``digest``."""
+        return self.root / "sha256" / digest
+
+    def has(self, digest: str | None) -> bool:
+        """Whether a blob with ``digest`` is stored."""
+        return bool(digest) and self.blob_path(digest).is_file()
+
+    def partial_path(self, url: str) -> Path:
+        """Return the partial-download path for ``url``."""
+        key = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.root / "partial" / f"{key}.part"
+
+    def put(self, path: Path, digest: str) -> Path:
+        """
+        Move a finished file into the store.
+
+        Args:
+            path: The finished file
+            digest: Its SHA-256 digest
+
+        Returns:
+            The blob path (an existing identical blob is kept)
+
+        """
+        blob = self.blob_path(digest)
+        if blob.exists():
+            path.unlink()
+        else:
+            path.replace(blob)
+        return blob
+
+    def lookup_url(self, url: str) -> dict[str, Any] | None:
+        """
+        Return what ``url`` served last time, if known.
+
+        Returns:
+            The ``digest``, and the ``etag`` and ``size`` the server reported
+            (None for records without them)
+
+        """
+        ref = self.root / "urls" / hashlib.sha256(url.encode()).hexdigest()
+        try:
+            text = ref.read_text().strip()
+        except OSError:
+            return None
+        try:
+            record = json.loads(text)
+        except ValueError:
+            # Records of older versions hold only the digest
+            record = {"digest": text}
+        return {
+            "digest": record.get("digest"),
+            "etag": record.get("etag"),
+            "size": record.get("size"),
+        }
+
+    def remember_url(
+        self,
+        url: str,
+        digest: str,
+        etag: str | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Record that ``url`` served the content with ``digest``."""
+        ref = self.root / "urls" / hashlib.sha256(url.encode()).hexdigest()
+        ref.write_text(json.dumps({"digest": digest, "etag": etag, "size": size}))
+
+    def link(self, digest: str, dest: Path) -> Path:
+        """
+        Make ``dest`` refer to a blob, by hard link where possible.
+
+        Falls back to a symbolic link, then to a copy, on file systems that
+        do not support hard links.
+
+        Args:
+            digest: The blob digest
+            dest: Path to create or replace
+
+        Returns:
+            ``dest``
+
+        """
+        blob = self.blob_path(digest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(OSError):
+            if dest.exists() and dest.samefile(blob):
+                return dest
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(blob, tmp)
+        except OSError:
+            try:
+                tmp.symlink_to(blob.resolve())
+            except OSError:
+                shutil.copy2(blob, tmp)
+        tmp.replace(dest)
+        return dest
+
+
+class DownloadTask:
+    """A download running in a background thread."""
+
+    def __init__(self, url: str, model_id: str, file_name: str) -> None:
+        """
+        Initialize the task.
+
+        Args:
+            url: The URL being downloaded
+            model_id: The model the file belongs to
+            file_name: Name of the file in the model directory
+
+        """
+        self.url = url
+        self.model_id = model_id
+        self.file_name = file_name
+        self.progress = DownloadProgress()
+        self.path: Path | None = None
+        self.exception: BaseException | None = None
+        self.cancel_event = threading.Event()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def done(self) -> bool:
+        """Whether the download has finished, successfully or not."""
+        return self._done.is_set()
+
+    def cancel(self) -> None:
+        """Ask the download to stop; partial data is kept for resuming."""
+        self.cancel_event.set()
+
+    def wait(self, timeout: float | None = None) -> Path:
+        """
+        Wait for the download to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+
+        Returns:
+            Path of the file in the model directory
+
+        Raises:
+            TimeoutError: If the download is still running after ``timeout``
+            DownloadError: If the download failed or was cancelled
+
+        """
+        if not self._done.wait(timeout):
+            error_msg = f"Download of {self.url} still running"
+            raise TimeoutError(error_msg)
+        if self.exception is not None:
+            raise self.exception
+        return self.path
+
+
+class ModelDownloader:
+    """Download model files in parallel byte ranges into a content-addressed store."""
+
+    def __init__(
+        self,
+        model_manager: ModelManager | None = None,
+        *,
+        cache_dir: str | None = None,
+        models_dir: str | None = None,
+        num_connections: int = 8,
+        part_size: int = 8 * MiB,
+        chunk_size: int = 256 * 1024,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        client: httpx.Client | None = None,
+    ) -> None:
+        """
+        Initialize the downloader.
+
+        Args:
+            model_manager: Manager that downloaded models are registered with
+            cache_dir: Root of the blob store (the manager's cache_dir/blobs
+                by default)
+            models_dir: Directory of per-model file links (the manager's
+                models_dir by default)
+            num_connections: Parallel range requests per file
+            part_size: Bytes per range request, and the resume granularity
+            chunk_size: Bytes per read from a response stream
+            timeout: Network timeout in seconds
+            max_retries: Retries per part before the download fails
+            client: HTTP client to use (one is created if None)
+
+        """
+        config = model_manager.config if model_manager is not None else ModelConfig()
+        self.model_manager = model_manager
+        self.store = BlobStore(cache_dir or str(Path(config.cache_dir) / "blobs"))
+        self.models_dir = Path(models_dir or config.models_dir)
+        self.num_connections = num_connections
+        self.part_size = part_size
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        # Concurrent downloads of one URL share its partial file: coalesce them
+        self._flight: SingleFlight[str] = SingleFlight()
+        self._own_client = client is None
+        self.client = client or httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=num_connections * 2,
+                max_keepalive_connections=num_connections * 2,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the HTTP client if the downloader created it."""
+        if self._own_client:
+            self.client.close()
+
+    def __enter__(self) -> ModelDownloader:  # noqa: PYI034
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Close the downloader."""
+        self.close()
+
+    def _probe(self, url: str) -> tuple[int, bool, str | None]:
+        """
+        Find the size, range support and ETag of a remote file.
+
+        Returns:
+            Size in bytes (0 if unknown), whether byte ranges are served,
+            and the ETag
+
+        """
+        with self.client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+            response.raise_for_status()
+            etag = response.headers.get("etag")
+            if response.status_code == httpx.codes.PARTIAL_CONTENT:
+                match = _CONTENT_RANGE_PATTERN.match(
+                    response.headers.get("content-range", "")
+                )
+                if match:
+                    return int(match.group(1)), True, etag
+            return int(response.headers.get("content-length", 0)), False, etag
+
+    def _read_range(
+        self,
+        url: str,
+        path: Path,
+        part: _Part,
+        *,
+        etag: str | None,
+        progress: DownloadProgress,
+        cancel: threading.Event,
+    ) -> None:
+        """
+        Stream the rest of a part into ``path``, advancing ``part.pos``.
+
+        Raises:
+            DownloadError: If the server does not answer with the range, or
+                closes the connection early (after the bytes it did send
+                have been written)
+
+        """
+        headers = {"Range": f"bytes={part.pos}-{part.end}"}
+        if etag:
+            headers["If-Range"] = etag
+        with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code != httpx.codes.PARTIAL_CONTENT:
+                error_msg = (
+                    f"Expected 206 for bytes {part.pos}-{part.end} of {url}, "
+                    f"got {response.status_code}"
+                )
+                raise DownloadError(error_msg)
+            with path.open("r+b") as f:
+                f.seek(part.pos)
+                for chunk in response.iter_bytes(self.chunk_size):
+                    if cancel.is_set():
+                        raise DownloadCancelledError
+                    data = chunk[: part.end + 1 - part.pos]
+                    f.write(data)
+                    progress.add(len(data))
+                    part.pos += len(data)
+        if part.pos <= part.end:
+            error_msg = f"Connection closed at byte {part.pos} of {url}"
+            raise DownloadError(error_msg)
+
+    def _fetch_part(self, url: str, path: Path, part: _Part, **kwargs: Any) -> None:  # noqa: ANN401
+        """
+        Download a part into ``path``, with retries.
+
+        A retry continues from the last byte written rather than the part start.
+
+        Args:
+            url: The file URL
+            path: The preallocated partial file
+            part: The byte range to download
+            **kwargs: ``etag``, ``progress`` and ``cancel`` for :meth:`_read_range`
+
+        """
+        attempt = 0
+        while True:
+            try:
+                self._read_range(url, path, part, **kwargs)
+            except DownloadCancelledError:  # noqa: PERF203 - retry loop
+                raise
+            except (httpx.HTTPError, DownloadError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "Retrying bytes %d-%d of %s (%d/%d): %s",
+                    part.pos,
+                    part.end,
+                    url,
+                    attempt,
+                    self.max_retries,
+                    e,
+                )
+                time.sleep(min(0.25 * 2**attempt, 5.0))
+            else:
+                return
+
+    def _fetch_ranges(
+        self,
+        url: str,
+        size: int,
+        etag: str | None,
+        progress: DownloadProgress,
+        cancel: threading.Event,
+    ) -> tuple[Path, str]:
+        """Download a file as parallel ranges, resuming from its manifest."""
+        path = self.store.partial_path(url)
+        manifest_path = path.with_suffix(".manifest.json")
+        manifest = _Manifest(url, size, etag, self.part_size)
+        saved = _Manifest.load(manifest_path)
+        if saved is not None and saved.matches(manifest) and path.exists():
+            manifest.completed = saved.completed
+        else:
+            with path.open("wb") as f:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, size)
+                except (AttributeError, OSError):
+                    f.truncate(size)
+            manifest.save(manifest_path)
+
+        num_parts = (size + self.part_size - 1) // self.part_size
+        pending = [i for i in range(num_parts) if i not in manifest.completed]
+        resumed = sum(
+            min(self.part_size, size - i * self.part_size) for i in manifest.completed
+        )
+        progress.resumed_bytes = progress.downloaded_bytes = resumed
+        if resumed:
+            logger.info("Resuming %s at %d of %d bytes", url, resumed, size)
+
+        hasher = _PrefixHasher(path, size, self.part_size)
+        hasher.advance(manifest.completed)
+        options = {"etag": etag, "progress": progress, "cancel": cancel}
+        with ThreadPoolExecutor(self.num_connections) as pool:
+            futures = {
+                pool.submit(
+                    self._fetch_part,
+                    url,
+                    path,
+                    _Part(i * self.part_size, min((i + 1) * self.part_size, size) - 1),
+                    **options,
+                ): i
+                for i in pending
+            }
+            remaining = set(futures)
+            while remaining:
+                done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+                if any(future.exception() for future in done):
+                    # Stop the other parts, keeping those that still finish
+                    cancel.set()
+                    done |= wait(remaining).done
+                    remaining = set()
+                manifest.completed.update(
+                    futures[future] for future in done if not future.exception()
+                )
+                manifest.save(manifest_path)
+                # Hash while later parts are still downloading
+                hasher.advance(manifest.completed)
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            # A cancellation caused by another part's failure is not the cause
+            errors.sort(key=lambda e: isinstance(e, DownloadCancelledError))
+            raise errors[0]
+        manifest_path.unlink()
+        return path, hasher.hexdigest()
+
+    def _fetch_stream(
+        self, url: str, progress: DownloadProgress, cancel: threading.Event
+    ) -> tuple[Path, str]:
+        """Download a file in one stream (servers without range support)."""
+        path = self.store.partial_path(url)
+        sha = hashlib.sha256()
+        with self.client.stream("GET", url) as response, path.open("wb") as f:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(self.chunk_size):
+                if cancel.is_set():
+                    raise DownloadCancelledError
+                f.write(chunk)
+                sha.update(chunk)
+                progress.add(len(chunk))
+        return path, sha.hexdigest()
+
+    def _fetch_blob(self, url: str, sha256: str | None, task: DownloadTask) -> str:
+        """
+        Put the content of ``url`` into the store unless it is already there.
+
+        Concurrent calls for the same URL share one download.
+
+        Returns:
+            The content digest
+
+        Raises:
+            ChecksumMismatchError: If the content does not match ``sha256``
+
+        """
+        progress = task.progress
+        if self.store.has(sha256):
+            self._mark_deduplicated(progress, sha256)
+            return sha256
+        fetched = False
+
+        def fetch() -> str:
+            nonlocal fetched
+            fetched = True
+            return self._fetch_url(url, sha256, task)
+
+        digest = self._flight.do(url, fetch)
+        if not fetched:
+            # Another download of the same URL brought the content in
+            self._mark_deduplicated(progress, digest)
+            if sha256 and digest != sha256:
+                raise ChecksumMismatchError(url, sha256, digest)
+        return digest
+
+    def _fetch_url(self, url: str, sha256: str | None, task: DownloadTask) -> str:
+        """
+        Download ``url`` into the store unless its current content is stored.
+
+        The content is known without a transfer from a SHA-256 ETag, or from
+        an earlier download of the URL whose ETag and size are unchanged.
+
+        Returns:
+            The content digest
+
+        Raises:
+            ChecksumMismatchError: If the content does not match ``sha256``
+
+        """
+        progress = task.progress
+        size, ranges, etag = self._probe(url)
+        progress.total_bytes = size
+        digest = _etag_digest(etag)
+        known = self.store.lookup_url(url)
+        if (
+            digest is None
+            and known is not None
+            and (etag or size)
+            and (known["etag"], known["size"]) == (etag, size)
+        ):
+            digest = known["digest"]
+        if self.store.has(digest):
+            self._mark_deduplicated(progress, digest)
+            self.store.remember_url(url, digest, etag, size)
+            return digest
+        if ranges and size:
+            path, digest = self._fetch_ranges(
+                url, size, etag, progress, task.cancel_event
+            )
+        else:
+            path, digest = self._fetch_stream(url, progress, task.cancel_event)
+        if sha256 and digest != sha256:
+            path.unlink()
+            raise ChecksumMismatchError(url, sha256, digest)
+        self.store.put(path, digest)
+        self.store.remember_url(url, digest, etag, size)
+        return digest
+
+    def _mark_deduplicated(self, progress: DownloadProgress, digest: str) -> None:
+        """Report a download served from a blob already in the store."""
+        progress.deduplicated = True
+        progress.total_bytes = self.store.blob_path(digest).stat().st_size
+        progress.downloaded_bytes = progress.total_bytes
+
+    def download(
+        self,
+        url: str,
+        model_id: str,
+        *,
+        file_name: str | None = None,
+        sha256: str | None = None,
+        model_type: str = "",
+        auto_register: bool = False,
+        task: DownloadTask | None = None,
+    ) -> Path:
+        """
+        Download a file into a model's directory (blocking).
+
+        A file whose content is already in the store, known from ``sha256``,
+        from a SHA-256 ETag, or from an earlier download of the same URL whose
+        ETag and size have not changed, is linked without transferring it
+        again. Concurrent downloads of the same URL share one transfer.
+
+        Args:
+            url: The file URL
+            model_id: The model the file belongs to
+            file_name: Name in the model directory (from the URL if None)
+            sha256: Expected SHA-256 hex digest
+            model_type: Model type used when registering
+            auto_register: Register the model with the model manager
+            task: Task whose progress and cancellation to use
+
+        Returns:
+            Path of the file in the model directory
+
+        Raises:
+            ChecksumMismatchError: If the content does not match ``sha256``
+            DownloadCancelledError: If the task was cancelled
+            DownloadError: If the server fails or misbehaves after all retries
+
+        """
+        file_name = file_name or Path(urlsplit(url).path).name or "model.bin"
+        task = task or DownloadTask(url, model_id, file_name)
+        progress = task.progress
+        progress.started_at = time.monotonic()
+        progress.status = DownloadStatus.DOWNLOADING
+        sha256 = sha256.lower() if sha256 else None
+        dest = self.models_dir / model_id / file_name
+        try:
+            digest = self._fetch_blob(url, sha256, task)
+            self.store.link(digest, dest)
+        except DownloadCancelledError as e:
+            progress.status = DownloadStatus.CANCELLED
+            progress.error = str(e)
+            raise
+        except httpx.HTTPError as e:
+            progress.status = DownloadStatus.FAILED
+            progress.error = str(e)
+            error_msg = f"Download of {url} failed: {e}"
+            raise DownloadError(error_msg) from e
+        except Exception as e:
+            progress.status = DownloadStatus.FAILED
+            progress.error = str(e)
+            raise
+        finally:
+            progress.finished_at = time.monotonic()
+        progress.status = DownloadStatus.COMPLETED
+        task.path = dest
+        if auto_register and self.model_manager is not None:
+            self._register(model_id, model_type, dest)
+        return dest
+
+    def _register(self, model_id: str, model_type: str, path: Path) -> None:
+        """Register a downloaded model with the model manager."""
+        # Local import: model_manager imports the caching package
+        from ai_models.model_manager import MODEL_FILE_FORMATS  # noqa: PLC0415
+
+        model_dir = path.parent
+        files = [p for p in model_dir.iterdir() if not p.name.startswith(".")]
+        self.model_manager.register_model(
+            ModelInfo(
+                id=model_id,
+                type=model_type,
+                path=str(path if len(files) == 1 else model_dir),
+                format=MODEL_FILE_FORMATS.get(path.suffix, ""),
+            )
+        )
+
+    def _start(self, task: DownloadTask, **kwargs: Any) -> DownloadTask:  # noqa: ANN401
+        """Run a download task in a background thread."""
+
+        def run() -> None:
+            try:
+                self.download(
+                    task.url,
+                    task.model_id,
+                    file_name=task.file_name,
+                    task=task,
+                    **kwargs,
+                )
+            except BaseException as e:  # noqa: BLE001 - re-raised by wait()
+                task.exception = e
+            finally:
+                task._done.set()  # noqa: SLF001
+
+        task._thread = threading.Thread(  # noqa: SLF001
+            target=run, name=f"download-{task.model_id}", daemon=True
+        )
+        task._thread.start()  # noqa: SLF001
+        return task
+
+    def download_from_url(
+        self,
+        url: str,
+        model_id: str,
+        model_type: str = "",
+        *,
+        file_name: str | None = None,
+        sha256: str | None = None,
+        auto_register: bool = True,
+    ) -> DownloadTask:
+        """
+        Start downloading a file in the background.
+
+        Args:
+            url: The file URL
+            model_id: The model the file belongs to
+            model_type: Model type used when registering
+            file_name: Name in the model directory (from the URL if None)
+            sha256: Expected SHA-256 hex digest
+            auto_register: Register the model with the model manager
+
+        Returns:
+            The running task
+
+        """
+        file_name = file_name or Path(urlsplit(url).path).name or "model.bin"
+        return self._start(
+            DownloadTask(url, model_id, file_name),
+            sha256=sha256,
+            model_type=model_type,
+            auto_register=auto_register,
+        )
+
+    def download_from_huggingface(
+        self,
+        model_id: str,
+        file_name: str,
+        *,
+        revision: str = "main",
+        model_type: str = "",
+        sha256: str | None = None,
+        auto_register: bool = True,
+    ) -> DownloadTask:
+        """
+        Start downloading a file of a Hugging Face Hub repository.
+
+        Args:
+            model_id: Repository ID, e.g. "gpt2"; also used as the model ID
+            file_name: File in the repository
+            revision: Branch, tag or commit
+            model_type: Model type used when registering
+            sha256: Expected SHA-256 hex digest (LFS files also advertise it
+                in their ETag)
+            auto_register: Register the model with the model manager
+
+        Returns:
+            The running task
+
+        """
+        url = HF_URL_TEMPLATE.format(
+            repo_id=model_id, revision=revision, file_name=file_name
+        )
+        return self.download_from_url(
+            url,
+            model_id.replace("/", "--"),
+            model_type,
+            file_name=file_name,
+            sha256=sha256,
+            auto_register=auto_register,
+        )
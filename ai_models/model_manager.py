@@ -1,7 +1,497 @@
-"""model_manager - Module for ai_models.model_manager."""
+"""
+model_manager - Module for ai_models.model_manager.
+
+Registry of models that loads weights on first use.
+
+Registering a model only records its :class:`~ai_models.model_base_types.ModelInfo`.
+The weights are loaded the first time the model is requested, and concurrent
+first requests share a single load. Resident models are kept under a RAM
+budget: before a load, least recently used models are evicted until the new
+model's expected size fits. Pinned models and models currently held through
+:meth:`ModelManager.use` are never evicted.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import contextlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 # Third-party imports
-
 # Local imports
+from ai_models.caching.single_flight import SingleFlight
+from ai_models.model_base_types import ModelInfo
+from ai_models.model_config import ModelConfig
+from ai_models.model_types import get_model_class
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Weight formats recognised by discover_models, by file extension
+MODEL_FILE_FORMATS = {
+    ".onnx": "onnx",
+    ".gguf": "gguf",
+    ".safetensors": "safetensors",
+    ".bin": "pytorch",
+    ".pt": "pytorch",
+}
+
+ModelLoader = Callable[[ModelInfo], Any]
+
+
+class ModelNotFoundError(KeyError):
+    """Raised when a model ID is not registered."""
+
+    MESSAGE_TEMPLATE = "Model '{model_id}' is not registered"
+
+    def __init__(self, model_id: str) -> None:
+        """
+        Initialize the ModelNotFoundError.
+
+        Args:
+            model_id: The model identifier
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(model_id=model_id))
+
+
+class ModelMemoryBudgetError(MemoryError):
+    """Raised when a model cannot fit in the budget even after evictions."""
+
+    MESSAGE_TEMPLATE = (
+        "Model '{model_id}' needs {needed} bytes but only {available} of the "
+        "{budget}-byte budget can be freed"
+    )
+
+    def __init__(self, model_id: str, needed: int, available: int, budget: int) -> None:
+        """
+        Initialize the ModelMemoryBudgetError.
+
+        Args:
+            model_id: The model identifier
+            needed: Expected size of the model
+            available: Bytes available after evicting every evictable model
+            budget: The memory budget
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(
+                model_id=model_id, needed=needed, available=available, budget=budget
+            )
+        )
+
+
+@dataclass
+class _ResidentModel:
+    """A loaded model and its accounting."""
+
+    model: Any
+    memory_bytes: int
+    load_time: float
+    loaded_at: float
+    last_used: float
+    uses: int = 0
+    leases: int = 0
+
+
+class ModelManager:
+    """Register models, load them lazily and keep them under a RAM budget."""
+
+    def __init__(
+        self,
+        config: ModelConfig | None = None,
+        *,
+        memory_budget_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            config: Configuration (defaults if None)
+            memory_budget_bytes: RAM budget overriding the configuration's
+
+        """
+        self.config = config or ModelConfig()
+        self.memory_budget = (
+            memory_budget_bytes
+            if memory_budget_bytes is not None
+            else self.config.get_memory_budget()
+        )
+        self._models: dict[str, ModelInfo] = {}
+        self._loaders: dict[str, ModelLoader] = {}
+        # Least recently used first
+        self._resident: OrderedDict[str, _ResidentModel] = OrderedDict()
+        # Expected sizes of loads in progress
+        self._reserved: dict[str, int] = {}
+        self._pinned: set[str] = set(self.config.pinned_models)
+        self._lock = threading.RLock()
+        self._loads: SingleFlight[Any] = SingleFlight()
+        self.hits = 0
+        self.loads = 0
+        self.load_failures = 0
+        self.evictions = 0
+        self.total_load_time = 0.0
+
+    def register_model(
+        self, model_info: ModelInfo, loader: ModelLoader | None = None
+    ) -> None:
+        """
+        Register a model without loading it.
+
+        Args:
+            model_info: The model to register
+            loader: Function loading the model from its info (by default
+                the class registered for ``model_info.type`` is used)
+
+        """
+        with self._lock:
+            self._models[model_info.id] = model_info
+            if loader is not None:
+                self._loaders[model_info.id] = loader
+            else:
+                self._loaders.pop(model_info.id, None)
+
+    def unregister_model(self, model_id: str) -> None:
+        """
+        Unload and forget a model.
+
+        Args:
+            model_id: The model identifier
+
+        """
+        self.unload_model(model_id)
+        with self._lock:
+            self._models.pop(model_id, None)
+            self._loaders.pop(model_id, None)
+            self._pinned.discard(model_id)
+
+    def get_model_info(self, model_id: str) -> ModelInfo:
+        """
+        Get a registered model's information.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            The model information
+
+        Raises:
+            ModelNotFoundError: If the model is not registered
+
+        """
+        with self._lock:
+            info = self._models.get(model_id)
+        if info is None:
+            raise ModelNotFoundError(model_id)
+        return info
+
+    def get_all_models(self) -> list[ModelInfo]:
+        """Return all registered models."""
+        with self._lock:
+            return list(self._models.values())
+
+    def discover_models(self) -> list[ModelInfo]:
+        """
+        Register the model files found in ``config.models_dir``.
+
+        Files with a known weight extension and directories containing a
+        ``config.json`` are registered under their file or directory name.
+        Models that are already registered are left unchanged.
+
+        Returns:
+            The newly registered models
+
+        """
+        root = Path(self.config.models_dir)
+        if not root.is_dir():
+            return []
+        discovered = []
+        for path in sorted(root.iterdir()):
+            if path.is_dir() and (path / "config.json").exists():
+                info = ModelInfo(id=path.name, path=str(path), format="huggingface")
+            elif path.is_file() and path.suffix in MODEL_FILE_FORMATS:
+                info = ModelInfo(
+                    id=path.stem, path=str(path), format=MODEL_FILE_FORMATS[path.suffix]
+                )
+            else:
+                continue
+            with self._lock:
+                if info.id in self._models:
+                    continue
+                self._models[info.id] = info
+            discovered.append(info)
+        return discovered
+
+    def is_loaded(self, model_id: str) -> bool:
+        """Whether a model is resident."""
+        with self._lock:
+            return model_id in self._resident
+
+    def get_loaded_models(self) -> list[str]:
+        """Return the resident model IDs, least recently used first."""
+        with self._lock:
+            return list(self._resident)
+
+    def _default_loader(self, info: ModelInfo) -> Any:  # noqa: ANN401
+        """Load a model with the class registered for its type."""
+        options = {**info.metadata, **self.config.model_options.get(info.id, {})}
+        return get_model_class(info.type)(info.path, **options).load()
+
+    def _hit(self, model_id: str) -> _ResidentModel | None:
+        """Return a resident model marked as most recently used (lock held)."""
+        entry = self._resident.get(model_id)
+        if entry is not None:
+            self._resident.move_to_end(model_id)
+            entry.last_used = time.time()
+            entry.uses += 1
+            self.hits += 1
+        return entry
+
+    def _collect_evictions(self, needed: int, model_id: str) -> list[Any]:
+        """
+        Remove LRU models until ``needed`` more bytes fit (lock held).
+
+        Args:
+            needed: Bytes to make room for
+            model_id: The model being made room for (never evicted)
+
+        Returns:
+            The evicted model objects, to be released outside the lock
+
+        Raises:
+            ModelMemoryBudgetError: If ``needed`` cannot fit
+
+        """
+        budget = self.memory_budget
+        if budget is None:
+            return []
+        used = sum(e.memory_bytes for e in self._resident.values())
+        used += sum(self._reserved.values())
+        candidates = [
+            key
+            for key, entry in self._resident.items()
+            if key != model_id and key not in self._pinned and not entry.leases
+        ]
+        freeable = sum(self._resident[key].memory_bytes for key in candidates)
+        if needed and used - freeable + needed > budget:
+            raise ModelMemoryBudgetError(
+                model_id, needed, budget - used + freeable, budget
+            )
+        evicted = []
+        for key in candidates:
+            if used + needed <= budget:
+                break
+            entry = self._resident.pop(key)
+            used -= entry.memory_bytes
+            evicted.append(entry.model)
+            self.evictions += 1
+            logger.info("Evicting model %s (%d bytes)", key, entry.memory_bytes)
+        return evicted
+
+    @staticmethod
+    def _release(models: list[Any]) -> None:
+        """Unload evicted model objects."""
+        for model in models:
+            unload = getattr(model, "unload", None)
+            if callable(unload):
+                try:
+                    unload()
+                except Exception:
+                    logger.exception("Error unloading evicted model")
+
+    def _load(self, model_id: str) -> Any:  # noqa: ANN401
+        """Load a model once, making room for it first."""
+        with self._lock:
+            entry = self._hit(model_id)
+            if entry is not None:
+                return entry.model
+            info = self.get_model_info(model_id)
+            loader = self._loaders.get(model_id, self._default_loader)
+        expected = info.estimated_bytes()
+        with self._lock:
+            evicted = self._collect_evictions(expected, model_id)
+            self._reserved[model_id] = expected
+        self._release(evicted)
+
+        start = time.perf_counter()
+        try:
+            model = loader(info)
+        except Exception:
+            with self._lock:
+                self._reserved.pop(model_id, None)
+                self.load_failures += 1
+            raise
+        load_time = time.perf_counter() - start
+
+        measured = getattr(model, "memory_bytes", None)
+        size = measured if isinstance(measured, int) and measured > 0 else expected
+        now = time.time()
+        with self._lock:
+            self._reserved.pop(model_id, None)
+            self._resident[model_id] = _ResidentModel(
+                model, size, load_time, now, now, 1
+            )
+            self.loads += 1
+            self.total_load_time += load_time
+            # The measured size may exceed the estimate
+            evicted = self._collect_evictions(0, model_id)
+        self._release(evicted)
+        logger.info("Loaded model %s in %.3fs (%d bytes)", model_id, load_time, size)
+        return model
+
+    def load_model(self, model_id: str) -> Any:  # noqa: ANN401
+        """
+        Get a model, loading it on first use.
+
+        Concurrent callers asking for a model that is not resident share
+        one load.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            The loaded model
+
+        Raises:
+            ModelNotFoundError: If the model is not registered
+            ModelMemoryBudgetError: If the model cannot fit in the budget
+
+        """
+        with self._lock:
+            entry = self._hit(model_id)
+            if entry is not None:
+                return entry.model
+        return self._loads.do(model_id, lambda: self._load(model_id))
+
+    get_model = load_model
+
+    async def load_model_async(self, model_id: str) -> Any:  # noqa: ANN401
+        """
+        Get a model from a coroutine, loading it in an executor on first use.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            The loaded model
+
+        """
+        with self._lock:
+            entry = self._hit(model_id)
+            if entry is not None:
+                return entry.model
+        return await self._loads.do_async(model_id, lambda: self._load(model_id))
+
+    @contextlib.contextmanager
+    def use(self, model_id: str) -> Iterator[Any]:
+        """
+        Hold a model so that it is not evicted while in use.
+
+        Args:
+            model_id: The model identifier
+
+        Yields:
+            The loaded model
+
+        """
+        while True:
+            model = self.load_model(model_id)
+            with self._lock:
+                entry = self._resident.get(model_id)
+                # Retry if evicted between the load and taking the lease
+                if entry is not None and entry.model is model:
+                    entry.leases += 1
+                    break
+        try:
+            yield model
+        finally:
+            with self._lock:
+                entry.leases -= 1
+
+    def unload_model(self, model_id: str) -> bool:
+        """
+        Unload a model, even if pinned or in use.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            True if the model was resident
+
+        """
+        with self._lock:
+            entry = self._resident.pop(model_id, None)
+        if entry is None:
+            return False
+        self._release([entry.model])
+        return True
+
+    def pin(self, model_id: str) -> None:
+        """
+        Exempt a model from eviction.
+
+        Args:
+            model_id: The model identifier
+
+        Raises:
+            ModelNotFoundError: If the model is not registered
+
+        """
+        self.get_model_info(model_id)
+        with self._lock:
+            self._pinned.add(model_id)
+
+    def unpin(self, model_id: str) -> None:
+        """
+        Make a model evictable again.
+
+        Args:
+            model_id: The model identifier
+
+        """
+        with self._lock:
+            self._pinned.discard(model_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get loading, eviction and memory statistics.
+
+        Returns:
+            Dictionary with the budget, resident and reserved bytes,
+            counters and per-model load time, size and usage
+
+        """
+        with self._lock:
+            return {
+                "memory_budget_bytes": self.memory_budget,
+                "resident_bytes": sum(e.memory_bytes for e in self._resident.values()),
+                "reserved_bytes": sum(self._reserved.values()),
+                "registered": len(self._models),
+                "loaded": len(self._resident),
+                "hits": self.hits,
+                "loads": self.loads,
+                "load_failures": self.load_failures,
+                "evictions": self.evictions,
+                "total_load_time": self.total_load_time,
+                "models": {
+                    model_id: {
+                        "memory_bytes": entry.memory_bytes,
+                        "load_time": entry.load_time,
+                        "loaded_at": entry.loaded_at,
+                        "last_used": entry.last_used,
+                        "uses": entry.uses,
+                        "pinned": model_id in self._pinned,
+                        "in_use": entry.leases,
+                    }
+                    for model_id, entry in self._resident.items()
+                },
+            }
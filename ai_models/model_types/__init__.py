@@ -1,7 +1,86 @@
 """__init__ - Module for ai_models/model_types.__init__."""
 
-# Standard library imports
+from __future__ import annotations
 
+# Standard library imports
 # Third-party imports
-
 # Local imports
+from ai_models.model_base_types import LoadableModel
+
+from .audio_model import AudioModel
+from .onnx_model import ONNXModel, ONNXRuntimeNotAvailableError
+from .pipeline_model import PipelineModel, TransformersNotAvailableError
+from .quantized_model import QuantizedONNXModel
+from .vision_model import VisionModel
+
+# Model classes by ModelInfo.type
+MODEL_TYPES: dict[str, type[LoadableModel]] = {
+    "audio": AudioModel,
+    "onnx": ONNXModel,
+    "onnx-int8": QuantizedONNXModel,
+    "vision": VisionModel,
+}
+
+
+class UnknownModelTypeError(KeyError):
+    """Raised when no model class is registered for a model type."""
+
+    MESSAGE_TEMPLATE = "Unknown model type '{model_type}'"
+
+    def __init__(self, model_type: str) -> None:
+        """
+        Initialize the UnknownModelTypeError.
+
+        Args:
+            model_type: The model type
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(model_type=model_type))
+
+
+def register_model_type(name: str, model_class: type[LoadableModel]) -> None:
+    """
+    Register a model class for a model type.
+
+    Args:
+        name: The model type, as used in ``ModelInfo.type``
+        model_class: The class to load models of this type with
+
+    """
+    MODEL_TYPES[name] = model_class
+
+
+def get_model_class(name: str) -> type[LoadableModel]:
+    """
+    Get the model class for a model type.
+
+    Args:
+        name: The model type
+
+    Returns:
+        The registered class
+
+    Raises:
+        UnknownModelTypeError: If the type is not registered
+
+    """
+    try:
+        return MODEL_TYPES[name]
+    except KeyError:
+        raise UnknownModelTypeError(name) from None
+
+
+__all__ = [
+    "MODEL_TYPES",
+    "AudioModel",
+    "LoadableModel",
+    "ONNXModel",
+    "ONNXRuntimeNotAvailableError",
+    "PipelineModel",
+    "QuantizedONNXModel",
+    "TransformersNotAvailableError",
+    "UnknownModelTypeError",
+    "VisionModel",
+    "get_model_class",
+    "register_model_type",
+]
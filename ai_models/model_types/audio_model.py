@@ -1,7 +1,33 @@
-"""audio_model - Module for ai_models/model_types.audio_model."""
+"""
+audio_model - Module for ai_models/model_types.audio_model.
+
+Speech models served through ``transformers`` pipelines.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from typing import Any
 
 # Third-party imports
-
 # Local imports
+from .pipeline_model import PipelineModel
+
+
+class AudioModel(PipelineModel):
+    """A speech recognition (or other audio pipeline) model."""
+
+    DEFAULT_TASK = "automatic-speech-recognition"
+
+    def transcribe(self, audio: Any) -> str:  # noqa: ANN401
+        """
+        Transcribe audio, loading the model on first use.
+
+        Args:
+            audio: Audio file path or raw samples
+
+        Returns:
+            The transcription
+
+        """
+        return self.load().model(audio)["text"]
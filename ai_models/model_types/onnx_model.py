@@ -1,7 +1,718 @@
-"""onnx_model - Module for ai_models/model_types.onnx_model."""
+"""
+onnx_model - Module for ai_models/model_types.onnx_model.
+
+Text embedding and classification models run with ONNX Runtime on CPU.
+
+ONNX Runtime sessions are expensive to create (graph optimization happens at
+load time), so sessions are shared between models loaded from the same file
+with the same options, and live as long as one of those models is loaded.
+Inputs are bound to the session with I/O binding, which hands the NumPy
+buffers to the runtime without a copy.
+
+Texts are batched by length: they are sorted, split into batches, and each
+batch is padded only to its own longest sequence, which the dynamic batch and
+sequence axes of the exported graph allow. Short texts are therefore never
+padded to the length of the longest text in the request.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+import logging
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 # Third-party imports
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
 
 # Local imports
+from ai_models.model_base_types import LoadableModel
+
+from .pipeline_model import TransformersNotAvailableError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Graph optimization levels by option value
+OPTIMIZATION_LEVELS = {
+    "disabled": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+# Suffix of dynamically quantized graphs, e.g. model.int8.onnx
+QUANTIZED_SUFFIX = ".int8.onnx"
+EXPORT_TASKS = ("feature-extraction", "text-classification")
+_TOKEN_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+
+# Sessions by (model file, modification time, session options); an entry lives
+# while a loaded model holds the session
+_SESSIONS: weakref.WeakValueDictionary[tuple, Any] = weakref.WeakValueDictionary()
+_SESSIONS_LOCK = threading.Lock()
+
+
+class ONNXRuntimeNotAvailableError(ImportError):
+    """Raised when loading an ONNX model without onnxruntime installed."""
+
+    MESSAGE = "onnxruntime is required for ONNX models: uv pip install onnxruntime"
+
+    def __init__(self) -> None:
+        """Initialize the ONNXRuntimeNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+class ONNXExportNotAvailableError(ImportError):
+    """Raised when exporting or validating without torch and transformers."""
+
+    MESSAGE = (
+        "torch, transformers and onnx are required to export models: "
+        "uv pip install torch transformers onnx"
+    )
+
+    def __init__(self) -> None:
+        """Initialize the ONNXExportNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+class ModelOutputError(ValueError):
+    """Raised when a model's outputs do not fit the requested operation."""
+
+    MESSAGE_TEMPLATE = "Model {path} output has shape {shape}; expected {expected}"
+
+    def __init__(self, path: str, shape: tuple, expected: str) -> None:
+        """
+        Initialize the ModelOutputError.
+
+        Args:
+            path: The model file
+            shape: Shape of the output
+            expected: Description of the expected shape
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(path=path, shape=shape, expected=expected)
+        )
+
+
+def find_onnx_file(model_path: str) -> Path:
+    """
+    Find the ONNX graph of a model.
+
+    Args:
+        model_path: An ``.onnx`` file, or a directory containing ``model.onnx``
+            (or a single ``.onnx`` file)
+
+    Returns:
+        The graph file (``model_path`` itself if no file is found, so that
+        the runtime reports the error)
+
+    """
+    path = Path(model_path)
+    if not path.is_dir():
+        return path
+    if (path / "model.onnx").is_file():
+        return path / "model.onnx"
+    candidates = sorted(
+        p for p in path.glob("*.onnx") if not p.name.endswith(QUANTIZED_SUFFIX)
+    )
+    return candidates[0] if candidates else path / "model.onnx"
+
+
+def plan_batches(lengths: Sequence[int], max_batch_size: int) -> list[list[int]]:
+    """
+    Group inputs into batches of similar length.
+
+    Args:
+        lengths: Token count of each input
+        max_batch_size: Maximum inputs per batch
+
+    Returns:
+        Batches of input indices, longest inputs first
+
+    """
+    order = sorted(range(len(lengths)), key=lambda i: -lengths[i])
+    return [order[i : i + max_batch_size] for i in range(0, len(order), max_batch_size)]
+
+
+def pad_batch(sequences: Sequence[Sequence[int]], pad_id: int = 0) -> dict[str, Any]:
+    """
+    Pad token sequences to the longest in the batch.
+
+    Args:
+        sequences: Token IDs of each input
+        pad_id: Token ID used for padding
+
+    Returns:
+        ``input_ids``, ``attention_mask`` and ``token_type_ids`` arrays of
+        shape (batch, longest) and dtype int64
+
+    """
+    width = max((len(s) for s in sequences), default=0)
+    input_ids = np.full((len(sequences), width), pad_id, dtype=np.int64)
+    attention_mask = np.zeros((len(sequences), width), dtype=np.int64)
+    for row, sequence in enumerate(sequences):
+        input_ids[row, : len(sequence)] = sequence
+        attention_mask[row, : len(sequence)] = 1
+    return {
+        "input_ids": input_ids,
+        "attention_mask": attention_mask,
+        "token_type_ids": np.zeros_like(input_ids),
+    }
+
+
+def pool(
+    hidden: np.ndarray, attention_mask: np.ndarray, strategy: str = "mean"
+) -> np.ndarray:
+    """
+    Reduce token embeddings to one vector per input.
+
+    Args:
+        hidden: Token embeddings of shape (batch, sequence, dim)
+        attention_mask: Mask of shape (batch, sequence), 0 for padding
+        strategy: "mean" over unpadded tokens, or "cls" for the first token
+
+    Returns:
+        Array of shape (batch, dim)
+
+    """
+    if strategy == "cls":
+        return hidden[:, 0]
+    mask = attention_mask[..., None].astype(hidden.dtype)
+    counts = np.maximum(mask.sum(axis=1), 1e-9)
+    return (hidden * mask).sum(axis=1) / counts
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale vectors to unit L2 norm."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Softmax over the last axis."""
+    shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return shifted / shifted.sum(axis=-1, keepdims=True)
+
+
+def _load_tokenizer(source: Any) -> tuple[Callable[[list[str]], list[list[int]]], int]:  # noqa: ANN401
+    """
+    Create a function returning the (truncated, unpadded) token IDs of texts.
+
+    Args:
+        source: A callable returning token ID lists, or a tokenizer directory
+            readable by ``transformers.AutoTokenizer``
+
+    Returns:
+        The tokenize function and the padding token ID
+
+    Raises:
+        TransformersNotAvailableError: If a directory is given without
+            transformers installed
+
+    """
+    if callable(source):
+        return source, 0
+    try:
+        from transformers import AutoTokenizer  # noqa: PLC0415
+    except ImportError:
+        raise TransformersNotAvailableError from None
+    tokenizer = AutoTokenizer.from_pretrained(source)
+
+    def tokenize(texts: list[str]) -> list[list[int]]:
+        return tokenizer(texts, truncation=True)["input_ids"]
+
+    return tokenize, tokenizer.pad_token_id or 0
+
+
+class ONNXModel(LoadableModel):
+    """
+    A text embedding or classification model run with ONNX Runtime.
+
+    Options (given as keyword arguments or ``ModelInfo.metadata``):
+        tokenizer: Tokenizer directory or callable (the model directory by
+            default)
+        intra_op_threads: Threads used within an operator (0: one per core)
+        inter_op_threads: Threads used across independent operators
+        optimization_level: "disabled", "basic", "extended" or "all"
+        optimized_model_path: Where to save the optimized graph; once saved
+            (and newer than the model file), later loads run it with graph
+            optimization disabled
+        providers: Execution providers (CPU by default)
+        max_batch_size: Maximum texts per session run
+        pooling: "mean" or "cls" pooling of token embeddings
+        normalize: Whether to L2-normalize embeddings
+        labels: Class labels (``id2label`` of ``config.json`` by default)
+        io_binding: Whether to bind inputs with I/O binding
+    """
+
+    DEFAULT_OPTIONS: ClassVar[dict[str, Any]] = {
+        "intra_op_threads": 0,
+        "inter_op_threads": 1,
+        "optimization_level": "all",
+        "optimized_model_path": None,
+        "providers": ("CPUExecutionProvider",),
+        "max_batch_size": 32,
+        "pooling": "mean",
+        "normalize": True,
+        "labels": None,
+        "io_binding": True,
+    }
+
+    def __init__(self, model_path: str, model_type: str = "", **options: Any) -> None:  # noqa: ANN401
+        """
+        Initialize the model without loading it.
+
+        Args:
+            model_path: ``.onnx`` file or model directory
+            model_type: "feature-extraction" or "text-classification"
+            **options: See the class docstring
+
+        """
+        super().__init__(model_path, model_type, **options)
+        self.settings = {**self.DEFAULT_OPTIONS, **options}
+        self.tokenize: Callable[[list[str]], list[list[int]]] | None = None
+        self.pad_id = 0
+        self.labels: list[str] | None = None
+        self._input_types: dict[str, Any] = {}
+        self._output_names: list[str] = []
+
+    def onnx_file(self) -> Path:
+        """Return the graph file this model runs."""
+        return find_onnx_file(self.model_path)
+
+    def _session_source(self, onnx_file: Path) -> tuple[Path, bool]:
+        """
+        Choose the graph to open: the saved optimized graph if it is current.
+
+        Returns:
+            The graph file, and whether it is already optimized
+
+        """
+        optimized = self.settings["optimized_model_path"]
+        if optimized:
+            optimized_file = Path(optimized)
+            if (
+                optimized_file.is_file()
+                and optimized_file.stat().st_mtime_ns >= onnx_file.stat().st_mtime_ns
+            ):
+                return optimized_file, True
+        return onnx_file, False
+
+    def _session_options(self, *, preoptimized: bool = False) -> Any:  # noqa: ANN401
+        """Create the session options for the configured threads and level."""
+        session_options = ort.SessionOptions()
+        session_options.intra_op_num_threads = self.settings["intra_op_threads"]
+        session_options.inter_op_num_threads = self.settings["inter_op_threads"]
+        session_options.execution_mode = (
+            ort.ExecutionMode.ORT_PARALLEL
+            if self.settings["inter_op_threads"] > 1
+            else ort.ExecutionMode.ORT_SEQUENTIAL
+        )
+        level = "disabled" if preoptimized else self.settings["optimization_level"]
+        session_options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel, OPTIMIZATION_LEVELS[level]
+        )
+        if self.settings["optimized_model_path"] and not preoptimized:
+            session_options.optimized_model_filepath = str(
+                self.settings["optimized_model_path"]
+            )
+        return session_options
+
+    def _get_session(self, onnx_file: Path) -> Any:  # noqa: ANN401
+        """Return the shared session for the file and options, creating it once."""
+        graph_file, preoptimized = self._session_source(onnx_file)
+        key = (
+            str(graph_file.resolve()),
+            graph_file.stat().st_mtime_ns,
+            preoptimized,
+            tuple(
+                (name, str(self.settings[name]))
+                for name in (
+                    "intra_op_threads",
+                    "inter_op_threads",
+                    "optimization_level",
+                    "providers",
+                )
+            ),
+        )
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(key)
+            if session is None:
+                start = time.perf_counter()
+                session = ort.InferenceSession(
+                    str(graph_file),
+                    sess_options=self._session_options(preoptimized=preoptimized),
+                    providers=list(self.settings["providers"]),
+                )
+                _SESSIONS[key] = session
+                logger.info(
+                    "Created ONNX Runtime session for %s in %.0f ms",
+                    graph_file,
+                    (time.perf_counter() - start) * 1000,
+                )
+        return session
+
+    def _load(self) -> Any:  # noqa: ANN401
+        """
+        Get the session and tokenizer.
+
+        Raises:
+            ONNXRuntimeNotAvailableError: If onnxruntime is not installed
+
+        """
+        if ort is None:
+            raise ONNXRuntimeNotAvailableError
+        onnx_file = self.onnx_file()
+        session = self._get_session(onnx_file)
+        model_dir = onnx_file.parent
+        self.tokenize, self.pad_id = _load_tokenizer(
+            self.settings.get("tokenizer") or str(model_dir)
+        )
+        self.labels = self.settings["labels"] or self._config_labels(model_dir)
+        self._input_types = {
+            node.name: np.int32 if node.type == "tensor(int32)" else np.int64
+            for node in session.get_inputs()
+        }
+        self._output_names = [node.name for node in session.get_outputs()]
+        return session
+
+    @staticmethod
+    def _config_labels(model_dir: Path) -> list[str] | None:
+        """Read class labels from ``config.json``, if present."""
+        try:
+            id2label = json.loads((model_dir / "config.json").read_text())["id2label"]
+        except (OSError, ValueError, KeyError):
+            return None
+        return [id2label[key] for key in sorted(id2label, key=int)]
+
+    def unload(self) -> None:
+        """Release the session (freed once no other model shares it)."""
+        super().unload()
+        self.tokenize = None
+
+    def run(self, feeds: dict[str, np.ndarray]) -> list[np.ndarray]:
+        """
+        Run the session on one batch, loading the model on first use.
+
+        Args:
+            feeds: Input arrays; inputs the graph does not declare are ignored
+
+        Returns:
+            The output arrays, in graph order
+
+        """
+        session = self.load().model
+        inputs = {
+            name: np.ascontiguousarray(feeds[name], dtype=dtype)
+            for name, dtype in self._input_types.items()
+        }
+        if not self.settings["io_binding"]:
+            return session.run(self._output_names, inputs)
+        binding = session.io_binding()
+        for name, array in inputs.items():
+            binding.bind_cpu_input(name, array)
+        for name in self._output_names:
+            binding.bind_output(name, "cpu")
+        session.run_with_iobinding(binding)
+        return binding.copy_outputs_to_cpu()
+
+    def _run_batched(self, texts: list[str]) -> list[tuple[list[int], np.ndarray]]:
+        """
+        Run texts in length-sorted batches.
+
+        Returns:
+            For each batch, the text indices and the first output (pooled to
+            one row per text if it has a sequence axis)
+
+        """
+        self.load()
+        sequences = self.tokenize(texts)
+        results = []
+        for indices in plan_batches(
+            [len(s) for s in sequences], self.settings["max_batch_size"]
+        ):
+            feeds = pad_batch([sequences[i] for i in indices], self.pad_id)
+            output = self.run(feeds)[0]
+            if output.ndim == 3:  # noqa: PLR2004 - (batch, sequence, dim)
+                output = pool(output, feeds["attention_mask"], self.settings["pooling"])
+            elif output.ndim != 2:  # noqa: PLR2004
+                raise ModelOutputError(
+                    str(self.onnx_file()), output.shape, "(batch, [sequence,] dim)"
+                )
+            results.append((indices, output))
+        return results
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts.
+
+        Args:
+            texts: The texts
+
+        Returns:
+            float32 array of shape (len(texts), dim), in input order
+
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        batches = self._run_batched(texts)
+        out = np.empty((len(texts), batches[0][1].shape[1]), dtype=np.float32)
+        for indices, vectors in batches:
+            out[indices] = vectors
+        return normalize(out) if self.settings["normalize"] else out
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        **_kwargs: Any,  # noqa: ANN401
+    ) -> np.ndarray:
+        """
+        Embed text like ``SentenceTransformer.encode``.
+
+        Lets this model replace a sentence-transformers embedder.
+
+        Args:
+            sentences: A text or list of texts
+            **_kwargs: Ignored ``SentenceTransformer.encode`` options
+
+        Returns:
+            A vector for a single text, otherwise an array of vectors
+
+        """
+        if isinstance(sentences, str):
+            return self.embed([sentences])[0]
+        return self.embed(list(sentences))
+
+    def predict_proba(self, texts: list[str]) -> np.ndarray:
+        """
+        Compute class probabilities.
+
+        Args:
+            texts: The texts
+
+        Returns:
+            float32 array of shape (len(texts), num_classes), in input order
+
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        batches = self._run_batched(texts)
+        out = np.empty((len(texts), batches[0][1].shape[1]), dtype=np.float32)
+        for indices, logits in batches:
+            out[indices] = softmax(logits.astype(np.float32))
+        return out
+
+    def classify(self, texts: list[str], top_k: int = 1) -> list[list[dict[str, Any]]]:
+        """
+        Classify texts.
+
+        Args:
+            texts: The texts
+            top_k: Number of labels to return per text
+
+        Returns:
+            For each text, labels with scores, best first
+
+        """
+        probabilities = self.predict_proba(texts)
+        best = np.argsort(-probabilities, axis=1)[:, :top_k]
+        return [
+            [
+                {
+                    "label": self.labels[k] if self.labels else str(k),
+                    "score": float(probabilities[row, k]),
+                }
+                for k in best[row]
+            ]
+            for row in range(len(texts))
+        ]
+
+
+def export_to_onnx(
+    model_name_or_path: str,
+    output_dir: str,
+    task: str = "feature-extraction",
+    opset: int = 17,
+) -> Path:
+    """
+    Export a Hugging Face model to ONNX with dynamic batch and sequence axes.
+
+    The tokenizer and config are saved next to ``model.onnx``, so the output
+    directory can be loaded with :class:`ONNXModel`.
+
+    Args:
+        model_name_or_path: Hub model ID or local model directory
+        output_dir: Directory to write
+        task: "feature-extraction" (token embeddings) or "text-classification"
+            (logits)
+        opset: ONNX opset version
+
+    Returns:
+        Path of the exported graph
+
+    Raises:
+        ONNXExportNotAvailableError: If torch or transformers is not installed
+        ValueError: If the task is not supported
+
+    """
+    if task not in EXPORT_TASKS:
+        error_msg = f"Unsupported export task '{task}'; expected one of {EXPORT_TASKS}"
+        raise ValueError(error_msg)
+    try:
+        import torch  # noqa: PLC0415
+        from transformers import (  # noqa: PLC0415
+            AutoModel,
+            AutoModelForSequenceClassification,
+            AutoTokenizer,
+        )
+    except ImportError:
+        raise ONNXExportNotAvailableError from None
+
+    model_class = (
+        AutoModel
+        if task == "feature-extraction"
+        else (AutoModelForSequenceClassification)
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_name_or_path)
+    model = model_class.from_pretrained(model_name_or_path).eval()
+    sample = tokenizer(
+        ["an example input", "a longer example input"],
+        padding=True,
+        return_tensors="pt",
+    )
+    input_names = [name for name in _TOKEN_INPUTS if name in sample]
+    output_name = "last_hidden_state" if task == "feature-extraction" else "logits"
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes[output_name] = (
+        {0: "batch", 1: "sequence"} if task == "feature-extraction" else {0: "batch"}
+    )
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    onnx_file = out / "model.onnx"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            ({name: sample[name] for name in input_names},),
+            str(onnx_file),
+            input_names=input_names,
+            output_names=[output_name],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+    tokenizer.save_pretrained(out)
+    model.config.save_pretrained(out)
+    logger.info("Exported %s to %s", model_name_or_path, onnx_file)
+    return onnx_file
+
+
+def _reference_runner(reference: str, task: str) -> Callable[[list[str]], np.ndarray]:
+    """Load the PyTorch model and return a function computing its outputs."""
+    try:
+        import torch  # noqa: PLC0415
+        from transformers import (  # noqa: PLC0415
+            AutoModel,
+            AutoModelForSequenceClassification,
+            AutoTokenizer,
+        )
+    except ImportError:
+        raise ONNXExportNotAvailableError from None
+
+    if task == "feature-extraction":
+        try:
+            from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+        except ImportError:
+            pass
+        else:
+            embedder = SentenceTransformer(reference, device="cpu")
+            return lambda texts: embedder.encode(texts, normalize_embeddings=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(reference)
+    model_class = (
+        AutoModel
+        if task == "feature-extraction"
+        else (AutoModelForSequenceClassification)
+    )
+    model = model_class.from_pretrained(reference).eval()
+
+    def run(texts: list[str]) -> np.ndarray:
+        batch = tokenizer(texts, padding=True, truncation=True, return_tensors="pt")
+        with torch.no_grad():
+            output = model(**batch)
+        if task == "text-classification":
+            return softmax(output.logits.numpy())
+        hidden = output.last_hidden_state.numpy()
+        return normalize(pool(hidden, batch["attention_mask"].numpy()))
+
+    return run
+
+
+def validate_onnx_model(
+    onnx_path: str,
+    reference: str,
+    texts: list[str],
+    task: str = "feature-extraction",
+    tolerance: float = 1e-3,
+    **options: Any,  # noqa: ANN401
+) -> dict[str, Any]:
+    """
+    Compare an ONNX model with its PyTorch original on sample texts.
+
+    Embeddings are compared by cosine similarity, classifications by the
+    largest probability difference. Both models are loaded first and timed
+    on the texts after one warm-up pass.
+
+    Args:
+        onnx_path: The ONNX model file or directory
+        reference: Hub model ID or directory of the PyTorch model (a
+            sentence-transformers model for embeddings, when installed)
+        texts: Sample texts
+        task: "feature-extraction" or "text-classification"
+        tolerance: Largest allowed difference (1 - cosine for embeddings)
+        **options: Options for :class:`ONNXModel`
+
+    Returns:
+        The difference, the timings in milliseconds, the speedup of ONNX
+        Runtime over PyTorch, and whether the outputs are within tolerance
+
+    """
+    model = ONNXModel(onnx_path, task, **options).load()
+    run_onnx = model.predict_proba if task == "text-classification" else model.embed
+    run_reference = _reference_runner(reference, task)
+
+    def timed(fn: Callable[[list[str]], np.ndarray]) -> tuple[np.ndarray, float]:
+        fn(texts)
+        start = time.perf_counter()
+        result = np.asarray(fn(texts))
+        return result, (time.perf_counter() - start) * 1000
+
+    onnx_out, onnx_ms = timed(run_onnx)
+    reference_out, reference_ms = timed(run_reference)
+    if task == "text-classification":
+        difference = float(np.abs(onnx_out - reference_out).max())
+    else:
+        cosine = (normalize(onnx_out) * normalize(reference_out)).sum(axis=1)
+        difference = float(1.0 - cosine.min())
+    return {
+        "task": task,
+        "num_texts": len(texts),
+        "max_difference": difference,
+        "tolerance": tolerance,
+        "passed": difference <= tolerance,
+        "onnx_ms": onnx_ms,
+        "reference_ms": reference_ms,
+        "speedup": reference_ms / onnx_ms if onnx_ms else None,
+    }
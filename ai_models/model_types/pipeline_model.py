@@ -0,0 +1,59 @@
+"""
+pipeline_model - Module for ai_models/model_types.pipeline_model.
+
+Base for model types backed by a Hugging Face ``transformers`` pipeline.
+transformers is imported on the first load, not with this module.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from typing import Any
+
+# Third-party imports
+# Local imports
+from ai_models.model_base_types import LoadableModel
+
+
+class TransformersNotAvailableError(ImportError):
+    """Raised when loading a pipeline model without transformers installed."""
+
+    MESSAGE = (
+        "transformers is required for this model type: uv pip install transformers"
+    )
+
+    def __init__(self) -> None:
+        """Initialize the TransformersNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+class PipelineModel(LoadableModel):
+    """A model loaded as a ``transformers`` pipeline for ``model_type``."""
+
+    DEFAULT_TASK = ""
+
+    def _load(self) -> Any:  # noqa: ANN401
+        """
+        Create the pipeline.
+
+        Raises:
+            TransformersNotAvailableError: If transformers is not installed
+
+        """
+        # Imported here: transformers (and torch) take seconds to import
+        try:
+            import transformers  # noqa: PLC0415
+        except ImportError:
+            raise TransformersNotAvailableError from None
+        return transformers.pipeline(
+            self.model_type or self.DEFAULT_TASK, model=self.model_path, **self.options
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        """Resident size, from the parameter tensors when available."""
+        module = getattr(self.model, "model", None)
+        parameters = getattr(module, "parameters", None)
+        if not callable(parameters):
+            return super().memory_bytes
+        return sum(p.numel() * p.element_size() for p in parameters())
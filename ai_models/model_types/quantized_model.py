@@ -1,7 +1,57 @@
-"""quantized_model - Module for ai_models/model_types.quantized_model."""
+"""
+quantized_model - Module for ai_models/model_types.quantized_model.
+
+ONNX models run from their int8-quantized graph.
+
+The quantized graph is expected next to the float graph, named with
+:data:`~ai_models.model_types.onnx_model.QUANTIZED_SUFFIX` (``model.onnx`` is
+quantized to ``model.int8.onnx``). If it has not been created yet, the float
+graph is run instead.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import logging
+from typing import TYPE_CHECKING
 
 # Third-party imports
-
 # Local imports
+from .onnx_model import QUANTIZED_SUFFIX, ONNXModel, find_onnx_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def quantized_path(onnx_file: Path) -> Path:
+    """
+    Get the quantized graph path for a float graph.
+
+    Args:
+        onnx_file: The float graph, e.g. ``model.onnx``
+
+    Returns:
+        The quantized graph path, e.g. ``model.int8.onnx``
+
+    """
+    if onnx_file.name.endswith(QUANTIZED_SUFFIX):
+        return onnx_file
+    return onnx_file.with_name(onnx_file.stem + QUANTIZED_SUFFIX)
+
+
+class QuantizedONNXModel(ONNXModel):
+    """An ONNX model run from its int8-quantized graph when available."""
+
+    def onnx_file(self) -> Path:
+        """Return the quantized graph, or the float graph if it is missing."""
+        float_file = find_onnx_file(self.model_path)
+        quantized = quantized_path(float_file)
+        if quantized.is_file():
+            return quantized
+        logger.warning(
+            "No quantized graph %s; running the float graph %s", quantized, float_file
+        )
+        return float_file
@@ -1,7 +1,34 @@
-"""vision_model - Module for ai_models/model_types.vision_model."""
+"""
+vision_model - Module for ai_models/model_types.vision_model.
+
+Image models served through ``transformers`` pipelines.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from typing import Any
 
 # Third-party imports
-
 # Local imports
+from .pipeline_model import PipelineModel
+
+
+class VisionModel(PipelineModel):
+    """An image classification (or other vision pipeline) model."""
+
+    DEFAULT_TASK = "image-classification"
+
+    def classify_image(self, image: Any, top_k: int = 5) -> list[dict[str, Any]]:  # noqa: ANN401
+        """
+        Classify an image, loading the model on first use.
+
+        Args:
+            image: Image path, URL or PIL image
+            top_k: Number of labels to return
+
+        Returns:
+            Labels with scores, best first
+
+        """
+        return self.load().model(image, top_k=top_k)
@@ -1,7 +1,956 @@
-"""model_versioning - Module for ai_models.model_versioning."""
+"""
+model_versioning - Module for ai_models.model_versioning.
+
+Registry of model versions with content-addressed artifacts.
+
+Every file of a registered version is stored once under its SHA-256 digest
+in a :class:`~ai_models.model_downloader.BlobStore` and hard-linked into
+``versions/<name>/<version>/``, so files unchanged between versions (a
+tokenizer, frozen layers) are neither copied nor stored twice. A SQLite
+index answers lookups by name and version constraint ("1.2", ">=1.0,<2",
+"~=1.4", "^2.1", "latest") without scanning the file system.
+
+Aliases such as "active" point at one version of a model. Promotion and
+rollback are single SQLite transactions, mirrored by an atomically swapped
+symbolic link ``aliases/<name>/<alias>``, so readers see either the old or
+the new version. :class:`ModelDeployment` serves aliases through a
+:class:`~ai_models.model_manager.ModelManager`: the new version is loaded
+before the alias moves, and only the replaced version is unloaded.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import contextlib
+import hashlib
+import json
+import logging
+import re
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Third-party imports
-
 # Local imports
+from ai_models.model_base_types import ModelInfo
+from ai_models.model_downloader import BlobStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ai_models.model_manager import ModelLoader, ModelManager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALIAS = "active"
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+_VERSION_PATTERN = re.compile(r"^v?(\d+(?:\.\d+)*)$")
+_CLAUSE_PATTERN = re.compile(r"^(==|!=|>=|<=|~=|>|<|\^|=)?\s*v?([\d.]+?)(\.\*)?$")
+_HASH_READ_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    sort_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (name, version)
+);
+CREATE INDEX IF NOT EXISTS idx_versions_name_sort_key
+    ON versions (name, sort_key);
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    relpath TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (name, version, relpath)
+);
+CREATE INDEX IF NOT EXISTS idx_files_digest ON files (digest);
+CREATE TABLE IF NOT EXISTS aliases (
+    name TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    version TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (name, alias)
+);
+CREATE TABLE IF NOT EXISTS alias_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    version TEXT NOT NULL,
+    previous TEXT,
+    changed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_alias_history_name_alias
+    ON alias_history (name, alias, id);
+"""
+
+
+class VersionError(ValueError):
+    """Raised for malformed model names, versions or version constraints."""
+
+
+class VersionNotFoundError(KeyError):
+    """Raised when no version of a model matches a lookup."""
+
+    MESSAGE_TEMPLATE = "No version of model '{name}' matches '{spec}'"
+
+    def __init__(self, name: str, spec: str) -> None:
+        """
+        Initialize the VersionNotFoundError.
+
+        Args:
+            name: The model name
+            spec: The version, constraint or alias looked up
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(name=name, spec=spec))
+
+
+class VersionExistsError(ValueError):
+    """Raised when registering a version that is already registered."""
+
+    MESSAGE_TEMPLATE = "Model '{name}' already has version {version}"
+
+    def __init__(self, name: str, version: str) -> None:
+        """
+        Initialize the VersionExistsError.
+
+        Args:
+            name: The model name
+            version: The version
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(name=name, version=version))
+
+
+class VersionInUseError(RuntimeError):
+    """Raised when deleting a version that an alias points at or can roll back to."""
+
+    MESSAGE_TEMPLATE = "Version {version} of '{name}' is used by aliases {aliases}"
+
+    def __init__(self, name: str, version: str, aliases: list[str]) -> None:
+        """
+        Initialize the VersionInUseError.
+
+        Args:
+            name: The model name
+            version: The version
+            aliases: The aliases pointing at it or able to roll back to it
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(name=name, version=version, aliases=aliases)
+        )
+
+
+class RollbackError(RuntimeError):
+    """Raised when an alias has no earlier version to return to."""
+
+    MESSAGE_TEMPLATE = "Alias '{alias}' of model '{name}' has no earlier version"
+
+    def __init__(self, name: str, alias: str) -> None:
+        """
+        Initialize the RollbackError.
+
+        Args:
+            name: The model name
+            alias: The alias
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(name=name, alias=alias))
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    """
+    Parse a dotted numeric version such as "1.4.2" (a leading "v" is allowed).
+
+    Args:
+        version: The version string
+
+    Returns:
+        The numeric components
+
+    Raises:
+        VersionError: If the version is not dotted numbers
+
+    """
+    match = _VERSION_PATTERN.match(version.strip())
+    if not match:
+        error_msg = f"Invalid version '{version}': expected dotted numbers"
+        raise VersionError(error_msg)
+    return tuple(int(part) for part in match.group(1).split("."))
+
+
+def _padded(parts: tuple[int, ...], length: int) -> tuple[int, ...]:
+    """Extend a version with zeros."""
+    return parts + (0,) * (length - len(parts))
+
+
+def version_sort_key(version: str) -> str:
+    """
+    Build a string that sorts like the version, for indexing.
+
+    Args:
+        version: The version string
+
+    Returns:
+        Zero-padded components ("1.10" sorts after "1.9")
+
+    """
+    return ".".join(f"{part:010d}" for part in _padded(parse_version(version), 4))
+
+
+class VersionConstraint:
+    """
+    A set of conditions on versions.
+
+    Clauses are separated by commas and all must hold:
+
+    - "", "*" or "latest": any version
+    - "1.2" or "1.2.*": versions starting with 1.2
+    - "==1.2.0", "!=1.3", ">=1.0", ">1.0", "<=2.0", "<2.0"
+    - "~=1.4.2": at least 1.4.2 and starting with 1.4
+    - "^1.4": at least 1.4 with the same major version (same minor for 0.x)
+    """
+
+    def __init__(self, spec: str) -> None:
+        """
+        Parse a constraint.
+
+        Args:
+            spec: The constraint
+
+        Raises:
+            VersionError: If a clause is malformed
+
+        """
+        self.spec = spec.strip()
+        self.clauses: list[tuple[str, tuple[int, ...]]] = []
+        if self.spec in {"", "*", "latest"}:
+            return
+        for raw in self.spec.split(","):
+            match = _CLAUSE_PATTERN.match(raw.strip())
+            if not match:
+                error_msg = f"Invalid version constraint '{raw.strip()}'"
+                raise VersionError(error_msg)
+            operator, number, wildcard = match.groups()
+            parts = parse_version(number)
+            if operator in {None, "=", "=="} and (wildcard or operator is None):
+                self.clauses.append(("prefix", parts))
+            elif operator == "~=":
+                self.clauses.extend([(">=", parts), ("prefix", parts[:-1] or parts)])
+            elif operator == "^":
+                significant = next((i for i, p in enumerate(parts) if p), 0)
+                self.clauses.extend(
+                    [(">=", parts), ("prefix", parts[: significant + 1])]
+                )
+            else:
+                self.clauses.append(("==" if operator == "=" else operator, parts))
+
+    @property
+    def exact(self) -> str | None:
+        """The version if the constraint names exactly one, else None."""
+        match = re.match(r"^==\s*v?([\d.]+)$", self.spec)
+        return match.group(1) if match else None
+
+    def matches(self, version: str) -> bool:
+        """
+        Check a version against the constraint.
+
+        Args:
+            version: The version string
+
+        Returns:
+            True if every clause holds
+
+        """
+        parts = parse_version(version)
+        for operator, bound in self.clauses:
+            if operator == "prefix":
+                if parts[: len(bound)] != bound:
+                    return False
+                continue
+            length = max(len(parts), len(bound))
+            left, right = _padded(parts, length), _padded(bound, length)
+            holds = {
+                "==": left == right,
+                "!=": left != right,
+                ">=": left >= right,
+                "<=": left <= right,
+                ">": left > right,
+                "<": left < right,
+            }[operator]
+            if not holds:
+                return False
+        return True
+
+
+@dataclass
+class ModelVersion:
+    """
+    A registered version of a model.
+
+    Attributes:
+        name: The model name
+        version: The version string
+        path: Directory holding the version's files
+        size: Total bytes of the version's files
+        created_at: Registration time
+        metadata: Free-form information (e.g. "model_type", metrics)
+        new_bytes: Bytes that were not already stored when the version was
+            registered (0 when loaded from the index)
+
+    """
+
+    name: str
+    version: str
+    path: str
+    size: int
+    created_at: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+    new_bytes: int = 0
+
+    @property
+    def model_id(self) -> str:
+        """Identifier of this version in a model manager."""
+        return f"{self.name}@{self.version}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the version as a dictionary."""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "path": self.path,
+            "size": self.size,
+            "created_at": self.created_at,
+            "metadata": dict(self.metadata),
+            "new_bytes": self.new_bytes,
+        }
+
+
+def _sha256(path: Path) -> str:
+    """Hash a file without reading it into memory at once."""
+    sha = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_READ_SIZE):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _source_files(source: Path) -> list[tuple[str, Path]]:
+    """List (relative path, file) pairs of a file or directory."""
+    if source.is_file():
+        return [(source.name, source)]
+    if not source.is_dir():
+        error_msg = f"Model source {source} does not exist"
+        raise FileNotFoundError(error_msg)
+    return [
+        (path.relative_to(source).as_posix(), path)
+        for path in sorted(source.rglob("*"))
+        if path.is_file()
+    ]
+
+
+class ModelVersionRegistry:
+    """Store, look up, promote and roll back model versions."""
+
+    def __init__(self, root: str | Path) -> None:
+        """
+        Open or create a registry.
+
+        Args:
+            root: Directory holding ``registry.db``, ``blobs/``,
+                ``versions/`` and ``aliases/``
+
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.blobs = BlobStore(str(self.root / "blobs"))
+        self.versions_dir = self.root / "versions"
+        self.aliases_dir = self.root / "aliases"
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.root / "registry.db"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> ModelVersionRegistry:  # noqa: PYI034
+        """Return the registry."""
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Close the registry."""
+        self.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction (lock held)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _check_name(name: str) -> None:
+        """Reject names unusable as directory names."""
+        if not _NAME_PATTERN.match(name):
+            error_msg = f"Invalid model name '{name}'"
+            raise VersionError(error_msg)
+
+    def _row_to_version(self, row: tuple[Any, ...]) -> ModelVersion:
+        """Build a ModelVersion from a versions row."""
+        name, version, path, size, created_at, metadata = row
+        return ModelVersion(name, version, path, size, created_at, json.loads(metadata))
+
+    def _store_file(self, path: Path) -> tuple[str, bool]:
+        """Store a file's content; return its digest and whether it was new."""
+        digest = _sha256(path)
+        if self.blobs.has(digest):
+            return digest, False
+        tmp = self.blobs.root / "partial" / f"{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(path, tmp)
+        self.blobs.put(tmp, digest)
+        return digest, True
+
+    def register(
+        self,
+        name: str,
+        version: str,
+        source: str | Path,
+        *,
+        metadata: dict[str, Any] | None = None,
+    ) -> ModelVersion:
+        """
+        Add a version of a model from a file or directory.
+
+        Files whose content is already stored (from any model or version)
+        are linked, not copied.
+
+        Args:
+            name: The model name
+            version: The version (dotted numbers)
+            source: Model file or directory
+            metadata: Free-form information stored with the version
+
+        Returns:
+            The registered version
+
+        Raises:
+            VersionError: If the name or version is malformed
+            VersionExistsError: If the version is already registered
+
+        """
+        self._check_name(name)
+        sort_key = version_sort_key(version)
+        if self._find(name, version) is not None:
+            raise VersionExistsError(name, version)
+
+        files = []
+        new_bytes = 0
+        for relpath, path in _source_files(Path(source)):
+            digest, new = self._store_file(path)
+            size = path.stat().st_size
+            new_bytes += size if new else 0
+            files.append((relpath, digest, size))
+
+        # Build the version directory aside, then move it into place
+        target = self.versions_dir / name / version
+        staging = self.versions_dir / name / f".{version}.{uuid.uuid4().hex}.tmp"
+        for relpath, digest, _ in files:
+            self.blobs.link(digest, staging / relpath)
+        staging.mkdir(parents=True, exist_ok=True)
+
+        created_at = time.time()
+        size = sum(size for _, _, size in files)
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT INTO versions"
+                    " (name, version, sort_key, path, size, created_at, metadata)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        name,
+                        version,
+                        sort_key,
+                        str(target),
+                        size,
+                        created_at,
+                        json.dumps(metadata or {}),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO files (name, version, relpath, digest, size)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [(name, version, *entry) for entry in files],
+                )
+                if target.exists():
+                    shutil.rmtree(target)
+                staging.replace(target)
+        except sqlite3.IntegrityError:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise VersionExistsError(name, version) from None
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        logger.info(
+            "Registered %s %s: %d files, %d bytes (%d new)",
+            name,
+            version,
+            len(files),
+            size,
+            new_bytes,
+        )
+        return ModelVersion(
+            name, version, str(target), size, created_at, metadata or {}, new_bytes
+        )
+
+    def _find(self, name: str, version: str) -> ModelVersion | None:
+        """Look up an exact version."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, version, path, size, created_at, metadata"
+                " FROM versions WHERE name = ? AND version = ?",
+                (name, version),
+            ).fetchone()
+        return self._row_to_version(row) if row else None
+
+    def get(self, name: str, version: str) -> ModelVersion:
+        """
+        Get an exact version.
+
+        Args:
+            name: The model name
+            version: The version
+
+        Returns:
+            The version
+
+        Raises:
+            VersionNotFoundError: If it is not registered
+
+        """
+        found = self._find(name, version)
+        if found is None:
+            raise VersionNotFoundError(name, version)
+        return found
+
+    def list_versions(self, name: str) -> list[ModelVersion]:
+        """Return the versions of a model, oldest version number first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, version, path, size, created_at, metadata"
+                " FROM versions WHERE name = ? ORDER BY sort_key",
+                (name,),
+            ).fetchall()
+        return [self._row_to_version(row) for row in rows]
+
+    def list_models(self) -> list[str]:
+        """Return the names of all models with registered versions."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT name FROM versions ORDER BY name"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def aliases(self, name: str) -> dict[str, str]:
+        """Return the aliases of a model and the versions they point at."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT alias, version FROM aliases WHERE name = ? ORDER BY alias",
+                (name,),
+            ).fetchall()
+        return dict(rows)
+
+    def resolve(self, name: str, spec: str = "latest") -> ModelVersion:
+        """
+        Find the version of a model matching a version, constraint or alias.
+
+        Args:
+            name: The model name
+            spec: An exact version, a :class:`VersionConstraint`, or an alias
+                name such as "active"
+
+        Returns:
+            The highest matching version (the aliased one for an alias)
+
+        Raises:
+            VersionNotFoundError: If nothing matches
+
+        """
+        spec = spec.strip()
+        if _NAME_PATTERN.match(spec) and not _VERSION_PATTERN.match(spec):
+            if spec != "latest":
+                version = self.aliases(name).get(spec)
+                if version is None:
+                    raise VersionNotFoundError(name, spec)
+                return self.get(name, version)
+        elif _VERSION_PATTERN.match(spec) and (found := self._find(name, spec)):
+            return found
+
+        constraint = VersionConstraint(spec)
+        if constraint.exact is not None and (
+            found := self._find(name, constraint.exact)
+        ):
+            return found
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, version, path, size, created_at, metadata"
+                " FROM versions WHERE name = ? ORDER BY sort_key DESC",
+                (name,),
+            ).fetchall()
+        for row in rows:
+            if constraint.matches(row[1]):
+                return self._row_to_version(row)
+        raise VersionNotFoundError(name, spec)
+
+    def _link_alias(self, name: str, alias: str, version: str | None) -> None:
+        """Point ``aliases/<name>/<alias>`` at a version directory, atomically."""
+        link = self.aliases_dir / name / alias
+        if version is None:
+            with contextlib.suppress(FileNotFoundError):
+                link.unlink()
+            return
+        link.parent.mkdir(parents=True, exist_ok=True)
+        tmp = link.with_name(f".{alias}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp.symlink_to(Path("..", "..", "versions", name, version))
+            tmp.replace(link)
+        except OSError:
+            # File systems without symbolic links still have the index
+            logger.debug("Could not link alias %s of %s", alias, name, exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+
+    def promote(self, name: str, spec: str, alias: str = DEFAULT_ALIAS) -> ModelVersion:
+        """
+        Point an alias at a version.
+
+        Args:
+            name: The model name
+            spec: Version or constraint to promote
+            alias: The alias to move
+
+        Returns:
+            The promoted version
+
+        Raises:
+            VersionNotFoundError: If no version matches ``spec``
+
+        """
+        self._check_name(alias)
+        target = self.resolve(name, spec)
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT version FROM aliases WHERE name = ? AND alias = ?",
+                (name, alias),
+            ).fetchone()
+            previous = row[0] if row else None
+            if previous != target.version:
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO aliases (name, alias, version, updated_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (name, alias, target.version, now),
+                )
+                conn.execute(
+                    "INSERT INTO alias_history"
+                    " (name, alias, version, previous, changed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (name, alias, target.version, previous, now),
+                )
+            self._link_alias(name, alias, target.version)
+        logger.info("Promoted %s %s to '%s'", name, target.version, alias)
+        return target
+
+    @staticmethod
+    def _rollback_target(
+        conn: sqlite3.Connection, name: str, alias: str
+    ) -> tuple[list[int], str | None]:
+        """
+        Find the version a rollback of an alias returns to; caller holds the lock.
+
+        History entries whose previous version no longer exists are skipped.
+
+        Returns:
+            The ids of the history entries the rollback consumes, and the
+            version (None if the alias has no earlier version)
+
+        """
+        consumed = []
+        for history_id, previous, exists in conn.execute(
+            "SELECT h.id, h.previous, v.version IS NOT NULL FROM alias_history h"
+            " LEFT JOIN versions v ON v.name = h.name AND v.version = h.previous"
+            " WHERE h.name = ? AND h.alias = ?"
+            " ORDER BY h.id DESC",
+            (name, alias),
+        ).fetchall():
+            if previous is None:
+                break
+            consumed.append(history_id)
+            if exists:
+                return consumed, previous
+        return [], None
+
+    def previous(self, name: str, alias: str = DEFAULT_ALIAS) -> str | None:
+        """
+        Get the version a rollback of an alias would return to.
+
+        Args:
+            name: The model name
+            alias: The alias
+
+        Returns:
+            The version, or None if the alias has no earlier version
+
+        """
+        with self._lock:
+            return self._rollback_target(self._conn, name, alias)[1]
+
+    def rollback(self, name: str, alias: str = DEFAULT_ALIAS) -> ModelVersion:
+        """
+        Point an alias back at the version it had before its last promotion.
+
+        Repeated rollbacks walk further back through the alias history,
+        skipping versions that have since been deleted.
+
+        Args:
+            name: The model name
+            alias: The alias to move
+
+        Returns:
+            The version the alias now points at
+
+        Raises:
+            RollbackError: If the alias has no earlier version
+
+        """
+        with self._transaction() as conn:
+            consumed, previous = self._rollback_target(conn, name, alias)
+            if previous is None:
+                raise RollbackError(name, alias)
+            conn.executemany(
+                "DELETE FROM alias_history WHERE id = ?",
+                [(history_id,) for history_id in consumed],
+            )
+            conn.execute(
+                "UPDATE aliases SET version = ?, updated_at = ?"
+                " WHERE name = ? AND alias = ?",
+                (previous, time.time(), name, alias),
+            )
+            self._link_alias(name, alias, previous)
+        logger.info("Rolled back '%s' of %s to %s", alias, name, previous)
+        return self.get(name, previous)
+
+    def delete(self, name: str, version: str) -> None:
+        """
+        Remove a version; its blobs stay until :meth:`gc`.
+
+        Args:
+            name: The model name
+            version: The version
+
+        Raises:
+            VersionInUseError: If an alias points at the version or can roll
+                back to it
+
+        """
+        with self._transaction() as conn:
+            in_use = sorted(
+                {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT alias FROM aliases WHERE name = ? AND version = ?"
+                        " UNION SELECT alias FROM alias_history"
+                        " WHERE name = ? AND previous = ?",
+                        (name, version, name, version),
+                    )
+                }
+            )
+            if in_use:
+                raise VersionInUseError(name, version, in_use)
+            for table in ("versions", "files", "alias_history"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE name = ? AND version = ?",  # noqa: S608
+                    (name, version),
+                )
+        shutil.rmtree(self.versions_dir / name / version, ignore_errors=True)
+
+    def gc(self) -> int:
+        """
+        Delete stored blobs that no version references.
+
+        Returns:
+            Bytes freed
+
+        """
+        with self._lock:
+            referenced = {
+                row[0]
+                for row in self._conn.execute("SELECT DISTINCT digest FROM files")
+            }
+            freed = 0
+            for blob in (self.blobs.root / "sha256").iterdir():
+                if blob.name not in referenced:
+                    freed += blob.stat().st_size
+                    blob.unlink()
+        return freed
+
+
+class ModelDeployment:
+    """
+    Serve aliased model versions through a model manager.
+
+    Each version is registered in the manager as ``<name>@<version>``.
+    Switching an alias loads the new version first, moves the alias, and
+    unloads the replaced version; other models stay loaded.
+    """
+
+    def __init__(
+        self,
+        registry: ModelVersionRegistry,
+        manager: ModelManager,
+        loader: ModelLoader | None = None,
+    ) -> None:
+        """
+        Initialize the deployment.
+
+        Args:
+            registry: The version registry
+            manager: The manager holding loaded models
+            loader: Loader for the versions (the manager's default if None)
+
+        """
+        self.registry = registry
+        self.manager = manager
+        self.loader = loader
+
+    def _register(self, version: ModelVersion) -> str:
+        """Register a version in the manager and return its model ID."""
+        info = ModelInfo(
+            id=version.model_id,
+            name=version.name,
+            type=version.metadata.get("model_type", ""),
+            path=version.path,
+            format=version.metadata.get("format", ""),
+            metadata=version.metadata.get("options", {}),
+        )
+        self.manager.register_model(info, self.loader)
+        return info.id
+
+    def model_id(self, name: str, alias: str = DEFAULT_ALIAS) -> str:
+        """
+        Get the manager ID of the version an alias points at.
+
+        Args:
+            name: The model name
+            alias: The alias
+
+        Returns:
+            ``<name>@<version>``
+
+        """
+        version = self.registry.resolve(name, alias)
+        with contextlib.suppress(KeyError):
+            self.manager.get_model_info(version.model_id)
+            return version.model_id
+        return self._register(version)
+
+    def get_model(self, name: str, alias: str = DEFAULT_ALIAS) -> Any:  # noqa: ANN401
+        """
+        Get the loaded model an alias points at.
+
+        Args:
+            name: The model name
+            alias: The alias
+
+        Returns:
+            The loaded model
+
+        """
+        return self.manager.load_model(self.model_id(name, alias))
+
+    def _switch(self, name: str, alias: str, move: Any) -> ModelVersion:  # noqa: ANN401
+        """Move an alias with ``move()`` and swap the loaded versions."""
+        old = self.registry.aliases(name).get(alias)
+        version = move()
+        if old == version.version:
+            return version
+        # Unload the replaced version unless another alias still uses it
+        if old is not None and old not in self.registry.aliases(name).values():
+            self.manager.unregister_model(f"{name}@{old}")
+        return version
+
+    def deploy(
+        self,
+        name: str,
+        spec: str = "latest",
+        alias: str = DEFAULT_ALIAS,
+        *,
+        preload: bool = True,
+    ) -> ModelVersion:
+        """
+        Point an alias at a version and serve it.
+
+        Args:
+            name: The model name
+            spec: Version or constraint to deploy
+            alias: The alias to move
+            preload: Load the new version before the alias moves, so no
+                request waits for the load
+
+        Returns:
+            The deployed version
+
+        """
+        target = self.registry.resolve(name, spec)
+        model_id = self._register(target)
+        if preload:
+            self.manager.load_model(model_id)
+        return self._switch(
+            name, alias, lambda: self.registry.promote(name, target.version, alias)
+        )
+
+    def rollback(
+        self, name: str, alias: str = DEFAULT_ALIAS, *, preload: bool = True
+    ) -> ModelVersion:
+        """
+        Return an alias to its previous version and serve it.
+
+        Args:
+            name: The model name
+            alias: The alias to move
+            preload: Load the previous version before the alias moves
+
+        Returns:
+            The version the alias now points at
+
+        """
+        previous = self.registry.previous(name, alias)
+        if preload and previous is not None:
+            self.manager.load_model(self._register(self.registry.get(name, previous)))
+        return self._switch(name, alias, lambda: self.registry.rollback(name, alias))
@@ -1,7 +1,66 @@
 """__init__ - Module for ai_models/optimization/pruning.__init__."""
 
-# Standard library imports
+from __future__ import annotations
 
+# Standard library imports
 # Third-party imports
-
 # Local imports
+from .base import (
+    BasePruner,
+    PruningConfig,
+    PruningConfigError,
+    PruningResult,
+    UnsupportedModelError,
+)
+from .benchmark import benchmark_against_dense
+from .magnitude_pruner import MagnitudePruner
+from .structured_pruner import DenseLayer, StructuredPruner
+from .utils import count_parameters, named_weights, parameter_bytes, sparsity
+
+# Pruners by method name
+PRUNERS: dict[str, type[BasePruner]] = {
+    "magnitude": MagnitudePruner,
+    "structured": StructuredPruner,
+}
+
+
+def get_pruner(method: str, config: PruningConfig | None = None) -> BasePruner:
+    """
+    Create the pruner for a method.
+
+    Args:
+        method: "magnitude" or "structured"
+        config: Pruning options (defaults if None)
+
+    Returns:
+        The pruner
+
+    Raises:
+        PruningConfigError: If no pruner implements the method
+
+    """
+    if method not in PRUNERS:
+        error_msg = (
+            f"No pruner for method '{method}'; expected one of {sorted(PRUNERS)}"
+        )
+        raise PruningConfigError(error_msg)
+    return PRUNERS[method](config)
+
+
+__all__ = [
+    "PRUNERS",
+    "BasePruner",
+    "DenseLayer",
+    "MagnitudePruner",
+    "PruningConfig",
+    "PruningConfigError",
+    "PruningResult",
+    "StructuredPruner",
+    "UnsupportedModelError",
+    "benchmark_against_dense",
+    "count_parameters",
+    "get_pruner",
+    "named_weights",
+    "parameter_bytes",
+    "sparsity",
+]
@@ -1,7 +1,192 @@
-"""base - Module for ai_models/optimization/pruning.base."""
+"""
+base - Module for ai_models/optimization/pruning.base.
+
+Configuration, results and the base class of the pruners.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+
+class PruningConfigError(ValueError):
+    """Raised when a pruning configuration is invalid."""
+
+
+class UnsupportedModelError(TypeError):
+    """Raised when a pruner cannot find prunable structure in a model."""
+
+    MESSAGE_TEMPLATE = "{pruner} cannot prune {model}: {reason}"
+
+    def __init__(self, pruner: str, model: object, reason: str) -> None:
+        """
+        Initialize the UnsupportedModelError.
+
+        Args:
+            pruner: The pruner's method name
+            model: The model
+            reason: What is missing
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(
+                pruner=pruner, model=type(model).__name__, reason=reason
+            )
+        )
+
+
+@dataclass
+class PruningConfig:
+    """
+    Options for pruning.
+
+    Attributes:
+        target_sparsity: Fraction of weights (magnitude pruning) or of
+            channels and heads (structured pruning) to remove
+        scope: "global" ranks all selected weights together; "layer" prunes
+            each weight matrix to the target on its own
+        include: Regular expressions of parameter names to prune (all
+            weight matrices if empty)
+        exclude: Regular expressions of parameter names to keep dense
+            (embeddings and output heads are usually excluded)
+        min_channels: Fewest channels or heads to keep in a layer
+        multiple_of: Round kept channel counts to a multiple of this, which
+            keeps matrix shapes friendly to vectorized kernels
+
+    """
+
+    target_sparsity: float = 0.5
+    scope: str = "global"
+    include: list[str] = field(default_factory=list)
+    exclude: list[str] = field(
+        default_factory=lambda: [r"embed", r"classifier", r"lm_head", r"pooler"]
+    )
+    min_channels: int = 1
+    multiple_of: int = 1
+
+    SCOPES = ("global", "layer")
+
+    def __post_init__(self) -> None:
+        """
+        Validate the configuration.
+
+        Raises:
+            PruningConfigError: If a setting is out of range
+
+        """
+        detail = None
+        if not 0.0 <= self.target_sparsity < 1.0:
+            detail = "target_sparsity must be in [0, 1)"
+        elif self.scope not in self.SCOPES:
+            detail = f"scope must be one of {self.SCOPES}"
+        elif self.min_channels < 1 or self.multiple_of < 1:
+            detail = "min_channels and multiple_of must be positive"
+        if detail:
+            error_msg = f"Invalid pruning configuration: {detail}"
+            raise PruningConfigError(error_msg)
+
+    def selects(self, name: str) -> bool:
+        """
+        Whether a parameter is pruned under this configuration.
+
+        Args:
+            name: The parameter name
+
+        Returns:
+            True if it matches ``include`` (or ``include`` is empty) and
+            does not match ``exclude``
+
+        """
+        if self.include and not any(re.search(p, name) for p in self.include):
+            return False
+        return not any(re.search(p, name) for p in self.exclude)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the configuration as a dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class PruningResult:
+    """
+    Outcome of pruning a model.
+
+    Attributes:
+        method: The pruner's method name
+        params_before: Parameter count before pruning
+        params_after: Parameter count after pruning (structured pruning
+            shrinks the model; magnitude pruning keeps the count)
+        sparsity_before: Fraction of zero weights in the pruned layers before
+        sparsity_after: Fraction of zero weights in the pruned layers after
+        layers: Per-layer details (sparsity, or kept channels and heads)
+        config: The configuration used
+
+    """
+
+    method: str
+    params_before: int
+    params_after: int
+    sparsity_before: float
+    sparsity_after: float
+    layers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    config: PruningConfig | None = None
+
+    @property
+    def size_ratio(self) -> float:
+        """Parameters after pruning relative to before."""
+        return self.params_after / self.params_before if self.params_before else 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a dictionary."""
+        return {
+            "method": self.method,
+            "params_before": self.params_before,
+            "params_after": self.params_after,
+            "size_ratio": self.size_ratio,
+            "sparsity_before": self.sparsity_before,
+            "sparsity_after": self.sparsity_after,
+            "layers": self.layers,
+            "config": self.config.to_dict() if self.config else None,
+        }
+
+    def to_json(self) -> str:
+        """Return the result as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class BasePruner(ABC):
+    """Prune a model in place."""
+
+    method = ""
+
+    def __init__(self, config: PruningConfig | None = None) -> None:
+        """
+        Initialize the pruner.
+
+        Args:
+            config: Pruning options (defaults if None)
+
+        """
+        self.config = config or PruningConfig()
+
+    @abstractmethod
+    def prune(self, model: Any) -> PruningResult:  # noqa: ANN401
+        """
+        Prune a model in place.
+
+        Args:
+            model: The model
+
+        Returns:
+            The pruning result
+
+        """
@@ -0,0 +1,156 @@
+"""
+benchmark - Module for ai_models/optimization/pruning.benchmark.
+
+Compare a pruned model with its dense baseline.
+
+Both models run through :class:`ai_models.benchmarking.BenchmarkRunner` with
+the same prompts and settings, so the latency, throughput and peak RSS
+figures are directly comparable with other benchmark results. The parameter
+memory of each model is reported alongside: the dense size, and the size
+when only non-zero values are stored, which is what magnitude pruning saves
+with a sparse format.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+# Third-party imports
+# Local imports
+from ai_models.benchmarking import BenchmarkConfig, BenchmarkRunner
+
+from .utils import parameter_bytes, sparsity
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# A model under test: a batch of texts in, one output row per text out
+ModelFn = Callable[[list[str]], Any]
+
+
+class _ModelAdapter:
+    """Expose a model function as an embedding adapter for the runner."""
+
+    def __init__(self, fn: ModelFn) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            fn: The model function
+
+        """
+        self.fn = fn
+
+    def embed(self, texts: list[str]) -> list[Any]:
+        """Run the model; one output row per text."""
+        return list(self.fn(texts))
+
+
+def _weights_report(weights: Iterable[np.ndarray] | None) -> dict[str, Any]:
+    """Summarize the parameter memory of a model."""
+    if weights is None:
+        return {}
+    arrays = list(weights)
+    return {
+        "parameter_bytes": parameter_bytes(arrays),
+        "nonzero_bytes": parameter_bytes(arrays, nonzero_only=True),
+        "sparsity": sparsity(arrays),
+    }
+
+
+def _ratio(numerator: float | None, denominator: float | None) -> float | None:
+    """Divide, or None if either side is missing or the divisor is zero."""
+    if not numerator or not denominator:
+        return None
+    return numerator / denominator
+
+
+def benchmark_against_dense(
+    dense: ModelFn,
+    pruned: ModelFn,
+    *,
+    prompts: Sequence[str] | None = None,
+    num_runs: int = 50,
+    warmup_runs: int = 5,
+    concurrency_levels: Sequence[int] = (1,),
+    dense_weights: Iterable[np.ndarray] | None = None,
+    pruned_weights: Iterable[np.ndarray] | None = None,
+) -> dict[str, Any]:
+    """
+    Benchmark a pruned model against the dense model it came from.
+
+    Args:
+        dense: The dense model function
+        pruned: The pruned model function
+        prompts: Benchmark inputs (the harness defaults if None)
+        num_runs: Timed requests per concurrency level
+        warmup_runs: Untimed requests per concurrency level
+        concurrency_levels: Requests kept in flight
+        dense_weights: Arrays of the dense model, for the memory report
+        pruned_weights: Arrays of the pruned model, for the memory report
+
+    Returns:
+        Dictionary with the "dense" and "pruned" benchmark results, their
+        parameter memory, and per-level "speedup" (dense p50 latency over
+        pruned p50 latency) and "throughput_ratio"
+
+    """
+    results = {}
+    for label, fn in (("dense", dense), ("pruned", pruned)):
+        options: dict[str, Any] = {
+            "model_id": label,
+            "operation": "embed",
+            "num_runs": num_runs,
+            "warmup_runs": warmup_runs,
+            "concurrency_levels": list(concurrency_levels),
+        }
+        if prompts is not None:
+            options["prompts"] = list(prompts)
+        results[label] = BenchmarkRunner(
+            BenchmarkConfig(**options), adapter=_ModelAdapter(fn)
+        ).run()
+
+    levels = {}
+    for concurrency in concurrency_levels:
+        before = results["dense"].get_level(concurrency)
+        after = results["pruned"].get_level(concurrency)
+        levels[concurrency] = {
+            "speedup": _ratio(before.latency.get("p50"), after.latency.get("p50")),
+            "throughput_ratio": _ratio(
+                after.throughput.get("requests_per_sec"),
+                before.throughput.get("requests_per_sec"),
+            ),
+        }
+    first = levels[concurrency_levels[0]]
+    logger.info(
+        "Pruned model: %.2fx p50 speedup, %.2fx throughput",
+        first["speedup"] or 0.0,
+        first["throughput_ratio"] or 0.0,
+    )
+
+    dense_memory = _weights_report(dense_weights)
+    pruned_memory = _weights_report(pruned_weights)
+    return {
+        "dense": results["dense"].to_dict(),
+        "pruned": results["pruned"].to_dict(),
+        "levels": levels,
+        "speedup": first["speedup"],
+        "memory": {
+            "dense": dense_memory,
+            "pruned": pruned_memory,
+            "parameter_ratio": _ratio(
+                pruned_memory.get("parameter_bytes"),
+                dense_memory.get("parameter_bytes"),
+            ),
+            "peak_rss_bytes": {
+                "dense": results["dense"].peak_rss_bytes,
+                "pruned": results["pruned"].peak_rss_bytes,
+            },
+        },
+    }
@@ -1,7 +1,180 @@
-"""utils - Module for ai_models/optimization/pruning.utils."""
+"""
+utils - Module for ai_models/optimization/pruning.utils.
+
+Weight access, sparsity measurement and channel ranking for the pruners.
+
+Models are handled as named weight arrays: a mapping of NumPy arrays, or a
+PyTorch module whose CPU parameters are exposed as NumPy views sharing the
+parameter memory, so pruning the arrays prunes the module.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 # Third-party imports
+import numpy as np
 
 # Local imports
+
+
+def named_weights(model: Any) -> dict[str, np.ndarray]:  # noqa: ANN401
+    """
+    Get the weights of a model as writable arrays.
+
+    Args:
+        model: A mapping of names to NumPy arrays, or a PyTorch module on CPU
+
+    Returns:
+        Arrays by parameter name; writes to them update the model
+
+    Raises:
+        TypeError: If the model is neither
+
+    """
+    if isinstance(model, Mapping):
+        return dict(model)
+    if hasattr(model, "named_parameters"):
+        return {
+            name: param.detach().numpy() for name, param in model.named_parameters()
+        }
+    error_msg = f"Expected a mapping of arrays or a torch module, got {type(model)}"
+    raise TypeError(error_msg)
+
+
+def count_parameters(weights: Iterable[np.ndarray]) -> int:
+    """Return the number of values in the arrays."""
+    return sum(int(w.size) for w in weights)
+
+
+def count_nonzero(weights: Iterable[np.ndarray]) -> int:
+    """Return the number of non-zero values in the arrays."""
+    return sum(int(np.count_nonzero(w)) for w in weights)
+
+
+def sparsity(weights: Iterable[np.ndarray]) -> float:
+    """
+    Get the fraction of zero values.
+
+    Args:
+        weights: The arrays
+
+    Returns:
+        Zeros over total values (0.0 for no values)
+
+    """
+    arrays = list(weights)
+    total = count_parameters(arrays)
+    return 1.0 - count_nonzero(arrays) / total if total else 0.0
+
+
+def magnitude_masks(
+    weights: Iterable[np.ndarray], target_sparsity: float
+) -> list[np.ndarray]:
+    """
+    Mask out the ``target_sparsity`` fraction of values of smallest magnitude.
+
+    Values are ranked together across the arrays; ties at the cut are broken
+    by rank, so exactly that fraction is pruned even when many values share
+    a magnitude.
+
+    Args:
+        weights: The arrays ranked together
+        target_sparsity: Fraction of values to prune
+
+    Returns:
+        One boolean mask per array, in order, False where a value is pruned
+
+    """
+    arrays = list(weights)
+    magnitudes = np.concatenate([np.abs(w).ravel() for w in arrays])
+    k = min(int(target_sparsity * magnitudes.size), magnitudes.size)
+    keep = np.ones(magnitudes.size, dtype=bool)
+    if k == magnitudes.size:
+        keep[:] = False
+    elif k > 0:
+        # Indices of the k smallest magnitudes, in no particular order
+        keep[np.argpartition(magnitudes, k - 1)[:k]] = False
+    offsets = np.cumsum([w.size for w in arrays])[:-1]
+    return [
+        mask.reshape(w.shape) for mask, w in zip(np.split(keep, offsets), arrays)
+    ]
+
+
+def channel_scores(weight: np.ndarray, axis: int = 0, norm: int = 2) -> np.ndarray:
+    """
+    Score channels of a weight matrix by their norm.
+
+    Args:
+        weight: Matrix of shape (out, in), as in ``nn.Linear``
+        axis: 0 to score output channels (rows), 1 for input channels
+        norm: 1 or 2
+
+    Returns:
+        One score per channel
+
+    """
+    other = 1 - axis
+    if norm == 1:
+        return np.abs(weight).sum(axis=other)
+    return np.sqrt(np.square(weight, dtype=np.float64).sum(axis=other))
+
+
+def keep_count(
+    total: int, prune_ratio: float, min_keep: int = 1, multiple_of: int = 1
+) -> int:
+    """
+    Get how many of ``total`` channels to keep.
+
+    Args:
+        total: Channels in the layer
+        prune_ratio: Fraction to remove
+        min_keep: Fewest to keep
+        multiple_of: Round the count up to a multiple of this
+
+    Returns:
+        The number of channels to keep, at most ``total``
+
+    """
+    keep = max(round(total * (1.0 - prune_ratio)), min_keep)
+    keep = -(-keep // multiple_of) * multiple_of
+    return min(keep, total)
+
+
+def top_indices(scores: np.ndarray, keep: int) -> np.ndarray:
+    """
+    Select the highest-scoring channels.
+
+    Args:
+        scores: One score per channel
+        keep: How many to select
+
+    Returns:
+        Indices of the selected channels in ascending order, so the kept
+        channels stay in their original order
+
+    """
+    if keep >= scores.size:
+        return np.arange(scores.size)
+    return np.sort(np.argpartition(-scores, keep - 1)[:keep])
+
+
+def parameter_bytes(
+    weights: Iterable[np.ndarray], *, nonzero_only: bool = False
+) -> int:
+    """
+    Get the memory the weights occupy.
+
+    Args:
+        weights: The arrays
+        nonzero_only: Count only non-zero values (the size in a sparse format)
+
+    Returns:
+        Bytes
+
+    """
+    if nonzero_only:
+        return sum(int(np.count_nonzero(w)) * w.itemsize for w in weights)
+    return sum(int(w.nbytes) for w in weights)
@@ -1,7 +1,64 @@
 """__init__ - Module for ai_models/optimization/quantization.__init__."""
 
-# Standard library imports
+from __future__ import annotations
 
+# Standard library imports
 # Third-party imports
-
 # Local imports
+from .base import (
+    BaseQuantizer,
+    QuantizationConfig,
+    QuantizationConfigError,
+    QuantizationResult,
+    QuantizerNotAvailableError,
+)
+from .dynamic_quantizer import ONNXDynamicQuantizer, TorchDynamicQuantizer
+from .utils import compare_models, measure_latency, output_drift
+
+# Quantizers by model format
+QUANTIZERS: dict[str, type[BaseQuantizer]] = {
+    "onnx": ONNXDynamicQuantizer,
+    "pytorch": TorchDynamicQuantizer,
+}
+
+
+def get_quantizer(
+    model_format: str, config: QuantizationConfig | None = None
+) -> BaseQuantizer:
+    """
+    Create the quantizer for a model format.
+
+    Args:
+        model_format: "onnx" or "pytorch"
+        config: Quantization options (defaults if None)
+
+    Returns:
+        The quantizer
+
+    Raises:
+        QuantizationConfigError: If no quantizer handles the format
+
+    """
+    if model_format not in QUANTIZERS:
+        error_msg = (
+            f"No quantizer for format '{model_format}'; "
+            f"expected one of {sorted(QUANTIZERS)}"
+        )
+        raise QuantizationConfigError(error_msg)
+    return QUANTIZERS[model_format](config)
+
+
+__all__ = [
+    "QUANTIZERS",
+    "BaseQuantizer",
+    "ONNXDynamicQuantizer",
+    "QuantizationConfig",
+    "QuantizationConfigError",
+    "QuantizationResult",
+    "QuantizerNotAvailableError",
+    "TorchDynamicQuantizer",
+    "compare_models",
+    "get_quantizer",
+    "measure_latency",
+    "output_drift",
+]
@@ -1,7 +1,160 @@
-"""base - Module for ai_models/optimization/quantization.base."""
+"""
+base - Module for ai_models/optimization/quantization.base.
+
+Configuration, results and the base class of the quantizers.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Any, ClassVar
 
 # Third-party imports
 
 # Local imports
+
+
+class QuantizationConfigError(ValueError):
+    """Raised when a quantization configuration is invalid."""
+
+
+class QuantizerNotAvailableError(ImportError):
+    """Raised when a quantizer's backend library is not installed."""
+
+    MESSAGE_TEMPLATE = "{quantizer} requires {packages}: uv pip install {packages}"
+
+    def __init__(self, quantizer: str, packages: str) -> None:
+        """
+        Initialize the QuantizerNotAvailableError.
+
+        Args:
+            quantizer: Name of the quantizer
+            packages: Space-separated packages to install
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(quantizer=quantizer, packages=packages)
+        )
+
+
+@dataclass
+class QuantizationConfig:
+    """
+    Options for post-training quantization.
+
+    Attributes:
+        weight_type: "qint8" (signed) or "quint8" (unsigned) weights
+        per_channel: Quantize weights per output channel instead of per tensor
+        reduce_range: Use 7-bit weights, avoiding overflow on CPUs without
+            VNNI instructions
+        op_types: ONNX operators to quantize (linear layers by default)
+        exclude_nodes: ONNX nodes to leave in float precision
+
+    """
+
+    WEIGHT_TYPES: ClassVar[tuple[str, ...]] = ("qint8", "quint8")
+
+    weight_type: str = "qint8"
+    per_channel: bool = False
+    reduce_range: bool = False
+    op_types: list[str] = field(default_factory=lambda: ["MatMul", "Gemm"])
+    exclude_nodes: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the configuration.
+
+        Raises:
+            QuantizationConfigError: If the weight type is unknown
+
+        """
+        if self.weight_type not in self.WEIGHT_TYPES:
+            error_msg = (
+                f"Unknown weight type '{self.weight_type}'; "
+                f"expected one of {self.WEIGHT_TYPES}"
+            )
+            raise QuantizationConfigError(error_msg)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the configuration as a dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class QuantizationResult:
+    """
+    Outcome of quantizing a model.
+
+    Attributes:
+        method: The quantizer's method name
+        source_path: The original model
+        output_path: The quantized model
+        config: The configuration used
+        report: Before/after comparison, if samples were evaluated
+
+    """
+
+    method: str
+    source_path: str
+    output_path: str
+    config: QuantizationConfig
+    report: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a dictionary."""
+        return {
+            "method": self.method,
+            "source_path": self.source_path,
+            "output_path": self.output_path,
+            "config": self.config.to_dict(),
+            "report": self.report,
+        }
+
+    def to_json(self) -> str:
+        """Return the result as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class BaseQuantizer(ABC):
+    """Quantize a saved model into a new file."""
+
+    method = ""
+
+    def __init__(self, config: QuantizationConfig | None = None) -> None:
+        """
+        Initialize the quantizer.
+
+        Args:
+            config: Quantization options (defaults if None)
+
+        """
+        self.config = config or QuantizationConfig()
+
+    @classmethod
+    @abstractmethod
+    def is_available(cls) -> bool:
+        """Whether the backend library is installed."""
+
+    @abstractmethod
+    def quantize(
+        self,
+        model_path: str,
+        output_path: str | None = None,
+        samples: list[str] | None = None,
+    ) -> QuantizationResult:
+        """
+        Quantize a model.
+
+        Args:
+            model_path: The model file or directory
+            output_path: Where to write the quantized model (a default next to
+                the model if None)
+            samples: Sample inputs for a before/after report (no report if None)
+
+        Returns:
+            The quantization result
+
+        """
@@ -1,7 +1,122 @@
-"""utils - Module for ai_models/optimization/quantization.utils."""
+"""
+utils - Module for ai_models/optimization/quantization.utils.
+
+Before/after comparison of a model and its quantized version.
+
+The report covers what quantization trades: size (on disk, and so roughly
+resident), latency on a sample set, and drift of the outputs on that set.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import statistics
+import time
+from typing import Any, Callable
 
 # Third-party imports
+import numpy as np
 
 # Local imports
+
+# A model under comparison: sample inputs to an output array (one row each)
+ModelFn = Callable[[list[str]], Any]
+
+
+def measure_latency(
+    fn: ModelFn, samples: list[str], *, warmup: int = 1, repeats: int = 5
+) -> dict[str, float]:
+    """
+    Time a model on the sample set.
+
+    Args:
+        fn: The model
+        samples: Sample inputs, run as one batch
+        warmup: Untimed runs first
+        repeats: Timed runs
+
+    Returns:
+        Median and minimum milliseconds per run, and median per sample
+
+    """
+    for _ in range(warmup):
+        fn(samples)
+    timings = []
+    for _ in range(max(repeats, 1)):
+        start = time.perf_counter()
+        fn(samples)
+        timings.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(timings)
+    return {
+        "median_ms": median,
+        "min_ms": min(timings),
+        "per_sample_ms": median / max(len(samples), 1),
+    }
+
+
+def output_drift(reference: Any, candidate: Any) -> dict[str, float]:  # noqa: ANN401
+    """
+    Measure how far quantized outputs are from the original outputs.
+
+    Args:
+        reference: Original outputs, one row per sample
+        candidate: Quantized outputs of the same shape
+
+    Returns:
+        Largest and mean absolute difference, smallest and mean cosine
+        similarity per row, and the share of rows with the same argmax (top-1
+        agreement, the accuracy proxy for classifiers)
+
+    """
+    ref = np.asarray(reference, dtype=np.float64).reshape(len(reference), -1)
+    cand = np.asarray(candidate, dtype=np.float64).reshape(len(candidate), -1)
+    diff = np.abs(ref - cand)
+    norms = np.linalg.norm(ref, axis=1) * np.linalg.norm(cand, axis=1)
+    cosine = (ref * cand).sum(axis=1) / np.maximum(norms, 1e-12)
+    return {
+        "max_abs_diff": float(diff.max()) if diff.size else 0.0,
+        "mean_abs_diff": float(diff.mean()) if diff.size else 0.0,
+        "min_cosine": float(cosine.min()) if cosine.size else 1.0,
+        "mean_cosine": float(cosine.mean()) if cosine.size else 1.0,
+        "top1_agreement": float((ref.argmax(axis=1) == cand.argmax(axis=1)).mean())
+        if ref.size
+        else 1.0,
+    }
+
+
+def compare_models(
+    before: ModelFn,
+    after: ModelFn,
+    samples: list[str],
+    *,
+    size_before: int,
+    size_after: int,
+    repeats: int = 5,
+) -> dict[str, Any]:
+    """
+    Build the before/after report of a quantization.
+
+    Args:
+        before: The original model
+        after: The quantized model
+        samples: Sample inputs
+        size_before: Size of the original model in bytes
+        size_after: Size of the quantized model in bytes
+        repeats: Timed runs per model
+
+    Returns:
+        Sizes, latencies, their ratios, and the output drift
+
+    """
+    latency_before = measure_latency(before, samples, repeats=repeats)
+    latency_after = measure_latency(after, samples, repeats=repeats)
+    return {
+        "num_samples": len(samples),
+        "size_bytes": {"before": size_before, "after": size_after},
+        "size_ratio": size_after / size_before if size_before else None,
+        "latency": {"before": latency_before, "after": latency_after},
+        "speedup": latency_before["median_ms"] / latency_after["median_ms"]
+        if latency_after["median_ms"]
+        else None,
+        "drift": output_drift(before(samples), after(samples)),
+    }
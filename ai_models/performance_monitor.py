@@ -1,7 +1,320 @@
-"""performance_monitor - Module for ai_models.performance_monitor."""
+"""
+performance_monitor - Module for ai_models.performance_monitor.
+
+Low-overhead per-model performance monitoring for adapter calls.
+
+The monitor records latency, token counts and errors for every wrapped call
+into fixed-memory rolling-window histograms (see
+:mod:`ai_models.metrics.enhanced_metrics`), cheap enough to leave enabled in
+production. Statistics are served by ``/metrics`` in the REST API.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 # Third-party imports
-
 # Local imports
+from ai_models.benchmarking.utils import count_tokens
+from ai_models.metrics.enhanced_metrics import ModelStats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Adapter methods wrapped by PerformanceMonitor.wrap by default
+MONITORED_METHODS = (
+    "generate_text",
+    "generate",
+    "generate_chat_completions",
+    "chat",
+    "embed",
+    "send_message",
+)
+
+
+class CallRecord:
+    """Token counts for a call being tracked with :meth:`PerformanceMonitor.track`."""
+
+    __slots__ = ("input_tokens", "output_tokens")
+
+    def __init__(self) -> None:
+        """Initialize the record with zero tokens."""
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+
+class PerformanceMonitor:
+    """Record per-model latency, token and error statistics."""
+
+    def __init__(
+        self, window_seconds: float = 60.0, slots: int = 12, *, enabled: bool = True
+    ) -> None:
+        """
+        Initialize the performance monitor.
+
+        Args:
+            window_seconds: Length of the rolling window for percentiles
+            slots: Number of time slots the window is divided into
+            enabled: Whether calls are recorded
+
+        """
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self.enabled = enabled
+        self._models: dict[str, ModelStats] = {}
+        self._lock = threading.Lock()
+
+    def get_model_stats(self, model_id: str) -> ModelStats:
+        """
+        Get (or create) the statistics for a model.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            The model's statistics
+
+        """
+        stats = self._models.get(model_id)
+        if stats is None:
+            with self._lock:
+                stats = self._models.setdefault(
+                    model_id, ModelStats(self.window_seconds, self.slots)
+                )
+        return stats
+
+    def record(
+        self,
+        model_id: str,
+        latency: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        *,
+        error: bool = False,
+    ) -> None:
+        """
+        Record one call.
+
+        Args:
+            model_id: The model identifier
+            latency: Call latency in seconds
+            input_tokens: Prompt tokens
+            output_tokens: Generated tokens
+            error: Whether the call failed
+
+        """
+        if self.enabled:
+            self.get_model_stats(model_id).record(
+                latency, input_tokens, output_tokens, error=error
+            )
+
+    @contextmanager
+    def track(self, model_id: str) -> Iterator[CallRecord]:
+        """
+        Time a block of code as one call.
+
+        The yielded record's token counts may be set inside the block. An
+        exception marks the call as failed and is re-raised.
+
+        Args:
+            model_id: The model identifier
+
+        Yields:
+            A record for the call's token counts
+
+        """
+        record = CallRecord()
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            self.record(
+                model_id,
+                time.perf_counter() - started,
+                record.input_tokens,
+                record.output_tokens,
+                error=True,
+            )
+            raise
+        self.record(
+            model_id,
+            time.perf_counter() - started,
+            record.input_tokens,
+            record.output_tokens,
+        )
+
+    def monitored(
+        self,
+        model_id: str,
+        token_counter: Callable[[Any], int] = count_tokens,
+    ) -> Callable[[F], F]:
+        """
+        Decorate a sync or async function so each call is recorded.
+
+        Args:
+            model_id: The model identifier
+            token_counter: Function returning output tokens for a result
+
+        Returns:
+            A decorator
+
+        """
+
+        def decorator(func: F) -> F:
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                    started = time.perf_counter()
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception:
+                        self.record(model_id, time.perf_counter() - started, error=True)
+                        raise
+                    self.record(
+                        model_id,
+                        time.perf_counter() - started,
+                        output_tokens=token_counter(result),
+                    )
+                    return result
+
+                return async_wrapper  # type: ignore[return-value]
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                started = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    self.record(model_id, time.perf_counter() - started, error=True)
+                    raise
+                self.record(
+                    model_id,
+                    time.perf_counter() - started,
+                    output_tokens=token_counter(result),
+                )
+                return result
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def wrap(
+        self,
+        adapter: object,
+        model_id: str,
+        methods: tuple[str, ...] = MONITORED_METHODS,
+    ) -> MonitoredAdapter:
+        """
+        Wrap an adapter so calls to its model methods are recorded.
+
+        Args:
+            adapter: The adapter to wrap
+            model_id: The model identifier to record under
+            methods: Names of the adapter methods to monitor
+
+        Returns:
+            A proxy forwarding every attribute to the adapter
+
+        """
+        return MonitoredAdapter(adapter, self, model_id, methods)
+
+    def model_ids(self) -> list[str]:
+        """Return the identifiers of all models with statistics."""
+        with self._lock:
+            return sorted(self._models)
+
+    def get_stats(
+        self, model_id: str | None = None, window_seconds: float | None = None
+    ) -> dict[str, Any]:
+        """
+        Get rolling-window statistics.
+
+        Args:
+            model_id: Report only this model (all models if None)
+            window_seconds: Window to report (the full window if None)
+
+        Returns:
+            Dictionary mapping model ids to snapshots from
+            :meth:`ModelStats.snapshot`
+
+        """
+        with self._lock:
+            models = dict(self._models)
+        if model_id is not None:
+            models = {model_id: models[model_id]} if model_id in models else {}
+        return {
+            name: stats.snapshot(window_seconds)
+            for name, stats in sorted(models.items())
+        }
+
+    def reset(self) -> None:
+        """Remove all statistics."""
+        with self._lock:
+            self._models.clear()
+
+
+class MonitoredAdapter:
+    """Adapter proxy that records calls to selected methods."""
+
+    def __init__(
+        self,
+        adapter: object,
+        monitor: PerformanceMonitor,
+        model_id: str,
+        methods: tuple[str, ...] = MONITORED_METHODS,
+    ) -> None:
+        """
+        Initialize the proxy.
+
+        Args:
+            adapter: The adapter to wrap
+            monitor: The monitor to record into
+            model_id: The model identifier to record under
+            methods: Names of the adapter methods to monitor
+
+        """
+        self.adapter = adapter
+        self.monitor = monitor
+        self.model_id = model_id
+        self._methods = frozenset(methods)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Forward attribute access, wrapping monitored methods once."""
+        attr = getattr(self.adapter, name)
+        if name in self._methods and callable(attr):
+            attr = self.monitor.monitored(self.model_id)(attr)
+            # Cache the wrapper so later lookups skip __getattr__
+            self.__dict__[name] = attr
+        return attr
+
+
+# Process-wide monitor used by the REST metrics endpoint
+_default_monitor = PerformanceMonitor()
+
+
+def get_performance_monitor() -> PerformanceMonitor:
+    """
+    Get the process-wide performance monitor.
+
+    Returns:
+        The shared monitor
+
+    """
+    return _default_monitor
+
+
+__all__ = [
+    "CallRecord",
+    "MonitoredAdapter",
+    "PerformanceMonitor",
+    "get_performance_monitor",
+]
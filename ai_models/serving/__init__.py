@@ -5,3 +5,21 @@
 # Third-party imports
 
 # Local imports
+from .batching import BatchScheduler, BatchSizeMismatchError
+from .server import (
+    ModelRuntime,
+    OperationNotSupportedError,
+    ServerProtocol,
+    extract_text,
+    get_runtime,
+)
+
+__all__ = [
+    "BatchScheduler",
+    "BatchSizeMismatchError",
+    "ModelRuntime",
+    "OperationNotSupportedError",
+    "ServerProtocol",
+    "extract_text",
+    "get_runtime",
+]
@@ -0,0 +1,216 @@
+"""
+batching - Module for ai_models/serving.batching.
+
+Asynchronous micro-batching shared by the REST and gRPC servers.
+
+Requests submit items (e.g. texts to embed) and await their results. A
+worker task gathers pending items from all concurrent requests into batches of
+up to ``max_batch_size``, waiting at most ``max_wait`` for a batch to fill,
+and runs the blocking batch function in an executor. One model call then
+serves many requests, which is what makes batched embedding cheap.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+
+# Third-party imports
+
+# Local imports
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchSizeMismatchError(RuntimeError):
+    """Raised when a batch function returns the wrong number of results."""
+
+    MESSAGE_TEMPLATE = "Batch function returned {got} results for {expected} items"
+
+    def __init__(self, expected: int, got: int) -> None:
+        """
+        Initialize the BatchSizeMismatchError.
+
+        Args:
+            expected: Number of items in the batch
+            got: Number of results returned
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(expected=expected, got=got))
+
+
+class BatchScheduler(Generic[T, R]):
+    """Coalesce items from concurrent requests into batched calls."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], list[R]],
+        *,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        max_concurrent_batches: int = 2,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            batch_fn: Blocking function mapping a list of items to results
+            max_batch_size: Maximum items per call of ``batch_fn``
+            max_wait: Maximum seconds to wait for a batch to fill
+            max_concurrent_batches: Batches allowed to run at once
+            executor: Executor for ``batch_fn`` (the loop default if None)
+
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_concurrent_batches = max_concurrent_batches
+        self.executor = executor
+        self._pending: deque[tuple[T, asyncio.Future[R]]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._running: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_worker(self) -> None:
+        """
+        Start the worker task on the running loop if needed.
+
+        A scheduler used from a new event loop (e.g. a restarted server)
+        starts a fresh worker there; items queued on the old loop are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._worker = None
+            self._running = set()
+            self._pending = deque(
+                entry for entry in self._pending if entry[1].get_loop() is loop
+            )
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._worker = loop.create_task(self._run())
+
+    async def submit_many(self, items: list[T]) -> list[R]:
+        """
+        Submit items and wait for all their results.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            Results in the same order as ``items``
+
+        """
+        if not items:
+            return []
+        self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[R]] = []
+        for item in items:
+            future: asyncio.Future[R] = loop.create_future()
+            self._pending.append((item, future))
+            futures.append(future)
+        self._wakeup.set()
+        return list(await asyncio.gather(*futures))
+
+    async def submit(self, item: T) -> R:
+        """
+        Submit one item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The item's result
+
+        """
+        return (await self.submit_many([item]))[0]
+
+    async def _run(self) -> None:
+        """Gather pending items into batches until cancelled."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                if len(self._pending) < self.max_batch_size and self.max_wait > 0:
+                    # Give concurrent requests a moment to add to this batch
+                    await asyncio.sleep(self.max_wait)
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(len(self._pending), self.max_batch_size))
+                ]
+                batch = [(item, fut) for item, fut in batch if not fut.cancelled()]
+                if not batch:
+                    continue
+                await self._slots.acquire()
+                task = asyncio.get_running_loop().create_task(self._execute(batch))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+    async def _execute(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        """Run one batch and resolve its futures."""
+        try:
+            items = [item for item, _ in batch]
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(
+                    self.executor, self.batch_fn, items
+                )
+                if len(results) != len(items):
+                    raise BatchSizeMismatchError(len(items), len(results))  # noqa: TRY301
+            except Exception as e:  # delivered to each waiter
+                logger.debug("Batch of %d items failed", len(items), exc_info=True)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            self.batches += 1
+            self.items += len(items)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Stop the worker and wait for running batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        while self._pending:
+            _, future = self._pending.popleft()
+            future.cancel()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with batches, items, mean_batch_size and queued items
+
+        """
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "queued": len(self._pending),
+        }
@@ -5,3 +5,37 @@
 # Third-party imports
 
 # Local imports
+from .config import GRPCConfig
+from .messages import (
+    EmbedRequest,
+    EmbedResponse,
+    GenerateRequest,
+    GenerateResponse,
+    MessageDecodeError,
+)
+from .server import GRPCNotAvailableError, GRPCServer
+from .servicer import (
+    CallDeadlineExceededError,
+    InvalidArgumentError,
+    ModelServicer,
+    ServicerError,
+    UnimplementedError,
+    add_model_servicer_to_server,
+)
+
+__all__ = [
+    "CallDeadlineExceededError",
+    "EmbedRequest",
+    "EmbedResponse",
+    "GRPCConfig",
+    "GRPCNotAvailableError",
+    "GRPCServer",
+    "GenerateRequest",
+    "GenerateResponse",
+    "InvalidArgumentError",
+    "MessageDecodeError",
+    "ModelServicer",
+    "ServicerError",
+    "UnimplementedError",
+    "add_model_servicer_to_server",
+]
@@ -1,7 +1,68 @@
-"""config - Module for ai_models/serving/grpc_server.config."""
+"""
+config - Module for ai_models/serving/grpc_server.config.
+
+Configuration for the gRPC model server.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+
+@dataclass
+class GRPCConfig:
+    """Configuration for :class:`~ai_models.serving.grpc_server.server.GRPCServer`."""
+
+    adapter: str = "fake"
+    model_id: str = "default"
+    model_host: str = "localhost"
+    model_port: int = 0
+    adapter_options: dict[str, Any] = field(default_factory=dict)
+    host: str = "127.0.0.1"
+    port: int = 50051
+    # HTTP/2 streams allowed per client connection, and RPCs allowed in
+    # flight server-wide (None for no limit; excess RPCs get RESOURCE_EXHAUSTED)
+    max_concurrent_streams: int = 100
+    max_concurrent_rpcs: int | None = None
+    # Requests on one bidirectional stream processed at once
+    max_inflight_per_stream: int = 16
+    # Deadline in seconds applied when the client sets none
+    default_deadline: float = 60.0
+    max_message_bytes: int = 64 * 1024 * 1024
+    # Embedding micro-batching
+    max_batch_size: int = 64
+    max_batch_wait_ms: float = 5.0
+    max_inputs_per_request: int = 2048
+    max_tokens_limit: int = 4096
+    grace_period: float = 5.0
+
+    def to_json(self) -> str:
+        """
+        Serialize the configuration to JSON.
+
+        Returns:
+            The JSON document
+
+        """
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> GRPCConfig:
+        """
+        Create a configuration from :meth:`to_json` output.
+
+        Args:
+            data: The JSON document
+
+        Returns:
+            The configuration
+
+        """
+        return cls(**json.loads(data))
@@ -0,0 +1,317 @@
+"""
+messages - Module for ai_models/serving/grpc_server.messages.
+
+Protocol buffer messages of ``model_service.proto``, encoded directly.
+
+The messages are small and fixed, so they are encoded and decoded here with
+the protobuf wire format instead of through protoc-generated classes. This
+keeps the server free of a code generation step while staying wire-compatible
+with clients generated from ``model_service.proto``. Like generated classes,
+each message has ``SerializeToString`` and ``FromString``, which is what gRPC
+method handlers expect.
+
+Embedding vectors are sent as one packed ``repeated float`` holding every
+vector back to back: 4 bytes per value plus a few bytes of framing, encoded
+with a single ``array.tobytes`` call.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, ClassVar
+
+# Third-party imports
+
+# Local imports
+
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+_UINT64_MASK = (1 << 64) - 1
+_LOW_SEVEN_BITS = 0x7F
+_CONTINUATION_BIT = 0x80
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class MessageDecodeError(ValueError):
+    """Raised when bytes are not a valid encoding of a message."""
+
+    MESSAGE_TEMPLATE = "Cannot decode {message}: {reason}"
+
+    def __init__(self, message: str, reason: str) -> None:
+        """
+        Initialize the MessageDecodeError.
+
+        Args:
+            message: Name of the message type
+            reason: What is wrong with the data
+
+        """
+        super().__init__(self.MESSAGE_TEMPLATE.format(message=message, reason=reason))
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode an integer as a base-128 varint (negatives as 64-bit)."""
+    value &= _UINT64_MASK
+    out = bytearray()
+    while value > _LOW_SEVEN_BITS:
+        out.append((value & _LOW_SEVEN_BITS) | _CONTINUATION_BIT)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode a varint at ``pos``, returning the value and the next position."""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & _LOW_SEVEN_BITS) << shift
+        if not byte & _CONTINUATION_BIT:
+            return result, pos
+        shift += 7
+
+
+def _pack_floats(values: Any) -> bytes:  # noqa: ANN401
+    """Pack floats as little-endian float32."""
+    packed = values if isinstance(values, array) else array("f", values)
+    if _BIG_ENDIAN:
+        packed = array("f", packed)
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_floats(data: bytes) -> array:
+    """Unpack little-endian float32 values."""
+    values = array("f")
+    values.frombytes(data)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def _encode_field(out: bytearray, number: int, kind: str, value: Any) -> None:  # noqa: ANN401
+    """Append one field to ``out``, omitting scalars at their default."""
+    if kind == "string":
+        if value:
+            raw = value.encode()
+            out += _encode_varint(number << 3 | _LENGTH_DELIMITED)
+            out += _encode_varint(len(raw)) + raw
+    elif kind in ("int", "bool"):
+        if value:
+            out += _encode_varint(number << 3 | _VARINT) + _encode_varint(int(value))
+    elif kind == "float":
+        if value is not None:
+            out += _encode_varint(number << 3 | _FIXED32) + struct.pack("<f", value)
+    elif kind == "strings":
+        tag = _encode_varint(number << 3 | _LENGTH_DELIMITED)
+        for item in value:
+            raw = item.encode()
+            out += tag + _encode_varint(len(raw)) + raw
+    elif len(value):  # floats
+        raw = _pack_floats(value)
+        out += _encode_varint(number << 3 | _LENGTH_DELIMITED)
+        out += _encode_varint(len(raw)) + raw
+
+
+def _read_field(message: str, data: bytes, pos: int) -> tuple[int, int, Any, int]:
+    """
+    Read the field at ``pos``.
+
+    Returns:
+        The field number, wire type, raw value (an int for varints, bytes
+        otherwise) and the position of the next field
+
+    """
+    key, pos = _decode_varint(data, pos)
+    number, wire_type = key >> 3, key & 0x7
+    if wire_type == _VARINT:
+        raw, pos = _decode_varint(data, pos)
+        return number, wire_type, raw, pos
+    if wire_type == _FIXED32:
+        size = 4
+    elif wire_type == _FIXED64:
+        size = 8
+    elif wire_type == _LENGTH_DELIMITED:
+        size, pos = _decode_varint(data, pos)
+    else:
+        raise MessageDecodeError(message, f"wire type {wire_type}")
+    if pos + size > len(data):
+        raise MessageDecodeError(message, "truncated")
+    return number, wire_type, data[pos : pos + size], pos + size
+
+
+def _decode_scalar(kind: str, raw: Any) -> Any:  # noqa: ANN401
+    """Convert a raw field value to a scalar attribute value."""
+    if kind == "string":
+        return raw.decode()
+    if kind == "int":
+        return raw - (1 << 64) if raw >> 63 else raw
+    if kind == "bool":
+        return bool(raw)
+    return struct.unpack("<f", raw)[0]
+
+
+class _Message:
+    """
+    Base for messages described by a ``FIELDS`` table.
+
+    ``FIELDS`` lists ``(number, attribute, kind)`` with kind one of "string",
+    "int", "bool", "float", "strings" or "floats". Scalars at their default
+    value are omitted, as in proto3; a float attribute set to None is absent.
+    """
+
+    FIELDS: ClassVar[tuple[tuple[int, str, str], ...]] = ()
+
+    def SerializeToString(self) -> bytes:  # noqa: N802 - protobuf API
+        """
+        Encode the message.
+
+        Returns:
+            The protobuf wire encoding
+
+        """
+        out = bytearray()
+        for number, name, kind in self.FIELDS:
+            _encode_field(out, number, kind, getattr(self, name))
+        return bytes(out)
+
+    @classmethod
+    def FromString(cls, data: bytes) -> Any:  # noqa: ANN401, N802 - protobuf API
+        """
+        Decode a message, skipping unknown fields.
+
+        Args:
+            data: The protobuf wire encoding
+
+        Returns:
+            The message
+
+        Raises:
+            MessageDecodeError: If the data is truncated or malformed
+
+        """
+        try:
+            return cls(**cls._decode_fields(data))
+        except (IndexError, UnicodeDecodeError, struct.error) as e:
+            raise MessageDecodeError(cls.__name__, str(e) or "truncated") from e
+
+    @classmethod
+    def _decode_fields(cls, data: bytes) -> dict[str, Any]:
+        """Decode the known fields of ``data`` into constructor arguments."""
+        kinds = {number: (name, kind) for number, name, kind in cls.FIELDS}
+        values: dict[str, Any] = {}
+        pos = 0
+        while pos < len(data):
+            number, _, raw, pos = _read_field(cls.__name__, data, pos)
+            if number not in kinds:
+                continue
+            name, kind = kinds[number]
+            if kind == "strings":
+                values.setdefault(name, []).append(raw.decode())
+            elif kind == "floats":  # packed, or one value per field when unpacked
+                values.setdefault(name, array("f")).extend(_unpack_floats(raw))
+            else:
+                values[name] = _decode_scalar(kind, raw)
+        return values
+
+
+@dataclass
+class GenerateRequest(_Message):
+    """A prompt to complete."""
+
+    FIELDS: ClassVar[tuple[tuple[int, str, str], ...]] = (
+        (1, "request_id", "string"),
+        (2, "prompt", "string"),
+        (3, "max_tokens", "int"),
+        (4, "temperature", "float"),
+    )
+
+    request_id: str = ""
+    prompt: str = ""
+    max_tokens: int = 0
+    temperature: float | None = None
+
+
+@dataclass
+class GenerateResponse(_Message):
+    """A completion, or one chunk of a streamed completion."""
+
+    FIELDS: ClassVar[tuple[tuple[int, str, str], ...]] = (
+        (1, "request_id", "string"),
+        (2, "text", "string"),
+        (3, "completion_tokens", "int"),
+        (4, "done", "bool"),
+    )
+
+    request_id: str = ""
+    text: str = ""
+    completion_tokens: int = 0
+    done: bool = False
+
+
+@dataclass
+class EmbedRequest(_Message):
+    """Texts to embed."""
+
+    FIELDS: ClassVar[tuple[tuple[int, str, str], ...]] = (
+        (1, "request_id", "string"),
+        (2, "texts", "strings"),
+    )
+
+    request_id: str = ""
+    texts: list[str] = field(default_factory=list)
+
+
+@dataclass
+class EmbedResponse(_Message):
+    """Embedding vectors, concatenated into one packed float array."""
+
+    FIELDS: ClassVar[tuple[tuple[int, str, str], ...]] = (
+        (1, "request_id", "string"),
+        (2, "dimensions", "int"),
+        (3, "values", "floats"),
+    )
+
+    request_id: str = ""
+    dimensions: int = 0
+    values: array = field(default_factory=lambda: array("f"))
+
+    @classmethod
+    def from_vectors(cls, request_id: str, vectors: list[list[float]]) -> EmbedResponse:
+        """
+        Create a response from a list of vectors.
+
+        Args:
+            request_id: The request identifier
+            vectors: Vectors of equal length
+
+        Returns:
+            The response
+
+        """
+        dimensions = len(vectors[0]) if vectors else 0
+        return cls(request_id, dimensions, array("f", chain.from_iterable(vectors)))
+
+    def vectors(self) -> list[list[float]]:
+        """
+        Split the packed values into vectors.
+
+        Returns:
+            One list of floats per embedded text
+
+        """
+        size = self.dimensions
+        if not size:
+            return []
+        return [
+            self.values[i : i + size].tolist() for i in range(0, len(self.values), size)
+        ]
@@ -1,7 +1,162 @@
-"""server - Module for ai_models/serving/grpc_server.server."""
+"""
+server - Module for ai_models/serving/grpc_server.server.
+
+gRPC server for serving a model to internal clients.
+
+The server runs on ``grpc.aio``. Pass the runtime of a running REST app (see
+``RESTConfig.grpc_port``) to serve both protocols from one process and one event
+loop, so that both feed the same embedding batch scheduler.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import asyncio
+import logging
+from typing import Any
 
 # Third-party imports
+try:
+    import grpc
+except ImportError:
+    grpc = None
 
 # Local imports
+from ai_models.serving.server import ModelRuntime, get_runtime
+
+from .config import GRPCConfig
+from .servicer import ModelServicer, add_model_servicer_to_server
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class GRPCNotAvailableError(ImportError):
+    """Raised when starting the server without grpcio installed."""
+
+    MESSAGE = "grpcio is required to run the gRPC server: uv pip install grpcio"
+
+    def __init__(self) -> None:
+        """Initialize the GRPCNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+def load_runtime(config: GRPCConfig) -> ModelRuntime:
+    """
+    Get this process's runtime for the configured model.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        The runtime, loaded on first use in this process
+
+    """
+    return get_runtime(
+        config.adapter,
+        config.model_id,
+        config.model_host,
+        config.model_port,
+        config.adapter_options,
+        max_batch_size=config.max_batch_size,
+        max_batch_wait=config.max_batch_wait_ms / 1000,
+    )
+
+
+class GRPCServer:
+    """Serve a model over gRPC."""
+
+    def __init__(
+        self,
+        config: GRPCConfig | None = None,
+        runtime: ModelRuntime | None = None,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            config: Server configuration (defaults if None)
+            runtime: Runtime to serve (loaded from ``config`` if None)
+
+        """
+        self.config = config or GRPCConfig()
+        self.runtime = runtime
+        self.port: int | None = None
+        self._server: Any | None = None
+
+    def load_model(self) -> ModelRuntime:
+        """
+        Load the model in this process ahead of the first request.
+
+        Returns:
+            The runtime
+
+        """
+        if self.runtime is None:
+            self.runtime = load_runtime(self.config)
+        return self.runtime
+
+    def _options(self) -> list[tuple[str, int]]:
+        """Return the gRPC channel options for the configuration."""
+        return [
+            ("grpc.max_concurrent_streams", self.config.max_concurrent_streams),
+            ("grpc.max_send_message_length", self.config.max_message_bytes),
+            ("grpc.max_receive_message_length", self.config.max_message_bytes),
+        ]
+
+    async def start(self) -> int:
+        """
+        Start serving on the running event loop.
+
+        Returns:
+            The bound port (useful when ``config.port`` is 0)
+
+        Raises:
+            GRPCNotAvailableError: If grpcio is not installed
+
+        """
+        if grpc is None:
+            raise GRPCNotAvailableError
+        server = grpc.aio.server(
+            options=self._options(),
+            maximum_concurrent_rpcs=self.config.max_concurrent_rpcs,
+        )
+        add_model_servicer_to_server(
+            ModelServicer(self.load_model(), self.config), server
+        )
+        self.port = server.add_insecure_port(f"{self.config.host}:{self.config.port}")
+        await server.start()
+        self._server = server
+        logger.info("gRPC server listening on %s:%d", self.config.host, self.port)
+        return self.port
+
+    async def stop(self, grace: float | None = None) -> None:
+        """
+        Stop serving, letting in-flight calls finish.
+
+        Args:
+            grace: Seconds to wait for in-flight calls (config default if None)
+
+        """
+        if self._server is not None:
+            await self._server.stop(
+                self.config.grace_period if grace is None else grace
+            )
+            self._server = None
+
+    async def wait_for_termination(self) -> None:
+        """Wait until the server stops."""
+        if self._server is not None:
+            await self._server.wait_for_termination()
+
+    def serve(self) -> None:
+        """Run the server until it is stopped (blocking)."""
+
+        async def run() -> None:
+            await self.start()
+            try:
+                await self.wait_for_termination()
+            finally:
+                await self.stop()
+
+        asyncio.run(run())
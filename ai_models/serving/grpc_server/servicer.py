@@ -1,7 +1,392 @@
-"""servicer - Module for ai_models/serving/grpc_server.servicer."""
+"""
+servicer - Module for ai_models/serving/grpc_server.servicer.
+
+Implementation of the ``ai_models.v1.ModelService`` gRPC service.
+
+The servicer wraps the same :class:`~ai_models.serving.server.ModelRuntime` as
+the REST server, so embedding requests from both protocols are merged by one
+batch scheduler. The streaming methods process up to
+``max_inflight_per_stream`` requests of a stream at once; embedding requests
+pipelined on one stream therefore share model batches as well.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import asyncio
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
 
 # Third-party imports
+try:
+    import grpc
+except ImportError:
+    grpc = None
 
 # Local imports
+from ai_models.serving.server import ModelRuntime, OperationNotSupportedError
+
+from .config import GRPCConfig
+from .messages import EmbedRequest, EmbedResponse, GenerateRequest, GenerateResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Iterator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "ai_models.v1.ModelService"
+DEFAULT_MAX_TOKENS = 16
+STREAM_BUFFER_SIZE = 256
+
+_END = object()
+
+
+class ServicerError(RuntimeError):
+    """An error reported to the client with the gRPC status ``CODE``."""
+
+    CODE = "INTERNAL"
+
+    def __init__(self, details: str) -> None:
+        """
+        Initialize the ServicerError.
+
+        Args:
+            details: Message for the client
+
+        """
+        super().__init__(details)
+        self.details = details
+
+    @property
+    def status_code(self) -> Any:  # noqa: ANN401
+        """The ``grpc.StatusCode`` member for ``CODE``."""
+        return getattr(grpc.StatusCode, self.CODE)
+
+
+class InvalidArgumentError(ServicerError):
+    """Raised when a request is malformed or exceeds a limit."""
+
+    CODE = "INVALID_ARGUMENT"
+
+
+class CallDeadlineExceededError(ServicerError):
+    """Raised when a call cannot finish before its deadline."""
+
+    CODE = "DEADLINE_EXCEEDED"
+    MESSAGE = "Deadline exceeded"
+
+    def __init__(self) -> None:
+        """Initialize the CallDeadlineExceededError."""
+        super().__init__(self.MESSAGE)
+
+
+class UnimplementedError(ServicerError):
+    """Raised when the model does not support the called method."""
+
+    CODE = "UNIMPLEMENTED"
+
+
+class ModelServicer:
+    """Serve generation and embedding for one model over gRPC."""
+
+    def __init__(self, runtime: ModelRuntime, config: GRPCConfig | None = None) -> None:
+        """
+        Initialize the servicer.
+
+        Args:
+            runtime: The loaded model
+            config: Server configuration (defaults if None)
+
+        """
+        self.runtime = runtime
+        self.config = config or GRPCConfig()
+
+    def _deadline(self, context: Any) -> float:  # noqa: ANN401
+        """Return the call's deadline in event loop time."""
+        remaining = context.time_remaining()
+        if remaining is None:
+            remaining = self.config.default_deadline
+        return asyncio.get_running_loop().time() + remaining
+
+    @staticmethod
+    def _time_left(deadline: float) -> float:
+        """Return the seconds left before ``deadline``, failing if none."""
+        left = deadline - asyncio.get_running_loop().time()
+        if left <= 0:
+            raise CallDeadlineExceededError
+        return left
+
+    def _generation_params(self, request: GenerateRequest) -> dict[str, Any]:
+        """Validate a generation request and return its parameters."""
+        if not self.runtime.supports_generation:
+            error = OperationNotSupportedError(self.runtime.model_id, "text generation")
+            raise UnimplementedError(str(error))
+        max_tokens = request.max_tokens or DEFAULT_MAX_TOKENS
+        if not 0 < max_tokens <= self.config.max_tokens_limit:
+            error_msg = (
+                f"max_tokens must be between 1 and {self.config.max_tokens_limit}"
+            )
+            raise InvalidArgumentError(error_msg)
+        params: dict[str, Any] = {"max_tokens": max_tokens}
+        if request.temperature is not None:
+            params["temperature"] = request.temperature
+        return params
+
+    async def _generate(
+        self, request: GenerateRequest, deadline: float
+    ) -> GenerateResponse:
+        """Generate a full completion before the deadline."""
+        params = self._generation_params(request)
+        call = partial(self.runtime.generate, request.prompt, **params)
+        try:
+            result = await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(None, call),
+                self._time_left(deadline),
+            )
+        except asyncio.TimeoutError as e:
+            # The model call itself cannot be interrupted and finishes in
+            # its worker thread; only the client stops waiting.
+            raise CallDeadlineExceededError from e
+        return GenerateResponse(
+            request.request_id, result["text"], result["completion_tokens"], done=True
+        )
+
+    async def _stream_tokens(
+        self,
+        request: GenerateRequest,
+        deadline: float,
+        emit: Callable[[GenerateResponse], Awaitable[None]],
+    ) -> None:
+        """Emit one chunk per token, then a final chunk with ``done`` set."""
+        params = self._generation_params(request)
+        loop = asyncio.get_running_loop()
+        tokens: Iterator[str] = self.runtime.stream(request.prompt, **params)
+        count = 0
+        while True:
+            try:
+                token = await asyncio.wait_for(
+                    loop.run_in_executor(None, next, tokens, _END),
+                    self._time_left(deadline),
+                )
+            except asyncio.TimeoutError as e:
+                raise CallDeadlineExceededError from e
+            if token is _END:
+                break
+            count += 1
+            await emit(GenerateResponse(request.request_id, token, count))
+        await emit(GenerateResponse(request.request_id, "", count, done=True))
+
+    async def _embed(self, request: EmbedRequest, deadline: float) -> EmbedResponse:
+        """Embed the request's texts before the deadline."""
+        if len(request.texts) > self.config.max_inputs_per_request:
+            error_msg = (
+                f"At most {self.config.max_inputs_per_request} inputs are allowed"
+            )
+            raise InvalidArgumentError(error_msg)
+        try:
+            vectors = await asyncio.wait_for(
+                self.runtime.embed(request.texts), self._time_left(deadline)
+            )
+        except asyncio.TimeoutError as e:
+            raise CallDeadlineExceededError from e
+        except OperationNotSupportedError as e:
+            raise UnimplementedError(str(e)) from e
+        return EmbedResponse.from_vectors(request.request_id, vectors)
+
+    async def _serve_stream(  # noqa: C901
+        self,
+        request_iterator: AsyncIterator[Any],
+        context: Any,  # noqa: ANN401
+        handle: Callable[
+            [Any, float, Callable[[Any], Awaitable[None]]], Awaitable[None]
+        ],
+    ) -> AsyncIterator[Any]:
+        """
+        Handle the requests of a stream concurrently, yielding their output.
+
+        Each request is passed to ``handle`` with its deadline and an ``emit``
+        coroutine. At most ``max_inflight_per_stream`` requests run at once
+        and output is buffered up to ``STREAM_BUFFER_SIZE`` messages, so a
+        client that reads slowly holds back the work for its stream. The first
+        error ends the stream.
+        """
+        output: asyncio.Queue[Any] = asyncio.Queue(STREAM_BUFFER_SIZE)
+        slots = asyncio.Semaphore(self.config.max_inflight_per_stream)
+        tasks: set[asyncio.Task[None]] = set()
+        loop = asyncio.get_running_loop()
+
+        async def run(request: Any, deadline: float) -> None:  # noqa: ANN401
+            try:
+                await handle(request, deadline, output.put)
+            except Exception as e:  # noqa: BLE001 - delivered to the stream
+                await output.put(e)
+            finally:
+                slots.release()
+
+        async def read() -> None:
+            try:
+                async for request in request_iterator:
+                    deadline = self._deadline(context)
+                    await slots.acquire()
+                    task = loop.create_task(run(request, deadline))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                if tasks:
+                    await asyncio.gather(*tasks)
+                await output.put(_END)
+            except Exception as e:  # noqa: BLE001 - delivered to the stream
+                await output.put(e)
+
+        reader = loop.create_task(read())
+        try:
+            while True:
+                item = await output.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            reader.cancel()
+            for task in list(tasks):
+                task.cancel()
+
+    async def _emit_embedding(
+        self,
+        request: EmbedRequest,
+        deadline: float,
+        emit: Callable[[EmbedResponse], Awaitable[None]],
+    ) -> None:
+        """Stream handler for embedding requests."""
+        await emit(await self._embed(request, deadline))
+
+    async def Generate(  # noqa: N802 - gRPC method name
+        self,
+        request: GenerateRequest,
+        context: Any,  # noqa: ANN401
+    ) -> GenerateResponse | None:
+        """
+        Generate a full completion.
+
+        Args:
+            request: The generation request
+            context: The gRPC servicer context
+
+        Returns:
+            The completion
+
+        """
+        try:
+            return await self._generate(request, self._deadline(context))
+        except ServicerError as e:
+            await context.abort(e.status_code, e.details)
+        return None
+
+    async def GenerateStream(  # noqa: N802 - gRPC method name
+        self,
+        request_iterator: AsyncIterator[GenerateRequest],
+        context: Any,  # noqa: ANN401
+    ) -> AsyncIterator[GenerateResponse]:
+        """
+        Stream tokens for every request on the stream.
+
+        Args:
+            request_iterator: The client's generation requests
+            context: The gRPC servicer context
+
+        Yields:
+            Token chunks tagged with their request_id; the last chunk of
+            each request has ``done`` set
+
+        """
+        try:
+            async for chunk in self._serve_stream(
+                request_iterator, context, self._stream_tokens
+            ):
+                yield chunk
+        except ServicerError as e:
+            await context.abort(e.status_code, e.details)
+
+    async def Embed(  # noqa: N802 - gRPC method name
+        self,
+        request: EmbedRequest,
+        context: Any,  # noqa: ANN401
+    ) -> EmbedResponse | None:
+        """
+        Embed a batch of texts.
+
+        Args:
+            request: The embedding request
+            context: The gRPC servicer context
+
+        Returns:
+            The vectors as one packed float array
+
+        """
+        try:
+            return await self._embed(request, self._deadline(context))
+        except ServicerError as e:
+            await context.abort(e.status_code, e.details)
+        return None
+
+    async def EmbedStream(  # noqa: N802 - gRPC method name
+        self,
+        request_iterator: AsyncIterator[EmbedRequest],
+        context: Any,  # noqa: ANN401
+    ) -> AsyncIterator[EmbedResponse]:
+        """
+        Embed every request on the stream.
+
+        Args:
+            request_iterator: The client's embedding requests
+            context: The gRPC servicer context
+
+        Yields:
+            One response per request, in completion order
+
+        """
+        try:
+            async for response in self._serve_stream(
+                request_iterator, context, self._emit_embedding
+            ):
+                yield response
+        except ServicerError as e:
+            await context.abort(e.status_code, e.details)
+
+
+def add_model_servicer_to_server(servicer: ModelServicer, server: Any) -> None:  # noqa: ANN401
+    """
+    Register the servicer's methods on a ``grpc.aio`` server.
+
+    Args:
+        servicer: The servicer
+        server: The gRPC server
+
+    """
+    handlers = {
+        "Generate": grpc.unary_unary_rpc_method_handler(
+            servicer.Generate,
+            request_deserializer=GenerateRequest.FromString,
+            response_serializer=GenerateResponse.SerializeToString,
+        ),
+        "GenerateStream": grpc.stream_stream_rpc_method_handler(
+            servicer.GenerateStream,
+            request_deserializer=GenerateRequest.FromString,
+            response_serializer=GenerateResponse.SerializeToString,
+        ),
+        "Embed": grpc.unary_unary_rpc_method_handler(
+            servicer.Embed,
+            request_deserializer=EmbedRequest.FromString,
+            response_serializer=EmbedResponse.SerializeToString,
+        ),
+        "EmbedStream": grpc.stream_stream_rpc_method_handler(
+            servicer.EmbedStream,
+            request_deserializer=EmbedRequest.FromString,
+            response_serializer=EmbedResponse.SerializeToString,
+        ),
+    }
+    server.add_generic_rpc_handlers(
+        (grpc.method_handlers_generic_handler(SERVICE_NAME, handlers),)
+    )
@@ -5,3 +5,26 @@
 # Third-party imports
 
 # Local imports
+from .config import RESTConfig
+from .middleware import (
+    AdmissionController,
+    AdmissionControlMiddleware,
+    APIKeyMiddleware,
+)
+from .server import (
+    RESTServer,
+    UvicornNotAvailableError,
+    create_app,
+    create_app_from_env,
+)
+
+__all__ = [
+    "APIKeyMiddleware",
+    "AdmissionControlMiddleware",
+    "AdmissionController",
+    "RESTConfig",
+    "RESTServer",
+    "UvicornNotAvailableError",
+    "create_app",
+    "create_app_from_env",
+]
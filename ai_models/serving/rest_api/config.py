@@ -1,7 +1,72 @@
-"""config - Module for ai_models/serving/rest_api.config."""
+"""
+config - Module for ai_models/serving/rest_api.config.
+
+Configuration for the REST model server.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
 # Third-party imports
 
 # Local imports
+
+
+@dataclass
+class RESTConfig:
+    """Configuration for :class:`~ai_models.serving.rest_api.server.RESTServer`."""
+
+    adapter: str = "fake"
+    model_id: str = "default"
+    model_host: str = "localhost"
+    model_port: int = 0
+    adapter_options: dict[str, Any] = field(default_factory=dict)
+    host: str = "127.0.0.1"
+    port: int = 8000
+    workers: int = 1
+    enable_text_generation: bool = True
+    enable_embedding: bool = True
+    enable_metrics: bool = True
+    enable_auth: bool = False
+    api_keys: list[str] = field(default_factory=list)
+    # Admission control: requests beyond max_concurrent_requests wait in a
+    # queue of max_queue_size; anything beyond that is rejected with 429.
+    max_concurrent_requests: int = 64
+    max_queue_size: int = 256
+    queue_timeout: float = 30.0
+    # Embedding micro-batching
+    max_batch_size: int = 64
+    max_batch_wait_ms: float = 5.0
+    max_inputs_per_request: int = 2048
+    max_tokens_limit: int = 4096
+    # Also serve gRPC on this port from the same process and event loop, so
+    # both protocols share the model and its embedding batches
+    grpc_port: int | None = None
+
+    def to_json(self) -> str:
+        """
+        Serialize the configuration to JSON.
+
+        Returns:
+            The JSON document
+
+        """
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> RESTConfig:
+        """
+        Create a configuration from :meth:`to_json` output.
+
+        Args:
+            data: The JSON document
+
+        Returns:
+            The configuration
+
+        """
+        return cls(**json.loads(data))
@@ -1,7 +1,194 @@
-"""middleware - Module for ai_models/serving/rest_api.middleware."""
+"""
+middleware - Module for ai_models/serving/rest_api.middleware.
+
+ASGI middleware for the REST model server.
+
+Both classes are plain ASGI middleware rather than ``BaseHTTPMiddleware``, so
+streaming responses pass through untouched and the admission slot is held
+until the last byte of a stream has been sent.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import asyncio
+import hmac
+from typing import TYPE_CHECKING, Any
 
 # Third-party imports
+from starlette.responses import JSONResponse
 
 # Local imports
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AdmissionController:
+    """
+    Bound in-flight requests with a fixed-size waiting queue.
+
+    Up to ``max_concurrent`` requests run at once and up to ``max_queue`` more
+    wait for a slot. Further requests, and requests that wait longer than
+    ``queue_timeout``, are refused so callers can back off instead of piling
+    up behind a saturated model.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 64,
+        max_queue: int = 256,
+        queue_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrent: Requests allowed to run at once
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout: Maximum seconds a request waits for a slot
+
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def acquire(self) -> bool:
+        """
+        Wait for a slot.
+
+        Returns:
+            True if admitted; False if the queue is full or the wait timed out
+
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self.active = self.waiting = 0
+        if self.active + self.waiting >= self.max_concurrent + self.max_queue:
+            self.rejected += 1
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        """Release a slot taken by :meth:`acquire`."""
+        self.active -= 1
+        self._semaphore.release()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get admission statistics.
+
+        Returns:
+            Dictionary with active, waiting and rejected counts and limits
+
+        """
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+        }
+
+
+class AdmissionControlMiddleware:
+    """Apply an :class:`AdmissionController` to HTTP requests, answering 429."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        exempt_paths: tuple[str, ...] = ("/health", "/metrics"),
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            controller: The admission controller
+            exempt_paths: Path prefixes that bypass admission control
+
+        """
+        self.app = app
+        self.controller = controller
+        self.exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Admit, queue or reject an HTTP request."""
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        if not await self.controller.acquire():
+            response = JSONResponse(
+                {"detail": "Server is at capacity, retry later"},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+
+class APIKeyMiddleware:
+    """Require an API key in ``Authorization: Bearer`` or ``X-API-Key``."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        api_keys: list[str],
+        exempt_paths: tuple[str, ...] = ("/health",),
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            api_keys: Accepted API keys
+            exempt_paths: Path prefixes that do not require a key
+
+        """
+        self.app = app
+        self.api_keys = [key.encode() for key in api_keys]
+        self.exempt_paths = exempt_paths
+
+    def _authorized(self, scope: Scope) -> bool:
+        """Check the request headers for an accepted key."""
+        headers = dict(scope["headers"])
+        key = headers.get(b"x-api-key", b"")
+        auth = headers.get(b"authorization", b"")
+        if auth.lower().startswith(b"bearer "):
+            key = auth[7:].strip()
+        return any(hmac.compare_digest(key, accepted) for accepted in self.api_keys)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject HTTP requests without a valid key."""
+        if (
+            scope["type"] == "http"
+            and not scope["path"].startswith(self.exempt_paths)
+            and not self._authorized(scope)
+        ):
+            response = JSONResponse(
+                {"detail": "Invalid or missing API key"}, status_code=401
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -5,3 +5,14 @@
 # Third-party imports
 
 # Local imports
+from .embedding import router as embedding_router
+from .health import router as health_router
+from .metrics import router as metrics_router
+from .text_generation import router as text_generation_router
+
+__all__ = [
+    "embedding_router",
+    "health_router",
+    "metrics_router",
+    "text_generation_router",
+]
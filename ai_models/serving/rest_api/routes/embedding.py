@@ -1,7 +1,83 @@
-"""embedding - Module for ai_models/serving/rest_api/routes.embedding."""
+"""
+embedding - Module for ai_models/serving/rest_api/routes.embedding.
+
+Batched embedding endpoint.
+
+``POST /v1/embeddings`` accepts one string or an array of strings, in the
+OpenAI request format. Texts from concurrent requests are merged into shared
+model batches by the runtime's batch scheduler.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import base64
+import struct
+from typing import Any, Literal, Union
 
 # Third-party imports
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import BaseModel, Field
 
 # Local imports
+from ai_models.serving.server import ModelRuntime, OperationNotSupportedError
+
+router = APIRouter(prefix="/v1", tags=["Embeddings"])
+
+
+class EmbeddingRequest(BaseModel):
+    """Request body for ``/v1/embeddings``."""
+
+    input: Union[str, list[str]] = Field(..., description="Text or array of texts")
+    model: str | None = Field(None, description="Model name (informational)")
+    encoding_format: Literal["float", "base64"] = Field(
+        "float", description="'base64' returns little-endian float32 bytes"
+    )
+
+
+def _runtime(request: Request) -> ModelRuntime:
+    """Return the model runtime loaded for this app."""
+    return request.app.state.runtime
+
+
+def _encode(vector: list[float], encoding_format: str) -> Union[list[float], str]:
+    """Encode a vector as a float list or base64 float32 bytes."""
+    if encoding_format == "base64":
+        return base64.b64encode(struct.pack(f"<{len(vector)}f", *vector)).decode()
+    return vector
+
+
+@router.post("/embeddings", summary="Embed one or more texts")
+async def create_embeddings(
+    payload: EmbeddingRequest, request: Request
+) -> dict[str, Any]:
+    """Embed the input texts in as few model calls as possible."""
+    texts = [payload.input] if isinstance(payload.input, str) else payload.input
+    limit = request.app.state.config.max_inputs_per_request
+    if len(texts) > limit:
+        raise HTTPException(
+            status_code=413,  # Starlette renamed this constant; the code is stable
+            detail=f"At most {limit} inputs are allowed per request",
+        )
+    runtime = _runtime(request)
+    try:
+        vectors = await runtime.embed(texts)
+    except OperationNotSupportedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    prompt_tokens = sum(len(text.split()) for text in texts)
+    return {
+        "object": "list",
+        "model": runtime.model_id,
+        "data": [
+            {
+                "object": "embedding",
+                "index": index,
+                "embedding": _encode(vector, payload.encoding_format),
+            }
+            for index, vector in enumerate(vectors)
+        ],
+        "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+    }
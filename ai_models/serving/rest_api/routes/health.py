@@ -1,7 +1,30 @@
-"""health - Module for ai_models/serving/rest_api/routes.health."""
+"""
+health - Module for ai_models/serving/rest_api/routes.health.
+
+Liveness and capacity endpoint.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from typing import Any
 
 # Third-party imports
+from fastapi import APIRouter, Request
 
 # Local imports
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get("/health", summary="Server health and load")
+async def health(request: Request) -> dict[str, Any]:
+    """Report the loaded model, admission load and embedding batching stats."""
+    state = request.app.state
+    runtime = state.runtime
+    return {
+        "status": "ok",
+        "model": runtime.model_id,
+        "admission": state.admission.get_stats() if state.admission else None,
+        "embedding_batches": runtime.embedding_scheduler.get_stats(),
+    }
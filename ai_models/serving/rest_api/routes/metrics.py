@@ -1,7 +1,52 @@
-"""metrics - Module for ai_models/serving/rest_api/routes.metrics."""
+"""
+metrics - Module for ai_models/serving/rest_api/routes.metrics.
+
+Endpoints exposing performance monitor statistics.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+from typing import Annotated, Any, Optional
 
 # Third-party imports
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
 
 # Local imports
+from ai_models.metrics.api import get_metrics, to_prometheus
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+WindowQuery = Annotated[
+    Optional[float],
+    Query(gt=0, description="Rolling window in seconds (defaults to the full window)"),
+]
+
+
+@router.get("", summary="Rolling-window metrics for all models")
+async def list_metrics(window: WindowQuery = None) -> dict[str, Any]:
+    """Return latency percentiles, throughput and error rates per model."""
+    return get_metrics(window_seconds=window)
+
+
+@router.get(
+    "/prometheus",
+    summary="Metrics in Prometheus text format",
+    response_class=PlainTextResponse,
+)
+async def prometheus_metrics(window: WindowQuery = None) -> str:
+    """Return all model metrics in Prometheus text exposition format."""
+    return to_prometheus(get_metrics(window_seconds=window))
+
+
+@router.get("/{model_id}", summary="Rolling-window metrics for one model")
+async def model_metrics(model_id: str, window: WindowQuery = None) -> dict[str, Any]:
+    """Return metrics for one model, or 404 if it has no recorded calls."""
+    metrics = get_metrics(model_id=model_id, window_seconds=window)
+    if model_id not in metrics["models"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No metrics recorded for model '{model_id}'",
+        )
+    return metrics
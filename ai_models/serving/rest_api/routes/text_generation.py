@@ -1,7 +1,129 @@
-"""text_generation - Module for ai_models/serving/rest_api/routes.text_generation."""
+"""
+text_generation - Module for ai_models/serving/rest_api/routes.text_generation.
+
+Text completion endpoint with optional server-sent-event streaming.
+
+``POST /v1/completions`` returns an OpenAI-style completion, or with
+``"stream": true`` a ``text/event-stream`` of ``data: {...}`` chunks, one per
+token, terminated by ``data: [DONE]``.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
 
 # Third-party imports
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Local imports
+from ai_models.serving.server import ModelRuntime, OperationNotSupportedError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+router = APIRouter(prefix="/v1", tags=["Text Generation"])
+
+
+class CompletionRequest(BaseModel):
+    """Request body for ``/v1/completions``."""
+
+    prompt: str = Field(..., description="The prompt")
+    max_tokens: int = Field(16, ge=1, description="Maximum tokens to generate")
+    temperature: float | None = Field(None, ge=0, description="Sampling temperature")
+    stream: bool = Field(False, description="Stream tokens as server-sent events")
+    model: str | None = Field(None, description="Model name (informational)")
+
+
+def _runtime(request: Request) -> ModelRuntime:
+    """Return the model runtime loaded for this app."""
+    return request.app.state.runtime
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize a JSON object, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+async def _sse_events(
+    runtime: ModelRuntime, completion_id: str, prompt: str, params: dict[str, Any]
+) -> AsyncIterator[bytes]:
+    """Yield one SSE event per generated token, then the terminator."""
+    created = int(time.time())
+    async for token in iterate_in_threadpool(runtime.stream(prompt, **params)):
+        chunk = {
+            "id": completion_id,
+            "object": "text_completion",
+            "created": created,
+            "model": runtime.model_id,
+            "choices": [{"index": 0, "text": token, "finish_reason": None}],
+        }
+        yield b"data: " + _dumps(chunk) + b"\n\n"
+    final = {
+        "id": completion_id,
+        "object": "text_completion",
+        "created": created,
+        "model": runtime.model_id,
+        "choices": [{"index": 0, "text": "", "finish_reason": "length"}],
+    }
+    yield b"data: " + _dumps(final) + b"\n\n"
+    yield b"data: [DONE]\n\n"
+
+
+@router.post("/completions", summary="Generate a completion", response_model=None)
+async def create_completion(
+    payload: CompletionRequest, request: Request
+) -> dict[str, Any] | StreamingResponse:
+    """Generate text, optionally streaming tokens as server-sent events."""
+    runtime = _runtime(request)
+    if not runtime.supports_generation:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(OperationNotSupportedError(runtime.model_id, "text generation")),
+        )
+    limit = request.app.state.config.max_tokens_limit
+    if payload.max_tokens > limit:
+        raise HTTPException(
+            status_code=422,  # Starlette renamed this constant; the code is stable
+            detail=f"max_tokens must not exceed {limit}",
+        )
+
+    params: dict[str, Any] = {"max_tokens": payload.max_tokens}
+    if payload.temperature is not None:
+        params["temperature"] = payload.temperature
+    completion_id = f"cmpl-{uuid.uuid4().hex}"
+
+    if payload.stream:
+        return StreamingResponse(
+            _sse_events(runtime, completion_id, payload.prompt, params),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    result = await run_in_threadpool(runtime.generate, payload.prompt, **params)
+    prompt_tokens = len(payload.prompt.split())
+    return {
+        "id": completion_id,
+        "object": "text_completion",
+        "created": int(time.time()),
+        "model": runtime.model_id,
+        "choices": [{"index": 0, "text": result["text"], "finish_reason": "length"}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": result["completion_tokens"],
+            "total_tokens": prompt_tokens + result["completion_tokens"],
+        },
+    }
@@ -1,7 +1,250 @@
-"""server - Module for ai_models/serving/rest_api.server."""
+"""
+server - Module for ai_models/serving/rest_api.server.
+
+FastAPI application and server for serving a model over REST.
+
+Each worker process loads the model once (see
+:func:`ai_models.serving.server.get_runtime`) and shares it between requests.
+Embedding requests are micro-batched across concurrent callers, completions can
+be streamed as server-sent events, and admission control bounds the number of
+in-flight requests so overload turns into fast 429s rather than timeouts.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import contextlib
+import logging
+import os
+from typing import TYPE_CHECKING
 
 # Third-party imports
+from fastapi import FastAPI
 
 # Local imports
+from ai_models.serving.grpc_server import GRPCConfig, GRPCServer
+from ai_models.serving.server import ModelRuntime, get_runtime
+
+from .config import RESTConfig
+from .middleware import (
+    AdmissionController,
+    AdmissionControlMiddleware,
+    APIKeyMiddleware,
+)
+from .routes import (
+    embedding_router,
+    health_router,
+    metrics_router,
+    text_generation_router,
+)
+
+try:
+    import uvicorn
+except ImportError:
+    uvicorn = None
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CONFIG_ENV_VAR = "AI_MODELS_REST_CONFIG"
+
+
+class UvicornNotAvailableError(ImportError):
+    """Raised when starting the server without uvicorn installed."""
+
+    MESSAGE = "uvicorn is required to run the REST server: uv pip install uvicorn"
+
+    def __init__(self) -> None:
+        """Initialize the UvicornNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+def load_runtime(config: RESTConfig) -> ModelRuntime:
+    """
+    Get this process's runtime for the configured model.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        The runtime, loaded on first use in this process
+
+    """
+    return get_runtime(
+        config.adapter,
+        config.model_id,
+        config.model_host,
+        config.model_port,
+        config.adapter_options,
+        max_batch_size=config.max_batch_size,
+        max_batch_wait=config.max_batch_wait_ms / 1000,
+    )
+
+
+def grpc_config(config: RESTConfig) -> GRPCConfig:
+    """
+    Derive the gRPC configuration for a REST server that also serves gRPC.
+
+    Args:
+        config: REST server configuration with ``grpc_port`` set
+
+    Returns:
+        The gRPC configuration
+
+    """
+    return GRPCConfig(
+        adapter=config.adapter,
+        model_id=config.model_id,
+        model_host=config.model_host,
+        model_port=config.model_port,
+        adapter_options=config.adapter_options,
+        host=config.host,
+        port=config.grpc_port,
+        max_batch_size=config.max_batch_size,
+        max_batch_wait_ms=config.max_batch_wait_ms,
+        max_inputs_per_request=config.max_inputs_per_request,
+        max_tokens_limit=config.max_tokens_limit,
+    )
+
+
+def create_app(config: RESTConfig | None = None) -> FastAPI:
+    """
+    Create the FastAPI application.
+
+    Args:
+        config: Server configuration (defaults if None)
+
+    Returns:
+        The application
+
+    """
+    config = config or RESTConfig()
+    runtime = load_runtime(config)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        grpc_server = None
+        if config.grpc_port is not None:
+            grpc_server = GRPCServer(grpc_config(config), runtime=runtime)
+            await grpc_server.start()
+        try:
+            yield
+        finally:
+            if grpc_server is not None:
+                await grpc_server.stop()
+            await runtime.close()
+
+    app = FastAPI(
+        title="AI Models API",
+        description=f"Serving model '{config.model_id}'",
+        lifespan=lifespan,
+    )
+    app.state.config = config
+    app.state.runtime = runtime
+    app.state.admission = AdmissionController(
+        config.max_concurrent_requests, config.max_queue_size, config.queue_timeout
+    )
+
+    app.include_router(health_router)
+    if config.enable_text_generation:
+        app.include_router(text_generation_router)
+    if config.enable_embedding:
+        app.include_router(embedding_router)
+    if config.enable_metrics:
+        app.include_router(metrics_router)
+
+    # Middleware added last runs first: authenticate before taking a slot
+    app.add_middleware(AdmissionControlMiddleware, controller=app.state.admission)
+    if config.enable_auth:
+        app.add_middleware(APIKeyMiddleware, api_keys=config.api_keys)
+    return app
+
+
+def create_app_from_env() -> FastAPI:
+    """
+    Create the application from the ``AI_MODELS_REST_CONFIG`` environment variable.
+
+    This is the factory uvicorn calls in each worker process.
+
+    Returns:
+        The application
+
+    """
+    data = os.environ.get(CONFIG_ENV_VAR)
+    return create_app(RESTConfig.from_json(data) if data else None)
+
+
+class RESTServer:
+    """Serve a model over REST with uvicorn."""
+
+    def __init__(self, config: RESTConfig | None = None) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            config: Server configuration (defaults if None)
+
+        """
+        self.config = config or RESTConfig()
+        self._app: FastAPI | None = None
+        self._server: object | None = None
+
+    @property
+    def app(self) -> FastAPI:
+        """The application, created on first access."""
+        if self._app is None:
+            self._app = create_app(self.config)
+        return self._app
+
+    def load_model(self) -> ModelRuntime:
+        """
+        Load the model in this process ahead of the first request.
+
+        Returns:
+            The runtime
+
+        """
+        return load_runtime(self.config)
+
+    def start(self) -> None:
+        """
+        Run the server until it is stopped.
+
+        With more than one worker, uvicorn starts each worker from
+        :func:`create_app_from_env` so every process loads its own model.
+
+        Raises:
+            UvicornNotAvailableError: If uvicorn is not installed
+
+        """
+        if uvicorn is None:
+            raise UvicornNotAvailableError
+        logger.info(
+            "Starting REST server on %s:%d with %d worker(s)",
+            self.config.host,
+            self.config.port,
+            self.config.workers,
+        )
+        if self.config.workers > 1:
+            os.environ[CONFIG_ENV_VAR] = self.config.to_json()
+            uvicorn.run(
+                f"{__name__}:create_app_from_env",
+                factory=True,
+                host=self.config.host,
+                port=self.config.port,
+                workers=self.config.workers,
+            )
+            return
+        server = uvicorn.Server(
+            uvicorn.Config(self.app, host=self.config.host, port=self.config.port)
+        )
+        self._server = server
+        server.run()
+
+    def stop(self) -> None:
+        """Ask a running single-process server to shut down."""
+        if self._server is not None:
+            self._server.should_exit = True
@@ -1,7 +1,248 @@
-"""server - Module for ai_models/serving.server."""
+"""
+server - Module for ai_models/serving.server.
+
+Protocol-independent model runtime shared by the REST and gRPC servers.
+
+A :class:`ModelRuntime` owns the loaded model (an adapter) together with its
+embedding batch scheduler. :func:`get_runtime` caches runtimes per process, so
+each server worker loads a model once no matter how many apps or protocols
+use it.
+"""
+
+from __future__ import annotations
 
 # Standard library imports
+import json
+import logging
+import os
+import threading
+from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 # Third-party imports
-
 # Local imports
+from ai_models.adapters.adapter_factory import get_adapter
+from ai_models.benchmarking.utils import count_tokens
+from ai_models.performance_monitor import get_performance_monitor
+
+from .batching import BatchScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ServerProtocol(str, Enum):
+    """Protocols a model can be served over."""
+
+    REST = "rest"
+    GRPC = "grpc"
+
+
+class OperationNotSupportedError(RuntimeError):
+    """Raised when the loaded model cannot perform an operation."""
+
+    MESSAGE_TEMPLATE = "Model '{model_id}' does not support {operation}"
+
+    def __init__(self, model_id: str, operation: str) -> None:
+        """
+        Initialize the OperationNotSupportedError.
+
+        Args:
+            model_id: The model identifier
+            operation: The unsupported operation
+
+        """
+        super().__init__(
+            self.MESSAGE_TEMPLATE.format(model_id=model_id, operation=operation)
+        )
+
+
+def extract_text(response: Any) -> str:  # noqa: ANN401
+    """
+    Extract generated text from an adapter response.
+
+    Args:
+        response: A string, or a dict with "text"/"response"/"content" or
+            OpenAI-style "choices"
+
+    Returns:
+        The generated text
+
+    """
+    if isinstance(response, str):
+        return response
+    if isinstance(response, dict):
+        for key in ("text", "response", "content"):
+            if isinstance(response.get(key), str):
+                return response[key]
+        choices = response.get("choices")
+        if choices:
+            first = choices[0]
+            return first.get("text") or first.get("message", {}).get("content", "")
+    return str(response)
+
+
+class ModelRuntime:
+    """A loaded model with batched embedding and monitored generation."""
+
+    def __init__(
+        self,
+        adapter: object,
+        model_id: str,
+        *,
+        max_batch_size: int = 64,
+        max_batch_wait: float = 0.005,
+    ) -> None:
+        """
+        Initialize the runtime.
+
+        Args:
+            adapter: The loaded model adapter
+            model_id: Model identifier reported in responses and metrics
+            max_batch_size: Maximum texts per embedding call
+            max_batch_wait: Maximum seconds to wait for an embedding batch
+
+        """
+        self.model_id = model_id
+        self.adapter = get_performance_monitor().wrap(adapter, model_id)
+        self.embedding_scheduler: BatchScheduler[str, list[float]] = BatchScheduler(
+            self._embed_batch,
+            max_batch_size=max_batch_size,
+            max_wait=max_batch_wait,
+        )
+
+    @property
+    def supports_embedding(self) -> bool:
+        """Whether the model can embed texts."""
+        return callable(getattr(self.adapter.adapter, "embed", None))
+
+    @property
+    def supports_generation(self) -> bool:
+        """Whether the model can generate text."""
+        return callable(getattr(self.adapter.adapter, "generate_text", None))
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts with one model call."""
+        if not self.supports_embedding:
+            raise OperationNotSupportedError(self.model_id, "embedding")
+        return [list(vector) for vector in self.adapter.embed(texts)]
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts, batched with concurrent requests.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per text
+
+        """
+        return await self.embedding_scheduler.submit_many(texts)
+
+    def generate(self, prompt: str, **params: Any) -> dict[str, Any]:  # noqa: ANN401
+        """
+        Generate a completion (blocking).
+
+        Args:
+            prompt: The prompt
+            **params: Generation parameters such as ``max_tokens``
+
+        Returns:
+            Dictionary with "text" and "completion_tokens"
+
+        """
+        if not self.supports_generation:
+            raise OperationNotSupportedError(self.model_id, "text generation")
+        response = self.adapter.generate_text(prompt, **params)
+        return {
+            "text": extract_text(response),
+            "completion_tokens": count_tokens(response),
+        }
+
+    def stream(self, prompt: str, **params: Any) -> Iterator[str]:  # noqa: ANN401
+        """
+        Stream a completion token by token (blocking iterator).
+
+        Uses the adapter's ``stream_text`` when available and otherwise splits
+        a full completion into words.
+
+        Args:
+            prompt: The prompt
+            **params: Generation parameters such as ``max_tokens``
+
+        Yields:
+            Text fragments in order
+
+        """
+        stream_text = getattr(self.adapter.adapter, "stream_text", None)
+        if callable(stream_text):
+            with get_performance_monitor().track(self.model_id) as call:
+                for token in stream_text(prompt, **params):
+                    call.output_tokens += 1
+                    yield token
+            return
+        words = self.generate(prompt, **params)["text"].split(" ")
+        for i, word in enumerate(words):
+            yield word if i == 0 else f" {word}"
+
+    async def close(self) -> None:
+        """Stop the embedding scheduler."""
+        await self.embedding_scheduler.close()
+
+
+_runtimes: dict[tuple[int, str], ModelRuntime] = {}
+_runtimes_lock = threading.Lock()
+
+
+def get_runtime(
+    adapter: str,
+    model_id: str,
+    host: str = "localhost",
+    port: int = 0,
+    adapter_options: dict[str, Any] | None = None,
+    **runtime_options: Any,  # noqa: ANN401
+) -> ModelRuntime:
+    """
+    Get the process-wide runtime for a model, loading it on first use.
+
+    Runtimes are keyed by process id as well as configuration, so a forked
+    worker loads its own copy instead of reusing the parent's.
+
+    Args:
+        adapter: Adapter type for :func:`get_adapter`
+        model_id: Model identifier
+        host: Model server host
+        port: Model server port
+        adapter_options: Extra adapter arguments
+        **runtime_options: :class:`ModelRuntime` options
+
+    Returns:
+        The runtime
+
+    """
+    options = adapter_options or {}
+    key = (
+        os.getpid(),
+        json.dumps(
+            [adapter, model_id, host, port, options, runtime_options],
+            sort_keys=True,
+            default=str,
+        ),
+    )
+    with _runtimes_lock:
+        runtime = _runtimes.get(key)
+        if runtime is None:
+            logger.info(
+                "Loading model %s (%s) in process %d", model_id, adapter, key[0]
+            )
+            runtime = ModelRuntime(
+                get_adapter(adapter, host, port, **options),
+                model_id,
+                **runtime_options,
+            )
+            _runtimes[key] = runtime
+        return runtime
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
-from typing import Annotated
+from collections import Counter
+from typing import Annotated, Any, Literal
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from utils.math_utils import add, average, divide, multiply, subtract
+from utils.math_utils import (
+    ARRAY_KERNELS,
+    add,
+    average,
+    average_arrays,
+    divide,
+    multiply,
+    subtract,
+)
+from utils.streaming_stats import StreamingStats, merge_stats
 
 # --- Logging setup ---
 logger = logging.getLogger("tool_api_audit")
@@ -24,7 +36,11 @@ if not logger.hasHandlers():
 API_KEY = os.getenv("TOOL_API_KEY")
 if not API_KEY:
     # Check if we're in a testing/CI environment where API key might not be set
-    if os.getenv("CI") == "true" or os.getenv("PYTEST_CURRENT_TEST") or os.getenv("TESTING"):
+    if (
+        os.getenv("CI") == "true"
+        or os.getenv("PYTEST_CURRENT_TEST")
+        or os.getenv("TESTING")
+    ):
         API_KEY = "test-api-key-for-ci"
         logger.warning("Using test API key for CI/testing environment")
     else:
@@ -59,6 +75,234 @@ class AverageRequest(BaseModel):
     numbers: list[float] = Field(..., description="List of numbers")
 
 
+# Most operations (column items plus listed operations) accepted in one batch
+MAX_BATCH_SIZE = 100_000
+
+BinaryOp = Literal["add", "subtract", "multiply", "divide"]
+
+# Per-item error messages, matching the single-operation endpoints
+ERROR_MESSAGES = {
+    "divide": "Cannot divide by zero",
+    "average": "Cannot calculate average of empty list",
+}
+
+
+class BatchOperation(BaseModel):
+    """One operation in a batch: a and b for binary operations, numbers for average."""
+
+    op: Literal[BinaryOp, "average"] = Field(..., description="Operation name")
+    a: float | None = Field(None, description="First number")
+    b: float | None = Field(None, description="Second number")
+    numbers: list[float] | None = Field(None, description="List of numbers")
+
+
+class ColumnBatch(BaseModel):
+    """One binary operation applied to columns of operands."""
+
+    op: BinaryOp = Field(..., description="Operation name")
+    a: list[float] = Field(..., description="First numbers")
+    b: list[float] = Field(..., description="Second numbers (same length as a)")
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> ColumnBatch:
+        """Require operand columns of equal length."""
+        if len(self.a) != len(self.b):
+            msg = f"Columns a and b differ in length ({len(self.a)} != {len(self.b)})"
+            raise ValueError(msg)
+        return self
+
+
+class BatchRequest(BaseModel):
+    """Request model for batch evaluation: listed operations and/or columns."""
+
+    operations: list[BatchOperation] = Field(
+        default_factory=list, description="Operations, evaluated in order"
+    )
+    columns: ColumnBatch | None = Field(
+        None, description="Column operands, evaluated after the operations"
+    )
+
+    @model_validator(mode="after")
+    def check_size(self) -> BatchRequest:
+        """Require between one and MAX_BATCH_SIZE items."""
+        size = len(self.operations) + (len(self.columns.a) if self.columns else 0)
+        if not 0 < size <= MAX_BATCH_SIZE:
+            msg = (
+                f"A batch must contain between 1 and {MAX_BATCH_SIZE} items, got {size}"
+            )
+            raise ValueError(msg)
+        return self
+
+
+class BatchItemError(BaseModel):
+    """Why one batch item has no result."""
+
+    index: int
+    error: str
+
+
+class BatchResponse(BaseModel):
+    """Response model for batch evaluation."""
+
+    results: list[float | None] = Field(
+        ..., description="One result per item, null where the item failed"
+    )
+    errors: list[BatchItemError] = Field(..., description="The failed items")
+
+
+def _evaluate_operations(
+    operations: list[BatchOperation], results: np.ndarray, messages: dict[int, str]
+) -> None:
+    """Evaluate listed operations with one kernel call per operation type."""
+    by_op: dict[str, list[int]] = {}
+    for index, operation in enumerate(operations):
+        if operation.op == "average":
+            if operation.numbers is None:
+                messages[index] = "Missing operand 'numbers'"
+                continue
+        elif operation.a is None or operation.b is None:
+            missing = "a" if operation.a is None else "b"
+            messages[index] = f"Missing operand '{missing}'"
+            continue
+        by_op.setdefault(operation.op, []).append(index)
+
+    for op, indices in by_op.items():
+        if op == "average":
+            values = average_arrays([operations[i].numbers for i in indices])
+        else:
+            a = np.fromiter((operations[i].a for i in indices), float, len(indices))
+            b = np.fromiter((operations[i].b for i in indices), float, len(indices))
+            values = ARRAY_KERNELS[op](a, b)
+        results[indices] = values
+        for i in np.flatnonzero(np.isnan(values)):
+            messages.setdefault(
+                indices[i], ERROR_MESSAGES.get(op, "Result is not a number")
+            )
+
+
+def evaluate_batch(payload: BatchRequest) -> tuple[BatchResponse, Counter[str]]:
+    """
+    Evaluate a batch with vectorized kernels.
+
+    Failed items (division by zero, the average of an empty list, a missing
+    operand, a result too large to represent) get a null result and an
+    entry in the errors list; the other items are unaffected.
+
+    Args:
+        payload: The batch
+
+    Returns:
+        The response and the number of items per operation
+
+    """
+    operations = payload.operations
+    columns = payload.columns
+    size = len(operations) + (len(columns.a) if columns else 0)
+    results = np.full(size, np.nan)
+    messages: dict[int, str] = {}
+    counts = Counter(operation.op for operation in operations)
+
+    # Overflow yields inf, reported per item below
+    with np.errstate(over="ignore"):
+        _evaluate_operations(operations, results, messages)
+        if columns is not None:
+            values = ARRAY_KERNELS[columns.op](columns.a, columns.b)
+    if columns is not None:
+        offset = len(operations)
+        results[offset:] = values
+        counts[columns.op] += len(values)
+        for i in np.flatnonzero(np.isnan(values)):
+            messages.setdefault(
+                offset + int(i),
+                ERROR_MESSAGES.get(columns.op, "Result is not a number"),
+            )
+
+    # JSON cannot carry inf: report overflowing results as errors
+    for i in np.flatnonzero(np.isinf(results)):
+        messages.setdefault(int(i), "Result is not finite")
+    failed = sorted(messages)
+    output: list[float | None] = results.tolist()
+    for i in failed:
+        output[i] = None
+    errors = [BatchItemError(index=i, error=messages[i]) for i in failed]
+    return BatchResponse(results=output, errors=errors), counts
+
+
+class StatsMergeRequest(BaseModel):
+    """Request model for merging partial statistics."""
+
+    partials: list[dict[str, Any]] = Field(
+        ..., description="Partial states returned by /tools/stats"
+    )
+
+
+# Longest NDJSON line accepted by the streaming endpoints, in bytes
+MAX_NDJSON_LINE_BYTES = 1024 * 1024
+
+
+def _parse_ndjson_lines(lines: list[bytes]) -> np.ndarray:
+    """Parse NDJSON lines holding numbers or arrays of numbers."""
+    lines = [line for line in (raw.strip() for raw in lines) if line]
+    try:
+        # Fast path: one number per line, converted by NumPy in one step
+        return np.array(lines, dtype=bytes).astype(float)
+    except ValueError:
+        pass
+    values: list[float] = []
+    for line in lines:
+        item = json.loads(line)
+        if isinstance(item, list):
+            values.extend(item)
+        else:
+            values.append(item)
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        msg = "NDJSON lines must hold a number or an array of numbers"
+        raise ValueError(msg)
+    return np.array(values, dtype=float)
+
+
+async def stream_statistics(request: Request) -> StreamingStats:
+    """
+    Summarize a streamed NDJSON body without holding it in memory.
+
+    The body is parsed as it arrives (chunked transfer encoding works), one
+    network chunk at a time, so memory use does not depend on its length.
+    Lines are limited to MAX_NDJSON_LINE_BYTES.
+
+    Args:
+        request: A request whose body has one number, or one JSON array of
+            numbers, per line
+
+    Returns:
+        The statistics of the numbers
+
+    Raises:
+        HTTPException: 400 if a line is not a number or an array of numbers,
+            413 if a line is longer than MAX_NDJSON_LINE_BYTES
+
+    """
+    stats = StreamingStats()
+    remainder = b""
+    try:
+        async for block in request.stream():
+            lines = (remainder + block).split(b"\n")
+            remainder = lines.pop()
+            if len(remainder) > MAX_NDJSON_LINE_BYTES or (
+                lines and max(map(len, lines)) > MAX_NDJSON_LINE_BYTES
+            ):
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"NDJSON lines must not exceed {MAX_NDJSON_LINE_BYTES} bytes",
+                )
+            if lines:
+                stats.update(_parse_ndjson_lines(lines))
+        if remainder.strip():
+            stats.update(_parse_ndjson_lines([remainder]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid NDJSON body: {e}") from e
+    return stats
+
+
 # --- Router ---
 router = APIRouter(
     prefix="/tools", tags=["Tools"], responses={401: {"description": "Unauthorized"}}
@@ -156,3 +400,102 @@ async def average_endpoint(
             "[AUDIT] tool=average, params=%s, api_key=***", payload.model_dump()
         )
         return {"result": result}
+
+
+@router.post(
+    "/batch",
+    summary="Evaluate many operations in one request",
+    response_description="One result per item, with per-item errors",
+)
+async def batch_endpoint(
+    payload: BatchRequest,
+    api_key: Annotated[str, Depends(api_key_auth)],  # noqa: ARG001
+) -> BatchResponse:
+    """
+    Evaluate a batch of operations.
+
+    Send ``operations`` (a list of ``{"op", "a", "b"}`` or ``{"op": "average",
+    "numbers"}`` items) and/or ``columns`` (``{"op", "a": [...], "b": [...]}``).
+    Results come back in the same order, operations first; an item that fails
+    has a null result and an entry in ``errors`` instead of failing the
+    request. One audit record covers the whole batch.
+    """
+    response, counts = evaluate_batch(payload)
+    logger.info(
+        "[AUDIT] tool=batch, items=%d, ops=%s, errors=%d, api_key=***",
+        len(response.results),
+        dict(sorted(counts.items())),
+        len(response.errors),
+    )
+    return response
+
+
+@router.post(
+    "/average/stream",
+    summary="Average a stream of numbers",
+    response_description="Average value",
+)
+async def average_stream_endpoint(
+    request: Request,
+    api_key: Annotated[str, Depends(api_key_auth)],  # noqa: ARG001
+) -> dict[str, float]:
+    """
+    Average numbers sent as an NDJSON body, in constant memory.
+
+    Each line holds a number or a JSON array of numbers; the body may be
+    sent with chunked transfer encoding.
+    """
+    stats = await stream_statistics(request)
+    if stats.count == 0:
+        logger.info(
+            "[AUDIT] tool=average_stream, count=0, api_key=***, error=ValueError"
+        )
+        raise HTTPException(
+            status_code=400, detail="Cannot calculate average of empty list"
+        )
+    logger.info("[AUDIT] tool=average_stream, count=%d, api_key=***", stats.count)
+    return {"result": stats.mean}
+
+
+@router.post(
+    "/stats",
+    summary="Summarize a stream of numbers",
+    response_description="Summary statistics and a mergeable partial state",
+)
+async def stats_endpoint(
+    request: Request,
+    api_key: Annotated[str, Depends(api_key_auth)],  # noqa: ARG001
+) -> dict[str, Any]:
+    """
+    Summarize numbers sent as an NDJSON body, in constant memory.
+
+    Returns count, mean, variance, standard deviation, min, max and
+    approximate quantiles (within 1%), plus a ``partial`` state. Split a
+    large stream across requests and combine their partials with
+    ``/tools/stats/merge``.
+    """
+    stats = await stream_statistics(request)
+    logger.info("[AUDIT] tool=stats, count=%d, api_key=***", stats.count)
+    return {"summary": stats.summary(), "partial": stats.to_dict()}
+
+
+@router.post(
+    "/stats/merge",
+    summary="Merge partial statistics",
+    response_description="Summary statistics and the merged partial state",
+)
+async def stats_merge_endpoint(
+    payload: StatsMergeRequest,
+    api_key: Annotated[str, Depends(api_key_auth)],  # noqa: ARG001
+) -> dict[str, Any]:
+    """Merge partial states returned by ``/tools/stats``."""
+    try:
+        stats = merge_stats(StreamingStats.from_dict(p) for p in payload.partials)
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid partial statistics") from e
+    logger.info(
+        "[AUDIT] tool=stats_merge, partials=%d, count=%d, api_key=***",
+        len(payload.partials),
+        stats.count,
+    )
+    return {"summary": stats.summary(), "partial": stats.to_dict()}
@@ -0,0 +1,320 @@
+"""
+API orchestration for ARTIST experiments.
+
+This module issues the API calls a prompt needs concurrently, behind a shared
+HTTP connection pool, a TTL cache and per-API rate limits.
+
+Calls run on a :class:`~agent_team.tool_execution.ToolExecutor`, so a prompt
+that needs several APIs takes about as long as the slowest call. Responses
+are cached by API and normalized query: a repeated query is answered from the
+cache without a thread or a request, and identical queries in flight at the
+same time share one request.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable
+
+import httpx
+
+from agent_team.tool_execution import ToolCall, ToolExecutor, ToolOutcome
+from ai_models.caching.cache_backends.base import (
+    CacheEncodingError,
+    decode_value,
+    encode_value,
+)
+from ai_models.caching.cache_backends.memory_cache import MemoryCache
+from ai_models.caching.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Seconds a cached API response stays valid
+DEFAULT_CACHE_TTL = 300.0
+
+# Responses kept in the cache
+DEFAULT_CACHE_ENTRIES = 1024
+
+# Limits of the shared HTTP connection pool
+DEFAULT_HTTP_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+
+_SHARED_CLIENT: httpx.Client | None = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def get_shared_client() -> httpx.Client:
+    """
+    Return the HTTP client shared by all API tools.
+
+    The client is created on first use. Sharing it lets concurrent calls
+    reuse pooled keep-alive connections instead of opening new ones.
+
+    Returns:
+        httpx.Client: The shared client.
+
+    """
+    global _SHARED_CLIENT  # noqa: PLW0603
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+            _SHARED_CLIENT = httpx.Client(
+                timeout=DEFAULT_HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=DEFAULT_MAX_CONNECTIONS,
+                    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return _SHARED_CLIENT
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for use in a cache key.
+
+    Args:
+        query (str): The query.
+
+    Returns:
+        str: The query, case-folded and with whitespace collapsed.
+
+    """
+    return " ".join(query.casefold().split())
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter, safe to share between threads.
+
+    Usage:
+        limiter = RateLimiter(rate=5, burst=2)
+        limiter.acquire()  # blocks until a call is allowed
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate (float): Calls allowed per second.
+            burst (int, optional): Calls allowed at once after a quiet period.
+                Defaults to 1.
+
+        """
+        if rate <= 0 or burst < 1:
+            error_msg = (
+                f"rate must be positive and burst at least 1, got {rate}/{burst}"
+            )
+            raise ValueError(error_msg)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # The token may be borrowed from the future; later callers then
+            # queue up behind this one.
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Wait until a call is allowed.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class APIOrchestrator:
+    """
+    Run API calls concurrently with caching and rate limiting.
+
+    Usage:
+        orchestrator = APIOrchestrator({"search": search}, rate_limits={"search": 5})
+        outcomes = orchestrator.run([("search", "laptops"), ("search", "phones")])
+
+    """
+
+    def __init__(
+        self,
+        apis: Mapping[str, Callable[[str], Any]],
+        *,
+        rate_limits: Mapping[str, RateLimiter | float] | None = None,
+        cache: MemoryCache | None = None,
+        cache_ttl: float | None = DEFAULT_CACHE_TTL,
+        max_workers: int | None = None,
+        timeout: float | None = DEFAULT_HTTP_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the orchestrator.
+
+        Args:
+            apis (Mapping[str, Callable[[str], Any]]): API functions by name.
+            rate_limits (Optional[Mapping[str, RateLimiter | float]], optional):
+                Limiter, or calls per second, by API name. APIs without one
+                are not limited. Defaults to None.
+            cache (Optional[MemoryCache], optional): Response cache. Defaults to
+                a new in-memory cache.
+            cache_ttl (Optional[float], optional): Seconds responses stay
+                cached; None keeps them until evicted. Defaults to
+                DEFAULT_CACHE_TTL.
+            max_workers (Optional[int], optional): Maximum concurrent calls.
+                Defaults to one per call, up to the executor's limit.
+            timeout (Optional[float], optional): Seconds a call may take.
+                Defaults to DEFAULT_HTTP_TIMEOUT.
+
+        """
+        self.apis = dict(apis)
+        self.limiters = {
+            name: limit if isinstance(limit, RateLimiter) else RateLimiter(limit)
+            for name, limit in (rate_limits or {}).items()
+        }
+        self.cache = cache if cache is not None else MemoryCache(DEFAULT_CACHE_ENTRIES)
+        self.cache_ttl = cache_ttl
+        self.executor = ToolExecutor(max_workers=max_workers, default_timeout=timeout)
+        self.api_calls: Counter[str] = Counter()
+        self._calls_lock = threading.Lock()
+        self._flight: SingleFlight[Any] = SingleFlight()
+
+    @staticmethod
+    def cache_key(api: str, query: str) -> str:
+        """Return the cache key of a call."""
+        return f"{api}:{normalize_query(query)}"
+
+    def cached(self, api: str, query: str) -> tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            api (str): The API name.
+            query (str): The query.
+
+        Returns:
+            tuple[bool, Any]: Whether the response was cached, and the response.
+
+        """
+        entry = self.cache.get_entry(self.cache_key(api, query))
+        if entry is None:
+            return False, None
+        return True, decode_value(entry[0])
+
+    def fetch(self, api: str, query: str) -> Any:  # noqa: ANN401
+        """
+        Call an API, or answer from the cache.
+
+        Args:
+            api (str): The API name.
+            query (str): The query passed to the API.
+
+        Returns:
+            Any: The API response.
+
+        """
+        hit, response = self.cached(api, query)
+        if hit:
+            return response
+        return self._fetch_uncached(api, query)
+
+    def fetcher(self, api: str) -> Callable[[str], Any]:
+        """
+        Return a cached, rate-limited function calling one API.
+
+        Args:
+            api (str): The API name.
+
+        Returns:
+            Callable[[str], Any]: Function taking the query.
+
+        """
+        func = self.apis[api]
+
+        def fetch(query: str) -> Any:  # noqa: ANN401
+            return self.fetch(api, query)
+
+        fetch.__name__ = getattr(func, "__name__", api)
+        fetch.__doc__ = func.__doc__
+        return fetch
+
+    def _fetch_uncached(self, api: str, query: str) -> Any:  # noqa: ANN401
+        """Call an API after a cache miss, sharing identical calls in flight."""
+        key = self.cache_key(api, query)
+        return self._flight.do(key, lambda: self._call(api, query, key))
+
+    def _call(self, api: str, query: str, key: str) -> Any:  # noqa: ANN401
+        """Call an API within its rate limit and cache the response."""
+        limiter = self.limiters.get(api)
+        if limiter is not None:
+            limiter.acquire()
+        with self._calls_lock:
+            self.api_calls[api] += 1
+        response = self.apis[api](query)
+        try:
+            encoded = encode_value(response)
+        except CacheEncodingError:
+            logger.debug("Response of %s is not cacheable", api)
+            return response
+        expires_at = None if self.cache_ttl is None else time.time() + self.cache_ttl
+        self.cache.set(key, encoded, expires_at)
+        return response
+
+    def run(self, calls: Sequence[tuple[str, str]]) -> list[ToolOutcome]:
+        """
+        Run API calls concurrently.
+
+        Cached responses are returned without scheduling a call.
+
+        Args:
+            calls (Sequence[tuple[str, str]]): (API name, query) pairs.
+
+        Returns:
+            list[ToolOutcome]: One outcome per call, in order.
+
+        """
+        outcomes: dict[int, ToolOutcome] = {}
+        pending = []
+        for index, (api, query) in enumerate(calls):
+            hit, response = self.cached(api, query)
+            if hit:
+                outcomes[index] = ToolOutcome(index, api, result=response)
+            else:
+                pending.append(
+                    ToolCall(
+                        index, api, query, functools.partial(self._fetch_uncached, api)
+                    )
+                )
+        for outcome in self.executor.run(pending):
+            outcomes[outcome.index] = outcome
+        return [outcomes[index] for index in range(len(calls))]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache statistics and the number of calls made per API."""
+        with self._calls_lock:
+            api_calls = dict(self.api_calls)
+        return {
+            "cache": self.cache.stats.to_dict(),
+            "api_calls": api_calls,
+            "coalesced": self._flight.coalesced,
+        }
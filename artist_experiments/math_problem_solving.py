@@ -12,7 +12,7 @@ import re
 import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr
 
-from ai_models.artist_agent import ArtistAgent
+from ai_models.artist_agent import ArtistAgent, ToolRoute
 from common_utils import tooling
 
 # Configure logging
@@ -119,6 +119,15 @@ class MathTool:
 class EnhancedArtistAgent(ArtistAgent):
     """Enhanced ARTIST agent for mathematical problem-solving."""
 
+    dispatch_table = (
+        ToolRoute("solve_equation", ("solve", "equation", "=", "find", "value")),
+        ToolRoute("factor_expression", ("factor", "factorize", "factorization")),
+        ToolRoute("expand_expression", ("expand", "distribute", "multiply out")),
+        ToolRoute(
+            "calculator", ("calculate", "compute", "evaluate", "+", "-", "*", "/")
+        ),
+    )
+
     def __init__(self) -> None:
         """Initialize the enhanced ARTIST agent."""
         super().__init__()
@@ -132,36 +141,6 @@ class EnhancedArtistAgent(ArtistAgent):
         # Update tools dictionary
         self.tools = tooling.list_tools()
 
-    def decide_tool(self, prompt: str) -> str:
-        """
-        Select appropriate tool based on prompt keywords.
-
-        Args:
-            prompt (str): The user's input or problem description.
-
-        Returns:
-            str: Name of the tool to use.
-
-        """
-        prompt_lower = prompt.lower()
-
-        if any(k in prompt_lower for k in ["solve", "equation", "=", "find", "value"]):
-            return "solve_equation"
-
-        if any(k in prompt_lower for k in ["factor", "factorize", "factorization"]):
-            return "factor_expression"
-
-        if any(k in prompt_lower for k in ["expand", "distribute", "multiply out"]):
-            return "expand_expression"
-
-        if any(
-            k in prompt_lower
-            for k in ["calculate", "compute", "evaluate", "+", "-", "*", "/"]
-        ):
-            return "calculator"
-
-        return ""
-
 
 def run_experiment(prompt: str) -> str:
     """
@@ -8,13 +8,20 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Optional
-
-import httpx
-
-from ai_models.artist_agent import ArtistAgent
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ai_models.artist_agent import ArtistAgent, ToolRoute
+from artist_experiments.api_orchestration import (
+    DEFAULT_CACHE_TTL,
+    APIOrchestrator,
+    RateLimiter,
+    get_shared_client,
+)
 from common_utils import tooling
 
+if TYPE_CHECKING:
+    import httpx
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,16 +33,38 @@ logger = logging.getLogger(__name__)
 class APITool:
     """API tool for ARTIST experiments."""
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    # API name -> (calls per second, burst) allowed by the provider
+    rate_limits: ClassVar[dict[str, tuple[float, int]]] = {
+        "search_products": (10.0, 5),
+        "get_market_trends": (5.0, 2),
+        "analyze_competitors": (5.0, 2),
+    }
+
+    def __init__(
+        self, api_key: str | None = None, client: httpx.Client | None = None
+    ) -> None:
         """
         Initialize the API tool.
 
         Args:
             api_key (Optional[str], optional): API key for authentication. Defaults to None.
+            client (Optional[httpx.Client], optional): HTTP client. Defaults to the
+                client shared by all API tools.
 
         """
         self.api_key = api_key
-        self.client = httpx.Client(timeout=30.0)
+        self.client = client if client is not None else get_shared_client()
+
+    def apis(self) -> dict[str, Any]:
+        """Return the API methods by tool name."""
+        return {name: getattr(self, name) for name in self.rate_limits}
+
+    def rate_limiters(self) -> dict[str, RateLimiter]:
+        """Return a fresh rate limiter for each API."""
+        return {
+            name: RateLimiter(rate, burst)
+            for name, (rate, burst) in self.rate_limits.items()
+        }
 
     def search_products(self, query: str, limit: int = 5) -> str:
         """
@@ -141,53 +170,105 @@ class APITool:
 class MultiAPIAgent(ArtistAgent):
     """Enhanced ARTIST agent for multi-API orchestration."""
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    dispatch_table = (
+        ToolRoute("search_products", ("product", "search", "find products")),
+        ToolRoute("get_market_trends", ("market", "trend", "industry")),
+        ToolRoute("analyze_competitors", ("competitor", "competition", "rival")),
+    )
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        cache_ttl: float | None = DEFAULT_CACHE_TTL,
+        max_workers: int | None = None,
+    ) -> None:
         """
         Initialize the multi-API agent.
 
         Args:
             api_key (Optional[str], optional): API key for authentication. Defaults to None.
+            cache_ttl (Optional[float], optional): Seconds API responses stay
+                cached. Defaults to DEFAULT_CACHE_TTL.
+            max_workers (Optional[int], optional): Maximum concurrent API calls.
+                Defaults to one per call.
 
         """
         super().__init__()
 
         # Create API tool
         api_tool = APITool(api_key)
+        self.orchestrator = APIOrchestrator(
+            api_tool.apis(),
+            rate_limits=api_tool.rate_limiters(),
+            cache_ttl=cache_ttl,
+            max_workers=max_workers,
+        )
 
-        # Register API tools
-        tooling.register_tool("search_products", api_tool.search_products)
-        tooling.register_tool("get_market_trends", api_tool.get_market_trends)
-        tooling.register_tool("analyze_competitors", api_tool.analyze_competitors)
+        # Register API tools (cached and rate limited)
+        for name in api_tool.rate_limits:
+            tooling.register_tool(name, self.orchestrator.fetcher(name))
 
         # Update tools dictionary
         self.tools = tooling.list_tools()
 
-    def decide_tool(self, prompt: str) -> str:
+    def plan(self, prompt: str) -> list[tuple[str, str]]:
         """
-        Select appropriate tool based on prompt keywords.
+        Plan the API calls a prompt needs.
 
         Args:
-            prompt (str): The user's input or problem description.
+            prompt (str): The user's request.
 
         Returns:
-            str: Name of the tool to use.
+            list[tuple[str, str]]: (API name, query) for every route whose
+            keywords appear in the prompt, in dispatch order.
 
         """
-        prompt_lower = prompt.lower()
-
-        if any(k in prompt_lower for k in ["product", "search", "find products"]):
-            return "search_products"
+        return [
+            (tool_name, self.extract_relevant_expression(prompt, tool_name))
+            for tool_name, pattern in self.compiled_dispatch()
+            if tool_name in self.orchestrator.apis and pattern.search(prompt)
+        ]
 
-        if any(k in prompt_lower for k in ["market", "trend", "industry"]):
-            return "get_market_trends"
+    def run(self, prompt: str) -> str:
+        """
+        Process a prompt, calling every API it needs concurrently.
 
-        if any(k in prompt_lower for k in ["competitor", "competition", "rival"]):
-            return "analyze_competitors"
+        Prompts that need a single API are handled like any ARTIST prompt.
 
-        return ""
+        Args:
+            prompt (str): The user's request.
 
+        Returns:
+            str: The API output, or for several APIs a JSON object of their
+            outputs by API name.
 
-def run_experiment(prompt: str, api_key: Optional[str] = None) -> str:
+        """
+        calls = self.plan(prompt)
+        if len(calls) < 2:  # noqa: PLR2004
+            return super().run(prompt)
+        combined: dict[str, Any] = {}
+        for outcome in self.orchestrator.run(calls):
+            if outcome.ok:
+                combined[outcome.tool_name] = _parse_response(outcome.result)
+            elif outcome.timed_out:
+                combined[outcome.tool_name] = {"error": "timed out"}
+            else:
+                combined[outcome.tool_name] = {"error": str(outcome.error)}
+        return json.dumps(combined)
+
+
+def _parse_response(response: Any) -> Any:  # noqa: ANN401
+    """Decode a JSON response, leaving other responses unchanged."""
+    if isinstance(response, str):
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            pass
+    return response
+
+
+def run_experiment(prompt: str, api_key: str | None = None) -> str:
     """
     Run the multi-API orchestration experiment.
 
@@ -0,0 +1,278 @@
+"""
+expressions - Module for common_utils.expressions.
+
+Safe arithmetic expressions, validated and compiled once.
+
+:func:`compile_expression` parses an expression, checks that its syntax tree
+holds only numbers, declared variables and the arithmetic operators
+``+ - * / % **``, and compiles it to bytecode. Compiled expressions are kept
+in an LRU cache, so evaluating the same expression again costs one bytecode
+run instead of a parse and a tree walk.
+
+A compiled expression evaluates scalars with :meth:`CompiledExpression.evaluate`
+or whole arrays of variable bindings at once with
+:meth:`CompiledExpression.evaluate_batch` (requires NumPy), which runs every
+operator once per batch rather than once per binding.
+
+Exponents are limited to :data:`MAX_EXPONENT_VALUE` in absolute value, so an
+expression cannot build an astronomically large integer.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import ast
+import functools
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+# Third-party imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local imports
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Largest exponent allowed in "**"
+MAX_EXPONENT_VALUE = 100
+
+# Number of compiled expressions kept by compile_expression
+EXPRESSION_CACHE_SIZE = 1024
+
+_BINARY_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.Pow)
+_UNARY_OPERATORS = (ast.UAdd, ast.USub)
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is invalid or cannot be evaluated."""
+
+
+class NumPyNotAvailableError(ImportError):
+    """Raised when evaluating a batch without NumPy installed."""
+
+    MESSAGE = "numpy is required for batch evaluation: uv pip install numpy"
+
+    def __init__(self) -> None:
+        """Initialize the NumPyNotAvailableError."""
+        super().__init__(self.MESSAGE)
+
+
+def _pow(base: Any, exponent: Any) -> Any:  # noqa: ANN401
+    """Raise to a power, refusing exponents above MAX_EXPONENT_VALUE."""
+    if np is not None and isinstance(exponent, np.ndarray):
+        too_large = bool(np.any(np.abs(exponent) > MAX_EXPONENT_VALUE))
+    else:
+        too_large = abs(exponent) > MAX_EXPONENT_VALUE
+    if too_large:
+        error_msg = f"Exponentiation with values > {MAX_EXPONENT_VALUE} not allowed"
+        raise ExpressionError(error_msg)
+    return base**exponent
+
+
+# Globals for compiled expressions: no builtins, only the guarded power
+_EVAL_GLOBALS: dict[str, Any] = {"__builtins__": {}, "_pow": _pow}
+
+
+class _Validator(ast.NodeTransformer):
+    """Check an expression tree and route "**" through the exponent guard."""
+
+    def __init__(self, variables: frozenset[str] | None) -> None:
+        """Initialize with the allowed variable names (None for any)."""
+        self.allowed = variables
+        self.names: list[str] = []
+
+    def visit_Expression(self, node: ast.Expression) -> ast.AST:
+        """Visit the expression body."""
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        """Allow arithmetic operators, replacing "**" with the guarded power."""
+        if not isinstance(node.op, _BINARY_OPERATORS):
+            error_msg = f"Unsupported operator: {type(node.op).__name__}"
+            raise ExpressionError(error_msg)
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        if isinstance(node.op, ast.Pow):
+            call = ast.Call(
+                func=ast.Name(id="_pow", ctx=ast.Load()),
+                args=[node.left, node.right],
+                keywords=[],
+            )
+            return ast.copy_location(call, node)
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        """Allow unary plus and minus."""
+        if not isinstance(node.op, _UNARY_OPERATORS):
+            error_msg = f"Unsupported unary operator: {type(node.op).__name__}"
+            raise ExpressionError(error_msg)
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        """Allow int and float constants."""
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            error_msg = f"Unsupported constant: {value!r}"
+            raise ExpressionError(error_msg)
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        """Allow variables, recording them in order of appearance."""
+        name = node.id
+        if name.startswith("_") or (
+            self.allowed is not None and name not in self.allowed
+        ):
+            error_msg = f"Unknown variable: {name}"
+            raise ExpressionError(error_msg)
+        if name not in self.names:
+            self.names.append(name)
+        return node
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        """Reject every other node."""
+        error_msg = f"Unsupported node type: {type(node).__name__}"
+        raise ExpressionError(error_msg)
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """
+    A validated expression compiled to bytecode.
+
+    Attributes:
+        expression: The source expression
+        variables: The variables the expression uses, in order of appearance
+        code: The compiled bytecode
+
+    """
+
+    expression: str
+    variables: tuple[str, ...]
+    code: Any
+
+    def _bind(self, bindings: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Check that every variable has a value."""
+        missing = [name for name in self.variables if name not in bindings]
+        if missing:
+            error_msg = f"Missing values for variables: {', '.join(missing)}"
+            raise ExpressionError(error_msg)
+        return bindings
+
+    def evaluate(self, bindings: Mapping[str, Any] | None = None) -> Any:  # noqa: ANN401
+        """
+        Evaluate the expression for one set of variable values.
+
+        Args:
+            bindings: Values of the variables
+
+        Returns:
+            The result
+
+        Raises:
+            ExpressionError: If a variable has no value or an exponent is too
+                large
+            ZeroDivisionError: If the expression divides by zero
+
+        """
+        if not self.variables:
+            return eval(self.code, _EVAL_GLOBALS)  # noqa: S307 - validated tree
+        return eval(self.code, _EVAL_GLOBALS, self._bind(bindings or {}))  # noqa: S307
+
+    def evaluate_batch(
+        self,
+        bindings: Mapping[str, Sequence[float] | Any],
+        dtype: Any = float,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """
+        Evaluate the expression over arrays of variable values.
+
+        Arrays are broadcast against each other, so scalars and arrays can be
+        mixed. Division by zero yields inf or nan instead of raising.
+
+        Args:
+            bindings: Values of the variables (arrays or scalars)
+            dtype: NumPy dtype the values are converted to
+
+        Returns:
+            A NumPy array of results
+
+        Raises:
+            NumPyNotAvailableError: If NumPy is not installed
+            ExpressionError: If a variable has no value or an exponent is too
+                large
+
+        """
+        if np is None:
+            raise NumPyNotAvailableError
+        arrays = {
+            name: np.asarray(value, dtype=dtype)
+            for name, value in self._bind(bindings).items()
+            if name in self.variables
+        }
+        shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            result = eval(self.code, _EVAL_GLOBALS, arrays)  # noqa: S307
+        return np.broadcast_to(np.asarray(result, dtype=dtype), shape).copy()
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(
+    expression: str, variables: Iterable[str] | None = None
+) -> CompiledExpression:
+    """
+    Validate and compile an arithmetic expression.
+
+    Results are cached by expression and variables (which must then be
+    hashable, e.g. a tuple), so repeated expressions are parsed once.
+
+    Args:
+        expression: The expression, e.g. "(a + b) * 2"
+        variables: The variable names allowed (None allows any name not
+            starting with an underscore; empty allows none)
+
+    Returns:
+        The compiled expression
+
+    Raises:
+        ExpressionError: If the expression is malformed or uses anything
+            besides numbers, allowed variables and arithmetic operators
+
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(str(e)) from e
+    validator = _Validator(None if variables is None else frozenset(variables))
+    tree = ast.fix_missing_locations(validator.visit(tree))
+    code = compile(tree, "<expression>", "eval")
+    return CompiledExpression(expression, tuple(validator.names), code)
+
+
+def evaluate_batch(
+    expression: str,
+    bindings: Mapping[str, Sequence[float] | Any],
+    dtype: Any = float,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """
+    Evaluate one expression over arrays of variable values.
+
+    Args:
+        expression: The expression, e.g. "price * (1 - discount)"
+        bindings: Values of the variables (arrays or scalars)
+        dtype: NumPy dtype the values are converted to
+
+    Returns:
+        A NumPy array of results
+
+    """
+    return compile_expression(expression).evaluate_batch(bindings, dtype)
@@ -0,0 +1,380 @@
+"""
+memory_buffer - Module for common_utils.memory_buffer.
+
+Write-behind buffering of memory writes (``Memory.add``) for agents.
+
+:class:`WriteBehindMemory` queues writes per user and persists them on a
+background worker, so handling a message no longer waits for the memory
+store. A user's writes are flushed together once ``batch_size`` of them are
+waiting, once the oldest has waited ``flush_interval`` seconds, on
+:meth:`~WriteBehindMemory.flush`, or when the buffer is closed (buffers still
+open at interpreter exit are closed then). A single worker persists them, so
+each user's writes reach the store in the order they were made; it runs only
+while writes are waiting.
+
+Writes that are queued or being persisted can be searched with
+:meth:`~WriteBehindMemory.search_pending`, so an agent sees its own writes
+before the store does.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Union
+
+# Third-party imports
+# Local imports
+from common_utils.text_analysis import tokenize
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Writes waiting for one user that trigger a flush
+DEFAULT_BATCH_SIZE = 16
+
+# Seconds the oldest waiting write may wait before it is flushed
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+MemoryContent = Union[str, list[dict[str, str]]]
+
+# Buffers to flush at interpreter exit
+_OPEN_BUFFERS: weakref.WeakSet[WriteBehindMemory] = weakref.WeakSet()
+
+
+@dataclass(frozen=True)
+class PendingWrite:
+    """
+    A memory write that has not reached the store yet.
+
+    Attributes:
+        seq: Position of the write among all writes to the buffer
+        user_id: The user the memory belongs to
+        content: The content passed to ``Memory.add``
+        metadata: The metadata passed to ``Memory.add``
+        enqueued: ``time.monotonic()`` when the write was made
+
+    """
+
+    seq: int
+    user_id: str
+    content: MemoryContent
+    metadata: dict[str, Any] = field(default_factory=dict)
+    enqueued: float = 0.0
+
+    @property
+    def text(self) -> str:
+        """The content as plain text."""
+        if isinstance(self.content, str):
+            return self.content
+        return "\n".join(
+            f"{message.get('role', '')}: {message.get('content', '')}"
+            for message in self.content
+        )
+
+
+class WriteBehindMemory:
+    """
+    Batch ``add`` calls to a memory store on a background worker.
+
+    Usage:
+        writer = WriteBehindMemory(Memory())
+        writer.add("User prefers email", user_id="user123")
+        writer.search_pending("email", user_id="user123")
+        writer.close()
+
+    """
+
+    def __init__(
+        self,
+        memory: Any,  # noqa: ANN401
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            memory: The store; anything with mem0's
+                ``add(content, user_id=..., metadata=...)``
+            batch_size: Writes waiting for one user that trigger a flush
+            flush_interval: Seconds a write may wait before it is flushed
+
+        """
+        if batch_size < 1 or flush_interval <= 0:
+            error_msg = (
+                "batch_size must be at least 1 and flush_interval positive, "
+                f"got {batch_size} and {flush_interval}"
+            )
+            raise ValueError(error_msg)
+        self.memory = memory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.persisted = 0
+        self.failed = 0
+        self.batches = 0
+        self._queues: dict[str, deque[PendingWrite]] = {}
+        self._in_flight: dict[str, list[PendingWrite]] = {}
+        self._seq = 0
+        self._flush_through = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        _OPEN_BUFFERS.add(self)
+
+    def add(
+        self,
+        content: MemoryContent,
+        *,
+        user_id: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Queue a memory write.
+
+        Args:
+            content: The content to store (string or conversation messages)
+            user_id: The user the memory belongs to
+            metadata: Optional metadata for the memory
+
+        Raises:
+            RuntimeError: If the buffer is closed
+
+        """
+        with self._condition:
+            if self._closed:
+                error_msg = "Cannot add to a closed memory buffer"
+                raise RuntimeError(error_msg)
+            self._seq += 1
+            queue = self._queues.setdefault(user_id, deque())
+            queue.append(
+                PendingWrite(
+                    self._seq, user_id, content, metadata or {}, time.monotonic()
+                )
+            )
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="memory-write-behind", daemon=True
+                )
+                self._worker.start()
+            elif len(queue) == 1 or len(queue) >= self.batch_size:
+                self._condition.notify_all()
+
+    def pending(self, user_id: str | None = None) -> list[PendingWrite]:
+        """
+        Return the writes not yet persisted, oldest first.
+
+        Args:
+            user_id: Only return this user's writes (default: all users)
+
+        Returns:
+            The queued and in-flight writes
+
+        """
+        with self._condition:
+            users = (
+                set(self._queues) | set(self._in_flight)
+                if user_id is None
+                else {user_id}
+            )
+            writes = [
+                write
+                for user in users
+                for write in (
+                    *self._in_flight.get(user, ()),
+                    *self._queues.get(user, ()),
+                )
+            ]
+        return sorted(writes, key=lambda write: write.seq)
+
+    def search_pending(
+        self, query: str, user_id: str, limit: int = 5
+    ) -> list[dict[str, Any]]:
+        """
+        Find a user's unpersisted writes that share words with a query.
+
+        Args:
+            query: The search query
+            user_id: The user whose writes to search
+            limit: Maximum number of results
+
+        Returns:
+            mem0-style results (``memory``, ``metadata``, ``score``) with
+            ``pending`` set, best match first and newest first on ties
+
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        scored = []
+        for write in self.pending(user_id):
+            text = write.text
+            overlap = len(terms.intersection(tokenize(text)))
+            if overlap:
+                scored.append((overlap, write.seq, text, write.metadata))
+        scored.sort(reverse=True)
+        return [
+            {
+                "memory": text,
+                "metadata": metadata,
+                "score": overlap / len(terms),
+                "pending": True,
+            }
+            for overlap, _, text, metadata in scored[:limit]
+        ]
+
+    def queue_depth(self) -> dict[str, int]:
+        """Return the number of unpersisted writes per user."""
+        with self._condition:
+            users = set(self._queues) | set(self._in_flight)
+            depth = {
+                user: len(self._queues.get(user, ()))
+                + len(self._in_flight.get(user, ()))
+                for user in users
+            }
+        return {user: count for user, count in depth.items() if count}
+
+    @property
+    def depth(self) -> int:
+        """Total number of unpersisted writes."""
+        return sum(self.queue_depth().values())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depths and persisted, failed and batch counts."""
+        depth = self.queue_depth()
+        return {
+            "depth": sum(depth.values()),
+            "depth_by_user": depth,
+            "persisted": self.persisted,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Persist every write made so far, waiting until it is done.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits until done)
+
+        Returns:
+            True if the writes were persisted within the timeout
+
+        """
+        with self._condition:
+            target = self._seq
+            self._flush_through = max(self._flush_through, target)
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: self._oldest_unpersisted() > target, timeout
+            )
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Persist the remaining writes and stop the worker.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits until done)
+
+        Returns:
+            True if the worker finished within the timeout
+
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            worker = self._worker
+        _OPEN_BUFFERS.discard(self)
+        if worker is None:
+            return True
+        worker.join(timeout)
+        return not worker.is_alive()
+
+    def _oldest_unpersisted(self) -> float:
+        """Return the lowest unpersisted sequence number; caller holds the lock."""
+        heads = [queue[0].seq for queue in self._queues.values() if queue]
+        heads += [writes[0].seq for writes in self._in_flight.values() if writes]
+        return min(heads, default=float("inf"))
+
+    def _due(self, now: float) -> tuple[list[str], float | None]:
+        """
+        Pick the users whose writes should be flushed; caller holds the lock.
+
+        Returns:
+            The users to flush, and the seconds until the next write is due
+            (None if nothing is waiting)
+
+        """
+        due = []
+        next_due = None
+        for user, queue in self._queues.items():
+            if not queue:
+                continue
+            wait = queue[0].enqueued + self.flush_interval - now
+            if (
+                self._closed
+                or len(queue) >= self.batch_size
+                or queue[0].seq <= self._flush_through
+                or wait <= 0
+            ):
+                due.append(user)
+            elif next_due is None or wait < next_due:
+                next_due = wait
+        return due, next_due
+
+    def _take_batches(self) -> dict[str, list[PendingWrite]] | None:
+        """Wait for due writes and move them in flight; None once drained."""
+        with self._condition:
+            while True:
+                due, next_due = self._due(time.monotonic())
+                if due:
+                    batches = {}
+                    for user in due:
+                        batches[user] = list(self._queues.pop(user))
+                        self._in_flight[user] = batches[user]
+                    return batches
+                if next_due is None:
+                    # Nothing is waiting: stop; the next add starts a new worker
+                    self._worker = None
+                    return None
+                self._condition.wait(next_due)
+
+    def _run(self) -> None:
+        """Persist batches until no writes are waiting."""
+        while True:
+            batches = self._take_batches()
+            if batches is None:
+                return
+            for user, writes in batches.items():
+                self._persist(writes)
+                with self._condition:
+                    self._in_flight.pop(user, None)
+                    self.batches += 1
+                    self._condition.notify_all()
+
+    def _persist(self, writes: list[PendingWrite]) -> None:
+        """Write one user's batch to the store, in order."""
+        for write in writes:
+            try:
+                self.memory.add(
+                    write.content, user_id=write.user_id, metadata=write.metadata
+                )
+            except Exception:  # noqa: PERF203 - one failed write must not drop the batch
+                logger.exception("Error storing memory for user %s", write.user_id)
+                self.failed += 1
+            else:
+                self.persisted += 1
+
+
+@atexit.register
+def _close_open_buffers() -> None:
+    """Persist the writes of buffers still open at interpreter exit."""
+    for buffer in list(_OPEN_BUFFERS):
+        buffer.close()
@@ -0,0 +1,203 @@
+"""
+memory_prefetch - Module for common_utils.memory_prefetch.
+
+Background prefetching of memory retrievals for multi-step agent workflows.
+
+When a crew or conversation starts, most of the retrievals its steps will make
+are already known: the task descriptions, the agent roles, the workflow
+description. :class:`MemoryPrefetcher` issues them all at once on a thread
+pool, so the round trips overlap. A step then takes the ready result
+(waiting only for what is still in flight) instead of starting a fresh
+retrieval.
+
+A prefetched result is handed out once and expires after ``ttl`` seconds, so
+later retrievals with the same query go back to the store and see newer
+memories.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Callable
+
+# Third-party imports
+# Local imports
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Retrievals run at the same time
+DEFAULT_PREFETCH_WORKERS = 4
+
+# Seconds a prefetched result may be used
+DEFAULT_PREFETCH_TTL = 60.0
+
+
+class MemoryPrefetcher:
+    """
+    Run foreseeable memory retrievals ahead of time, concurrently.
+
+    Usage:
+        prefetcher = MemoryPrefetcher(lambda q: memory.search(query=q, user_id=u))
+        prefetcher.prefetch([task.description for task in tasks])
+        ...
+        results = prefetcher.take(task.description)
+        if results is None:
+            results = memory.search(query=task.description, user_id=u)
+
+    """
+
+    def __init__(
+        self,
+        retrieve: Callable[[str], Any],
+        *,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        ttl: float = DEFAULT_PREFETCH_TTL,
+    ) -> None:
+        """
+        Initialize the prefetcher.
+
+        Args:
+            retrieve: Function running one retrieval for a query
+            max_workers: Retrievals run at the same time
+            ttl: Seconds a prefetched result may be used
+
+        """
+        if max_workers < 1 or ttl <= 0:
+            error_msg = (
+                "max_workers must be at least 1 and ttl positive, "
+                f"got {max_workers} and {ttl}"
+            )
+            raise ValueError(error_msg)
+        self.retrieve = retrieve
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.scheduled = 0
+        self.hits = 0
+        self.misses = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[Future[Any], float]] = {}
+        self._pool: ThreadPoolExecutor | None = None
+
+    @staticmethod
+    def key(query: str) -> str:
+        """Return the key a query's result is kept under."""
+        return " ".join(query.split())
+
+    def prefetch(self, queries: Iterable[str | None]) -> int:
+        """
+        Start retrievals in the background.
+
+        Blank queries and queries already prefetched are skipped.
+
+        Args:
+            queries: The queries later steps will retrieve
+
+        Returns:
+            The number of retrievals started
+
+        """
+        started = 0
+        with self._lock:
+            self._drop_expired(time.monotonic())
+            for query in queries:
+                if not isinstance(query, str) or not query.strip():
+                    continue
+                key = self.key(query)
+                if key in self._entries:
+                    continue
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="memory-prefetch",
+                    )
+                future = self._pool.submit(self.retrieve, query)
+                self._entries[key] = (future, time.monotonic() + self.ttl)
+                started += 1
+            self.scheduled += started
+        return started
+
+    def take(self, query: str, timeout: float | None = None) -> Any | None:  # noqa: ANN401
+        """
+        Take the prefetched result of a query, waiting if it is in flight.
+
+        Args:
+            query: The query
+            timeout: Maximum seconds to wait for an in-flight retrieval
+
+        Returns:
+            The result, or None if the query was not prefetched, expired,
+            failed or did not finish in time (the caller then retrieves it
+            itself)
+
+        """
+        with self._lock:
+            entry = self._entries.pop(self.key(query), None)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    entry[0].cancel()
+                self.misses += 1
+                return None
+        try:
+            result = entry[0].result(timeout)
+        except FutureTimeoutError:
+            entry[0].cancel()
+            outcome = "misses"
+            result = None
+        except Exception:
+            logger.exception("Prefetched memory retrieval failed")
+            outcome = "failed"
+            result = None
+        else:
+            outcome = "hits"
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+        return result
+
+    def pending(self) -> int:
+        """Return the number of prefetched results not taken yet."""
+        with self._lock:
+            self._drop_expired(time.monotonic())
+            return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return scheduled, hit, miss and failure counts."""
+        pending = self.pending()
+        with self._lock:
+            return {
+                "scheduled": self.scheduled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "failed": self.failed,
+                "pending": pending,
+            }
+
+    def clear(self) -> None:
+        """Forget every prefetched result, cancelling retrievals not yet started."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for future, _ in entries:
+            future.cancel()
+
+    def close(self) -> None:
+        """Forget prefetched results and stop the worker threads."""
+        self.clear()
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _drop_expired(self, now: float) -> None:
+        """Forget expired results; caller holds the lock."""
+        for key in [k for k, (_, expires) in self._entries.items() if expires <= now]:
+            self._entries.pop(key)[0].cancel()
@@ -0,0 +1,316 @@
+"""
+text_analysis - Module for common_utils.text_analysis.
+
+Lexicon-based sentiment analysis in one pass over the text.
+
+Text is lowercased and split into word tokens once; each token (and each
+run of tokens, for multi-word phrases) is then looked up in a hashed
+:class:`Lexicon`. The cost is linear in the length of the text whatever the
+size of the lexicon, and words only match whole: "like" is not found in
+"likely".
+
+:func:`analyze_texts` analyzes many documents, spreading large batches over
+a process pool.
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import functools
+import logging
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+# Third-party imports
+# Local imports
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Word tokens: letters and digits, with inner apostrophes ("don't")
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+DEFAULT_POSITIVE_WORDS = (
+    "good",
+    "great",
+    "excellent",
+    "fantastic",
+    "amazing",
+    "wonderful",
+    "love",
+    "like",
+    "happy",
+    "positive",
+)
+DEFAULT_NEGATIVE_WORDS = (
+    "bad",
+    "terrible",
+    "awful",
+    "hate",
+    "dislike",
+    "sad",
+    "negative",
+    "horrible",
+    "worst",
+)
+
+# Batches smaller than this are analyzed in the calling process
+MIN_PARALLEL_BATCH = 2000
+
+# Documents sent to a worker process at a time
+DEFAULT_CHUNK_SIZE = 500
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: The text
+
+    Returns:
+        The tokens, in order
+
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class Lexicon:
+    """
+    Positive and negative terms, indexed for constant-time lookup.
+
+    Terms may be single words or phrases ("not good"); a phrase match takes
+    precedence over the words inside it.
+
+    Usage:
+        lexicon = Lexicon(positive=["love", "must have"], negative=["meh"])
+        analyze_text("A must have!", lexicon)
+
+    """
+
+    def __init__(
+        self, positive: Iterable[str] = (), negative: Iterable[str] = ()
+    ) -> None:
+        """
+        Build the index.
+
+        Args:
+            positive: Positive words and phrases
+            negative: Negative words and phrases
+
+        Raises:
+            ValueError: If a term is empty or in both lists
+
+        """
+        # Term (as a token tuple) -> polarity, +1 or -1
+        self.terms: dict[tuple[str, ...], int] = {}
+        for polarity, terms in ((1, positive), (-1, negative)):
+            for term in terms:
+                tokens = tuple(tokenize(term))
+                if not tokens:
+                    error_msg = f"Lexicon term has no words: {term!r}"
+                    raise ValueError(error_msg)
+                if self.terms.get(tokens, polarity) != polarity:
+                    error_msg = f"Lexicon term is both positive and negative: {term!r}"
+                    raise ValueError(error_msg)
+                self.terms[tokens] = polarity
+        # Single words for the per-token lookup; phrase lengths to try,
+        # longest first, by first token
+        self.words = {
+            tokens[0]: p for tokens, p in self.terms.items() if len(tokens) == 1
+        }
+        lengths: dict[str, set[int]] = {}
+        for tokens in self.terms:
+            if len(tokens) > 1:
+                lengths.setdefault(tokens[0], set()).add(len(tokens))
+        self.phrase_lengths = {
+            first: sorted(sizes, reverse=True) for first, sizes in lengths.items()
+        }
+
+    def __len__(self) -> int:
+        """Return the number of terms."""
+        return len(self.terms)
+
+    def extend(
+        self, positive: Iterable[str] = (), negative: Iterable[str] = ()
+    ) -> Lexicon:
+        """
+        Return a new lexicon with additional terms.
+
+        Args:
+            positive: More positive words and phrases
+            negative: More negative words and phrases
+
+        Returns:
+            The combined lexicon
+
+        """
+        current_positive = [" ".join(t) for t, p in self.terms.items() if p > 0]
+        current_negative = [" ".join(t) for t, p in self.terms.items() if p < 0]
+        return Lexicon([*current_positive, *positive], [*current_negative, *negative])
+
+    def match(self, tokens: Sequence[str]) -> tuple[Counter[str], Counter[str]]:
+        """
+        Count the lexicon terms in a token sequence.
+
+        Args:
+            tokens: Lowercase tokens
+
+        Returns:
+            Positive and negative term counts
+
+        """
+        positive: Counter[str] = Counter()
+        negative: Counter[str] = Counter()
+        words = self.words
+        if not self.phrase_lengths:
+            for token in tokens:
+                polarity = words.get(token)
+                if polarity:
+                    (positive if polarity > 0 else negative)[token] += 1
+            return positive, negative
+
+        terms = self.terms
+        phrase_lengths = self.phrase_lengths
+        i = 0
+        end = len(tokens)
+        while i < end:
+            token = tokens[i]
+            size = 1
+            polarity = 0
+            for length in phrase_lengths.get(token, ()):
+                polarity = terms.get(tuple(tokens[i : i + length]), 0)
+                if polarity:
+                    size = length
+                    break
+            if not polarity:
+                polarity = words.get(token, 0)
+            if polarity:
+                term = token if size == 1 else " ".join(tokens[i : i + size])
+                (positive if polarity > 0 else negative)[term] += 1
+            i += size
+        return positive, negative
+
+
+DEFAULT_LEXICON = Lexicon(DEFAULT_POSITIVE_WORDS, DEFAULT_NEGATIVE_WORDS)
+
+
+@dataclass(frozen=True)
+class TextAnalysis:
+    """
+    Sentiment counts and basic metrics of a text.
+
+    ``str()`` gives the one-line summary agents log and display.
+
+    Attributes:
+        sentiment: "positive", "negative" or "neutral"
+        word_count: Number of whitespace-separated words
+        char_count: Number of characters
+        positive_count: Occurrences of positive terms
+        negative_count: Occurrences of negative terms
+        positive_terms: Occurrences per positive term
+        negative_terms: Occurrences per negative term
+
+    """
+
+    sentiment: str
+    word_count: int
+    char_count: int
+    positive_count: int
+    negative_count: int
+    positive_terms: dict[str, int] = field(default_factory=dict)
+    negative_terms: dict[str, int] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        """Return the one-line summary."""
+        return (
+            f"Sentiment: {self.sentiment} | Words: {self.word_count} | "
+            f"Characters: {self.char_count} | "
+            f"Positive indicators: {self.positive_count} | "
+            f"Negative indicators: {self.negative_count}"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the analysis as a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def analyze_text(text: str, lexicon: Lexicon | None = None) -> TextAnalysis:
+    """
+    Analyze a text for sentiment and basic metrics.
+
+    Args:
+        text: The text
+        lexicon: Terms to count (default: DEFAULT_LEXICON)
+
+    Returns:
+        The analysis
+
+    """
+    tokens = tokenize(text)
+    positive, negative = (lexicon or DEFAULT_LEXICON).match(tokens)
+    positive_count = sum(positive.values())
+    negative_count = sum(negative.values())
+    if positive_count > negative_count:
+        sentiment = "positive"
+    elif negative_count > positive_count:
+        sentiment = "negative"
+    else:
+        sentiment = "neutral"
+    return TextAnalysis(
+        sentiment=sentiment,
+        word_count=len(text.split()),
+        char_count=len(text),
+        positive_count=positive_count,
+        negative_count=negative_count,
+        positive_terms=dict(positive),
+        negative_terms=dict(negative),
+    )
+
+
+def _analyze_chunk(texts: Sequence[str], lexicon: Lexicon) -> list[TextAnalysis]:
+    """Analyze a chunk of texts in a worker process."""
+    return [analyze_text(text, lexicon) for text in texts]
+
+
+def analyze_texts(
+    texts: Iterable[str],
+    lexicon: Lexicon | None = None,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_parallel: int = MIN_PARALLEL_BATCH,
+) -> list[TextAnalysis]:
+    """
+    Analyze many texts, in parallel for large batches.
+
+    Batches of at least ``min_parallel`` texts are split into chunks of
+    ``chunk_size`` and analyzed on a process pool (the lexicon is sent once
+    per chunk); smaller batches are not worth the process startup and run in
+    the calling process.
+
+    Args:
+        texts: The texts
+        lexicon: Terms to count (default: DEFAULT_LEXICON)
+        max_workers: Worker processes (default: one per CPU)
+        chunk_size: Texts per worker task
+        min_parallel: Smallest batch analyzed on the process pool
+
+    Returns:
+        One analysis per text, in order
+
+    """
+    texts = list(texts)
+    lexicon = lexicon or DEFAULT_LEXICON
+    if len(texts) < min_parallel or max_workers == 1:
+        return _analyze_chunk(texts, lexicon)
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    analyze = functools.partial(_analyze_chunk, lexicon=lexicon)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [analysis for chunk in pool.map(analyze, chunks) for analysis in chunk]
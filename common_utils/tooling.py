@@ -5,22 +5,40 @@ This module allows registration and retrieval of callable tools (functions, APIs
 for use by agent wrappers.
 """
 
-# ruff: noqa: C901, N802
-
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from common_utils import expressions, text_analysis
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 # Tool registry: maps tool name to dict with 'func', optional 'keywords', optional 'input_preprocessor'
 _TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 
+# Routing index over the registry; None until built, reset by register_tool
+_ROUTER: ToolRouter | None = None
+_ROUTER_LOCK = threading.Lock()
+
+# Match weights: a tool's name counts more than one of its keywords, and a
+# match on word boundaries more than one inside a longer word
+NAME_WEIGHT = 3
+KEYWORD_WEIGHT = 1
+WHOLE_WORD_BONUS = 1
+
 
 def register_tool(
     name: str,
     func: Callable[..., Any],
     *,
-    keywords: Optional[list[str]] = None,
-    input_preprocessor: Optional[Callable[[str], Any]] = None,
+    keywords: list[str] | None = None,
+    input_preprocessor: Callable[[str], Any] | None = None,
+    timeout: float | None = None,
 ) -> None:
     """
     Register a callable tool with a name and optional metadata.
@@ -30,13 +48,18 @@ def register_tool(
         func (Callable): Function implementing the tool.
         keywords (list[str], optional): Keywords for heuristic selection.
         input_preprocessor (Callable, optional): Function to extract/prepare input for this tool from a task description.
+        timeout (float, optional): Seconds a call may take before it is abandoned; None uses the caller's default.
 
     """
-    _TOOL_REGISTRY[name] = {
-        "func": func,
-        "keywords": keywords or [],
-        "input_preprocessor": input_preprocessor,
-    }
+    global _ROUTER  # noqa: PLW0603
+    with _ROUTER_LOCK:
+        _TOOL_REGISTRY[name] = {
+            "func": func,
+            "keywords": keywords or [],
+            "input_preprocessor": input_preprocessor,
+            "timeout": timeout,
+        }
+        _ROUTER = None
 
 
 def get_tool(name: str) -> Callable[..., Any]:
@@ -49,6 +72,212 @@ def list_tools() -> dict[str, dict[str, Any]]:
     return dict(_TOOL_REGISTRY)
 
 
+@dataclass(frozen=True)
+class ToolMatch:
+    """
+    A tool matched against a task description.
+
+    Attributes:
+        name: The tool name
+        score: Sum of the weights of the distinct terms matched
+        terms: The matched name and keywords, in order of first occurrence
+        position: Offset of the first match in the description
+        metadata: The tool's registry entry
+
+    """
+
+    name: str
+    score: int
+    terms: tuple[str, ...]
+    position: int
+    metadata: dict[str, Any] = field(repr=False, compare=False)
+
+
+class ToolRouter:
+    """
+    Route task descriptions to tools with an Aho-Corasick automaton.
+
+    The automaton holds the lowercased name and keywords of every tool, so
+    one pass over a description finds every match, whatever the number of
+    tools: selection costs O(len(description) + matches). Terms match as
+    substrings, as in the original heuristic; each distinct term adds its
+    weight once (:data:`NAME_WEIGHT` or :data:`KEYWORD_WEIGHT`, plus
+    :data:`WHOLE_WORD_BONUS` on word boundaries). Ties go to the tool with
+    the earlier first match, then to the earlier registered tool.
+    """
+
+    def __init__(self, tools: Mapping[str, dict[str, Any]]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            tools: Tool names and registry entries, in registration order
+
+        """
+        self._tools = dict(tools)
+        self._order = {name: i for i, name in enumerate(self._tools)}
+        # Per term: (tool name, weight) pairs
+        self._terms: dict[str, list[tuple[str, int]]] = {}
+        for name, metadata in self._tools.items():
+            entries = [(name.lower(), NAME_WEIGHT)] + [
+                (keyword.lower(), KEYWORD_WEIGHT)
+                for keyword in metadata.get("keywords", [])
+            ]
+            for term, weight in entries:
+                if term:
+                    self._terms.setdefault(term, []).append((name, weight))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for term in self._terms:
+            self._insert(term)
+        self._link()
+
+    def _insert(self, term: str) -> None:
+        """Add a term to the trie."""
+        node = 0
+        for char in term:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = next_node
+        self._out[node] += (term,)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def find(self, text: str) -> dict[str, tuple[int, bool]]:
+        """
+        Find the terms occurring in a text.
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Each matched term with the offset of its first occurrence and
+            whether any occurrence falls on word boundaries
+
+        """
+        found: dict[str, tuple[int, bool]] = {}
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for term in out[node]:
+                start = end - len(term)
+                whole = _on_boundary(text, term, start, end)
+                first = found.get(term)
+                if first is None:
+                    found[term] = (start, whole)
+                elif whole and not first[1]:
+                    found[term] = (first[0], True)
+        return found
+
+    def match(self, description: str) -> list[ToolMatch]:
+        """
+        Score every tool matching a description.
+
+        Args:
+            description: The task description
+
+        Returns:
+            The matching tools, best first
+
+        """
+        scores: dict[str, int] = {}
+        terms: dict[str, list[str]] = {}
+        positions: dict[str, int] = {}
+        found = self.find(description.lower())
+        for term, (position, whole) in sorted(found.items(), key=lambda i: i[1][0]):
+            for name, weight in self._terms[term]:
+                scores[name] = (
+                    scores.get(name, 0) + weight + (WHOLE_WORD_BONUS if whole else 0)
+                )
+                terms.setdefault(name, []).append(term)
+                positions.setdefault(name, position)
+        matches = [
+            ToolMatch(
+                name, score, tuple(terms[name]), positions[name], self._tools[name]
+            )
+            for name, score in scores.items()
+        ]
+        matches.sort(key=lambda m: (-m.score, m.position, self._order[m.name]))
+        return matches
+
+    def best(self, description: str) -> ToolMatch | None:
+        """
+        Select the best tool for a description.
+
+        Args:
+            description: The task description
+
+        Returns:
+            The highest-scoring match, or None if no tool matches
+
+        """
+        matches = self.match(description)
+        return matches[0] if matches else None
+
+
+def _on_boundary(text: str, term: str, start: int, end: int) -> bool:
+    """Whether a match is not part of a longer word."""
+    before = start == 0 or not text[start - 1].isalnum() or not term[0].isalnum()
+    after = end == len(text) or not text[end].isalnum() or not term[-1].isalnum()
+    return before and after
+
+
+def get_router() -> ToolRouter:
+    """
+    Get the routing index over the registered tools.
+
+    The index is built on first use after a :func:`register_tool` call, so
+    registering many tools builds it once.
+
+    Returns:
+        The router
+
+    """
+    global _ROUTER  # noqa: PLW0603
+    router = _ROUTER
+    if router is None:
+        with _ROUTER_LOCK:
+            if _ROUTER is None:
+                _ROUTER = ToolRouter(_TOOL_REGISTRY)
+            router = _ROUTER
+    return router
+
+
+def select_tool(description: str) -> ToolMatch | None:
+    """
+    Select the registered tool that best matches a task description.
+
+    Args:
+        description: The task description
+
+    Returns:
+        The best match, or None if no tool's name or keywords occur in it
+
+    """
+    return get_router().best(description)
+
+
 # Example input preprocessor for calculator
 def calculator_input_preprocessor(description: str) -> str:
     """
@@ -56,22 +285,40 @@ def calculator_input_preprocessor(description: str) -> str:
 
     For demo: use a simple regex, as before.
     """
-    import re
-
     match = re.search(r"([0-9\+\-\*\/\.\s\%\(\)]+)", description)
     if match:
         return match.group(1)
     return description
 
 
-# Example tool: simple calculator (unchanged)
-MAX_EXPONENT_VALUE = 100
+# Example tool: simple calculator
+MAX_EXPONENT_VALUE = expressions.MAX_EXPONENT_VALUE
+
+_CALCULATOR_CHARACTERS = re.compile(r"^[\d\s\+\-\*\/\(\)\.\%]+$")
+_NUMBER = re.compile(r"\d+")
+
+
+def _compile_calculator_expression(expression: str) -> expressions.CompiledExpression:
+    """Validate a calculator expression and compile it (compilation is cached)."""
+    if not _CALCULATOR_CHARACTERS.match(expression):
+        error_msg = "Invalid characters in expression"
+        raise expressions.ExpressionError(error_msg)
+    if "**" in expression and any(
+        int(x) > MAX_EXPONENT_VALUE for x in _NUMBER.findall(expression)
+    ):
+        error_msg = f"Exponentiation with values > {MAX_EXPONENT_VALUE} not allowed"
+        raise expressions.ExpressionError(error_msg)
+    return expressions.compile_expression(expression, ())
 
 
 def calculator(expression: str) -> object:
     """
     Evaluate a mathematical expression safely and return the result.
 
+    Compiled expressions are kept in an LRU cache, so a repeated expression
+    is parsed only once. To evaluate one expression over many values,
+    use :func:`common_utils.expressions.evaluate_batch`.
+
     Args:
         expression: A string containing a mathematical expression to evaluate
 
@@ -79,76 +326,9 @@ def calculator(expression: str) -> object:
         The result of the calculation or an error message
 
     """
-    import ast
-    import operator
-    import re
-
-    operators = {
-        "+": operator.add,
-        "-": operator.sub,
-        "*": operator.mul,
-        "/": operator.truediv,
-        "**": operator.pow,
-        "%": operator.mod,
-    }
-
     try:
-        if not re.match(r"^[\d\s\+\-\*\/\(\)\.\%]+$", expression):
-            return "Error: Invalid characters in expression"
-
-        if "**" in expression and any(
-            n > MAX_EXPONENT_VALUE
-            for n in [float(x) for x in re.findall(r"\d+", expression) if x.isdigit()]
-        ):
-            return (
-                f"Error: Exponentiation with values > {MAX_EXPONENT_VALUE} not allowed"
-            )
-        try:
-            return ast.literal_eval(expression)
-        except (ValueError, SyntaxError):
-
-            class SafeExpressionEvaluator(ast.NodeVisitor):
-                def visit_BinOp(self, node: ast.BinOp) -> object:
-                    left = self.visit(node.left)
-                    right = self.visit(node.right)
-                    if isinstance(node.op, ast.Add):
-                        return operators["+"](left, right)
-                    if isinstance(node.op, ast.Sub):
-                        return operators["-"](left, right)
-                    if isinstance(node.op, ast.Mult):
-                        return operators["*"](left, right)
-                    if isinstance(node.op, ast.Div):
-                        return operators["/"](left, right)
-                    if isinstance(node.op, ast.Pow):
-                        return operators["**"](left, right)
-                    if isinstance(node.op, ast.Mod):
-                        return operators["%"](left, right)
-                    error_msg = f"Unsupported operator: {type(node.op).__name__}"
-                    raise ValueError(error_msg)
-
-                def visit_UnaryOp(self, node: ast.UnaryOp) -> object:
-                    operand = self.visit(node.operand)
-                    if isinstance(node.op, ast.USub):
-                        return -operand
-                    if isinstance(node.op, ast.UAdd):
-                        return operand
-                    error_msg = f"Unsupported unary operator: {type(node.op).__name__}"
-                    raise ValueError(error_msg)
-
-                def visit_Num(self, node: ast.Num) -> object:
-                    return node.n
-
-                def visit_Constant(self, node: ast.Constant) -> object:
-                    return node.value
-
-                def generic_visit(self, node: ast.AST) -> None:
-                    error_msg = f"Unsupported node type: {type(node).__name__}"
-                    raise ValueError(error_msg)
-
-            parsed_expr = ast.parse(expression, mode="eval")
-            evaluator = SafeExpressionEvaluator()
-            return evaluator.visit(parsed_expr.body)
-    except (ValueError, SyntaxError, TypeError, ZeroDivisionError, OverflowError) as e:
+        return _compile_calculator_expression(expression).evaluate()
+    except (ValueError, TypeError, ZeroDivisionError, OverflowError) as e:
         return f"Error: {e}"
 
 
@@ -177,6 +357,10 @@ def text_analyzer(text: str) -> str:
     """
     Analyze text for basic sentiment and characteristics.
 
+    Words are matched whole against the default sentiment lexicon in one pass
+    over the text. For the structured result, custom lexicons and batch
+    analysis, use :func:`common_utils.text_analysis.analyze_text`.
+
     Args:
         text (str): The text to analyze.
 
@@ -184,53 +368,7 @@ def text_analyzer(text: str) -> str:
         str: Analysis results including sentiment and basic metrics.
 
     """
-    # Basic sentiment analysis using simple keyword matching
-    positive_words = [
-        "good",
-        "great",
-        "excellent",
-        "fantastic",
-        "amazing",
-        "wonderful",
-        "love",
-        "like",
-        "happy",
-        "positive",
-    ]
-    negative_words = [
-        "bad",
-        "terrible",
-        "awful",
-        "hate",
-        "dislike",
-        "sad",
-        "negative",
-        "horrible",
-        "worst",
-    ]
-
-    try:
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-
-        # Determine sentiment
-        if positive_count > negative_count:
-            sentiment = "positive"
-        elif negative_count > positive_count:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
-
-        # Basic metrics
-        word_count = len(text.split())
-        char_count = len(text)
-
-        result = f"Sentiment: {sentiment} | Words: {word_count} | Characters: {char_count} | Positive indicators: {positive_count} | Negative indicators: {negative_count}"
-    except ValueError as e:  # Replace with the most likely specific exception
-        return f"Error analyzing text: {e}"
-    else:
-        return result
+    return str(text_analysis.analyze_text(text))
 
 
 # Register the text analyzer tool
@@ -1,7 +1,13 @@
 """Mock ADK (Agent Development Kit) package."""
 
 from .agent import Agent
-from .communication import AgentCommunicator, Message
+from .communication import (
+    AgentCommunicator,
+    Mailbox,
+    MailboxClosedError,
+    MailboxFullError,
+    Message,
+)
 from .memory import SimpleMemory
 from .skill import Skill
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .communication import AgentCommunicator, Message
+    from .skill import Skill
 
 
 class Agent:
@@ -15,13 +16,41 @@ class Agent:
         """Initialize an agent."""
         self.name = name
         self.communicator: AgentCommunicator | None = None
+        self.skills: dict[str, Skill] = {}
 
     def set_communicator(self, communicator: AgentCommunicator) -> None:
-        """Set the communicator for this agent."""
+        """Set the communicator for this agent and register its mailbox."""
         self.communicator = communicator
-
-    def start(self) -> None:
-        """Start the agent. Override in subclasses."""
+        communicator.register(self)
+
+    def add_skill(self, name: str, skill: Skill) -> None:
+        """Add a named skill."""
+        self.skills[name] = skill
+
+    def start(self, workers: int = 1) -> None:
+        """Start handling messages from the agent's mailbox in the background."""
+        if self.communicator is not None:
+            self.communicator.start_agent(self, workers)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background workers after the mailbox is drained."""
+        if self.communicator is not None:
+            self.communicator.stop_agent(self, timeout)
+
+    def on_message(self, message: Message) -> None:
+        """
+        Handle a message delivered by the communicator.
+
+        Sends the response of handle_message, if any, by default back to the
+        message's sender. Override in subclasses that send their own messages.
+        """
+        response = self.handle_message(message)
+        if response is not None and self.communicator is not None:
+            if response.receiver is None:
+                response.receiver = message.sender
+            if response.conversation_id is None:
+                response.conversation_id = message.conversation_id
+            self.communicator.send(response)
 
     def handle_message(self, message: Message) -> Message | None:  # noqa: ARG002
         """Handle a received message. Override in subclasses."""
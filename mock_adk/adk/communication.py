@@ -1,31 +1,376 @@
-"""Mock message and communication classes for ADK."""
+"""
+Mock message and communication classes for ADK.
+
+:class:`AgentCommunicator` is an in-process message bus. Every agent (and
+every other named receiver, such as the user) has a bounded mailbox; a
+message goes to its receiver's mailbox, or to the subscribers of its type
+when it has no receiver. A sender blocks while a mailbox is full, which
+slows producers down to the pace of their consumers.
+
+Agents started with :meth:`Agent.start` are driven by worker threads that
+take messages from their mailbox and call ``on_message``, so agents in a
+pipeline work on different messages at the same time.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import Agent
+
+logger = logging.getLogger(__name__)
+
+# Messages a mailbox holds before senders block
+DEFAULT_MAILBOX_SIZE = 1000
+
+# Seconds a sender waits for room in a full mailbox
+DEFAULT_SEND_TIMEOUT = 10.0
+
+# Mailbox of messages that have no receiver and no subscriber
+UNADDRESSED = "__unaddressed__"
+
+
+class MailboxFullError(RuntimeError):
+    """Raised when a mailbox stays full for the whole send timeout."""
+
+    MESSAGE_TEMPLATE = "Mailbox of {receiver!r} is full ({size} messages)"
+
+    def __init__(self, receiver: str, size: int) -> None:
+        """Initialize the error."""
+        super().__init__(self.MESSAGE_TEMPLATE.format(receiver=receiver, size=size))
+        self.receiver = receiver
+
+
+class MailboxClosedError(RuntimeError):
+    """Raised when sending to a mailbox whose agent has been stopped."""
+
+    MESSAGE_TEMPLATE = "Mailbox of {receiver!r} is closed"
+
+    def __init__(self, receiver: str) -> None:
+        """Initialize the error."""
+        super().__init__(self.MESSAGE_TEMPLATE.format(receiver=receiver))
+        self.receiver = receiver
 
 
 @dataclass
 class Message:
-    """Message class for agent communication."""
+    """
+    Message class for agent communication.
+
+    ``receiver`` addresses one agent; without it the message is published to
+    the subscribers of its ``type``. ``conversation_id`` ties together the
+    messages of one request as it moves through a pipeline.
+    """
 
     type: str
     payload: dict[str, Any]
     sender: str
+    receiver: str | None = None
+    conversation_id: str | None = None
+
+    def reply(
+        self,
+        sender: str,
+        type: str,  # noqa: A002
+        payload: dict[str, Any],
+        receiver: str | None = None,
+    ) -> Message:
+        """Build a message in the same conversation, by default to the sender."""
+        return Message(
+            type=type,
+            payload=payload,
+            sender=sender,
+            receiver=receiver or self.sender,
+            conversation_id=self.conversation_id,
+        )
+
+
+class Mailbox:
+    """Bounded, thread-safe FIFO of messages."""
+
+    def __init__(self, name: str, maxsize: int = DEFAULT_MAILBOX_SIZE) -> None:
+        """Initialize an empty mailbox."""
+        if maxsize < 1:
+            error_msg = f"maxsize must be at least 1, got {maxsize}"
+            raise ValueError(error_msg)
+        self.name = name
+        self.maxsize = maxsize
+        self.high_water = 0
+        self._messages: deque[Message] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Return the number of waiting messages."""
+        return len(self._messages)
+
+    def put(self, message: Message, timeout: float | None = None) -> float:
+        """
+        Add a message, waiting while the mailbox is full.
+
+        Returns the seconds spent waiting. Raises MailboxFullError if there is
+        still no room after ``timeout`` seconds (None waits indefinitely), and
+        MailboxClosedError if the mailbox is or gets closed meanwhile.
+        """
+        with self._not_full:
+            started = time.monotonic()
+            if not self._not_full.wait_for(
+                lambda: len(self._messages) < self.maxsize or self._closed, timeout
+            ):
+                raise MailboxFullError(self.name, self.maxsize)
+            if self._closed:
+                raise MailboxClosedError(self.name)
+            self._messages.append(message)
+            self.high_water = max(self.high_water, len(self._messages))
+            self._not_empty.notify()
+            return time.monotonic() - started
+
+    def get(self, timeout: float | None = None) -> Message | None:
+        """Take the oldest message, or None after ``timeout`` or once closed."""
+        with self._not_empty:
+            if not self._not_empty.wait_for(
+                lambda: self._messages or self._closed, timeout
+            ):
+                return None
+            if not self._messages:
+                return None
+            message = self._messages.popleft()
+            self._not_full.notify()
+            return message
+
+    def peek(self) -> list[Message]:
+        """Return the waiting messages, oldest first, without taking them."""
+        with self._lock:
+            return list(self._messages)
+
+    def close(self) -> None:
+        """
+        Stop accepting messages and wake every waiting reader and writer.
+
+        Writers then get MailboxClosedError; readers get None once empty.
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def reopen(self) -> None:
+        """Accept messages and blocking reads again after close."""
+        with self._lock:
+            self._closed = False
+
+
+@dataclass
+class BusMetrics:
+    """Counters of an AgentCommunicator."""
+
+    sent: int = 0
+    delivered: int = 0
+    handled: int = 0
+    errors: int = 0
+    rejected: int = 0
+    blocked_seconds: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+
+    def to_dict(self) -> dict[str, float]:
+        """Return the counters and the handled-message throughput."""
+        elapsed = time.monotonic() - self.started
+        return {
+            "sent": self.sent,
+            "delivered": self.delivered,
+            "handled": self.handled,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "blocked_seconds": self.blocked_seconds,
+            "elapsed_seconds": elapsed,
+            "handled_per_second": self.handled / elapsed if elapsed > 0 else 0.0,
+        }
 
 
 class AgentCommunicator:
-    """Mock communicator for agent message passing."""
+    """In-process message bus with per-agent mailboxes and topics."""
+
+    def __init__(
+        self,
+        mailbox_size: int = DEFAULT_MAILBOX_SIZE,
+        send_timeout: float | None = DEFAULT_SEND_TIMEOUT,
+    ) -> None:
+        """
+        Initialize communicator.
+
+        Args:
+            mailbox_size: Messages each mailbox holds before senders block
+            send_timeout: Seconds a sender waits for room in a full mailbox
+                (None waits indefinitely)
+
+        """
+        self.mailbox_size = mailbox_size
+        self.send_timeout = send_timeout
+        self.metrics = BusMetrics()
+        self._lock = threading.Lock()
+        self._mailboxes: dict[str, Mailbox] = {}
+        self._subscriptions: dict[str, set[str]] = {}
+        self._agents: dict[str, Agent] = {}
+        self._workers: dict[str, list[threading.Thread]] = {}
+
+    def mailbox(self, name: str) -> Mailbox:
+        """Return the mailbox of a receiver, creating it on first use."""
+        with self._lock:
+            mailbox = self._mailboxes.get(name)
+            if mailbox is None:
+                mailbox = Mailbox(name, self.mailbox_size)
+                self._mailboxes[name] = mailbox
+            return mailbox
+
+    def register(self, agent: Agent) -> None:
+        """Give an agent a mailbox."""
+        with self._lock:
+            self._agents[agent.name] = agent
+        self.mailbox(agent.name)
+
+    def subscribe(self, topic: str, name: str) -> None:
+        """Deliver unaddressed messages of type ``topic`` to ``name``."""
+        self.mailbox(name)
+        with self._lock:
+            self._subscriptions.setdefault(topic, set()).add(name)
+
+    def unsubscribe(self, topic: str, name: str) -> None:
+        """Stop delivering messages of type ``topic`` to ``name``."""
+        with self._lock:
+            self._subscriptions.get(topic, set()).discard(name)
+
+    def _count(self, counter: str, amount: float = 1) -> None:
+        """Add to a metrics counter."""
+        with self._lock:
+            setattr(self.metrics, counter, getattr(self.metrics, counter) + amount)
 
-    def __init__(self) -> None:
-        """Initialize communicator."""
-        self.messages: list[Message] = []
+    def send(self, message: Message, timeout: float | None = None) -> int:
+        """
+        Deliver a message to its receiver, or publish it to its topic.
+
+        Messages with neither a receiver nor a subscriber wait in a shared
+        mailbox read by :meth:`receive_message`.
+
+        Args:
+            message: The message
+            timeout: Seconds to wait for room in a full mailbox (default: the
+                communicator's send_timeout)
+
+        Returns:
+            The number of mailboxes the message was delivered to
+
+        Raises:
+            MailboxFullError: If a mailbox stays full for the whole timeout
+            MailboxClosedError: If a receiver's agent has been stopped
+
+        """
+        if message.receiver is not None:
+            receivers = [message.receiver]
+        else:
+            with self._lock:
+                receivers = sorted(self._subscriptions.get(message.type, ()))
+            receivers = receivers or [UNADDRESSED]
+        self._count("sent")
+        wait = self.send_timeout if timeout is None else timeout
+        for name in receivers:
+            try:
+                blocked = self.mailbox(name).put(message, wait)
+            except (MailboxFullError, MailboxClosedError):
+                self._count("rejected")
+                raise
+            with self._lock:
+                self.metrics.delivered += 1
+                self.metrics.blocked_seconds += blocked
+        return len(receivers)
+
+    def publish(self, topic: str, message: Message, timeout: float | None = None) -> int:
+        """Send a message to every subscriber of ``topic``."""
+        return self.send(replace(message, type=topic, receiver=None), timeout)
+
+    def receive(self, receiver: str, timeout: float | None = None) -> Message | None:
+        """Take the next message for ``receiver``, or None after ``timeout``."""
+        return self.mailbox(receiver).get(timeout)
+
+    def pending(self, receiver: str) -> list[Message]:
+        """Return the messages waiting for ``receiver`` without taking them."""
+        return self.mailbox(receiver).peek()
 
     def send_message(self, message: Message) -> None:
-        """Send a message (store in list)."""
-        self.messages.append(message)
+        """Send a message (kept for compatibility; see send)."""
+        self.send(message)
 
     def receive_message(self) -> Message | None:
-        """Receive a message (pop from list)."""
-        return self.messages.pop(0) if self.messages else None
+        """Take the oldest message that had no receiver and no subscriber."""
+        return self.mailbox(UNADDRESSED).get(timeout=0)
+
+    def start_agent(self, agent: Agent, workers: int = 1) -> None:
+        """
+        Drive an agent with worker threads calling its ``on_message``.
+
+        With more than one worker the agent handles several messages at once,
+        so its handlers must be thread-safe and messages may finish out of
+        order.
+        """
+        if workers < 1:
+            error_msg = f"workers must be at least 1, got {workers}"
+            raise ValueError(error_msg)
+        self.register(agent)
+        mailbox = self.mailbox(agent.name)
+        mailbox.reopen()
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(agent, mailbox),
+                name=f"{agent.name}-{i}",
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        with self._lock:
+            self._workers.setdefault(agent.name, []).extend(threads)
+        for thread in threads:
+            thread.start()
+
+    def stop_agent(self, agent: Agent, timeout: float | None = None) -> None:
+        """Stop an agent's workers once they have drained its mailbox."""
+        with self._lock:
+            threads = self._workers.pop(agent.name, [])
+        self.mailbox(agent.name).close()
+        for thread in threads:
+            thread.join(timeout)
+
+    def _work(self, agent: Agent, mailbox: Mailbox) -> None:
+        """Handle messages from a mailbox until it is closed and empty."""
+        while True:
+            message = mailbox.get()
+            if message is None:
+                return
+            try:
+                agent.on_message(message)
+            except Exception:
+                # A failing message must not stop the worker
+                logger.exception(
+                    "Agent %s failed to handle a %r message", agent.name, message.type
+                )
+                self._count("errors")
+            else:
+                self._count("handled")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the bus metrics and the depth of every mailbox."""
+        with self._lock:
+            mailboxes = dict(self._mailboxes)
+            stats: dict[str, Any] = self.metrics.to_dict()
+        stats["mailboxes"] = {
+            name: {"depth": len(box), "high_water": box.high_water}
+            for name, box in mailboxes.items()
+        }
+        return stats
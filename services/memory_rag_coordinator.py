@@ -33,6 +33,9 @@ class MemoryRAGCoordinator:
         Number of top results to return from ChromaDB (default: 5).
     chroma_persist_dir : Optional[str]
         Directory for ChromaDB persistence (default: uses CHROMADB_PERSIST_DIR env or ".chromadb_demo").
+    embedder : Optional[Any]
+        Object with a SentenceTransformer-style ``encode`` method, such as
+        ``ai_models.model_types.ONNXModel`` (default: SentenceTransformer "all-MiniLM-L6-v2").
 
     """
 
@@ -41,6 +44,7 @@ class MemoryRAGCoordinator:
         chroma_collection_name: str = "demo_rag",
         chroma_n_results: int = 5,
         chroma_persist_dir: str | None = None,
+        embedder: Any | None = None,  # noqa: ANN401
     ) -> None:
         """Initialize the MemoryRAGCoordinator."""
         # Setup ChromaDB client, collection, and embedder (can fail gracefully if not installed)
@@ -51,12 +55,11 @@ class MemoryRAGCoordinator:
         )
         self._chroma_client = None
         self._chroma_collection = None
-        self._embedder = None
+        self._embedder = embedder
 
         try:
             import chromadb
             from chromadb.config import Settings
-            from sentence_transformers import SentenceTransformer
 
             # Initialize client and collection
             self._chroma_client = chromadb.Client(
@@ -68,7 +71,10 @@ class MemoryRAGCoordinator:
             self._chroma_collection = self._chroma_client.get_or_create_collection(
                 self.chroma_collection_name
             )
-            self._embedder = SentenceTransformer("all-MiniLM-L6-v2")
+            if self._embedder is None:
+                from sentence_transformers import SentenceTransformer
+
+                self._embedder = SentenceTransformer("all-MiniLM-L6-v2")
         except ImportError:
             logger.warning(
                 "chromadb and/or sentence-transformers not installed. Install with: uv pip install chromadb sentence-transformers"
@@ -0,0 +1,149 @@
+"""
+Tests for the ADK demo agents and message bus.
+
+These tests drive the DataGatherer and Summarizer agents through the mock ADK
+communicator.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("adk")
+
+from adk.agent import Agent
+from adk.communication import (
+    AgentCommunicator,
+    Mailbox,
+    MailboxClosedError,
+    MailboxFullError,
+    Message,
+)
+
+from adk_demo.agents import DataGathererAgent, SummarizerAgent, run_conversations
+
+
+class _SlowEcho(Agent):
+    """Agent that sleeps, then echoes the payload back."""
+
+    def handle_message(self, message):
+        time.sleep(0.05)
+        return Message(type="echo", payload=message.payload, sender=self.name)
+
+
+class TestMailbox:
+    """Tests for bounded mailboxes."""
+
+    def test_back_pressure(self):
+        """Test that a full mailbox blocks, then rejects, the sender."""
+        mailbox = Mailbox("box", maxsize=1)
+        mailbox.put(Message("a", {}, "s"))
+
+        with pytest.raises(MailboxFullError, match="'box' is full"):
+            mailbox.put(Message("b", {}, "s"), timeout=0.05)
+        threading.Timer(0.05, mailbox.get).start()
+        assert mailbox.put(Message("c", {}, "s"), timeout=2) > 0
+        assert mailbox.get().type == "c"
+        assert mailbox.get(timeout=0.01) is None
+
+    def test_closed_mailbox_rejects_messages(self):
+        """Test that close wakes a blocked sender and rejects later messages."""
+        mailbox = Mailbox("box", maxsize=1)
+        mailbox.put(Message("a", {}, "s"))
+
+        threading.Timer(0.05, mailbox.close).start()
+        with pytest.raises(MailboxClosedError, match="'box' is closed"):
+            mailbox.put(Message("b", {}, "s"), timeout=2)
+        with pytest.raises(MailboxClosedError):
+            mailbox.put(Message("c", {}, "s"))
+        assert len(mailbox) == 1
+        assert mailbox.get().type == "a"
+        assert mailbox.get() is None
+        mailbox.reopen()
+        mailbox.put(Message("d", {}, "s"))
+        assert mailbox.get().type == "d"
+
+    def test_peek_leaves_messages_queued(self):
+        """Test that peek returns the waiting messages without taking them."""
+        bus = AgentCommunicator()
+        bus.send(Message("a", {}, "s", receiver="box"))
+        bus.send(Message("b", {}, "s", receiver="box"))
+
+        assert [m.type for m in bus.pending("box")] == ["a", "b"]
+        assert bus.receive("box", 0).type == "a"
+        assert [m.type for m in bus.mailbox("box").peek()] == ["b"]
+
+
+class TestAgentCommunicator:
+    """Tests for routing and driving agents."""
+
+    def test_addressed_topic_and_unaddressed(self):
+        """Test delivery by receiver, by subscription and to the shared box."""
+        bus = AgentCommunicator()
+        bus.subscribe("news", "a")
+        bus.subscribe("news", "b")
+
+        bus.send(Message("hi", {}, "s", receiver="a"))
+        assert bus.publish("news", Message("x", {"n": 1}, "s")) == 2
+        bus.send_message(Message("legacy", {}, "s"))
+
+        assert [bus.receive("a", 0).type for _ in range(2)] == ["hi", "news"]
+        assert bus.receive("b", 0).payload == {"n": 1}
+        assert bus.receive_message().type == "legacy"
+        assert bus.receive_message() is None
+
+    def test_workers_reply_to_sender(self):
+        """Test that started agents handle messages in parallel and reply."""
+        bus = AgentCommunicator()
+        echo = _SlowEcho("echo")
+        echo.set_communicator(bus)
+        echo.start(workers=4)
+
+        started = time.monotonic()
+        for i in range(8):
+            bus.send(Message("ping", {"i": i}, "user", "echo", conversation_id=str(i)))
+        replies = [bus.receive("user", timeout=2) for _ in range(8)]
+        echo.stop()
+
+        assert time.monotonic() - started < 0.3
+        assert sorted(r.payload["i"] for r in replies) == list(range(8))
+        assert all(r.conversation_id == str(r.payload["i"]) for r in replies)
+        stats = bus.get_stats()
+        assert stats["handled"] == 8
+        assert stats["handled_per_second"] > 0
+        assert stats["mailboxes"]["echo"]["depth"] == 0
+
+
+class TestPipeline:
+    """Tests for the gather and summarize pipeline."""
+
+    def test_single_query(self):
+        """Test the message flow used by the CLI demo."""
+        bus = AgentCommunicator()
+        agents = [DataGathererAgent("gatherer"), SummarizerAgent("summarizer")]
+        for agent in agents:
+            agent.set_communicator(bus)
+            agent.start()
+
+        bus.send(Message("gather", {"query": "bees"}, "user", "gatherer"))
+        reply = bus.receive("user", timeout=2)
+        for agent in agents:
+            agent.stop()
+
+        assert reply.type == "summary_result"
+        assert reply.payload["summary"].startswith("Data found for 'bees'")
+
+    def test_many_conversations(self):
+        """Test that summaries come back per conversation through small mailboxes."""
+        queries = [f"topic {i}" for i in range(200)]
+
+        summaries = run_conversations(
+            queries, communicator=AgentCommunicator(mailbox_size=8)
+        )
+
+        assert all(
+            s.startswith(f"Data found for '{q}'") for q, s in zip(queries, summaries)
+        )
@@ -100,11 +100,19 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
             user_id="test-user",
         )
 
+        # Persist the writes made during initialization
+        self.gatherer.flush_memories()
+        self.summarizer.flush_memories()
+
         # Disable logging during tests
         logging.disable(logging.CRITICAL)
 
     def tearDown(self):
         """Tear down test fixtures."""
+        # Release the shared memory store
+        self.gatherer.stop()
+        self.summarizer.stop()
+
         # Stop all patches
         self.memory_patcher.stop()
         self.simple_memory_patcher.stop()
@@ -131,6 +139,21 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
         args, kwargs = self.memory_mock.add.call_args_list[0]
         assert "TestGatherer" in str(args) or "TestGatherer" in str(kwargs)
 
+    def test_agents_share_one_write_buffer(self):
+        """Test that one buffer orders a user's writes across agents."""
+        assert self.gatherer.memory_writer is self.summarizer.memory_writer
+        self.memory_mock.add.reset_mock()
+
+        # The buffer stays open while another agent still uses it
+        self.gatherer.stop()
+        self.summarizer._store_memory("Still buffered")  # noqa: SLF001
+        self.summarizer.flush_memories()
+        self.memory_mock.add.assert_called_once()
+
+        self.summarizer.stop()
+        with pytest.raises(RuntimeError, match="closed"):
+            self.summarizer.memory_writer.add("Too late", user_id="test-user")
+
     def test_handle_message(self):
         """Test handling a message with memory enhancement."""
         # Handle a message
@@ -145,6 +168,7 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
         assert "Test query" in str(args) or "Test query" in str(kwargs)
 
         # Check that the interaction was stored
+        self.gatherer.flush_memories()
         assert self.memory_mock.add.call_count >= 3  # Init + interaction
         args, kwargs = self.memory_mock.add.call_args
         assert "user" in str(args) or "user" in str(kwargs)
@@ -153,6 +177,27 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
         # Check that the response was returned
         assert response == self.response_mock
 
+    def test_start_prefetches_queued_messages(self):
+        """Test that handling a queued message uses the search run at start."""
+        communicator = MagicMock()
+        communicator.pending.return_value = [self.message_mock]
+        self.gatherer.communicator = communicator
+
+        # Start without workers so the test handles the message itself
+        with patch("adk_demo.mem0_enhanced_adk_agents.Agent.start") as start_mock:
+            self.gatherer.start(workers=2)
+        start_mock.assert_called_once_with(2)
+        communicator.pending.assert_called_once_with("TestGatherer")
+
+        self.gatherer.handle_message(self.message_mock)
+
+        # The prefetch was the only search
+        self.memory_mock.search.assert_called_once_with(
+            query="Test query", user_id="test-user", limit=5
+        )
+        assert self.gatherer.memory_prefetcher.get_stats()["hits"] == 1
+        self.gatherer.communicator = None
+
     def test_extract_query_from_message(self):
         """Test extracting a query from a message."""
         # Extract query from gather message
@@ -176,6 +221,8 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
 
     def test_store_memory(self):
         """Test storing a memory."""
+        self.memory_mock.add.reset_mock()
+
         # Store a memory
         self.gatherer.store_memory_for_test(
             "Test memory content",
@@ -183,7 +230,8 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
         )
 
         # Check that the memory was stored
-        self.memory_mock.add.assert_called_with(
+        self.gatherer.flush_memories()
+        self.memory_mock.add.assert_called_once_with(
             "Test memory content",
             user_id="test-user",
             metadata={"test_key": "test_value"},
@@ -209,10 +257,13 @@ class TestMemoryEnhancedADKAgents(unittest.TestCase):
 
     def test_store_interaction(self):
         """Test storing an interaction."""
+        self.memory_mock.add.reset_mock()
+
         # Store an interaction
         self.gatherer.store_interaction_for_test(self.message_mock, self.response_mock)
 
         # Check that the interaction was stored
+        self.gatherer.flush_memories()
         self.memory_mock.add.assert_called_once_with(
             [
                 {"role": "user", "content": "gather: {'query': 'Test query'}"},
@@ -95,6 +95,7 @@ class TestMemoryEnhancedCrewAIAgentTeam(unittest.TestCase):
         assert self.team.user_id == "test-user"
 
         # Check that a memory was stored during initialization
+        self.team.flush_memories()
         self.memory_mock.add.assert_called_once()
         args, kwargs = self.memory_mock.add.call_args
         assert "test-user" in str(args) or "test-user" in str(kwargs)
@@ -115,6 +116,7 @@ class TestMemoryEnhancedCrewAIAgentTeam(unittest.TestCase):
         assert agent in self.team.agents
 
         # Check that a memory was stored
+        self.team.flush_memories()
         assert self.memory_mock.add.call_count >= 2  # Once for init, once for add_agent
         args, kwargs = self.memory_mock.add.call_args
         assert "Researcher" in str(args) or "Researcher" in str(kwargs)
@@ -141,6 +143,7 @@ class TestMemoryEnhancedCrewAIAgentTeam(unittest.TestCase):
         assert task in self.team.tasks
 
         # Check that a memory was stored
+        self.team.flush_memories()
         assert self.memory_mock.add.call_count >= 3  # Init, add_agent, add_task
         args, kwargs = self.memory_mock.add.call_args
         assert "Research AI memory systems" in str(
@@ -168,6 +171,7 @@ class TestMemoryEnhancedCrewAIAgentTeam(unittest.TestCase):
         self.crew_mock.kickoff.assert_called_once()
 
         # Check that memories were retrieved and stored
+        self.team.flush_memories()
         assert self.memory_mock.search.call_count >= 1
         assert self.memory_mock.add.call_count >= 4  # Init, add_agent, add_task, run
 
@@ -180,6 +184,7 @@ class TestMemoryEnhancedCrewAIAgentTeam(unittest.TestCase):
         )
 
         # Check that the memory was stored
+        self.team.flush_memories()
         self.memory_mock.add.assert_called_with(
             "Test memory content",
             user_id="test-user",
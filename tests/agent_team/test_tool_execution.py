@@ -0,0 +1,181 @@
+"""test_tool_execution - Module for tests/agent_team.test_tool_execution."""
+
+from __future__ import annotations
+
+# Standard library imports
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+# Third-party imports
+import pytest
+
+# Local imports
+from agent_team.crewai_agents import CrewAIAgentTeam
+from agent_team.tool_execution import (
+    ToolCall,
+    ToolDependencyCycleError,
+    ToolExecutor,
+    ToolTimeoutError,
+    resolve_dependencies,
+)
+
+
+def _sleeper(delay, value=None):
+    """Build a tool that sleeps and returns its input (or a fixed value)."""
+
+    def tool(tool_input):
+        time.sleep(delay)
+        return tool_input if value is None else value
+
+    return tool
+
+
+class TestToolExecutor:
+    """Tests for concurrent, dependency-ordered tool calls."""
+
+    def test_independent_calls_overlap(self):
+        """Test that independent calls run concurrently."""
+        calls = [ToolCall(i, "sleep", i, _sleeper(0.2)) for i in range(8)]
+
+        started = time.monotonic()
+        outcomes = ToolExecutor(max_workers=8).run(calls)
+
+        assert time.monotonic() - started < 1.0
+        assert [o.result for o in outcomes] == list(range(8))
+
+    def test_dependencies_order_calls(self):
+        """Test that a call waits for calls reached through its dependencies."""
+        finished = []
+
+        def record(name, delay):
+            def tool(_):
+                time.sleep(delay)
+                finished.append(name)
+                return name
+
+            return tool
+
+        calls = [
+            ToolCall(0, "slow", None, record("slow", 0.2)),
+            ToolCall(2, "after", None, record("after", 0)),
+            ToolCall(3, "free", None, record("free", 0)),
+        ]
+
+        ToolExecutor().run(calls, dependencies={2: [1], 1: [0]})
+
+        assert finished == ["free", "slow", "after"]
+
+    def test_outcomes_delivered_in_order(self):
+        """Test that outcomes arrive in call order, not completion order."""
+        calls = [ToolCall(i, "sleep", i, _sleeper(0.05 * (3 - i))) for i in range(3)]
+        delivered = []
+
+        ToolExecutor().run(calls, on_outcome=lambda o: delivered.append(o.index))
+
+        assert delivered == [0, 1, 2]
+
+    def test_timeouts_and_errors(self):
+        """Test that slow and failing tools do not hold up the others."""
+        release = threading.Event()
+
+        async def slow_async(_):
+            await asyncio.sleep(10)
+
+        def fail(_):
+            error_msg = "boom"
+            raise RuntimeError(error_msg)
+
+        calls = [
+            ToolCall(0, "hung", None, lambda _: release.wait(10), timeout=0.1),
+            ToolCall(1, "async", None, slow_async, timeout=0.1),
+            ToolCall(2, "fail", None, fail),
+            ToolCall(3, "ok", "x", _sleeper(0)),
+        ]
+
+        started = time.monotonic()
+        outcomes = ToolExecutor(default_timeout=5).run(calls)
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert [o.timed_out for o in outcomes] == [True, True, False, False]
+        assert isinstance(outcomes[2].error, RuntimeError)
+        assert outcomes[3].ok
+        assert outcomes[3].result == "x"
+
+    def test_hung_call_frees_its_worker(self):
+        """Test that a queued call still runs once a hung call is abandoned."""
+        release = threading.Event()
+        calls = [
+            ToolCall(0, "hung", None, lambda _: release.wait(10), timeout=0.1),
+            ToolCall(1, "queued", "x", _sleeper(0.05), timeout=0.1),
+        ]
+
+        started = time.monotonic()
+        outcomes = ToolExecutor(max_workers=1).run(calls)
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert outcomes[0].timed_out
+        assert outcomes[1].ok
+        assert outcomes[1].result == "x"
+
+    def test_timeouts_raised_by_tools_are_errors(self):
+        """Test that only the executor's own timeouts count as timed out."""
+
+        async def slow_async(_):
+            await asyncio.sleep(10)
+
+        async def async_timeout(_):
+            raise asyncio.TimeoutError
+
+        def sync_timeout(_):
+            raise TimeoutError
+
+        with pytest.raises(ToolTimeoutError):
+            ToolExecutor().invoke(ToolCall(0, "slow", None, slow_async, 0.05), {})
+
+        outcomes = ToolExecutor(default_timeout=5).run(
+            [
+                ToolCall(0, "async", None, async_timeout),
+                ToolCall(1, "sync", None, sync_timeout),
+            ]
+        )
+        assert [o.timed_out for o in outcomes] == [False, False]
+        assert all(isinstance(o.error, asyncio.TimeoutError) for o in outcomes)
+
+    def test_cycle_rejected(self):
+        """Test that cyclic dependencies are reported."""
+        assert resolve_dependencies([0, 2], {2: [1], 1: [0]}) == {0: set(), 2: {0}}
+        with pytest.raises(ToolDependencyCycleError):
+            resolve_dependencies([0], {0: [1], 1: [0]})
+
+
+class TestCrewAIAgentTeamTools:
+    """Tests for tool execution in CrewAIAgentTeam.run."""
+
+    def test_results_become_task_context(self, caplog):
+        """Test that tool results are logged in order and added to tasks."""
+        team = CrewAIAgentTeam()
+        agent = team.add_agent(role="Math", goal="Compute", backstory="Numbers")
+        first = team.add_task(description="Calculate 6 * 7", agent=agent)
+        team.add_task(description="Write a poem", agent=agent)
+        last = team.add_task(description="Calculate 1 + 1", agent=agent)
+        last.context = [first]
+
+        with patch.object(team, "_create_crew") as create_crew, caplog.at_level(
+            "INFO", logger="agentic_reasoning"
+        ):
+            create_crew.return_value = MagicMock()
+            team.run()
+            team.run()
+
+        returned = [m for m in caplog.messages if "returned" in m]
+        assert returned[:2] == [
+            "Tool 'calculator' returned: 42",
+            "Tool 'calculator' returned: 2",
+        ]
+        assert first.description == "Calculate 6 * 7\n\nTool results:\n- calculator: 42"
+        assert team.tasks[1].description == "Write a poem"
+        assert [o.index for o in team.tool_outcomes] == [0, 2]
@@ -0,0 +1 @@
+"""AI models benchmarking tests package."""
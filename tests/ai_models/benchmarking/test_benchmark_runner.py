@@ -0,0 +1,150 @@
+"""test_benchmark_runner - Module for tests/ai_models/benchmarking.test_benchmark_runner."""
+
+# Standard library imports
+import csv
+import io
+import json
+
+# Third-party imports
+import pytest
+
+# Local imports
+from ai_models.adapters.adapter_factory import get_adapter
+from ai_models.adapters.fake_adapter import FakeAdapter
+from ai_models.benchmarking import (
+    BenchmarkConfig,
+    BenchmarkConfigError,
+    BenchmarkResult,
+    BenchmarkRunner,
+    UnsupportedAdapterOperationError,
+    find_regressions,
+    run_benchmark,
+)
+from ai_models.benchmarking.utils import percentile
+from ai_models.cli import main
+
+
+class TestFakeAdapter:
+    """Tests for the deterministic fake adapter."""
+
+    def test_outputs_are_deterministic(self):
+        """Test that the same input always produces the same output."""
+        first, second = FakeAdapter(), FakeAdapter()
+        assert first.generate_text("hi", max_tokens=5) == second.generate_text(
+            "hi", max_tokens=5
+        )
+        assert first.embed(["hi"]) == second.embed(["hi"])
+        assert first.embed(["hi"]) != first.embed(["bye"])
+
+    def test_registered_in_factory(self):
+        """Test that the factory builds the fake adapter."""
+        adapter = get_adapter("fake", "localhost", 0, latency_ms=1.0)
+        assert isinstance(adapter, FakeAdapter)
+        assert adapter.latency_ms == 1.0
+
+
+class TestBenchmarkRunner:
+    """Tests for the benchmark runner."""
+
+    def test_concurrency_sweep_reports_all_metrics(self):
+        """Test that each level reports latency, throughput and memory."""
+        result = run_benchmark(
+            num_runs=8, warmup_runs=2, concurrency_levels=[1, 2], max_tokens=4
+        )
+
+        assert [level.concurrency for level in result.levels] == [1, 2]
+        for level in result.levels:
+            assert set(level.latency) >= {"p50", "p90", "p99", "mean"}
+            assert level.throughput["requests"] == 8
+            assert level.throughput["tokens"] == 8 * 4
+            assert level.throughput["requests_per_sec"] > 0
+            assert level.memory["peak_rss_bytes"] > 0
+        assert result.throughput > 0
+
+    def test_warmup_requests_are_not_measured(self):
+        """Test that warm-up calls reach the adapter but not the metrics."""
+        adapter = FakeAdapter()
+        config = BenchmarkConfig(num_runs=5, warmup_runs=3)
+        result = BenchmarkRunner(config, adapter=adapter).run()
+
+        assert adapter.calls == 8
+        assert result.get_throughput_stats()["requests"] == 5
+
+    def test_failures_are_counted(self):
+        """Test that adapter errors are recorded as failed requests."""
+        config = BenchmarkConfig(num_runs=10, warmup_runs=0)
+        result = BenchmarkRunner(config, adapter=FakeAdapter(fail_every=2)).run()
+
+        stats = result.get_throughput_stats()
+        assert stats["errors"] == 5
+        assert stats["error_rate"] == 0.5
+
+    def test_embedding_operation(self):
+        """Test benchmarking the embed operation."""
+        result = run_benchmark(operation="embed", num_runs=4, warmup_runs=0)
+        assert result.get_throughput_stats()["tokens"] == 4
+
+    def test_adapter_without_operation_is_rejected(self):
+        """Test that adapters lacking the operation's methods are rejected."""
+        with pytest.raises(UnsupportedAdapterOperationError):
+            BenchmarkRunner(BenchmarkConfig(operation="embed"), adapter=object())
+
+    def test_invalid_config(self):
+        """Test configuration validation."""
+        with pytest.raises(BenchmarkConfigError):
+            BenchmarkConfig(concurrency_levels=[0])
+
+
+class TestBenchmarkResult:
+    """Tests for result serialization and comparison."""
+
+    def test_json_round_trip_and_csv(self, tmp_path):
+        """Test that results survive JSON and flatten to CSV."""
+        result = run_benchmark(num_runs=3, warmup_runs=0, concurrency_levels=[1, 2])
+        path = result.save(str(tmp_path / "result.json"))
+        loaded = BenchmarkResult.load(str(path))
+        assert loaded.get_latency_stats(2) == result.get_latency_stats(2)
+
+        rows = list(csv.DictReader(io.StringIO(result.to_csv())))
+        assert [row["concurrency"] for row in rows] == ["1", "2"]
+        assert rows[0]["adapter"] == "fake"
+
+    def test_find_regressions(self):
+        """Test that slower latency and lower throughput are reported."""
+        baseline = run_benchmark(num_runs=3, warmup_runs=0)
+        current = BenchmarkResult.from_dict(baseline.to_dict())
+        assert find_regressions(baseline, current) == []
+
+        current.levels[0].latency["p99"] = baseline.levels[0].latency["p99"] * 2
+        current.levels[0].throughput["requests_per_sec"] /= 2
+        assert len(find_regressions(baseline, current)) == 2
+
+    def test_failing_requests_are_regressions(self):
+        """Test that a higher error rate and all-failed levels are reported."""
+        baseline = run_benchmark(num_runs=4, warmup_runs=0)
+        config = BenchmarkConfig(num_runs=4, warmup_runs=0)
+        current = BenchmarkRunner(config, adapter=FakeAdapter(fail_every=1)).run()
+
+        regressions = find_regressions(baseline, current)
+        assert any("all 4 requests failed" in item for item in regressions)
+        assert any("error rate 0.0% -> 100.0%" in item for item in regressions)
+
+    def test_percentile_interpolates(self):
+        """Test linear interpolation between ranks."""
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+        assert percentile([5], 99) == 5
+        assert percentile([], 50) == 0.0
+
+
+class TestBenchmarkCommand:
+    """Tests for the benchmark CLI command."""
+
+    def test_writes_output_and_checks_baseline(self, tmp_path):
+        """Test that the command writes JSON and compares to a baseline."""
+        output = tmp_path / "out.json"
+        argv = ["benchmark", "--num-runs", "4", "--concurrency", "1,2"]
+        assert main([*argv, "--output", str(output)]) == 0
+
+        data = json.loads(output.read_text())
+        assert [level["concurrency"] for level in data["levels"]] == [1, 2]
+        assert main([*argv, "--baseline", str(output), "--tolerance", "100"]) == 0
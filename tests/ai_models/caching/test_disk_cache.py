@@ -1,7 +1,71 @@
 """test_disk_cache - Module for tests/ai_models/caching.test_disk_cache."""
 
 # Standard library imports
+import time
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.caching.cache_backends import DiskCache
+from ai_models.caching.cache_backends.disk_cache import InvalidCacheKeyError
+
+
+class TestDiskCache:
+    """Tests for the file-per-entry disk cache tier."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test a basic round trip."""
+        cache = DiskCache(tmp_path)
+        cache.set("abc123", b"Jvalue")
+        assert cache.get("abc123") == b"Jvalue"
+        assert cache.get("missing") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == len(b"Jvalue")
+
+    def test_index_is_rebuilt_on_restart(self, tmp_path):
+        """Test that entries and sizes are recovered from disk."""
+        DiskCache(tmp_path).set("abc123", b"Jvalue")
+        reopened = DiskCache(tmp_path)
+        assert len(reopened) == 1
+        assert reopened.get_stats()["bytes"] == len(b"Jvalue")
+        assert reopened.get("abc123") == b"Jvalue"
+
+    def test_expiry(self, tmp_path):
+        """Test that expired entries are removed on access."""
+        cache = DiskCache(tmp_path)
+        cache.set("abc123", b"Jvalue", expires_at=time.time() - 1)
+        assert cache.get("abc123") is None
+        assert len(cache) == 0
+
+    def test_get_entry_returns_expiry(self, tmp_path):
+        """Test that the stored expiry time is returned."""
+        cache = DiskCache(tmp_path)
+        expires_at = time.time() + 60
+        cache.set("abc123", b"Jvalue", expires_at=expires_at)
+        value, stored_expiry = cache.get_entry("abc123")
+        assert value == b"Jvalue"
+        assert stored_expiry == pytest.approx(expires_at)
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        """Test that least recently used files are evicted to meet the byte bound."""
+        cache = DiskCache(tmp_path, max_bytes=20)
+        evicted = []
+        cache.set_eviction_callback(lambda key, value, _: evicted.append((key, value)))
+        cache.set("aaa", b"x" * 8)
+        cache.set("bbb", b"y" * 8)
+        cache.get("aaa")
+        cache.set("ccc", b"z" * 8)
+
+        assert evicted == [("bbb", b"y" * 8)]
+        assert cache.get("bbb") is None
+        assert not (tmp_path / "bb" / "bbb.bin").exists()
+
+    def test_rejects_unsafe_keys(self, tmp_path):
+        """Test that path-like keys are rejected."""
+        cache = DiskCache(tmp_path)
+        with pytest.raises(InvalidCacheKeyError):
+            cache.set("../escape", b"Jvalue")
@@ -0,0 +1,244 @@
+"""test_single_flight - Module for tests/ai_models/caching.test_single_flight."""
+
+# Standard library imports
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Third-party imports
+import pytest
+
+# Local imports
+from ai_models.caching import (
+    AsyncSingleFlight,
+    CacheManager,
+    CoalescingCache,
+    SingleFlight,
+    cache_model_call,
+)
+from ai_models.caching.cache_manager import CACHE_MISS
+
+
+class TestSingleFlight:
+    """Tests for thread-based request coalescing."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers with the same key run the function once."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            leader = pool.submit(flight.do, "key", slow)
+            started.wait(5)
+            followers = [pool.submit(flight.do, "key", slow) for _ in range(7)]
+            while flight.get_stats()["coalesced"] < 7:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result(5)] + [f.result(5) for f in followers]
+
+        assert results == ["result"] * 8
+        assert calls == [1]
+        assert flight.get_stats() == {"leaders": 1, "coalesced": 7, "in_flight": 0}
+
+    def test_errors_propagate_to_all_waiters(self):
+        """Test that the leader's exception is raised in every caller."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            error_msg = "backend down"
+            raise RuntimeError(error_msg)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", failing)
+            started.wait(5)
+            follower = pool.submit(flight.do, "key", failing)
+            while flight.get_stats()["coalesced"] < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError, match="backend down"):
+                    future.result(5)
+
+        # The key is released after a failure, so the next call retries
+        assert flight.do("key", lambda: "recovered") == "recovered"
+
+    async def test_async_callers_of_blocking_function(self):
+        """Test that asyncio callers share one executor call."""
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.05)
+            return 42
+
+        results = await asyncio.gather(
+            *(flight.do_async("key", slow) for _ in range(5))
+        )
+        assert results == [42] * 5
+        assert calls == [1]
+
+
+class TestAsyncSingleFlight:
+    """Tests for coroutine request coalescing."""
+
+    async def test_concurrent_coroutines_share_one_call(self):
+        """Test that concurrent coroutine callers await one shared call."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(10)))
+        assert results == ["value"] * 10
+        assert calls == [1]
+        assert flight.get_stats()["coalesced"] == 9
+
+    async def test_cancelling_one_waiter_keeps_shared_call(self):
+        """Test that a cancelled waiter does not cancel the call for others."""
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_cancelling_all_waiters_cancels_shared_call(self):
+        """Test that the shared call is cancelled once nobody is waiting."""
+        flight = AsyncSingleFlight()
+        finished = []
+
+        async def fetch():
+            await asyncio.sleep(1)
+            finished.append(1)
+
+        waiter = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+        assert flight.in_flight() == 0
+        assert finished == []
+
+    async def test_caller_after_teardown_starts_fresh_call(self):
+        """Test that a caller arriving as the shared call is cancelled is served."""
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        waiter = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        late = asyncio.ensure_future(flight.do("key", fetch))
+
+        assert await late == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert flight.get_stats()["leaders"] == 2
+
+
+class TestCoalescingCache:
+    """Tests for coalescing on top of the cache manager."""
+
+    def test_cold_key_burst_hits_backend_once(self):
+        """Test that a burst of identical misses issues one backend call."""
+        coalescing = CoalescingCache(CacheManager())
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def embed():
+            calls.append(1)
+            time.sleep(0.05)
+            return [1.0, 2.0]
+
+        def worker():
+            barrier.wait(5)
+            return coalescing.get_or_compute("m", "embed", "chunk", embed)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: worker(), range(8)))
+
+        assert results == [[1.0, 2.0]] * 8
+        assert calls == [1]
+        # Later callers are served from the cache
+        assert coalescing.get_or_compute("m", "embed", "chunk", embed) == [1.0, 2.0]
+        assert calls == [1]
+
+    def test_miss_after_previous_leader_stored_is_not_recomputed(self):
+        """Test a caller that missed just before the previous flight stored."""
+        coalescing = CoalescingCache(CacheManager())
+        calls = []
+
+        def embed():
+            calls.append(1)
+            return [1.0, 2.0]
+
+        coalescing.get_or_compute("m", "embed", "chunk", embed)
+        # The lookup ran before the previous leader stored and released the key
+        lookup = coalescing._lookup  # noqa: SLF001
+        with patch.object(
+            coalescing,
+            "_lookup",
+            side_effect=lambda *args: (lookup(*args)[0], CACHE_MISS),
+        ):
+            assert coalescing.get_or_compute("m", "embed", "chunk", embed) == [1.0, 2.0]
+            assert asyncio.run(
+                coalescing.aget_or_compute("m", "embed", "chunk", embed)
+            ) == [1.0, 2.0]
+
+        assert calls == [1]
+
+    def test_non_deterministic_calls_are_not_coalesced(self):
+        """Test that sampled generations always call the backend."""
+        coalescing = CoalescingCache(CacheManager())
+        calls = []
+        params = {"temperature": 0.8}
+        for _ in range(2):
+            coalescing.get_or_compute(
+                "m", "generate", "hi", lambda: calls.append(1), params
+            )
+        assert calls == [1, 1]
+
+    async def test_decorated_async_function_coalesces(self):
+        """Test that the cache decorator coalesces concurrent coroutine calls."""
+        manager = CacheManager()
+        calls = []
+
+        @cache_model_call(manager, "m", "embed")
+        async def embed(text):
+            calls.append(text)
+            await asyncio.sleep(0.01)
+            return [0.5]
+
+        results = await asyncio.gather(*(embed("same") for _ in range(6)))
+        assert results == [[0.5]] * 6
+        assert calls == ["same"]
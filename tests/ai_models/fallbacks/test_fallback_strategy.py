@@ -1,7 +1,186 @@
 """test_fallback_strategy - Module for tests/ai_models/fallbacks.test_fallback_strategy."""
 
 # Standard library imports
+import threading
+import time
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.adapters.fake_adapter import FakeAdapter
+from ai_models.fallbacks import (
+    AllBackendsUnavailableError,
+    AttemptOutcome,
+    Backend,
+    CircuitBreaker,
+    CircuitState,
+    DeadlineExceededError,
+    FallbackExhaustedError,
+    FallbackStrategy,
+)
+from ai_models.performance_monitor import PerformanceMonitor
+
+
+def make_backend(name, delay=0.0, fail=False, **kwargs):
+    """Create a backend whose function sleeps and then returns or raises."""
+
+    def func(prompt):
+        time.sleep(delay)
+        if fail:
+            error_msg = f"{name} failed"
+            raise RuntimeError(error_msg)
+        return f"{name}:{prompt}"
+
+    return Backend(name, func, **kwargs)
+
+
+@pytest.fixture
+def stall():
+    """Event that releases stalled backends at the end of a test."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit breaker."""
+
+    def test_opens_and_recovers(self):
+        """Test closed -> open -> half-open -> closed transitions."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+        time.sleep(0.06)
+        assert breaker.allow_request()
+        # Only one trial request is allowed while half-open
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed half-open trial opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestFallbackStrategy:
+    """Tests for the fallback engine."""
+
+    def test_fails_over_to_next_backend(self):
+        """Test that an error moves on to the next backend."""
+        with FallbackStrategy(
+            [make_backend("primary", fail=True), make_backend("secondary")],
+            hedge=False,
+        ) as strategy:
+            result = strategy.call("hi")
+
+        assert result.value == "secondary:hi"
+        assert [a.outcome for a in result.attempts] == [
+            AttemptOutcome.ERROR,
+            AttemptOutcome.SUCCESS,
+        ]
+
+    def test_stalled_backend_times_out(self, stall):
+        """Test that a stalled backend is abandoned after its timeout."""
+        stalled = Backend("stalled", lambda _prompt: stall.wait(), timeout=0.05)
+        with FallbackStrategy(
+            [stalled, make_backend("secondary")], hedge=False
+        ) as strategy:
+            started = time.monotonic()
+            result = strategy.call("hi")
+
+        assert result.backend == "secondary"
+        assert time.monotonic() - started < 1
+        assert result.attempts[0].outcome == AttemptOutcome.TIMEOUT
+
+    def test_hedges_at_p95(self, stall):
+        """Test that a second backend is fired once the first exceeds its p95."""
+        primary_calls = []
+
+        def primary(prompt):
+            primary_calls.append(prompt)
+            if len(primary_calls) > 5:
+                stall.wait()
+            return "primary"
+
+        backends = [Backend("primary", primary), make_backend("secondary")]
+        with FallbackStrategy(
+            backends, hedge_min_samples=5, stats_refresh_interval=0
+        ) as strategy:
+            for _ in range(5):
+                assert strategy.call("warm").backend == "primary"
+            started = time.monotonic()
+            result = strategy.call("hi")
+
+        assert result.backend == "secondary"
+        assert result.hedged
+        assert time.monotonic() - started < 1
+        assert result.attempts[-1].outcome == AttemptOutcome.SUPERSEDED
+
+    def test_deadline_bounds_the_chain(self, stall):
+        """Test that the whole chain gives up at the deadline."""
+        backends = [
+            Backend("a", lambda _prompt: stall.wait()),
+            Backend("b", lambda _prompt: stall.wait()),
+        ]
+        with FallbackStrategy(backends, deadline=0.1, hedge_delay=0.02) as strategy:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError) as excinfo:
+                strategy.call("hi")
+
+        assert time.monotonic() - started < 1
+        assert {a.backend for a in excinfo.value.attempts} == {"a", "b"}
+
+    def test_circuit_breaker_skips_failing_backend(self):
+        """Test that an open circuit removes a backend from the chain."""
+        failing = make_backend(
+            "failing", fail=True, breaker=CircuitBreaker(failure_threshold=2)
+        )
+        with FallbackStrategy(
+            [failing, make_backend("healthy")], hedge=False
+        ) as strategy:
+            for _ in range(2):
+                strategy.call("hi")
+            result = strategy.call("hi")
+
+        assert [a.backend for a in result.attempts] == ["healthy"]
+        assert strategy.get_stats()["failing"]["circuit"] == "open"
+
+    def test_all_failed_and_unavailable(self):
+        """Test the errors raised when no backend can answer."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        with FallbackStrategy(
+            [make_backend("only", fail=True, breaker=breaker)], hedge=False
+        ) as strategy:
+            with pytest.raises(FallbackExhaustedError):
+                strategy.call("hi")
+            with pytest.raises(AllBackendsUnavailableError):
+                strategy.call("hi")
+
+    def test_ranks_by_latency(self):
+        """Test that a faster backend is preferred once measured."""
+        slow = make_backend("slow", delay=0.03)
+        fast = make_backend("fast")
+        with FallbackStrategy([slow, fast], hedge=False) as strategy:
+            slow.observe(0.03, error=False)
+            fast.observe(0.001, error=False)
+            assert strategy.call("hi").backend == "fast"
+
+    def test_adapter_backends_record_into_monitor(self):
+        """Test adapter backends and shared performance monitor statistics."""
+        monitor = PerformanceMonitor()
+        backend = Backend.from_adapter("fake", FakeAdapter())
+        with FallbackStrategy([backend], monitor=monitor) as strategy:
+            result = strategy.call("hello", max_tokens=3)
+
+        assert len(result.value["text"].split()) == 3
+        assert monitor.get_stats()["fake"]["requests"] == 1
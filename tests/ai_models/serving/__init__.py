@@ -0,0 +1 @@
+"""AI models serving tests package."""
@@ -0,0 +1,189 @@
+"""test_grpc_server - Module for tests/ai_models/serving.test_grpc_server."""
+
+# Standard library imports
+import asyncio
+import struct
+
+# Third-party imports
+import pytest
+
+# Local imports
+from ai_models.adapters.fake_adapter import FakeAdapter
+from ai_models.serving.grpc_server import (
+    CallDeadlineExceededError,
+    EmbedRequest,
+    EmbedResponse,
+    GenerateRequest,
+    GenerateResponse,
+    GRPCConfig,
+    GRPCServer,
+    InvalidArgumentError,
+    MessageDecodeError,
+    ModelServicer,
+)
+from ai_models.serving.server import ModelRuntime
+
+
+class FakeContext:
+    """Minimal servicer context with an optional deadline."""
+
+    def __init__(self, time_remaining=None):
+        """Initialize the context."""
+        self._time_remaining = time_remaining
+
+    def time_remaining(self):
+        """Return the seconds left before the deadline."""
+        return self._time_remaining
+
+
+async def requests(*items):
+    """Yield requests like a client stream."""
+    for item in items:
+        yield item
+
+
+def make_servicer(**adapter_options):
+    """Create a servicer for a fake model."""
+    runtime = ModelRuntime(
+        FakeAdapter(**adapter_options), "fake-grpc", max_batch_wait=0.01
+    )
+    return ModelServicer(runtime, GRPCConfig(max_tokens_limit=64))
+
+
+class TestMessages:
+    """Tests for the protobuf message encoding."""
+
+    def test_round_trip(self):
+        """Test that messages decode to what was encoded."""
+        messages = [
+            GenerateRequest("r1", "héllo", 12, 0.5),
+            GenerateRequest("r2", "x", -1),
+            GenerateResponse("r1", " token", 3, done=True),
+            EmbedRequest("r3", ["a", "", "c"]),
+            EmbedResponse.from_vectors("r4", [[0.5, -1.0], [2.0, 0.25]]),
+        ]
+        for message in messages:
+            assert type(message).FromString(message.SerializeToString()) == message
+
+    def test_wire_format(self):
+        """Test the encoding against hand-assembled protobuf bytes."""
+        data = GenerateRequest("a", "", 300).SerializeToString()
+        assert data == b"\x0a\x01a\x18\xac\x02"
+
+        response = EmbedResponse.from_vectors("", [[1.0, 2.0]])
+        packed = struct.pack("<2f", 1.0, 2.0)
+        assert response.SerializeToString() == b"\x10\x02\x1a\x08" + packed
+        assert response.vectors() == [[1.0, 2.0]]
+
+    def test_unknown_and_unpacked_fields(self):
+        """Test that unknown fields are skipped and unpacked floats accepted."""
+        unknown = b"\x78\x05" + b"\x82\x01\x02hi"  # fields 15 (varint), 16 (bytes)
+        unpacked = b"\x1d" + struct.pack("<f", 1.5) + b"\x1d" + struct.pack("<f", 2.5)
+        response = EmbedResponse.FromString(b"\x10\x01" + unknown + unpacked)
+        assert response.vectors() == [[1.5], [2.5]]
+
+    def test_truncated(self):
+        """Test that truncated data is rejected."""
+        data = EmbedRequest("r", ["hello"]).SerializeToString()
+        with pytest.raises(MessageDecodeError):
+            EmbedRequest.FromString(data[:-2])
+
+
+class TestModelServicer:
+    """Tests for the servicer methods."""
+
+    async def test_generate(self):
+        """Test a unary completion."""
+        servicer = make_servicer()
+        response = await servicer.Generate(GenerateRequest("g", "hi", 5), FakeContext())
+        assert response.request_id == "g"
+        assert response.done
+        assert response.completion_tokens == 5
+
+    async def test_generate_stream(self):
+        """Test that chunks of each request concatenate to its completion."""
+        servicer = make_servicer()
+        full = await servicer.Generate(GenerateRequest("", "hi", 4), FakeContext())
+        chunks = [
+            chunk
+            async for chunk in servicer.GenerateStream(
+                requests(GenerateRequest("a", "hi", 4), GenerateRequest("b", "yo", 2)),
+                FakeContext(),
+            )
+        ]
+        by_request = {"a": [], "b": []}
+        for chunk in chunks:
+            by_request[chunk.request_id].append(chunk)
+        assert "".join(c.text for c in by_request["a"]) == full.text
+        assert [c.done for c in by_request["a"]] == [False] * 4 + [True]
+        assert by_request["b"][-1].completion_tokens == 2
+
+    async def test_embed_stream_shares_batches(self):
+        """Test that requests pipelined on a stream are batched together."""
+        servicer = make_servicer()
+        stream = requests(*(EmbedRequest(str(i), [f"text {i}"]) for i in range(6)))
+        responses = [r async for r in servicer.EmbedStream(stream, FakeContext())]
+
+        assert sorted(r.request_id for r in responses) == [str(i) for i in range(6)]
+        assert all(len(r.vectors()) == 1 and r.dimensions == 8 for r in responses)
+        stats = servicer.runtime.embedding_scheduler.get_stats()
+        assert stats["batches"] < 6
+        await servicer.runtime.close()
+
+    async def test_embed_matches_adapter(self):
+        """Test that packed vectors carry the model's embeddings."""
+        servicer = make_servicer()
+        response = await servicer.Embed(EmbedRequest("e", ["a", "b"]), FakeContext())
+        expected = FakeAdapter().embed(["a", "b"])
+        assert response.vectors() == [pytest.approx(v, rel=1e-6) for v in expected]
+        await servicer.runtime.close()
+
+    async def test_deadline(self):
+        """Test that slow calls fail with DEADLINE_EXCEEDED."""
+        servicer = make_servicer(latency_ms=200)
+        with pytest.raises(CallDeadlineExceededError):
+            await servicer._generate(  # noqa: SLF001
+                GenerateRequest("", "hi"), asyncio.get_running_loop().time() + 0.05
+            )
+
+    async def test_invalid_max_tokens(self):
+        """Test that max_tokens above the limit is rejected."""
+        servicer = make_servicer()
+        stream = servicer._serve_stream(  # noqa: SLF001
+            requests(GenerateRequest("", "hi", 65)),
+            FakeContext(),
+            servicer._stream_tokens,  # noqa: SLF001
+        )
+        with pytest.raises(InvalidArgumentError):
+            [chunk async for chunk in stream]
+
+
+class TestGRPCServer:
+    """End-to-end tests over a real channel."""
+
+    async def test_unary_and_streaming_calls(self):
+        """Test calls through grpc.aio with the message codecs."""
+        grpc = pytest.importorskip("grpc")
+        server = GRPCServer(GRPCConfig(port=0, model_id="fake-e2e"))
+        port = await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                embed = channel.unary_unary(
+                    "/ai_models.v1.ModelService/Embed",
+                    request_serializer=EmbedRequest.SerializeToString,
+                    response_deserializer=EmbedResponse.FromString,
+                )
+                response = await embed(EmbedRequest("x", ["a", "b"]), timeout=5)
+                assert len(response.vectors()) == 2
+
+                stream = channel.stream_stream(
+                    "/ai_models.v1.ModelService/GenerateStream",
+                    request_serializer=GenerateRequest.SerializeToString,
+                    response_deserializer=GenerateResponse.FromString,
+                )
+                chunks = [
+                    c async for c in stream(requests(GenerateRequest("s", "hi", 3)))
+                ]
+                assert chunks[-1].done
+        finally:
+            await server.stop(0)
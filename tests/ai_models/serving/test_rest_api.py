@@ -0,0 +1,204 @@
+"""test_rest_api - Module for tests/ai_models/serving.test_rest_api."""
+
+# Standard library imports
+import asyncio
+import base64
+import json
+import struct
+import threading
+
+# Third-party imports
+import pytest
+from fastapi.testclient import TestClient
+
+# Local imports
+from ai_models.serving.batching import BatchScheduler, BatchSizeMismatchError
+from ai_models.serving.rest_api import AdmissionController, RESTConfig, create_app
+
+
+def make_client(**overrides):
+    """Create a test client for an app serving a fake model."""
+    config = RESTConfig(model_id="fake-rest", **overrides)
+    return TestClient(create_app(config))
+
+
+class TestBatchScheduler:
+    """Tests for the micro-batching scheduler."""
+
+    async def test_concurrent_submits_share_a_batch(self):
+        """Test that concurrent requests are merged into one batch call."""
+        calls = []
+
+        def batch_fn(items):
+            calls.append(list(items))
+            return [item.upper() for item in items]
+
+        scheduler = BatchScheduler(batch_fn, max_batch_size=16, max_wait=0.02)
+        results = await asyncio.gather(
+            scheduler.submit_many(["a", "b"]),
+            scheduler.submit("c"),
+            scheduler.submit_many(["d"]),
+        )
+        await scheduler.close()
+
+        assert results == [["A", "B"], "C", ["D"]]
+        assert len(calls) == 1
+        assert scheduler.get_stats()["mean_batch_size"] == 4
+
+    async def test_batches_are_capped(self):
+        """Test that batches never exceed max_batch_size."""
+        sizes = []
+
+        def batch_fn(items):
+            sizes.append(len(items))
+            return items
+
+        scheduler = BatchScheduler(batch_fn, max_batch_size=3, max_wait=0.01)
+        assert await scheduler.submit_many(list(range(10))) == list(range(10))
+        await scheduler.close()
+        assert max(sizes) == 3
+        assert sum(sizes) == 10
+
+    async def test_errors_reach_every_waiter(self):
+        """Test that a failed batch raises in each request."""
+        scheduler = BatchScheduler(lambda items: items[:-1], max_wait=0.01)
+        with pytest.raises(BatchSizeMismatchError):
+            await scheduler.submit_many(["a", "b"])
+        await scheduler.close()
+
+
+class TestAdmissionController:
+    """Tests for admission control."""
+
+    async def test_rejects_beyond_queue(self):
+        """Test that requests beyond the running and queued limits are refused."""
+        controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5)
+        assert await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+        assert not await controller.acquire()
+
+        controller.release()
+        assert await waiter
+        controller.release()
+        assert controller.get_stats()["rejected"] == 1
+
+    async def test_queue_timeout(self):
+        """Test that waiting longer than queue_timeout is refused."""
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=4, queue_timeout=0.01
+        )
+        assert await controller.acquire()
+        assert not await controller.acquire()
+
+
+class TestRESTAPI:
+    """Tests for the REST endpoints."""
+
+    def test_embeddings_batch(self):
+        """Test embedding an array of texts."""
+        client = make_client()
+        response = client.post("/v1/embeddings", json={"input": ["a b", "c", "d"]})
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["index"] for item in body["data"]] == [0, 1, 2]
+        assert all(len(item["embedding"]) == 8 for item in body["data"])
+        assert body["usage"]["prompt_tokens"] == 4
+
+    def test_embeddings_base64(self):
+        """Test that base64 encoding returns the same float32 vector."""
+        client = make_client()
+        floats = client.post("/v1/embeddings", json={"input": "hello"}).json()
+        encoded = client.post(
+            "/v1/embeddings", json={"input": "hello", "encoding_format": "base64"}
+        ).json()
+        raw = base64.b64decode(encoded["data"][0]["embedding"])
+        vector = struct.unpack(f"<{len(raw) // 4}f", raw)
+        assert vector == pytest.approx(floats["data"][0]["embedding"], rel=1e-6)
+
+    def test_embeddings_input_limit(self):
+        """Test that oversized requests are rejected."""
+        client = make_client(max_inputs_per_request=2)
+        response = client.post("/v1/embeddings", json={"input": ["a", "b", "c"]})
+        assert response.status_code == 413
+
+    def test_completion(self):
+        """Test a non-streaming completion."""
+        client = make_client()
+        response = client.post(
+            "/v1/completions", json={"prompt": "hi", "max_tokens": 4}
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["choices"][0]["text"]
+        assert body["usage"]["completion_tokens"] == 4
+
+    def test_completion_stream(self):
+        """Test that streamed chunks concatenate to the completion."""
+        client = make_client()
+        full = client.post("/v1/completions", json={"prompt": "hi", "max_tokens": 5})
+        with client.stream(
+            "POST",
+            "/v1/completions",
+            json={"prompt": "hi", "max_tokens": 5, "stream": True},
+        ) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                line[len("data: ") :]
+                for line in response.iter_lines()
+                if line.startswith("data: ")
+            ]
+        assert events[-1] == "[DONE]"
+        text = "".join(json.loads(e)["choices"][0]["text"] for e in events[:-1])
+        assert text == full.json()["choices"][0]["text"]
+
+    def test_max_tokens_limit(self):
+        """Test that max_tokens above the server limit is rejected."""
+        client = make_client(max_tokens_limit=8)
+        response = client.post(
+            "/v1/completions", json={"prompt": "hi", "max_tokens": 9}
+        )
+        assert response.status_code == 422
+
+    def test_overload_returns_429(self):
+        """Test that requests beyond capacity get 429 while health stays up."""
+        config = {
+            "adapter_options": {"latency_ms": 300},
+            "max_concurrent_requests": 1,
+            "max_queue_size": 0,
+        }
+        statuses = []
+        with make_client(**config) as client:
+            slow = threading.Thread(
+                target=lambda: statuses.append(
+                    client.post("/v1/completions", json={"prompt": "x"}).status_code
+                )
+            )
+            slow.start()
+            while client.get("/health").json()["admission"]["active"] == 0:
+                pass
+            rejected = client.post("/v1/completions", json={"prompt": "y"})
+            slow.join()
+        assert rejected.status_code == 429
+        assert rejected.headers["retry-after"] == "1"
+        assert statuses == [200]
+
+    def test_api_key(self):
+        """Test API key authentication."""
+        client = make_client(enable_auth=True, api_keys=["secret"])
+        assert client.get("/health").status_code == 200
+        url = "/v1/embeddings"
+        assert client.post(url, json={"input": "a"}).status_code == 401
+        response = client.post(
+            url, json={"input": "a"}, headers={"Authorization": "Bearer secret"}
+        )
+        assert response.status_code == 200
+
+    def test_health(self):
+        """Test the health endpoint reports the model and batching stats."""
+        client = make_client()
+        client.post("/v1/embeddings", json={"input": ["a", "b"]})
+        body = client.get("/health").json()
+        assert body["status"] == "ok"
+        assert body["model"] == "fake-rest"
+        assert body["embedding_batches"]["items"] >= 2
@@ -0,0 +1,95 @@
+"""test_artist_agent - Module for tests/ai_models.test_artist_agent."""
+
+from __future__ import annotations
+
+# Standard library imports
+import threading
+from typing import ClassVar
+
+# Third-party imports
+import pytest
+
+# Local imports
+from ai_models.artist_agent import ArtistAgent, ToolRoute, benchmark_throughput
+from artist_experiments.multi_api_orchestration import MultiAPIAgent
+
+
+class _EchoAgent(ArtistAgent):
+    """Agent with a custom dispatch table and thread-recording tools."""
+
+    dispatch_table = (
+        ToolRoute("shout", ("loud", "!")),
+        ToolRoute("echo", ("say",)),
+    )
+    extractors: ClassVar[dict] = {"shout": str.upper}
+
+    def __init__(self) -> None:
+        self.threads: set[str] = set()
+
+        def record(text):
+            self.threads.add(threading.current_thread().name)
+            return text
+
+        self.tools = {"shout": {"func": record}, "echo": {"func": record}}
+
+
+class TestDispatchTable:
+    """Tests for declarative tool dispatch."""
+
+    def test_first_route_wins(self):
+        """Test route priority and case-insensitive keywords."""
+        agent = _EchoAgent()
+
+        assert agent.decide_tool("SAY it LOUD") == "shout"
+        assert agent.decide_tool("Say hi") == "echo"
+        assert agent.decide_tool("nothing") == ""
+
+    def test_compiled_once_per_class(self):
+        """Test that each class compiles its own table once."""
+        compiled = _EchoAgent.compiled_dispatch()
+
+        assert _EchoAgent.compiled_dispatch() is compiled
+        assert [tool for tool, _ in ArtistAgent.compiled_dispatch()] == ["calculator"]
+        assert [tool for tool, _ in MultiAPIAgent.compiled_dispatch()] == [
+            "search_products",
+            "get_market_trends",
+            "analyze_competitors",
+        ]
+
+    @pytest.mark.parametrize(
+        ("prompt", "tool", "expected"),
+        [
+            ("What is 12 * (3 + 4)?", "calculator", "12 * (3 + 4)"),
+            ("Run ```python\nprint(1)\n```", "code_executor", "print(1)"),
+            ("I love it", "text_analyzer", "I love it"),
+            ("hi", "text_analyzer", ""),
+        ],
+    )
+    def test_extractors(self, prompt, tool, expected):
+        """Test the precompiled extractors and the length cut-off."""
+        assert ArtistAgent().extract_relevant_expression(prompt, tool) == expected
+
+
+class TestRunMany:
+    """Tests for batch prompt processing."""
+
+    def test_results_in_order_on_pool(self):
+        """Test that run_many keeps order and uses worker threads."""
+        agent = _EchoAgent()
+        prompts = [f"say {i}" if i % 2 else f"loud {i}" for i in range(40)]
+
+        results = agent.run_many(prompts, max_workers=4)
+
+        assert results == [agent.run(p) for p in prompts]
+        assert results[:2] == ["LOUD 0", "say 1"]
+        assert any(name.startswith("artist") for name in agent.threads)
+
+    def test_calculator_batch_and_benchmark(self):
+        """Test real tools through run_many and the throughput report."""
+        agent = ArtistAgent()
+        prompts = [f"Calculate {i} + 1" for i in range(20)]
+
+        assert agent.run_many(prompts)[:2] == ["1", "2"]
+        rates = benchmark_throughput(agent, prompts, rounds=1)
+        assert set(rates) == {"decide_tool", "run", "run_many"}
+        assert all(rate > 0 for rate in rates.values())
@@ -1,7 +1,263 @@
 """test_caching - Module for tests/ai_models.test_caching."""
 
 # Standard library imports
+import json
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.caching import (
+    CacheConfig,
+    CacheConfigError,
+    CacheManager,
+    MemoryCache,
+    cache_model_call,
+    cached_embed_batch,
+    generate_cache_key,
+    is_deterministic,
+)
+from ai_models.caching.cache_backends import (
+    CacheEncodingError,
+    decode_value,
+    encode_value,
+)
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_key_is_stable_across_parameter_order(self):
+        """Test that parameter ordering does not change the key."""
+        key_a = generate_cache_key("m", "generate", "hi", {"a": 1, "b": 2})
+        key_b = generate_cache_key("m", "generate", "hi", {"b": 2, "a": 1})
+        assert key_a == key_b
+        assert len(key_a) == 64
+
+    def test_key_ignores_output_neutral_parameters(self):
+        """Test that stream/timeout parameters are ignored."""
+        key_a = generate_cache_key("m", "generate", "hi", {"temperature": 0})
+        key_b = generate_cache_key(
+            "m", "generate", "hi", {"temperature": 0, "timeout": 30}
+        )
+        assert key_a == key_b
+
+    def test_key_differs_by_model_and_input(self):
+        """Test that model and input are part of the key."""
+        base = generate_cache_key("m", "embed", "hi")
+        assert base != generate_cache_key("other", "embed", "hi")
+        assert base != generate_cache_key("m", "embed", "hello")
+
+    @pytest.mark.parametrize(
+        ("operation", "parameters", "expected"),
+        [
+            ("embed", {"temperature": 0.9}, True),
+            ("generate", {"temperature": 0}, True),
+            ("generate", {"temperature": 0.7, "seed": 42}, True),
+            ("generate", {"temperature": 0.7}, False),
+            ("generate", {}, False),
+        ],
+    )
+    def test_is_deterministic(self, operation, parameters, expected):
+        """Test detection of deterministic calls."""
+        assert is_deterministic(operation, parameters) is expected
+
+
+class TestValueEncoding:
+    """Tests for the compact value encoding."""
+
+    def test_float_vector_round_trip_is_compact(self):
+        """Test that float vectors are stored as packed doubles."""
+        vector = [0.1 * i for i in range(384)]
+        data = encode_value(vector)
+        assert decode_value(data) == vector
+        assert len(data) < len(json.dumps(vector))
+        assert len(data) == 2 + 8 * len(vector)
+
+    def test_float32_vector_halves_size(self):
+        """Test that the float32 typecode stores 4 bytes per value."""
+        vector = [0.5, 0.25, -1.0]
+        data = encode_value(vector, vector_dtype="f")
+        assert len(data) == 2 + 4 * len(vector)
+        assert decode_value(data) == vector
+
+    def test_matrix_round_trip(self):
+        """Test that batches of vectors round-trip."""
+        matrix = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        assert decode_value(encode_value(matrix)) == matrix
+
+    def test_json_fallback(self):
+        """Test that non-vector values use JSON."""
+        value = {"text": "hello", "tokens": [1, 2, 3]}
+        assert decode_value(encode_value(value)) == value
+
+    def test_object_ndarray_is_not_encodable(self):
+        """Test that arrays of Python objects are rejected, not stored as pointers."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(CacheEncodingError, match="object"):
+            encode_value(np.array([{"a": 1}, None], dtype=object))
+        assert decode_value(encode_value(np.arange(3))).tolist() == [0, 1, 2]
+
+
+class TestCacheManager:
+    """Tests for the tiered cache manager."""
+
+    def test_memory_only_hit_and_miss(self):
+        """Test basic get/set and statistics with a single tier."""
+        manager = CacheManager(CacheConfig(backend="memory"))
+        params = {"temperature": 0}
+
+        assert manager.get("gpt2", "generate", "Hello", params) is None
+        assert manager.set("gpt2", "generate", "Hello", "World", params)
+        assert manager.get("gpt2", "generate", "Hello", params) == "World"
+
+        stats = manager.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] > 0
+
+    def test_non_deterministic_calls_are_not_cached(self):
+        """Test that sampled generations bypass the cache."""
+        manager = CacheManager()
+        params = {"temperature": 0.7}
+        assert manager.set("gpt2", "generate", "Hello", "World", params) is False
+        assert manager.get("gpt2", "generate", "Hello", params) is None
+        assert manager.get_stats()["skipped"] == 1
+
+    def test_model_filter(self):
+        """Test that only configured models are cached."""
+        manager = CacheManager(CacheConfig(models=["allowed"]))
+        assert manager.set("other", "embed", "x", [1.0]) is False
+        assert manager.set("allowed", "embed", "x", [1.0]) is True
+
+    def test_invalid_backend(self):
+        """Test that unsupported backends are rejected."""
+        with pytest.raises(CacheConfigError):
+            CacheConfig(backend="memcached")
+
+    def test_demotion_and_promotion_with_sqlite(self, tmp_path):
+        """Test that memory evictions land in SQLite and hits are promoted back."""
+        config = CacheConfig(backend="sqlite", max_size=2, cache_dir=str(tmp_path))
+        with CacheManager(config) as manager:
+            for i in range(3):
+                manager.set("m", "embed", f"text-{i}", [float(i), 1.0])
+
+            assert len(manager.memory) == 2
+            assert len(manager.backend) == 1
+
+            # text-0 was demoted; reading it promotes it back into memory
+            assert manager.get("m", "embed", "text-0") == [0.0, 1.0]
+            key = generate_cache_key("m", "embed", "text-0")
+            assert manager.memory.get_entry(key) is not None
+            assert manager.get_stats()["tiers"]["sqlite"]["hits"] == 1
+
+    def test_close_flushes_memory_to_persistent_tier(self, tmp_path):
+        """Test that entries survive a restart via the second tier."""
+        config = CacheConfig(backend="sqlite", cache_dir=str(tmp_path))
+        with CacheManager(config) as manager:
+            manager.set("m", "embed", "persist me", [0.5, 0.25])
+
+        with CacheManager(config) as manager:
+            assert manager.get("m", "embed", "persist me") == [0.5, 0.25]
+
+    def test_undecodable_entry_is_a_miss(self):
+        """Test that a corrupt entry is dropped instead of failing every lookup."""
+        manager = CacheManager()
+        key = generate_cache_key("m", "embed", "x")
+        manager.memory.set(key, b"?garbage", None)
+
+        assert manager.get_by_key(key, "miss") == "miss"
+        assert manager.memory.get_entry(key) is None
+        assert manager.set("m", "embed", "x", [1.0])
+        assert manager.get("m", "embed", "x") == [1.0]
+
+    def test_get_or_compute_caches_none(self):
+        """Test that a cached None is distinguished from a miss."""
+        manager = CacheManager()
+        calls = []
+
+        def compute():
+            calls.append(1)
+
+        manager.get_or_compute("m", "embed", "x", compute)
+        manager.get_or_compute("m", "embed", "x", compute)
+        assert len(calls) == 1
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU tier."""
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted."""
+        cache = MemoryCache(max_entries=2)
+        evicted = []
+        cache.set_eviction_callback(lambda key, *_: evicted.append(key))
+        cache.set("aaa", b"J1")
+        cache.set("bbb", b"J2")
+        cache.get("aaa")
+        cache.set("ccc", b"J3")
+        assert evicted == ["bbb"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test that the byte bound is enforced."""
+        cache = MemoryCache(max_entries=100, max_bytes=10)
+        cache.set("aaa", b"x" * 6)
+        cache.set("bbb", b"y" * 6)
+        assert len(cache) == 1
+        assert cache.get_stats()["bytes"] == 6
+
+    def test_expired_entries_miss(self):
+        """Test that expired entries are treated as misses."""
+        cache = MemoryCache()
+        cache.set("aaa", b"J1", expires_at=0.0)
+        assert cache.get("aaa") is None
+        assert cache.get_stats()["expirations"] == 1
+
+
+class TestCacheIntegration:
+    """Tests for the model-call helpers."""
+
+    def test_cache_model_call_decorator(self):
+        """Test that a decorated function is only called once per input."""
+        manager = CacheManager()
+        calls = []
+
+        @cache_model_call(manager, "m", "generate")
+        def generate(prompt, **_params):
+            calls.append(prompt)
+            return prompt.upper()
+
+        assert generate("hi", temperature=0) == "HI"
+        assert generate("hi", temperature=0) == "HI"
+        assert calls == ["hi"]
+
+    async def test_cache_model_call_async(self):
+        """Test the decorator with a coroutine function."""
+        manager = CacheManager()
+        calls = []
+
+        @cache_model_call(manager, "m", "embed")
+        async def embed(text):
+            calls.append(text)
+            return [1.0, 2.0]
+
+        assert await embed("hi") == [1.0, 2.0]
+        assert await embed("hi") == [1.0, 2.0]
+        assert calls == ["hi"]
+
+    def test_cached_embed_batch_only_embeds_missing(self):
+        """Test that only uncached, unique texts reach the embedder."""
+        manager = CacheManager()
+        batches = []
+
+        def embed(texts):
+            batches.append(list(texts))
+            return [[float(len(t)), 0.0] for t in texts]
+
+        first = cached_embed_batch(manager, "m", ["a", "bb", "a"], embed)
+        second = cached_embed_batch(manager, "m", ["bb", "ccc"], embed)
+
+        assert first == [[1.0, 0.0], [2.0, 0.0], [1.0, 0.0]]
+        assert second == [[2.0, 0.0], [3.0, 0.0]]
+        assert batches == [["a", "bb"], ["ccc"]]
@@ -0,0 +1,205 @@
+"""test_data_collector - Module for tests/ai_models.test_data_collector."""
+
+from __future__ import annotations
+
+# Standard library imports
+import gzip
+import json
+from types import SimpleNamespace
+
+# Third-party imports
+import pytest
+
+# Local imports
+from ai_models.fine_tuning import (
+    BloomFilter,
+    DataCollectionConfig,
+    DataCollectionConfigError,
+    DataCollector,
+    ShardedWriter,
+    build_training_set,
+    iter_records,
+    run_and_collect,
+)
+from ai_models.fine_tuning.data_collector import content_hash
+
+
+def _records(count, start=0):
+    """Build distinct prompt/completion records."""
+    return [
+        {"prompt": f"question {i}", "completion": f"answer {i}", "timestamp": i}
+        for i in range(start, start + count)
+    ]
+
+
+def _read_shard(path):
+    """Read the records of a gzip JSONL shard."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+class TestDataCollector:
+    """Tests for deduplicated, sharded collection."""
+
+    def test_dedupes_on_content(self, tmp_path):
+        """Test that records differing only in ignored keys are dropped."""
+        config = DataCollectionConfig(output_dir=str(tmp_path))
+        records = [*_records(3), {**_records(1)[0], "timestamp": 99}]
+
+        with DataCollector(config) as collector:
+            written = collector.add_many(records)
+
+        assert written == 3
+        assert collector.stats.duplicates == 1
+        shard = tmp_path / "part-00000.jsonl.gz"
+        assert [r["prompt"] for r in _read_shard(shard)] == [
+            "question 0",
+            "question 1",
+            "question 2",
+        ]
+
+    def test_dedupe_state_persists_across_runs(self, tmp_path):
+        """Test that a later run skips records collected before."""
+        config = DataCollectionConfig(output_dir=str(tmp_path), dedupe_capacity=1000)
+        with DataCollector(config) as collector:
+            collector.add_many(_records(5))
+
+        with DataCollector(config) as collector:
+            written = collector.add_many(_records(8))
+
+        assert written == 3
+        assert sorted(p.name for p in tmp_path.glob("part-*")) == [
+            "part-00000.jsonl.gz",
+            "part-00001.jsonl.gz",
+        ]
+
+    def test_rolls_shards_by_records_and_time(self, tmp_path):
+        """Test size- and time-based shard rolling."""
+        by_records = DataCollectionConfig(
+            output_dir=str(tmp_path / "records"), shard_max_records=4
+        )
+        by_time = DataCollectionConfig(
+            output_dir=str(tmp_path / "time"), shard_max_seconds=0.0
+        )
+
+        with DataCollector(by_records) as collector:
+            collector.add_many(_records(10))
+        manifest = DataCollector(by_time).close()
+        with DataCollector(by_time) as collector:
+            collector.add_many(_records(3))
+
+        assert len(list((tmp_path / "records").glob("part-*"))) == 3
+        assert len(list((tmp_path / "time").glob("part-*"))) == 3
+        assert manifest["stats"]["written"] == 0
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_filters_and_splits(self, tmp_path):
+        """Test length filtering and hash-based splits."""
+        config = DataCollectionConfig(
+            output_dir=str(tmp_path),
+            min_length=5,
+            validation_split=0.2,
+            test_split=0.2,
+        )
+        records = [*_records(200), {"prompt": "hi"}]
+
+        with DataCollector(config) as collector:
+            collector.add_many(records)
+            collector.add("not a record")
+
+        stats = collector.stats
+        assert stats.filtered == 1
+        assert stats.invalid == 1
+        assert sum(stats.splits.values()) == 200
+        assert 20 < stats.splits["test"] < 60
+        test_records = list(iter_records(tmp_path / "test"))
+        assert len(test_records) == stats.splits["test"]
+
+    def test_invalid_config(self):
+        """Test that impossible settings are rejected."""
+        with pytest.raises(DataCollectionConfigError):
+            DataCollectionConfig(compression="zstd")
+        with pytest.raises(DataCollectionConfigError):
+            DataCollectionConfig(validation_split=0.5, test_split=0.5)
+
+
+class TestBloomFilter:
+    """Tests for the fixed-size duplicate filter."""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is found again."""
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        digests = [content_hash({"i": i}) for i in range(2000)]
+
+        new = sum(bloom.add(digest) for digest in digests)
+
+        assert new > 1950
+        assert not any(bloom.add(digest) for digest in digests)
+        assert len(bloom.bits) < 2500
+
+
+class TestShardedWriter:
+    """Tests for shard output formats."""
+
+    def test_parquet_round_trip(self, tmp_path):
+        """Test Parquet shards, nested values and schema changes."""
+        pytest.importorskip("pyarrow")
+        writer = ShardedWriter(
+            tmp_path, output_format="parquet", compression="zstd", row_group_size=2
+        )
+        records = [
+            {"prompt": "a", "score": 1, "messages": [{"role": "user"}]},
+            {"prompt": "b", "score": 2.5, "messages": None},
+            {"prompt": "c", "score": 3, "messages": []},
+            {"prompt": "d", "extra": True},
+        ]
+
+        for record in records:
+            writer.write(record)
+        shards = writer.close()
+
+        assert len(shards) == 2
+        read = list(iter_records(tmp_path))
+        assert read[0]["messages"] == [{"role": "user"}]
+        assert read[1]["score"] == 2.5
+        assert read[3] == {"prompt": "d", "extra": True}
+
+
+class TestWorkflows:
+    """Tests for collection workflows."""
+
+    def test_run_and_collect(self, tmp_path):
+        """Test that a team run becomes a prompt/completion record."""
+        agent = SimpleNamespace(role="Researcher")
+        team = SimpleNamespace(
+            agents=[agent],
+            tasks=[SimpleNamespace(description="Find niches", agent=agent)],
+            user_id="u1",
+            run=lambda: "Three niches",
+        )
+        config = DataCollectionConfig(output_dir=str(tmp_path), compression=None)
+
+        with DataCollector(config) as collector:
+            assert run_and_collect(team, collector, source="test") == "Three niches"
+
+        (record,) = iter_records(tmp_path / "part-00000.jsonl")
+        assert record["prompt"] == "Find niches"
+        assert record["completion"] == "Three niches"
+        assert record["metadata"] == {"source": "test", "user_id": "u1"}
+
+    def test_build_training_set_streams_logs(self, tmp_path):
+        """Test rebuilding a dataset from logs with duplicates and bad lines."""
+        log = tmp_path / "logs" / "day1.jsonl"
+        log.parent.mkdir()
+        lines = [json.dumps(r) for r in _records(5) + _records(5)] + ["{broken"]
+        log.write_text("\n".join(lines))
+
+        manifest = build_training_set(
+            [log.parent], DataCollectionConfig(output_dir=str(tmp_path / "out"))
+        )
+
+        assert manifest["stats"]["written"] == 5
+        assert manifest["stats"]["duplicates"] == 5
+        assert manifest["stats"]["invalid"] == 1
+        assert manifest["shards"]["train"] == ["part-00000.jsonl.gz"]
+        assert (tmp_path / "out" / "manifest.json").is_file()
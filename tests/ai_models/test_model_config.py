@@ -3,5 +3,39 @@
 # Standard library imports
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.model_config import ModelConfig, ModelConfigError
+
+
+class TestModelConfig:
+    """Tests for the model manager configuration."""
+
+    def test_explicit_budget(self):
+        """Test that an explicit budget is used as is."""
+        assert ModelConfig(memory_budget_bytes=1024).get_memory_budget() == 1024
+
+    def test_budget_from_fraction(self):
+        """Test that the default budget is a fraction of system memory."""
+        psutil = pytest.importorskip("psutil")
+        budget = ModelConfig(memory_budget_fraction=0.25).get_memory_budget()
+        assert budget == int(psutil.virtual_memory().total * 0.25)
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"default_device": "tpu"},
+            {"memory_budget_bytes": 0},
+            {"memory_budget_fraction": 1.5},
+        ],
+    )
+    def test_invalid_values(self, options):
+        """Test that invalid values are rejected."""
+        with pytest.raises(ModelConfigError):
+            ModelConfig(**options)
+
+    def test_round_trip(self):
+        """Test dictionary round trip."""
+        config = ModelConfig(pinned_models=["a"], model_options={"a": {"k": 1}})
+        assert ModelConfig.from_dict(config.to_dict()) == config
@@ -1,7 +1,293 @@
 """test_model_downloader - Module for tests/ai_models.test_model_downloader."""
 
+from __future__ import annotations
+
 # Standard library imports
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.cli import main
+from ai_models.model_base_types import ModelInfo
+from ai_models.model_config import ModelConfig
+from ai_models.model_downloader import (
+    BlobStore,
+    ChecksumMismatchError,
+    DownloadError,
+    DownloadStatus,
+    ModelDownloader,
+    _etag_digest,
+)
+from ai_models.model_manager import ModelManager
+
+PART_SIZE = 64 * 1024
+CONTENT = os.urandom(10 * PART_SIZE + 123)
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+_RANGE_PATTERN = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class _FileServer(ThreadingHTTPServer):
+    """Local HTTP server serving byte strings, with optional failures."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RangeHandler)
+        self.files: dict[str, bytes] = {}
+        self.supports_ranges = True
+        self.etag = '"v1"'
+        self.fail_offsets: set[int] = set()
+        self.ranges: list[tuple[int, int]] = []
+        self.lock = threading.Lock()
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/{name}"
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serve ``GET`` with ``Range`` support; fail ranges in ``fail_offsets``."""
+
+    server: _FileServer
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        data = self.server.files.get(self.path.lstrip("/"))
+        if data is None:
+            self.send_error(404)
+            return
+        match = _RANGE_PATTERN.match(self.headers.get("Range", ""))
+        if not (self.server.supports_ranges and match):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        start = int(match.group(1))
+        end = int(match.group(2) or len(data) - 1)
+        with self.server.lock:
+            self.server.ranges.append((start, end))
+            fail = start in self.server.fail_offsets
+        if fail:
+            self.send_error(500)
+            return
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("ETag", self.server.etag)
+        self.end_headers()
+        self.wfile.write(data[start : end + 1])
+
+
+@pytest.fixture
+def server():
+    """Run a local file server for one test."""
+    httpd = _FileServer()
+    httpd.files["model.bin"] = CONTENT
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    """Create a downloader with small parts and no retry delay."""
+    with ModelDownloader(
+        cache_dir=str(tmp_path / "cache"),
+        models_dir=str(tmp_path / "models"),
+        num_connections=4,
+        part_size=PART_SIZE,
+        max_retries=0,
+    ) as instance:
+        yield instance
+
+
+def _data_ranges(server: _FileServer) -> list[tuple[int, int]]:
+    """Ranges requested for data, excluding the size probe."""
+    return [r for r in server.ranges if r != (0, 0)]
+
+
+class TestModelDownloader:
+    """Tests for ModelDownloader."""
+
+    def test_parallel_range_download(self, server, downloader, tmp_path):
+        """Test that a file is fetched in parts and linked from the blob store."""
+        path = downloader.download(server.url("model.bin"), "m1", sha256=DIGEST)
+
+        assert path == tmp_path / "models" / "m1" / "model.bin"
+        assert path.read_bytes() == CONTENT
+        assert sorted(_data_ranges(server)) == [
+            (i * PART_SIZE, min((i + 1) * PART_SIZE, len(CONTENT)) - 1)
+            for i in range(11)
+        ]
+        blob = tmp_path / "cache" / "sha256" / DIGEST
+        assert os.path.samefile(path, blob)
+        assert not list((tmp_path / "cache" / "partial").iterdir())
+
+    def test_resumes_from_manifest(self, server, downloader, tmp_path):
+        """Test that a failed download resumes without refetching finished parts."""
+        server.fail_offsets = {5 * PART_SIZE}
+        with pytest.raises(DownloadError):
+            downloader.download(server.url("model.bin"), "m1")
+        manifest = next((tmp_path / "cache" / "partial").glob("*.manifest.json"))
+        completed = set(json.loads(manifest.read_text())["completed"])
+        assert 5 not in completed
+        assert completed
+
+        server.fail_offsets = set()
+        server.ranges.clear()
+        path = downloader.download(server.url("model.bin"), "m1", sha256=DIGEST)
+
+        assert path.read_bytes() == CONTENT
+        refetched = {start // PART_SIZE for start, _ in _data_ranges(server)}
+        assert refetched == set(range(11)) - completed
+
+    def test_checksum_mismatch(self, server, downloader, tmp_path):
+        """Test that content not matching the expected digest is discarded."""
+        with pytest.raises(ChecksumMismatchError):
+            downloader.download(server.url("model.bin"), "m1", sha256="0" * 64)
+
+        assert not (tmp_path / "models" / "m1" / "model.bin").exists()
+        assert not list((tmp_path / "cache" / "sha256").iterdir())
+
+    def test_shared_blob_is_downloaded_once(self, server, downloader):
+        """Test that a second model with the same file reuses the blob."""
+        first = downloader.download(server.url("model.bin"), "m1")
+        server.ranges.clear()
+        task = downloader.download_from_url(
+            server.url("model.bin"), "m2", sha256=DIGEST, auto_register=False
+        )
+        second = task.wait(10)
+
+        assert server.ranges == []
+        assert task.progress.deduplicated
+        assert task.progress.status == DownloadStatus.COMPLETED
+        assert os.path.samefile(first, second)
+
+    def test_changed_url_content_is_downloaded_again(self, server, downloader):
+        """Test that a URL is re-checked, and refetched once its ETag changes."""
+        downloader.download(server.url("model.bin"), "m1")
+        server.ranges.clear()
+        downloader.download(server.url("model.bin"), "m1")
+        assert _data_ranges(server) == []
+
+        new_content = CONTENT[::-1]
+        server.files["model.bin"] = new_content
+        server.etag = '"v2"'
+        path = downloader.download(server.url("model.bin"), "m1")
+
+        assert path.read_bytes() == new_content
+        assert _data_ranges(server)
+
+    def test_concurrent_downloads_share_one_transfer(self, server, downloader):
+        """Test that simultaneous downloads of one URL fetch each part once."""
+        barrier = threading.Barrier(3)
+        paths = {}
+
+        def download(model_id: str) -> None:
+            barrier.wait()
+            paths[model_id] = downloader.download(server.url("model.bin"), model_id)
+
+        threads = [
+            threading.Thread(target=download, args=(f"m{i}",)) for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        ranges = _data_ranges(server)
+        assert len(ranges) == len(set(ranges)) == 11
+        assert all(path.read_bytes() == CONTENT for path in paths.values())
+
+    def test_etag_digest(self):
+        """Test that strong and weak SHA-256 ETags are recognized."""
+        assert _etag_digest(f'"{DIGEST}"') == DIGEST
+        assert _etag_digest(f'W/"{DIGEST.upper()}"') == DIGEST
+        assert _etag_digest('"v1"') is None
+        assert _etag_digest(None) is None
+
+    def test_server_without_ranges(self, server, downloader):
+        """Test the single-stream fallback for servers without range support."""
+        server.supports_ranges = False
+
+        path = downloader.download(server.url("model.bin"), "m1", sha256=DIGEST)
+
+        assert path.read_bytes() == CONTENT
+
+    def test_registers_with_model_manager(self, server, tmp_path):
+        """Test that downloads are registered with the model manager."""
+        manager = ModelManager(
+            ModelConfig(
+                models_dir=str(tmp_path / "models"), cache_dir=str(tmp_path / "cache")
+            )
+        )
+        with ModelDownloader(manager, part_size=PART_SIZE) as downloader:
+            downloader.download_from_url(server.url("model.bin"), "m1", "vision").wait(
+                10
+            )
+
+        info = manager.get_model_info("m1")
+        assert isinstance(info, ModelInfo)
+        assert info.format == "pytorch"
+        assert Path(info.path).read_bytes() == CONTENT
+
+
+class TestBlobStore:
+    """Tests for BlobStore."""
+
+    def test_link_replaces_existing_file(self, tmp_path):
+        """Test that linking over an existing file points it at the blob."""
+        store = BlobStore(str(tmp_path / "cache"))
+        source = tmp_path / "source"
+        source.write_bytes(b"weights")
+        digest = hashlib.sha256(b"weights").hexdigest()
+        store.put(source, digest)
+        dest = tmp_path / "models" / "m1" / "w.bin"
+        dest.parent.mkdir(parents=True)
+        dest.write_bytes(b"old")
+
+        store.link(digest, dest)
+
+        assert dest.read_bytes() == b"weights"
+        assert store.has(digest)
+
+
+class TestDownloadCommand:
+    """Tests for the download CLI command."""
+
+    def test_download_command(self, server, tmp_path, capsys):
+        """Test that the command downloads the file and prints its path."""
+        code = main(
+            [
+                "download",
+                "--url",
+                server.url("model.bin"),
+                "--model-id",
+                "m1",
+                "--sha256",
+                DIGEST,
+                "--models-dir",
+                str(tmp_path / "models"),
+                "--cache-dir",
+                str(tmp_path / "cache"),
+            ]
+        )
+
+        output = json.loads(capsys.readouterr().out)
+        assert code == 0
+        assert output["status"] == "completed"
+        assert Path(output["path"]).read_bytes() == CONTENT
@@ -1,7 +1,220 @@
 """test_model_manager - Module for tests/ai_models.test_model_manager."""
 
 # Standard library imports
+import asyncio
+import subprocess
+import sys
+import threading
+import time
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.model_base_types import LoadableModel, ModelInfo
+from ai_models.model_config import ModelConfig
+from ai_models.model_manager import (
+    ModelManager,
+    ModelMemoryBudgetError,
+    ModelNotFoundError,
+)
+from ai_models.model_types import MODEL_TYPES, register_model_type
+
+
+class FakeModel:
+    """Loaded model object recording whether it was unloaded."""
+
+    def __init__(self, name, memory_bytes):
+        """Initialize the model."""
+        self.name = name
+        self.memory_bytes = memory_bytes
+        self.unloaded = False
+
+    def unload(self):
+        """Record the unload."""
+        self.unloaded = True
+
+
+class CountingLoader:
+    """Loader that counts calls and can be slowed down."""
+
+    def __init__(self, memory_bytes=40, delay=0.0):
+        """Initialize the loader."""
+        self.memory_bytes = memory_bytes
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, info):
+        """Load a fake model."""
+        with self._lock:
+            self.calls.append(info.id)
+        time.sleep(self.delay)
+        return FakeModel(info.id, self.memory_bytes)
+
+
+def make_manager(budget=100, models=("a", "b", "c"), **loader_options):
+    """Create a manager with fake models of 40 bytes each."""
+    manager = ModelManager(ModelConfig(memory_budget_bytes=budget))
+    loader = CountingLoader(**loader_options)
+    for model_id in models:
+        manager.register_model(ModelInfo(model_id, memory_bytes=40), loader)
+    return manager, loader
+
+
+class TestModelManager:
+    """Tests for lazy loading and eviction."""
+
+    def test_loads_on_first_use_only(self):
+        """Test that registration does not load and later uses hit."""
+        manager, loader = make_manager()
+        assert loader.calls == []
+        model = manager.load_model("a")
+        assert manager.load_model("a") is model
+        assert loader.calls == ["a"]
+        assert manager.get_stats()["hits"] == 1
+
+    def test_concurrent_first_use_loads_once(self):
+        """Test that concurrent first requests share one load."""
+        manager, loader = make_manager(delay=0.05)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(manager.load_model("a"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert loader.calls == ["a"]
+        assert len({id(model) for model in results}) == 1
+
+    async def test_async_first_use_loads_once(self):
+        """Test that concurrent coroutines share one load."""
+        manager, loader = make_manager(delay=0.02)
+        models = await asyncio.gather(
+            *(manager.load_model_async("b") for _ in range(5))
+        )
+        assert loader.calls == ["b"]
+        assert all(model is models[0] for model in models)
+
+    def test_lru_eviction_under_budget(self):
+        """Test that the least recently used model is evicted to fit."""
+        manager, _ = make_manager()
+        a = manager.load_model("a")
+        manager.load_model("b")
+        manager.load_model("a")  # b is now least recently used
+        manager.load_model("c")
+
+        assert manager.get_loaded_models() == ["a", "c"]
+        assert not a.unloaded
+        stats = manager.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["resident_bytes"] == 80
+
+    def test_pinned_models_stay_resident(self):
+        """Test that pinned models are never evicted."""
+        manager, _ = make_manager()
+        manager.pin("a")
+        manager.load_model("a")
+        manager.load_model("b")
+        manager.load_model("c")
+        assert manager.get_loaded_models() == ["a", "c"]
+
+        manager.pin("c")
+        with pytest.raises(ModelMemoryBudgetError):
+            manager.load_model("b")
+
+    def test_models_in_use_are_not_evicted(self):
+        """Test that a held model survives loads that need its memory."""
+        manager, _ = make_manager(budget=80)
+        with manager.use("a") as model:
+            manager.load_model("b")
+            with pytest.raises(ModelMemoryBudgetError), manager.use("b"):
+                manager.load_model("c")
+            assert manager.is_loaded("a")
+            assert manager.get_stats()["models"]["a"]["in_use"] == 1
+        manager.load_model("c")
+        assert model.unloaded
+
+    def test_stats_report_load_time_and_bytes(self):
+        """Test per-model load statistics."""
+        manager, _ = make_manager(delay=0.01)
+        manager.load_model("a")
+        stats = manager.get_stats()
+        assert stats["loads"] == 1
+        assert stats["models"]["a"]["memory_bytes"] == 40
+        assert stats["models"]["a"]["load_time"] >= 0.01
+        assert stats["total_load_time"] >= 0.01
+
+    def test_failed_load_releases_reservation(self):
+        """Test that a failing loader can be retried."""
+        manager = ModelManager(ModelConfig(memory_budget_bytes=100))
+        attempts = []
+
+        def loader(info):
+            attempts.append(info.id)
+            if len(attempts) == 1:
+                error_msg = "disk error"
+                raise OSError(error_msg)
+            return FakeModel(info.id, 10)
+
+        manager.register_model(ModelInfo("x", memory_bytes=10), loader)
+        with pytest.raises(OSError, match="disk error"):
+            manager.load_model("x")
+        assert manager.get_stats()["reserved_bytes"] == 0
+        assert manager.load_model("x").name == "x"
+
+    def test_unknown_model(self):
+        """Test that unregistered models raise."""
+        manager, _ = make_manager()
+        with pytest.raises(ModelNotFoundError):
+            manager.load_model("missing")
+
+    def test_default_loader_uses_model_types(self, tmp_path, monkeypatch):
+        """Test loading through a registered model type."""
+
+        class TextModel(LoadableModel):
+            def _load(self):
+                with open(self.model_path) as f:
+                    return f.read()
+
+        monkeypatch.setitem(MODEL_TYPES, "text", MODEL_TYPES.get("text"))
+        register_model_type("text", TextModel)
+        path = tmp_path / "weights.txt"
+        path.write_text("x" * 64)
+
+        manager = ModelManager(ModelConfig(memory_budget_bytes=1000))
+        manager.register_model(ModelInfo("t", type="text", path=str(path)))
+        model = manager.load_model("t")
+        assert model.model == "x" * 64
+        assert manager.get_stats()["models"]["t"]["memory_bytes"] == 64
+
+        manager.unload_model("t")
+        assert not model.is_loaded
+
+    def test_import_does_not_load_transformers(self):
+        """Test that heavy ML libraries are imported on first load only."""
+        code = (
+            "import sys, ai_models.model_manager; "
+            "print(sorted({'transformers', 'torch'} & set(sys.modules)))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_discover_models(self, tmp_path):
+        """Test registering model files from the models directory."""
+        (tmp_path / "tiny.onnx").write_bytes(b"0" * 10)
+        (tmp_path / "notes.txt").write_text("not a model")
+        (tmp_path / "hf-model").mkdir()
+        (tmp_path / "hf-model" / "config.json").write_text("{}")
+
+        manager = ModelManager(ModelConfig(models_dir=str(tmp_path)))
+        discovered = {info.id: info.format for info in manager.discover_models()}
+        assert discovered == {"hf-model": "huggingface", "tiny": "onnx"}
+        assert manager.discover_models() == []
@@ -1,7 +1,205 @@
 """test_model_versioning - Module for tests/ai_models.test_model_versioning."""
 
+from __future__ import annotations
+
 # Standard library imports
+import os
 
 # Third-party imports
+import pytest
 
 # Local imports
+from ai_models.model_manager import ModelManager
+from ai_models.model_versioning import (
+    ModelDeployment,
+    ModelVersionRegistry,
+    RollbackError,
+    VersionConstraint,
+    VersionError,
+    VersionExistsError,
+    VersionInUseError,
+    VersionNotFoundError,
+    version_sort_key,
+)
+
+
+def _model_dir(root, weights, tokenizer="vocab"):
+    """Write a model directory with weights and a tokenizer file."""
+    root.mkdir(parents=True)
+    (root / "model.bin").write_text(weights)
+    (root / "tokenizer.json").write_text(tokenizer)
+    return root
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Provide a registry with three versions of one model."""
+    with ModelVersionRegistry(tmp_path / "registry") as reg:
+        for version in ("1.0.0", "1.2.0", "2.0.0"):
+            reg.register(
+                "classifier",
+                version,
+                _model_dir(tmp_path / "src" / version, f"weights {version}"),
+                metadata={"model_type": "test"},
+            )
+        yield reg
+
+
+class TestVersionConstraint:
+    """Tests for version ordering and constraints."""
+
+    def test_sort_key_orders_numerically(self):
+        """Test that 1.10 sorts after 1.9."""
+        assert version_sort_key("1.10") > version_sort_key("1.9")
+        assert version_sort_key("1.2") == version_sort_key("1.2.0")
+
+    @pytest.mark.parametrize(
+        ("spec", "matching", "other"),
+        [
+            ("1.2", "1.2.7", "1.3.0"),
+            (">=1.0,<2", "1.9.9", "2.0.0"),
+            ("~=1.4.2", "1.4.9", "1.5.0"),
+            ("^1.4", "1.9.0", "2.0.0"),
+            ("^0.3", "0.3.5", "0.4.0"),
+            ("!=1.1", "1.2", "1.1.0"),
+        ],
+    )
+    def test_matches(self, spec, matching, other):
+        """Test constraint clauses."""
+        constraint = VersionConstraint(spec)
+
+        assert constraint.matches(matching)
+        assert not constraint.matches(other)
+
+    def test_invalid(self):
+        """Test that malformed versions and constraints are rejected."""
+        with pytest.raises(VersionError):
+            VersionConstraint(">=one")
+        with pytest.raises(VersionError):
+            version_sort_key("1.0-beta")
+
+
+class TestModelVersionRegistry:
+    """Tests for registering, resolving, promoting and rolling back."""
+
+    def test_unchanged_files_are_stored_once(self, registry, tmp_path):
+        """Test that files shared between versions are linked, not copied."""
+        tokenizers = [
+            os.stat(os.path.join(v.path, "tokenizer.json"))
+            for v in registry.list_versions("classifier")
+        ]
+
+        again = registry.register(
+            "classifier", "2.1.0", _model_dir(tmp_path / "src" / "x", "weights 2.0.0")
+        )
+
+        assert len({(s.st_dev, s.st_ino) for s in tokenizers}) == 1
+        assert again.new_bytes == 0
+        assert len(list((registry.blobs.root / "sha256").iterdir())) == 4
+
+    def test_resolve(self, registry):
+        """Test lookups by version, constraint and latest."""
+        assert registry.resolve("classifier").version == "2.0.0"
+        assert registry.resolve("classifier", "1").version == "1.2.0"
+        assert registry.resolve("classifier", "<1.2").version == "1.0.0"
+        assert registry.resolve("classifier", "1.0.0").metadata == {
+            "model_type": "test"
+        }
+        with pytest.raises(VersionNotFoundError):
+            registry.resolve("classifier", ">=3")
+        with pytest.raises(VersionExistsError):
+            registry.register("classifier", "1.0.0", registry.root)
+
+    def test_promote_and_rollback(self, registry):
+        """Test that aliases move atomically and roll back in order."""
+        registry.promote("classifier", "1.0.0")
+        registry.promote("classifier", "^1")
+        registry.promote("classifier", "2.0.0")
+        link = registry.aliases_dir / "classifier" / "active"
+
+        assert registry.resolve("classifier", "active").version == "2.0.0"
+        assert (link / "model.bin").read_text() == "weights 2.0.0"
+        assert registry.rollback("classifier").version == "1.2.0"
+        assert registry.rollback("classifier").version == "1.0.0"
+        assert (link / "model.bin").read_text() == "weights 1.0.0"
+        with pytest.raises(RollbackError):
+            registry.rollback("classifier")
+
+    def test_rollback_skips_deleted_versions(self, registry):
+        """Test that rollback never lands on a version that no longer exists."""
+        registry.promote("classifier", "1.0.0")
+        registry.promote("classifier", "1.2.0")
+        registry.promote("classifier", "2.0.0")
+
+        with pytest.raises(VersionInUseError):
+            registry.delete("classifier", "1.2.0")
+
+        # A history entry left pointing at a removed version is skipped
+        with registry._transaction() as conn:  # noqa: SLF001
+            conn.execute(
+                "DELETE FROM versions WHERE name = ? AND version = ?",
+                ("classifier", "1.2.0"),
+            )
+        assert registry.previous("classifier") == "1.0.0"
+        assert registry.rollback("classifier").version == "1.0.0"
+        assert registry.resolve("classifier", "active").version == "1.0.0"
+
+        with registry._transaction() as conn:  # noqa: SLF001
+            conn.execute(
+                "DELETE FROM versions WHERE name = ? AND version = ?",
+                ("classifier", "1.0.0"),
+            )
+        registry.promote("classifier", "2.0.0")
+        with pytest.raises(RollbackError):
+            registry.rollback("classifier")
+        assert registry.resolve("classifier", "active").version == "2.0.0"
+        assert registry.previous("classifier") is None
+
+    def test_delete_and_gc(self, registry):
+        """Test that aliased versions are kept and unreferenced blobs freed."""
+        registry.promote("classifier", "1.0.0")
+
+        with pytest.raises(VersionInUseError):
+            registry.delete("classifier", "1.0.0")
+        registry.delete("classifier", "2.0.0")
+
+        assert [v.version for v in registry.list_versions("classifier")] == [
+            "1.0.0",
+            "1.2.0",
+        ]
+        assert registry.gc() == len("weights 2.0.0")
+
+    def test_index_survives_reopen(self, registry):
+        """Test that versions and aliases persist in the index."""
+        registry.promote("classifier", "1.2.0", alias="canary")
+
+        with ModelVersionRegistry(registry.root) as reopened:
+            assert reopened.list_models() == ["classifier"]
+            assert reopened.aliases("classifier") == {"canary": "1.2.0"}
+
+
+class TestModelDeployment:
+    """Tests for serving aliases through a model manager."""
+
+    def test_switch_keeps_unrelated_models_loaded(self, registry):
+        """Test that deploying and rolling back only swaps one model."""
+        manager = ModelManager(memory_budget_bytes=10**9)
+        deployment = ModelDeployment(
+            registry, manager, loader=lambda info: info.path.rsplit("/", 1)[-1]
+        )
+        deployment.deploy("classifier", "1.2.0")
+        registry.register("embedder", "1.0", registry.versions_dir / "classifier")
+        deployment.deploy("embedder")
+
+        deployed = deployment.deploy("classifier", "2.0.0")
+
+        assert deployed.version == "2.0.0"
+        assert deployment.get_model("classifier") == "2.0.0"
+        assert sorted(manager.get_loaded_models()) == [
+            "classifier@2.0.0",
+            "embedder@1.0",
+        ]
+        deployment.rollback("classifier")
+        assert deployment.get_model("classifier") == "1.2.0"
+        assert "classifier@2.0.0" not in manager.get_loaded_models()
+        assert manager.is_loaded("embedder@1.0")
@@ -0,0 +1,157 @@
+"""test_onnx_model - Module for tests/ai_models.test_onnx_model."""
+
+from __future__ import annotations
+
+# Standard library imports
+import os
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local imports
+from ai_models.model_types import MODEL_TYPES, get_model_class, onnx_model
+from ai_models.model_types.onnx_model import (
+    ONNXModel,
+    ONNXRuntimeNotAvailableError,
+    find_onnx_file,
+    normalize,
+    pad_batch,
+    plan_batches,
+    pool,
+    softmax,
+)
+from ai_models.model_types.quantized_model import QuantizedONNXModel, quantized_path
+
+
+def _tokenize(texts):
+    """Map each word to its length, as a stand-in tokenizer."""
+    return [[len(word) for word in text.split()] for text in texts]
+
+
+def _build_mean_model(path):
+    """Write a graph whose token embedding is [token_id, 1] (needs onnx)."""
+    onnx = pytest.importorskip("onnx")
+    helper = onnx.helper
+    ids = helper.make_tensor_value_info(
+        "input_ids", onnx.TensorProto.INT64, ["batch", "sequence"]
+    )
+    mask = helper.make_tensor_value_info(
+        "attention_mask", onnx.TensorProto.INT64, ["batch", "sequence"]
+    )
+    hidden = helper.make_tensor_value_info(
+        "last_hidden_state", onnx.TensorProto.FLOAT, ["batch", "sequence", 2]
+    )
+    axes = helper.make_tensor("axes", onnx.TensorProto.INT64, [1], [2])
+    nodes = [
+        helper.make_node("Cast", ["input_ids"], ["ids_f"], to=onnx.TensorProto.FLOAT),
+        helper.make_node(
+            "Cast", ["attention_mask"], ["mask_f"], to=onnx.TensorProto.FLOAT
+        ),
+        helper.make_node("Unsqueeze", ["ids_f", "axes"], ["ids_3d"]),
+        helper.make_node("Unsqueeze", ["mask_f", "axes"], ["mask_3d"]),
+        helper.make_node(
+            "Concat", ["ids_3d", "mask_3d"], ["last_hidden_state"], axis=2
+        ),
+    ]
+    graph = helper.make_graph(nodes, "mean", [ids, mask], [hidden], [axes])
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+    return path
+
+
+class TestHelpers:
+    """Tests for the batching and pooling helpers."""
+
+    def test_plan_batches_groups_by_length(self):
+        """Test that batches hold inputs of similar length, longest first."""
+        batches = plan_batches([1, 9, 3, 8, 2], max_batch_size=2)
+
+        assert batches == [[1, 3], [2, 4], [0]]
+
+    def test_pad_batch_pads_to_longest(self):
+        """Test that padding is to the longest sequence of the batch."""
+        feeds = pad_batch([[5, 6, 7], [8]], pad_id=0)
+
+        assert feeds["input_ids"].tolist() == [[5, 6, 7], [8, 0, 0]]
+        assert feeds["attention_mask"].tolist() == [[1, 1, 1], [1, 0, 0]]
+        assert feeds["input_ids"].dtype == np.int64
+
+    def test_mean_pool_ignores_padding(self):
+        """Test that mean pooling averages unpadded tokens only."""
+        hidden = np.array([[[1.0], [3.0], [100.0]]])
+
+        assert pool(hidden, np.array([[1, 1, 0]])).tolist() == [[2.0]]
+        assert pool(hidden, np.array([[1, 1, 0]]), "cls").tolist() == [[1.0]]
+
+    def test_normalize_and_softmax(self):
+        """Test normalization and softmax."""
+        assert np.allclose(normalize(np.array([[3.0, 4.0]])), [[0.6, 0.8]])
+        assert np.allclose(softmax(np.array([[0.0, 0.0]])), [[0.5, 0.5]])
+
+
+class TestONNXModel:
+    """Tests for ONNXModel and QuantizedONNXModel."""
+
+    def test_registered_model_types(self):
+        """Test that the ONNX model types are registered."""
+        assert get_model_class("onnx") is ONNXModel
+        assert MODEL_TYPES["onnx-int8"] is QuantizedONNXModel
+
+    def test_finds_graph_in_directory(self, tmp_path):
+        """Test graph lookup and the quantized graph fallback."""
+        (tmp_path / "model.onnx").write_bytes(b"")
+
+        assert find_onnx_file(str(tmp_path)) == tmp_path / "model.onnx"
+        assert quantized_path(tmp_path / "model.onnx") == tmp_path / "model.int8.onnx"
+        model = QuantizedONNXModel(str(tmp_path))
+        assert model.onnx_file() == tmp_path / "model.onnx"
+        (tmp_path / "model.int8.onnx").write_bytes(b"")
+        assert model.onnx_file() == tmp_path / "model.int8.onnx"
+
+    def test_saved_optimized_graph_is_reused(self, tmp_path):
+        """Test that a current optimized graph is opened instead of the model."""
+        (tmp_path / "model.onnx").write_bytes(b"")
+        optimized = tmp_path / "model.opt.onnx"
+        model = ONNXModel(str(tmp_path), optimized_model_path=str(optimized))
+        source = model._session_source  # noqa: SLF001
+
+        assert source(model.onnx_file()) == (model.onnx_file(), False)
+        optimized.write_bytes(b"")
+        assert source(model.onnx_file()) == (optimized, True)
+        os.utime(optimized, ns=(0, 0))
+        assert source(model.onnx_file()) == (model.onnx_file(), False)
+
+    @pytest.mark.skipif(onnx_model.ort is not None, reason="onnxruntime installed")
+    def test_requires_onnxruntime(self, tmp_path):
+        """Test that loading without onnxruntime names the package to install."""
+        with pytest.raises(ONNXRuntimeNotAvailableError):
+            ONNXModel(str(tmp_path)).load()
+
+    def test_embeddings_with_dynamic_batches(self, tmp_path):
+        """Test embeddings in input order from length-sorted padded batches."""
+        pytest.importorskip("onnxruntime")
+        _build_mean_model(tmp_path / "model.onnx")
+        model = ONNXModel(
+            str(tmp_path), tokenizer=_tokenize, max_batch_size=2, normalize=False
+        )
+        texts = ["a bb", "ccc", "dddd e ff gg", "hhhhh"]
+
+        vectors = model.embed(texts)
+
+        assert np.allclose(vectors[:, 0], [1.5, 3.0, 2.25, 5.0])
+        assert np.allclose(vectors[:, 1], 1.0)
+        assert model.encode("a bb").shape == (2,)
+
+    def test_sessions_are_shared(self, tmp_path):
+        """Test that models of the same file and options share one session."""
+        pytest.importorskip("onnxruntime")
+        _build_mean_model(tmp_path / "model.onnx")
+
+        first = ONNXModel(str(tmp_path), tokenizer=_tokenize).load()
+        second = ONNXModel(str(tmp_path), tokenizer=_tokenize).load()
+        other = ONNXModel(str(tmp_path), tokenizer=_tokenize, intra_op_threads=1).load()
+
+        assert first.model is second.model
+        assert other.model is not first.model
@@ -1,7 +1,204 @@
 """test_performance_monitor - Module for tests/ai_models.test_performance_monitor."""
 
 # Standard library imports
+import random
+import threading
 
 # Third-party imports
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 # Local imports
+from ai_models.adapters.fake_adapter import FakeAdapter
+from ai_models.metrics import StreamingHistogram, get_metrics, to_prometheus
+from ai_models.metrics.enhanced_metrics import (
+    MAX_TRACKABLE_VALUE,
+    NUM_BUCKETS,
+    ModelStats,
+    bucket_bounds,
+    bucket_index,
+)
+from ai_models.performance_monitor import PerformanceMonitor
+from ai_models.serving.rest_api.routes import metrics as metrics_routes
+
+
+class TestStreamingHistogram:
+    """Tests for the log-linear histogram."""
+
+    def test_buckets_cover_values(self):
+        """Test that every value falls inside its bucket's bounds."""
+        rng = random.Random(0)  # noqa: S311
+        values = list(range(200)) + [
+            rng.randrange(MAX_TRACKABLE_VALUE) for _ in range(2000)
+        ]
+        for value in values:
+            index = bucket_index(value)
+            low, high = bucket_bounds(index)
+            assert low <= value < high
+            assert index < NUM_BUCKETS
+
+    def test_percentiles_within_relative_error(self):
+        """Test percentile estimates against exact values."""
+        rng = random.Random(1)  # noqa: S311
+        values = [int(rng.expovariate(1 / 5000)) for _ in range(20000)]
+        histogram = StreamingHistogram()
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for pct in (50, 90, 99):
+            exact = values[int(pct / 100 * len(values)) - 1]
+            assert histogram.percentile(pct) == pytest.approx(exact, rel=0.05)
+        assert histogram.max == values[-1]
+
+    def test_merge(self):
+        """Test that merging combines counts and extremes."""
+        first, second = StreamingHistogram(), StreamingHistogram()
+        first.record(10)
+        second.record(1000)
+        first.merge(second)
+        assert (first.count, first.min, first.max) == (2, 10, 1000)
+
+
+class TestModelStats:
+    """Tests for rolling-window model statistics."""
+
+    def test_snapshot(self):
+        """Test counts, error rate and latency percentiles."""
+        stats = ModelStats(window_seconds=60)
+        for _ in range(9):
+            stats.record(0.010, input_tokens=5, output_tokens=20)
+        stats.record(0.100, error=True)
+
+        snapshot = stats.snapshot()
+        assert snapshot["requests"] == 10
+        assert snapshot["errors"] == 1
+        assert snapshot["error_rate"] == 0.1
+        assert snapshot["output_tokens"] == 180
+        assert snapshot["latency_ms"]["p50"] == pytest.approx(10, rel=0.05)
+        assert snapshot["latency_ms"]["max"] == pytest.approx(100)
+        assert snapshot["totals"]["requests"] == 10
+
+    def test_old_slots_leave_the_window(self, monkeypatch):
+        """Test that samples older than the window are dropped but still totalled."""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "ai_models.metrics.enhanced_metrics._monotonic", lambda: clock[0]
+        )
+        monkeypatch.setattr(
+            "ai_models.metrics.enhanced_metrics.time.monotonic", lambda: clock[0]
+        )
+        stats = ModelStats(window_seconds=10, slots=5)
+        stats.record(0.5)
+        clock[0] += 30
+        stats.record(0.001)
+
+        snapshot = stats.snapshot()
+        assert snapshot["requests"] == 1
+        assert snapshot["latency_ms"]["max"] == pytest.approx(1)
+        assert snapshot["totals"]["requests"] == 2
+
+    def test_records_from_many_threads(self):
+        """Test that striped shards are merged without losing samples."""
+        stats = ModelStats()
+
+        def worker():
+            for _ in range(1000):
+                stats.record(0.001, output_tokens=1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert stats.snapshot()["requests"] == 8000
+
+    def test_memory_is_bounded_by_shards(self):
+        """Test that short-lived threads reuse shards and idle slots stay empty."""
+        stats = ModelStats(shards=4)
+        for _ in range(50):
+            thread = threading.Thread(target=stats.record, args=(0.001,))
+            thread.start()
+            thread.join()
+
+        assert len(stats._shards) == 4  # noqa: SLF001
+        histograms = [
+            slot.histogram
+            for shard in stats._shards  # noqa: SLF001
+            for slot in shard.slots
+            if slot.histogram is not None
+        ]
+        assert 1 <= len(histograms) <= 8
+        assert stats.snapshot()["totals"]["requests"] == 50
+
+
+class TestPerformanceMonitor:
+    """Tests for the performance monitor."""
+
+    def test_wrapped_adapter_records_calls(self):
+        """Test that adapter calls are timed and their tokens counted."""
+        monitor = PerformanceMonitor()
+        adapter = monitor.wrap(FakeAdapter(fail_every=3), "fake-model")
+
+        adapter.generate_text("hello", max_tokens=4)
+        adapter.generate_text("hello", max_tokens=4)
+        with pytest.raises(RuntimeError):
+            adapter.generate_text("hello", max_tokens=4)
+
+        stats = monitor.get_stats("fake-model")["fake-model"]
+        assert stats["requests"] == 3
+        assert stats["errors"] == 1
+        assert stats["output_tokens"] == 8
+        assert adapter.calls == 3
+
+    async def test_monitored_coroutine(self):
+        """Test the decorator on an async function."""
+        monitor = PerformanceMonitor()
+
+        @monitor.monitored("async-model")
+        async def generate():
+            return {"text": "a b c"}
+
+        await generate()
+        assert monitor.get_stats()["async-model"]["output_tokens"] == 3
+
+    def test_track_and_disable(self):
+        """Test the context manager and the enabled switch."""
+        monitor = PerformanceMonitor()
+        with monitor.track("m") as call:
+            call.output_tokens = 7
+        monitor.enabled = False
+        monitor.record("m", 0.1)
+        assert monitor.get_stats()["m"]["requests"] == 1
+        assert monitor.get_stats()["m"]["output_tokens"] == 7
+
+
+class TestMetricsEndpoint:
+    """Tests for the REST metrics routes."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Create a client for an app whose default monitor is isolated."""
+        monitor = PerformanceMonitor()
+        monkeypatch.setattr(
+            "ai_models.performance_monitor.get_performance_monitor", lambda: monitor
+        )
+        monitor.record("m1", 0.02, output_tokens=10)
+        app = FastAPI()
+        app.include_router(metrics_routes.router)
+        return TestClient(app)
+
+    def test_json_metrics(self, client):
+        """Test the JSON endpoints."""
+        body = client.get("/metrics").json()
+        assert body["models"]["m1"]["requests"] == 1
+        assert client.get("/metrics/m1").status_code == 200
+        assert client.get("/metrics/unknown").status_code == 404
+
+    def test_prometheus_metrics(self, client):
+        """Test the Prometheus exposition endpoint."""
+        text = client.get("/metrics/prometheus").text
+        assert 'ai_models_requests_total{model="m1"} 1' in text
+        assert "# TYPE ai_models_latency_ms gauge" in text
+        assert to_prometheus(get_metrics(PerformanceMonitor())) == ""
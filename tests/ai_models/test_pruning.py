@@ -0,0 +1,208 @@
+"""test_pruning - Module for tests/ai_models.test_pruning."""
+
+from __future__ import annotations
+
+# Standard library imports
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local imports
+from ai_models.optimization.pruning import (
+    DenseLayer,
+    MagnitudePruner,
+    PruningConfig,
+    PruningConfigError,
+    StructuredPruner,
+    UnsupportedModelError,
+    benchmark_against_dense,
+    get_pruner,
+    sparsity,
+)
+
+
+def _mlp(widths, seed=0):
+    """Build random NumPy layers for the given layer widths."""
+    rng = np.random.default_rng(seed)
+    return [
+        DenseLayer(
+            rng.standard_normal((out, inp)).astype(np.float32) / inp**0.5,
+            np.zeros(out, dtype=np.float32),
+        )
+        for inp, out in zip(widths, widths[1:])
+    ]
+
+
+def _forward(layers, x):
+    """Run an MLP with ReLU between layers."""
+    for layer in layers[:-1]:
+        x = np.maximum(layer(x), 0.0)
+    return layers[-1](x)
+
+
+class TestPruningConfig:
+    """Tests for the pruning configuration."""
+
+    def test_invalid_config(self):
+        """Test that out-of-range settings and unknown methods are rejected."""
+        with pytest.raises(PruningConfigError):
+            PruningConfig(target_sparsity=1.0)
+        with pytest.raises(PruningConfigError):
+            PruningConfig(scope="model")
+        with pytest.raises(PruningConfigError):
+            get_pruner("lottery")
+
+    def test_selects(self):
+        """Test include and exclude patterns."""
+        config = PruningConfig(include=[r"encoder"])
+
+        assert config.selects("encoder.layer.0.weight")
+        assert not config.selects("decoder.weight")
+        assert not config.selects("encoder.embed_tokens.weight")
+
+
+class TestMagnitudePruner:
+    """Tests for unstructured magnitude pruning."""
+
+    def test_global_target_sparsity(self):
+        """Test that global pruning reaches the target over all matrices."""
+        rng = np.random.default_rng(0)
+        weights = {
+            "a.weight": rng.standard_normal((64, 32)),
+            "b.weight": 10 * rng.standard_normal((32, 16)),
+            "b.bias": rng.standard_normal(16),
+        }
+
+        result = MagnitudePruner(PruningConfig(target_sparsity=0.75)).prune(weights)
+
+        assert result.sparsity_after == pytest.approx(0.75, abs=1e-3)
+        # The larger-magnitude layer keeps more of its weights
+        assert (
+            result.layers["b.weight"]["sparsity"]
+            < result.layers["a.weight"]["sparsity"]
+        )
+        assert np.count_nonzero(weights["b.bias"]) == 16
+
+    def test_layer_scope_and_masks(self):
+        """Test per-layer pruning, excluded layers and re-applying masks."""
+        rng = np.random.default_rng(1)
+        weights = {
+            "a.weight": rng.standard_normal((40, 10)),
+            "classifier.weight": rng.standard_normal((10, 4)),
+        }
+        pruner = MagnitudePruner(PruningConfig(target_sparsity=0.5, scope="layer"))
+
+        pruner.prune(weights)
+        weights["a.weight"] += 1.0
+        pruner.apply_masks(weights)
+
+        assert sparsity([weights["a.weight"]]) == pytest.approx(0.5)
+        assert sparsity([weights["classifier.weight"]]) == 0.0
+
+    def test_tied_magnitudes(self):
+        """Test that ties at the cut are broken so the target is still reached."""
+        weights = {"a.weight": np.ones((4, 4)), "b.weight": -np.ones((2, 8))}
+
+        result = MagnitudePruner(PruningConfig(target_sparsity=0.5)).prune(weights)
+
+        assert result.sparsity_after == 0.5
+        layer = MagnitudePruner(PruningConfig(target_sparsity=0.25, scope="layer"))
+        assert layer.prune({"a.weight": np.ones((4, 4))}).sparsity_after == 0.25
+
+    def test_nothing_selected(self):
+        """Test that a model without selected matrices is rejected."""
+        with pytest.raises(UnsupportedModelError):
+            MagnitudePruner().prune({"bias": np.ones(3)})
+
+
+class TestStructuredPruner:
+    """Tests for channel and head pruning."""
+
+    def test_prune_mlp_keeps_important_channels(self):
+        """Test that hidden layers shrink and the strongest channels survive."""
+        layers = _mlp([8, 16, 8])
+        layers[0].weight[[3, 11]] *= 100.0
+
+        result = StructuredPruner(PruningConfig(target_sparsity=0.5)).prune(layers)
+
+        assert layers[0].weight.shape == (8, 8)
+        assert layers[1].weight.shape == (8, 8)
+        assert result.layers["hidden.0"] == {"kept": 8, "total": 16}
+        assert result.params_after < result.params_before
+        kept = np.linalg.norm(layers[0].weight, axis=1)
+        assert (kept > 50).sum() == 2
+
+    def test_dead_channels_are_free_to_remove(self):
+        """Test that removing unused channels leaves the output unchanged."""
+        layers = _mlp([6, 12, 4])
+        layers[1].weight[:, 6:] = 0.0
+        x = np.random.default_rng(2).standard_normal((5, 6)).astype(np.float32)
+        expected = _forward(layers, x)
+
+        StructuredPruner(PruningConfig(target_sparsity=0.5)).prune(layers)
+
+        np.testing.assert_allclose(_forward(layers, x), expected, rtol=1e-5)
+
+    def test_multiple_of(self):
+        """Test that kept channel counts are rounded up."""
+        layers = _mlp([4, 30, 4])
+
+        StructuredPruner(PruningConfig(target_sparsity=0.7, multiple_of=8)).prune(
+            layers
+        )
+
+        assert layers[0].weight.shape[0] == 16
+
+    def test_prune_attention(self):
+        """Test that heads are removed from all four projections."""
+        layers = _mlp([16, 16, 16, 16, 16])
+        projections = dict(zip(("query", "key", "value", "output"), layers))
+        projections["value"].weight[4:8] *= 50.0
+
+        pruned, heads = StructuredPruner(
+            PruningConfig(target_sparsity=0.75)
+        ).prune_attention(projections, num_heads=4)
+
+        assert heads.tolist() == [1]
+        assert pruned["query"].weight.shape == (4, 16)
+        assert pruned["output"].weight.shape == (16, 4)
+        np.testing.assert_array_equal(
+            pruned["value"].weight, projections["value"].weight[4:8]
+        )
+
+    def test_torch_sequential(self):
+        """Test pruning the hidden channels of a PyTorch MLP."""
+        torch = pytest.importorskip("torch")
+        model = torch.nn.Sequential(
+            torch.nn.Linear(8, 32), torch.nn.ReLU(), torch.nn.Linear(32, 4)
+        )
+
+        result = StructuredPruner(PruningConfig(target_sparsity=0.5)).prune(model)
+
+        assert model[0].out_features == 16
+        assert model(torch.ones(2, 8)).shape == (2, 4)
+        assert result.size_ratio < 0.6
+
+
+class TestPruningBenchmark:
+    """Tests for the dense-baseline benchmark."""
+
+    def test_structured_pruning_speeds_up_mlp(self):
+        """Test that removing half the channels reports a speedup and less memory."""
+        dense = _mlp([256, 1024, 256])
+        pruned = list(dense)
+        StructuredPruner(PruningConfig(target_sparsity=0.5)).prune(pruned)
+        inputs = np.random.default_rng(3).standard_normal((64, 256)).astype(np.float32)
+
+        report = benchmark_against_dense(
+            lambda texts: _forward(dense, inputs[: len(texts)]),
+            lambda texts: _forward(pruned, inputs[: len(texts)]),
+            num_runs=10,
+            warmup_runs=2,
+            dense_weights=[layer.weight for layer in dense],
+            pruned_weights=[layer.weight for layer in pruned],
+        )
+
+        assert report["memory"]["parameter_ratio"] == pytest.approx(0.5)
+        assert report["speedup"] > 0
+        assert report["pruned"]["levels"][0]["throughput"]["errors"] == 0
@@ -0,0 +1,168 @@
+"""test_quantization - Module for tests/ai_models.test_quantization."""
+
+from __future__ import annotations
+
+# Standard library imports
+import json
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local imports
+from ai_models.cli import main
+from ai_models.optimization.quantization import (
+    ONNXDynamicQuantizer,
+    QuantizationConfig,
+    QuantizationConfigError,
+    QuantizerNotAvailableError,
+    TorchDynamicQuantizer,
+    compare_models,
+    dynamic_quantizer,
+    get_quantizer,
+    measure_latency,
+    output_drift,
+)
+
+
+def _tokenize(texts):
+    """Map each word to its length, as a stand-in tokenizer."""
+    return [[len(word) for word in text.split()] for text in texts]
+
+
+def _build_linear_model(path, width=512):
+    """Write a graph of two MatMul layers over the token IDs (needs onnx)."""
+    onnx = pytest.importorskip("onnx")
+    helper = onnx.helper
+    rng = np.random.default_rng(0)
+    weights = [
+        onnx.numpy_helper.from_array(
+            rng.standard_normal((1, width)).astype(np.float32), "w1"
+        ),
+        onnx.numpy_helper.from_array(
+            rng.standard_normal((width, width)).astype(np.float32) / width**0.5, "w2"
+        ),
+        helper.make_tensor("axes", onnx.TensorProto.INT64, [1], [2]),
+    ]
+    nodes = [
+        helper.make_node("Cast", ["input_ids"], ["ids_f"], to=onnx.TensorProto.FLOAT),
+        helper.make_node("Unsqueeze", ["ids_f", "axes"], ["ids_3d"]),
+        helper.make_node("MatMul", ["ids_3d", "w1"], ["h1"]),
+        helper.make_node("MatMul", ["h1", "w2"], ["last_hidden_state"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        "linear",
+        [
+            helper.make_tensor_value_info(
+                "input_ids", onnx.TensorProto.INT64, ["batch", "sequence"]
+            )
+        ],
+        [
+            helper.make_tensor_value_info(
+                "last_hidden_state",
+                onnx.TensorProto.FLOAT,
+                ["batch", "sequence", width],
+            )
+        ],
+        weights,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+    return path
+
+
+class TestQuantizationReport:
+    """Tests for the before/after report helpers."""
+
+    def test_output_drift(self):
+        """Test drift metrics between original and quantized outputs."""
+        reference = np.array([[1.0, 0.0], [0.0, 1.0]])
+        candidate = np.array([[1.0, 0.1], [0.2, 0.9]])
+
+        drift = output_drift(reference, candidate)
+
+        assert drift["max_abs_diff"] == pytest.approx(0.2)
+        assert drift["top1_agreement"] == 1.0
+        assert 0.97 < drift["min_cosine"] < 1.0
+
+    def test_measure_latency_runs_warmup_and_repeats(self):
+        """Test that latency is measured over the configured runs."""
+        calls = []
+
+        latency = measure_latency(calls.append, ["a", "b"], warmup=2, repeats=3)
+
+        assert len(calls) == 5
+        assert latency["per_sample_ms"] == pytest.approx(latency["median_ms"] / 2)
+
+    def test_compare_models(self):
+        """Test the size, speedup and drift entries of the report."""
+
+        def model(texts):
+            return np.ones((len(texts), 4))
+
+        report = compare_models(
+            model, model, ["a", "b"], size_before=400, size_after=100, repeats=1
+        )
+
+        assert report["size_ratio"] == 0.25
+        assert report["drift"]["max_abs_diff"] == 0.0
+        assert report["speedup"] > 0
+
+
+class TestQuantizers:
+    """Tests for quantizer selection and the ONNX quantizer."""
+
+    def test_invalid_config(self):
+        """Test that unknown weight types and formats are rejected."""
+        with pytest.raises(QuantizationConfigError):
+            QuantizationConfig(weight_type="int4")
+        with pytest.raises(QuantizationConfigError):
+            get_quantizer("gguf")
+
+    def test_get_quantizer(self):
+        """Test that quantizers are selected by model format."""
+        config = QuantizationConfig(per_channel=True)
+
+        quantizer = get_quantizer("onnx", config)
+
+        assert isinstance(quantizer, ONNXDynamicQuantizer)
+        assert quantizer.config is config
+        assert isinstance(get_quantizer("pytorch"), TorchDynamicQuantizer)
+
+    @pytest.mark.skipif(
+        dynamic_quantizer.quantize_dynamic is not None,
+        reason="onnxruntime installed",
+    )
+    def test_requires_onnxruntime(self, tmp_path):
+        """Test that quantizing without onnxruntime names the packages."""
+        with pytest.raises(QuantizerNotAvailableError, match="onnxruntime"):
+            ONNXDynamicQuantizer().quantize(str(tmp_path))
+
+    def test_onnx_dynamic_quantization_report(self, tmp_path):
+        """Test that an ONNX model shrinks with little output drift."""
+        pytest.importorskip("onnxruntime.quantization")
+        _build_linear_model(tmp_path / "model.onnx")
+
+        result = ONNXDynamicQuantizer().quantize(
+            str(tmp_path),
+            samples=["a bb ccc", "dddd", "ee f ggggg hh"],
+            model_options={"tokenizer": _tokenize},
+        )
+
+        assert result.output_path == str(tmp_path / "model.int8.onnx")
+        assert result.report["size_ratio"] < 0.5
+        assert result.report["drift"]["min_cosine"] > 0.99
+
+    def test_quantize_command(self, tmp_path, capsys):
+        """Test the quantize action of the optimize command."""
+        pytest.importorskip("onnxruntime.quantization")
+        _build_linear_model(tmp_path / "model.onnx")
+
+        code = main(["optimize", "quantize", str(tmp_path), "--no-report"])
+
+        output = json.loads(capsys.readouterr().out)
+        assert code == 0
+        assert output["method"] == "onnx-dynamic-int8"
+        assert (tmp_path / "model.int8.onnx").is_file()
@@ -97,3 +97,110 @@ def test_audit_logging_and_auth_failures(caplog):
     with caplog.at_level("INFO"):
         client.post("/tools/add", json={"a": 2, "b": 3}, headers={"x-api-key": "bad"})
         assert any("[AUTH FAIL]" in msg for msg in caplog.text.splitlines())
+
+
+def test_batch_operations_and_columns(caplog):
+    payload = {
+        "operations": [
+            {"op": "add", "a": 2, "b": 3},
+            {"op": "divide", "a": 1, "b": 0},
+            {"op": "average", "numbers": [1, 2, 3]},
+            {"op": "average", "numbers": []},
+            {"op": "multiply", "a": 2},
+            {"op": "divide", "a": 9, "b": 3},
+        ],
+        "columns": {"op": "divide", "a": [6, 1e308, 5], "b": [3, 1e-308, 0]},
+    }
+    with caplog.at_level("INFO"):
+        resp = client.post("/tools/batch", json=payload, headers=HEADERS)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["results"] == [5.0, None, 2.0, None, None, 3.0, 2.0, None, None]
+    assert body["errors"] == [
+        {"index": 1, "error": "Cannot divide by zero"},
+        {"index": 3, "error": "Cannot calculate average of empty list"},
+        {"index": 4, "error": "Missing operand 'b'"},
+        {"index": 7, "error": "Result is not finite"},
+        {"index": 8, "error": "Cannot divide by zero"},
+    ]
+    audit = [r for r in caplog.messages if "tool=batch" in r]
+    assert audit == [
+        (
+            "[AUDIT] tool=batch, items=9, "
+            "ops={'add': 1, 'average': 2, 'divide': 5, 'multiply': 1}, "
+            "errors=5, api_key=***"
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"columns": {"op": "add", "a": [1, 2], "b": [1]}},
+        {"operations": [{"op": "power", "a": 1, "b": 2}]},
+    ],
+)
+def test_batch_invalid(payload):
+    resp = client.post("/tools/batch", json=payload, headers=HEADERS)
+    assert resp.status_code == 422
+
+
+def test_average_stream_chunked():
+    def body():
+        yield b"1\n2"
+        yield b".5\n[3, 4]\n\n"
+        yield b"5.5"
+
+    resp = client.post(
+        "/tools/average/stream",
+        content=body(),
+        headers={**HEADERS, "content-type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"result": 3.2}
+
+
+@pytest.mark.parametrize(
+    ("body", "detail"),
+    [
+        (b"", "Cannot calculate average of empty list"),
+        (b'1\n"two"\n', "Invalid NDJSON body"),
+        (b"1\nnan\n", "Invalid NDJSON body"),
+    ],
+)
+def test_average_stream_errors(body, detail):
+    resp = client.post("/tools/average/stream", content=body, headers=HEADERS)
+    assert resp.status_code == 400
+    assert resp.json()["detail"].startswith(detail)
+
+
+def test_stream_line_too_long(monkeypatch):
+    monkeypatch.setattr("api.routes.tool_router.MAX_NDJSON_LINE_BYTES", 8)
+
+    def body():
+        yield b"1\n2"
+        yield b"000000"
+        yield b"000000"
+
+    resp = client.post("/tools/stats", content=body(), headers=HEADERS)
+    assert resp.status_code == 413
+    assert resp.json()["detail"].startswith("NDJSON lines must not exceed 8 bytes")
+
+
+def test_stats_partials_merge():
+    partials = []
+    for part in (b"1\n2\n3\n", b"4\n5\n", b"6\n7\n8\n9\n10\n"):
+        resp = client.post("/tools/stats", content=part, headers=HEADERS)
+        assert resp.status_code == 200
+        partials.append(resp.json()["partial"])
+
+    resp = client.post(
+        "/tools/stats/merge", json={"partials": partials}, headers=HEADERS
+    )
+    summary = resp.json()["summary"]
+    assert summary["count"] == 10
+    assert summary["mean"] == pytest.approx(5.5)
+    assert summary["variance"] == pytest.approx(8.25)
+    assert (summary["min"], summary["max"]) == (1.0, 10.0)
+    assert summary["quantiles"]["p50"] == pytest.approx(5, rel=0.02)
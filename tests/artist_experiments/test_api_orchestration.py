@@ -0,0 +1,149 @@
+"""
+Tests for concurrent API orchestration.
+
+This module contains tests for the API orchestrator and MultiAPIAgent.run.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from artist_experiments.api_orchestration import (
+    APIOrchestrator,
+    RateLimiter,
+    get_shared_client,
+    normalize_query,
+)
+from artist_experiments.multi_api_orchestration import APITool, MultiAPIAgent
+
+DELAY = 0.2
+
+
+def _slow_api(name, delay=DELAY):
+    """Build an API function that sleeps and echoes its query."""
+
+    def api(query):
+        time.sleep(delay)
+        return json.dumps({"api": name, "query": query})
+
+    return api
+
+
+class TestAPIOrchestrator:
+    """Tests for caching, coalescing and rate limiting API calls."""
+
+    def test_calls_overlap_and_cache(self):
+        """Test that calls run concurrently and repeats come from the cache."""
+        orchestrator = APIOrchestrator({n: _slow_api(n) for n in ("a", "b", "c")})
+        calls = [("a", "Laptops"), ("b", "laptops"), ("c", "x")]
+
+        started = time.monotonic()
+        first = orchestrator.run(calls)
+        elapsed = time.monotonic() - started
+        started = time.monotonic()
+        second = orchestrator.run([("a", "  LAPTOPS "), ("c", "x")])
+
+        assert elapsed < DELAY * 2
+        assert time.monotonic() - started < DELAY / 2
+        assert [json.loads(o.result)["api"] for o in first] == ["a", "b", "c"]
+        assert [o.result for o in second] == [first[0].result, first[2].result]
+        assert orchestrator.get_stats()["api_calls"] == {"a": 1, "b": 1, "c": 1}
+
+    def test_identical_calls_share_one_request(self):
+        """Test that concurrent identical queries make a single call."""
+        orchestrator = APIOrchestrator({"a": _slow_api("a")})
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(orchestrator.fetch("a", "q"))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(results)) == 1
+        assert orchestrator.get_stats()["api_calls"] == {"a": 1}
+
+    def test_expired_entries_are_refetched(self):
+        """Test that responses expire after the TTL."""
+        orchestrator = APIOrchestrator({"a": _slow_api("a", 0)}, cache_ttl=0.05)
+
+        orchestrator.fetch("a", "q")
+        time.sleep(0.1)
+        orchestrator.fetch("a", "q")
+
+        assert orchestrator.api_calls["a"] == 2
+
+    def test_rate_limit_spaces_calls(self):
+        """Test that calls beyond the burst wait for the rate."""
+        orchestrator = APIOrchestrator(
+            {"a": _slow_api("a", 0)}, rate_limits={"a": RateLimiter(20, burst=2)}
+        )
+
+        started = time.monotonic()
+        outcomes = orchestrator.run([("a", str(i)) for i in range(4)])
+
+        assert all(o.ok for o in outcomes)
+        assert time.monotonic() - started >= 0.09
+        with pytest.raises(ValueError, match="rate must be positive"):
+            RateLimiter(0)
+
+    def test_errors_are_reported_not_cached(self):
+        """Test that a failing API does not affect the other calls."""
+
+        def fail(_):
+            error_msg = "unavailable"
+            raise RuntimeError(error_msg)
+
+        orchestrator = APIOrchestrator({"bad": fail, "a": _slow_api("a", 0)})
+
+        bad, good = orchestrator.run([("bad", "q"), ("a", "q")])
+
+        assert str(bad.error) == "unavailable"
+        assert good.ok
+        assert orchestrator.cached("bad", "q") == (False, None)
+        assert normalize_query(" A\tb ") == "a b"
+
+
+class TestMultiAPIAgent:
+    """Tests for multi-source prompts."""
+
+    def test_plan_and_combined_result(self):
+        """Test that a multi-source prompt calls each matching API once."""
+        agent = MultiAPIAgent()
+        prompt = "Compare market trends and competitors for products"
+
+        plan = agent.plan(prompt)
+        result = json.loads(agent.run(prompt))
+
+        assert [api for api, _ in plan] == [
+            "search_products",
+            "get_market_trends",
+            "analyze_competitors",
+        ]
+        assert list(result) == [api for api, _ in plan]
+        assert result["get_market_trends"]["category"] == prompt
+        agent.run(prompt)
+        assert sum(agent.orchestrator.get_stats()["api_calls"].values()) == len(plan)
+
+    def test_single_source_prompt_uses_cache(self):
+        """Test that single-API prompts go through the cached tool."""
+        agent = MultiAPIAgent()
+
+        first = agent.run("Search for phone products")
+
+        assert json.loads(first)["results"][0]["name"].endswith("Product 1")
+        assert agent.run("search for  phone products") == first
+        assert agent.orchestrator.api_calls["search_products"] == 1
+
+    def test_tools_share_http_client(self):
+        """Test that API tools share one connection pool."""
+        assert APITool().client is APITool().client is get_shared_client()
@@ -0,0 +1,91 @@
+"""test_expressions - Module for tests/common_utils.test_expressions."""
+
+from __future__ import annotations
+
+# Standard library imports
+# Third-party imports
+import pytest
+
+# Local imports
+from common_utils.expressions import (
+    ExpressionError,
+    compile_expression,
+    evaluate_batch,
+)
+from common_utils.tooling import calculator
+
+
+class TestCompileExpression:
+    """Tests for validating, compiling and caching expressions."""
+
+    def test_compiled_once(self):
+        """Test that repeated expressions come from the cache."""
+        first = compile_expression("(a + b) * 2", ("a", "b"))
+
+        assert compile_expression("(a + b) * 2", ("a", "b")) is first
+        assert first.variables == ("a", "b")
+        assert first.evaluate({"a": 1, "b": 2}) == 6
+
+    @pytest.mark.parametrize(
+        "expression",
+        ['__import__("os")', "x.real", "[1]", "x if x else 1", "_pow(2, 3)", "'a'"],
+    )
+    def test_rejects_non_arithmetic(self, expression):
+        """Test that calls, attributes and other syntax are refused."""
+        with pytest.raises(ExpressionError):
+            compile_expression(expression)
+
+    def test_undeclared_and_missing_variables(self):
+        """Test that variables must be allowed and bound."""
+        with pytest.raises(ExpressionError, match="Unknown variable: y"):
+            compile_expression("x + y", ("x",))
+        with pytest.raises(ExpressionError, match="Missing values"):
+            compile_expression("x + y").evaluate({"x": 1})
+
+    def test_exponent_limit(self):
+        """Test that exponents from variables are bounded too."""
+        power = compile_expression("b ** e")
+
+        assert power.evaluate({"b": 2, "e": 10}) == 1024
+        with pytest.raises(ExpressionError):
+            power.evaluate({"b": 2, "e": 10**6})
+
+
+class TestEvaluateBatch:
+    """Tests for evaluating one expression over many bindings."""
+
+    def test_broadcasts_bindings(self):
+        """Test arrays and scalars mixed in one batch."""
+        np = pytest.importorskip("numpy")
+
+        result = evaluate_batch(
+            "price * (1 - discount) ** n", {"price": [10, 20], "discount": 0.5, "n": 2}
+        )
+
+        np.testing.assert_allclose(result, [2.5, 5.0])
+
+    def test_division_by_zero(self):
+        """Test that division by zero gives inf instead of failing the batch."""
+        pytest.importorskip("numpy")
+
+        assert evaluate_batch("1 / x", {"x": [0, 4]}).tolist() == [float("inf"), 0.25]
+
+
+class TestCalculator:
+    """Tests for the calculator tool."""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            (" 2 + 2", 4),
+            ("7/2", 3.5),
+            ("-(3) * 2 % 5", 4),
+            ("2**200", "Error: Exponentiation with values > 100 not allowed"),
+            ("1/0", "Error: division by zero"),
+            ("abs(2)", "Error: Invalid characters in expression"),
+            ("1 +", "Error: invalid syntax (<unknown>, line 1)"),
+        ],
+    )
+    def test_results(self, expression, expected):
+        """Test results and error messages."""
+        assert calculator(expression) == expected
@@ -0,0 +1,114 @@
+"""test_memory_buffer - Module for tests/common_utils.test_memory_buffer."""
+
+from __future__ import annotations
+
+# Standard library imports
+import threading
+import time
+
+# Third-party imports
+import pytest
+
+# Local imports
+from common_utils.memory_buffer import WriteBehindMemory
+
+
+class _SlowMemory:
+    """Memory store that takes a while per write and records them."""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.added = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def add(self, content, user_id, metadata):
+        self.release.wait(5)
+        time.sleep(self.delay)
+        if content == self.fail_on:
+            error_msg = "store unavailable"
+            raise RuntimeError(error_msg)
+        self.added.append((user_id, content, metadata))
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestWriteBehindMemory:
+    """Tests for buffered, background memory writes."""
+
+    def test_writes_leave_the_request_path(self):
+        """Test that add returns at once and flush persists in per-user order."""
+        memory = _SlowMemory(delay=0.02)
+        writer = WriteBehindMemory(memory, flush_interval=10)
+
+        started = time.monotonic()
+        for i in range(10):
+            writer.add(f"note {i}", user_id=f"user{i % 2}", metadata={"i": i})
+        assert time.monotonic() - started < 0.1
+
+        assert writer.flush(timeout=5)
+        assert writer.depth == 0
+        for user in ("user0", "user1"):
+            assert [c for u, c, _ in memory.added if u == user] == [
+                f"note {i}" for i in range(10) if f"user{i % 2}" == user
+            ]
+        writer.close()
+
+    def test_flush_on_size_and_time(self):
+        """Test that full batches and old writes are flushed without asking."""
+        memory = _SlowMemory()
+        by_size = WriteBehindMemory(memory, batch_size=3, flush_interval=10)
+        for i in range(3):
+            by_size.add(f"s{i}", user_id="u")
+        assert _wait_for(lambda: len(memory.added) == 3)
+
+        by_time = WriteBehindMemory(memory, flush_interval=0.05)
+        by_time.add("t", user_id="u")
+        assert _wait_for(lambda: len(memory.added) == 4)
+        assert by_time.get_stats()["batches"] == 1
+
+    def test_reads_see_pending_writes(self):
+        """Test that queued and in-flight writes are searchable and counted."""
+        memory = _SlowMemory()
+        memory.release.clear()
+        writer = WriteBehindMemory(memory, flush_interval=0.01)
+
+        writer.add("User prefers email updates", user_id="alice")
+        writer.add(
+            [{"role": "user", "content": "Email me weekly"}],
+            user_id="alice",
+            metadata={"kind": "chat"},
+        )
+        writer.add("Prefers phone", user_id="bob")
+
+        results = writer.search_pending("email preferences", user_id="alice")
+        assert [r["memory"] for r in results] == [
+            "user: Email me weekly",
+            "User prefers email updates",
+        ]
+        assert results[0]["metadata"] == {"kind": "chat"}
+        assert writer.queue_depth() == {"alice": 2, "bob": 1}
+
+        memory.release.set()
+        assert writer.flush(timeout=5)
+        assert writer.search_pending("email", user_id="alice") == []
+
+    def test_close_and_failures(self):
+        """Test that close persists the rest and failed writes are counted."""
+        memory = _SlowMemory(fail_on="bad")
+        writer = WriteBehindMemory(memory, flush_interval=10)
+        for content in ("a", "bad", "b"):
+            writer.add(content, user_id="u")
+
+        assert writer.close(timeout=5)
+        assert [c for _, c, _ in memory.added] == ["a", "b"]
+        assert writer.get_stats()["failed"] == 1
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.add("late", user_id="u")
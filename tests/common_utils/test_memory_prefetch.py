@@ -0,0 +1,92 @@
+"""test_memory_prefetch - Module for tests/common_utils.test_memory_prefetch."""
+
+from __future__ import annotations
+
+# Standard library imports
+import time
+from unittest.mock import MagicMock, patch
+
+# Third-party imports
+import pytest
+
+# Local imports
+from agent_team.mem0_enhanced_agents import MemoryEnhancedCrewAIAgentTeam
+from common_utils.memory_prefetch import MemoryPrefetcher
+
+DELAY = 0.1
+
+
+class _SlowStore:
+    """Retrieval function that sleeps and records its queries."""
+
+    def __init__(self, delay=DELAY):
+        self.delay = delay
+        self.queries = []
+
+    def __call__(self, query):
+        self.queries.append(query)
+        time.sleep(self.delay)
+        if query == "broken":
+            error_msg = "store unavailable"
+            raise RuntimeError(error_msg)
+        return [{"memory": f"about {query}"}]
+
+
+class TestMemoryPrefetcher:
+    """Tests for background memory retrievals."""
+
+    def test_retrievals_overlap(self):
+        """Test that prefetched retrievals run concurrently and are taken once."""
+        store = _SlowStore()
+        prefetcher = MemoryPrefetcher(store, max_workers=4)
+
+        started = time.monotonic()
+        assert prefetcher.prefetch(["a", "b", " a ", "", None, "c", "d"]) == 4
+        results = [prefetcher.take(q) for q in ("a", "b", "c", "d")]
+
+        assert time.monotonic() - started < DELAY * 3
+        assert results[0] == [{"memory": "about a"}]
+        assert prefetcher.take("a") is None
+        assert prefetcher.get_stats() == {
+            "scheduled": 4,
+            "hits": 4,
+            "misses": 1,
+            "failed": 0,
+            "pending": 0,
+        }
+        prefetcher.close()
+
+    def test_expired_and_failed_results_are_misses(self):
+        """Test that stale or failed prefetches fall back to the caller."""
+        prefetcher = MemoryPrefetcher(_SlowStore(delay=0), ttl=0.05)
+        prefetcher.prefetch(["old", "broken"])
+
+        assert prefetcher.take("broken") is None
+        time.sleep(0.1)
+        assert prefetcher.take("old") is None
+        assert prefetcher.get_stats()["failed"] == 1
+        with pytest.raises(ValueError, match="ttl positive"):
+            MemoryPrefetcher(len, ttl=0)
+
+
+class TestMemoryEnhancedTeamPrefetch:
+    """Tests for prefetching in MemoryEnhancedCrewAIAgentTeam.run."""
+
+    def test_run_uses_prefetched_results(self):
+        """Test that run prefetches only the retrievals it reads back."""
+        store = _SlowStore()
+        team = MemoryEnhancedCrewAIAgentTeam(user_id="u")
+        agent = team.add_agent(role="Researcher", goal="Find", backstory="Data")
+        team.add_task(description="Research memory systems", agent=agent)
+        team.add_task(description="Write a summary", agent=agent)
+
+        with patch.object(
+            team.rag_coordinator,
+            "query",
+            side_effect=lambda query, _user: {"merged_results": store(query)},
+        ), patch.object(team, "_create_crew", return_value=MagicMock()):
+            team.run()
+
+        assert store.queries == ["Information about team with 1 agents and 2 tasks"]
+        assert team.memory_prefetcher.hits == 1
+        assert team.memory_prefetcher.pending() == 0
@@ -0,0 +1,75 @@
+"""test_text_analysis - Module for tests/common_utils.test_text_analysis."""
+
+from __future__ import annotations
+
+# Standard library imports
+# Third-party imports
+import pytest
+
+# Local imports
+from common_utils.text_analysis import (
+    DEFAULT_LEXICON,
+    Lexicon,
+    analyze_text,
+    analyze_texts,
+    tokenize,
+)
+from common_utils.tooling import text_analyzer
+
+
+class TestAnalyzeText:
+    """Tests for single-text analysis."""
+
+    def test_whole_words_and_occurrences(self):
+        """Test that terms match whole tokens and every occurrence counts."""
+        analysis = analyze_text("Likely good. Good, GOOD! I dislike badges; sad")
+
+        assert analysis.positive_terms == {"good": 3}
+        assert analysis.negative_terms == {"dislike": 1, "sad": 1}
+        assert analysis.sentiment == "positive"
+        assert analysis.word_count == 8
+
+    def test_tool_keeps_summary_string(self):
+        """Test the registered tool's one-line summary."""
+        assert text_analyzer("I love it, it's great") == (
+            "Sentiment: positive | Words: 5 | Characters: 21 | "
+            "Positive indicators: 2 | Negative indicators: 0"
+        )
+        # Words are counted as before: whitespace-separated, punctuation included
+        assert analyze_text("well - done ... 42").word_count == 5
+
+    def test_custom_phrases(self):
+        """Test that phrases take precedence over their words."""
+        lexicon = DEFAULT_LEXICON.extend(
+            positive=["must have"], negative=["not good", "not worth it"]
+        )
+
+        analysis = analyze_text("Not good, and not worth it. A must-have!", lexicon)
+
+        assert analysis.negative_terms == {"not good": 1, "not worth it": 1}
+        assert analysis.positive_terms == {"must have": 1}
+        assert analysis.sentiment == "negative"
+
+    def test_invalid_lexicon(self):
+        """Test that empty and contradictory terms are rejected."""
+        with pytest.raises(ValueError, match="no words"):
+            Lexicon(positive=["!!"])
+        with pytest.raises(ValueError, match="both"):
+            Lexicon(positive=["fine"], negative=["Fine"])
+
+    def test_tokenize(self):
+        """Test apostrophes, underscores and unicode letters."""
+        assert tokenize("Don't_stop — café 42") == ["don't", "stop", "café", "42"]
+
+
+class TestAnalyzeTexts:
+    """Tests for batch analysis."""
+
+    def test_process_pool_matches_inline(self):
+        """Test that pooled results equal inline results, in order."""
+        texts = [f"post {i}: {'great' if i % 3 else 'awful'} deal" for i in range(60)]
+
+        pooled = analyze_texts(texts, max_workers=2, chunk_size=7, min_parallel=10)
+
+        assert pooled == [analyze_text(text) for text in texts]
+        assert [a.sentiment for a in pooled[:3]] == ["negative", "positive", "positive"]
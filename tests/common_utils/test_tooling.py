@@ -0,0 +1,103 @@
+"""test_tooling - Module for tests/common_utils.test_tooling."""
+
+from __future__ import annotations
+
+# Standard library imports
+# Third-party imports
+import pytest
+
+# Local imports
+from common_utils import tooling
+from common_utils.tooling import ToolRouter, get_router, register_tool, select_tool
+
+
+def _tools(**keywords):
+    """Build registry entries with the given keywords per tool."""
+    return {name: {"func": str, "keywords": words} for name, words in keywords.items()}
+
+
+@pytest.fixture
+def scratch_tool():
+    """Register a temporary tool and remove it afterwards."""
+    yield "zz_scratch"
+    tooling._TOOL_REGISTRY.pop("zz_scratch", None)  # noqa: SLF001
+    tooling._ROUTER = None  # noqa: SLF001
+
+
+class TestToolRouter:
+    """Tests for routing descriptions to tools."""
+
+    def test_best_match_beats_first_match(self):
+        """Test that the highest-scoring tool wins, not the first registered."""
+        router = ToolRouter(
+            _tools(search=["find"], summarizer=["summarize", "summary", "text"])
+        )
+
+        best = router.best("Summarize this text and find a summary")
+
+        assert best.name == "summarizer"
+        assert best.terms == ("summarize", "text", "summary")
+        assert [m.name for m in router.match("find a summary of the text")] == [
+            "summarizer",
+            "search",
+        ]
+
+    def test_name_and_whole_words_weigh_more(self):
+        """Test name weighting and the word-boundary bonus."""
+        router = ToolRouter(_tools(translator=["add"], adder=["sum"]))
+
+        assert router.best("use the adder").name == "adder"
+        assert router.best("address the sum").score == 2
+        assert router.best("address the summit").name == "translator"
+
+    def test_symbol_keywords(self):
+        """Test that symbols match inside expressions."""
+        router = ToolRouter(_tools(calc=["+", "*"], echo=["say"]))
+
+        best = router.best("what is 2+3*4")
+
+        assert best.name == "calc"
+        assert best.position == 9
+        assert router.best("nothing relevant") is None
+
+    def test_ties_are_deterministic(self):
+        """Test that ties go to the earlier match, then registration order."""
+        router = ToolRouter(_tools(first=["beta"], second=["alpha"], third=["beta"]))
+
+        assert [m.name for m in router.match("alpha then beta")] == [
+            "second",
+            "first",
+            "third",
+        ]
+
+    def test_overlapping_keywords(self):
+        """Test that keywords inside other keywords are all found."""
+        router = ToolRouter(_tools(a=["she", "he", "hers"], b=["ushers"]))
+
+        assert router.find("ushers") == {
+            "she": (1, False),
+            "he": (2, False),
+            "hers": (2, False),
+            "ushers": (0, True),
+        }
+
+
+class TestRegistryRouting:
+    """Tests for the router over the global registry."""
+
+    def test_register_rebuilds_router(self, scratch_tool):
+        """Test that registering a tool invalidates the cached router."""
+        router = get_router()
+        assert get_router() is router
+
+        register_tool(scratch_tool, str, keywords=["zzquux"])
+
+        assert get_router() is not router
+        assert select_tool("run zzquux").name == scratch_tool
+
+    def test_calculator_selected(self):
+        """Test that arithmetic descriptions select the calculator."""
+        match = select_tool("Calculate 2 + 2")
+
+        assert match.name == "calculator"
+        assert match.metadata["input_preprocessor"] is not None
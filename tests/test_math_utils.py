@@ -1,8 +1,19 @@
 """Tests for the math_utils module."""
 
+import math
+
 import pytest
 
-from utils.math_utils import add, average, divide, multiply, subtract
+from utils.math_utils import (
+    ARRAY_KERNELS,
+    add,
+    average,
+    average_arrays,
+    divide,
+    divide_arrays,
+    multiply,
+    subtract,
+)
 
 # Constants for test values
 EXPECTED_SUM_1_2 = 3
@@ -18,6 +29,8 @@ EXPECTED_QUOTIENT_5_2 = 2.5
 EXPECTED_QUOTIENT_NEG_6_3 = -2
 EXPECTED_AVG_1_TO_5 = 3
 EXPECTED_AVG_1_5_2_5_3_5 = 2.5
+EXPECTED_AVG_1_TO_3 = 2
+EXPECTED_AVG_4_5 = 4.5
 
 
 class TestMathUtils:
@@ -67,3 +80,38 @@ class TestMathUtils:
         """Test that average raises ValueError when given an empty list."""
         with pytest.raises(ValueError, match="Cannot calculate average of empty list"):
             average([])
+        with pytest.raises(ValueError, match="Cannot calculate average of empty list"):
+            average(iter([]))
+
+    def test_average_iterator_matches_sequence(self):
+        """Test that iterators and sequences are averaged the same way."""
+        values = [0.1] * 10 + [1e16, 1.0, -1e16]
+        assert average(iter(values)) == average(values)
+        assert math.isnan(average(iter([1.0, math.nan])))
+        assert average(iter([1.0, math.inf])) == math.inf
+
+
+class TestArrayKernels:
+    """Test class for the vectorized math_utils kernels."""
+
+    def test_binary_kernels(self):
+        """Test that array kernels match the scalar functions."""
+        a, b = [1.5, -2.0, 6.0], [2.0, 4.0, 3.0]
+        for name, scalar in [
+            ("add", add),
+            ("subtract", subtract),
+            ("multiply", multiply),
+            ("divide", divide),
+        ]:
+            assert ARRAY_KERNELS[name](a, b).tolist() == list(map(scalar, a, b))
+
+    def test_bad_items_are_nan(self):
+        """Test that division by zero and empty averages give NaN."""
+        quotients = divide_arrays([1, 4], [0, 2])
+        averages = average_arrays([[1, 2, 3], [], [EXPECTED_AVG_4_5]])
+
+        assert math.isnan(quotients[0])
+        assert quotients[1] == EXPECTED_QUOTIENT_6_3
+        assert averages[0] == EXPECTED_AVG_1_TO_3
+        assert math.isnan(averages[1])
+        assert averages[2] == EXPECTED_AVG_4_5
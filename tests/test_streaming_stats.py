@@ -0,0 +1,95 @@
+"""Tests for the streaming_stats module."""
+
+import math
+
+import numpy as np
+import pytest
+
+from utils.math_utils import average
+from utils.streaming_stats import (
+    QuantileSketch,
+    RunningStats,
+    StreamingStats,
+    merge_stats,
+)
+
+SAMPLE_SIZE = 100_000
+RELATIVE_ACCURACY = 0.01
+
+
+@pytest.fixture
+def sample():
+    """Provide normally distributed values."""
+    return np.random.default_rng(0).normal(50, 10, SAMPLE_SIZE)
+
+
+class TestRunningStats:
+    """Test class for running moments."""
+
+    def test_chunks_and_pushes_agree(self, sample):
+        """Test that chunked and one-by-one updates match NumPy."""
+        chunked = RunningStats()
+        for chunk in np.array_split(sample, 7):
+            chunked.update(chunk)
+        pushed = RunningStats()
+        for value in sample[:1000].tolist():
+            pushed.push(value)
+
+        assert chunked.count == SAMPLE_SIZE
+        assert chunked.mean == pytest.approx(sample.mean())
+        assert chunked.variance == pytest.approx(sample.var())
+        assert (chunked.min, chunked.max) == (sample.min(), sample.max())
+        assert pushed.sample_variance == pytest.approx(sample[:1000].var(ddof=1))
+
+    def test_rejects_nan(self):
+        """Test that NaN values are refused."""
+        with pytest.raises(ValueError, match="NaN or infinite"):
+            RunningStats().update([1.0, math.nan])
+
+
+class TestStreamingStats:
+    """Test class for mergeable summaries."""
+
+    def test_merged_partials_match_whole(self, sample):
+        """Test that partials merged through their state match one pass."""
+        whole = StreamingStats()
+        whole.update(sample)
+        partials = []
+        for part in np.array_split(sample, 4):
+            partial = StreamingStats()
+            partial.update(part)
+            partials.append(StreamingStats.from_dict(partial.to_dict()))
+
+        merged = merge_stats(partials)
+
+        merged_summary, whole_summary = merged.summary(), whole.summary()
+        assert merged_summary.pop("quantiles") == whole_summary.pop("quantiles")
+        assert merged_summary == pytest.approx(whole_summary)
+
+    def test_quantiles_within_accuracy(self, sample):
+        """Test quantile estimates against exact quantiles."""
+        stats = StreamingStats()
+        stats.update(sample - 50)
+
+        for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+            exact = np.quantile(sample - 50, q)
+            assert (
+                abs(stats.quantile(q) - exact) <= RELATIVE_ACCURACY * abs(exact) + 0.05
+            )
+
+    def test_empty(self):
+        """Test the summary of an empty stream."""
+        summary = StreamingStats().summary()
+
+        assert summary["count"] == 0
+        assert summary["mean"] is None
+        assert summary["quantiles"]["p50"] is None
+        with pytest.raises(ValueError, match="different relative accuracies"):
+            QuantileSketch().merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_average_of_iterator():
+    """Test that average accepts iterators and streams them."""
+    assert average(float(i) for i in range(1, 200_001)) == pytest.approx(100_000.5)
+    with pytest.raises(ValueError, match="empty list"):
+        average(iter([]))
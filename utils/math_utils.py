@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+import itertools
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+# Values averaged per vectorized step when average() is given an iterator
+AVERAGE_CHUNK_SIZE = 65_536
 
 
 def add(a: float, b: float) -> float:
@@ -71,12 +77,16 @@ def divide(a: float, b: float) -> float:
     return a / b
 
 
-def average(numbers: Sequence[float]) -> float:
+def average(numbers: Iterable[float]) -> float:
     """
     Calculate the average of a list of numbers.
 
+    Sequences are summed directly; other iterables (generators, streams) are
+    summed in chunks, so they never need to fit in memory. Both give the same
+    result, with NaN and infinities propagating as in ``sum``.
+
     Args:
-        numbers: List of numbers
+        numbers: List (or any iterable) of numbers
 
     Returns:
         Average of the numbers
@@ -85,7 +95,140 @@ def average(numbers: Sequence[float]) -> float:
         ValueError: If the list is empty
 
     """
-    if not numbers:
+    if isinstance(numbers, Sequence):
+        if not numbers:
+            msg = "Cannot calculate average of empty list"
+            raise ValueError(msg)
+        return sum(numbers) / len(numbers)
+
+    total: float = 0
+    count = 0
+    iterator = iter(numbers)
+    while chunk := list(itertools.islice(iterator, AVERAGE_CHUNK_SIZE)):
+        # Continuing the sum from the running total adds in the same order
+        # as the sequence path
+        total = sum(chunk, total)
+        count += len(chunk)
+    if not count:
         msg = "Cannot calculate average of empty list"
         raise ValueError(msg)
-    return sum(numbers) / len(numbers)
+    return total / count
+
+
+# --- Vectorized kernels ---
+# Array versions of the operations above, for evaluating many operations in
+# one call. They never raise on bad items: results that have no value (division
+# by zero, the average of an empty list) are NaN, so one bad item does not fail
+# the whole batch.
+
+
+def add_arrays(
+    a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray
+) -> np.ndarray:
+    """
+    Add two arrays element-wise.
+
+    Args:
+        a: First numbers
+        b: Second numbers (same length as a, or a scalar)
+
+    Returns:
+        Sums of a and b
+
+    """
+    return np.add(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+
+
+def subtract_arrays(
+    a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray
+) -> np.ndarray:
+    """
+    Subtract two arrays element-wise.
+
+    Args:
+        a: First numbers
+        b: Second numbers (same length as a, or a scalar)
+
+    Returns:
+        Differences of a and b
+
+    """
+    return np.subtract(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+
+
+def multiply_arrays(
+    a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray
+) -> np.ndarray:
+    """
+    Multiply two arrays element-wise.
+
+    Args:
+        a: First numbers
+        b: Second numbers (same length as a, or a scalar)
+
+    Returns:
+        Products of a and b
+
+    """
+    return np.multiply(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+
+
+def divide_arrays(
+    a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray
+) -> np.ndarray:
+    """
+    Divide two arrays element-wise.
+
+    Args:
+        a: Dividends
+        b: Divisors (same length as a, or a scalar)
+
+    Returns:
+        Quotients of a and b, NaN where b is zero
+
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        quotients = np.divide(a, b)
+    return np.where(b == 0, np.nan, quotients)
+
+
+def average_arrays(groups: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Average many lists of numbers at once.
+
+    The lists are concatenated and summed with one ``np.add.reduceat`` pass.
+
+    Args:
+        groups: Lists of numbers
+
+    Returns:
+        Average of each list, NaN for empty lists
+
+    """
+    lengths = np.fromiter(
+        (len(group) for group in groups), dtype=np.int64, count=len(groups)
+    )
+    if not lengths.any():
+        return np.full(len(groups), np.nan)
+    values = np.fromiter(
+        (value for group in groups for value in group),
+        dtype=float,
+        count=int(lengths.sum()),
+    )
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    sums = np.zeros(len(groups))
+    non_empty = lengths > 0
+    sums[non_empty] = np.add.reduceat(values, starts[non_empty])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(non_empty, sums / lengths, np.nan)
+
+
+# Array kernels by operation name, for the binary operations
+ARRAY_KERNELS: dict[str, Callable[..., np.ndarray]] = {
+    "add": add_arrays,
+    "subtract": subtract_arrays,
+    "multiply": multiply_arrays,
+    "divide": divide_arrays,
+}
@@ -0,0 +1,419 @@
+"""Streaming statistics: constant-memory, mergeable summaries of numeric streams."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+# Default relative accuracy of quantile estimates (1%)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Quantiles reported by StreamingStats.summary
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+# Magnitudes below this are counted as zero by the quantile sketch
+MIN_INDEXABLE_VALUE = 1e-12
+
+
+def _as_chunk(values: Iterable[float] | np.ndarray) -> np.ndarray:
+    """Convert values to a 1-D float array, rejecting NaN and infinities."""
+    chunk = np.asarray(
+        values if isinstance(values, (np.ndarray, Sequence)) else list(values),
+        dtype=float,
+    ).ravel()
+    if not np.isfinite(chunk).all():
+        msg = "Cannot summarize NaN or infinite values"
+        raise ValueError(msg)
+    return chunk
+
+
+@dataclass
+class RunningStats:
+    """
+    Count, mean, variance, minimum and maximum of a stream.
+
+    Uses Welford's update for single values and Chan et al.'s pairwise
+    combination for chunks and merges, so the mean and variance stay
+    accurate over long streams without keeping the values.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def push(self, value: float) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: The value
+
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update(self, values: Iterable[float] | np.ndarray) -> None:
+        """
+        Add a chunk of values with vectorized arithmetic.
+
+        Args:
+            values: The values
+
+        """
+        chunk = _as_chunk(values)
+        if chunk.size == 0:
+            return
+        mean = float(chunk.mean())
+        m2 = float(np.square(chunk - mean).sum())
+        self._combine(chunk.size, mean, m2, float(chunk.min()), float(chunk.max()))
+
+    def merge(self, other: RunningStats) -> None:
+        """
+        Add the values summarized by another instance.
+
+        Args:
+            other: A partial summary, e.g. from another worker
+
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+
+    def _combine(
+        self, count: int, mean: float, m2: float, minimum: float, maximum: float
+    ) -> None:
+        """Combine with the moments of another set of values."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 for fewer than two values)."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """Sample variance (0.0 for fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the state as a JSON-serializable dictionary."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RunningStats:
+        """
+        Rebuild an instance from :meth:`to_dict` output.
+
+        Args:
+            data: The state
+
+        Returns:
+            The instance
+
+        """
+        count = int(data["count"])
+        return cls(
+            count=count,
+            mean=float(data["mean"]),
+            m2=float(data["m2"]),
+            min=float(data["min"]) if count else math.inf,
+            max=float(data["max"]) if count else -math.inf,
+        )
+
+
+@dataclass
+class QuantileSketch:
+    """
+    Mergeable quantile estimates with bounded relative error (DDSketch).
+
+    Values are counted in logarithmically sized buckets, so any quantile is
+    estimated within ``relative_accuracy`` of a true value while memory grows
+    only with the logarithm of the value range. Sketches with the same
+    accuracy merge by adding bucket counts.
+    """
+
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+    positive: dict[int, int] = field(default_factory=dict)
+    negative: dict[int, int] = field(default_factory=dict)
+    zero: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the accuracy and derive the bucket growth factor."""
+        if not 0 < self.relative_accuracy < 1:
+            msg = f"relative_accuracy must be in (0, 1), got {self.relative_accuracy}"
+            raise ValueError(msg)
+        self.gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return self.zero + sum(self.positive.values()) + sum(self.negative.values())
+
+    def _add_buckets(self, store: dict[int, int], magnitudes: np.ndarray) -> None:
+        """Count magnitudes into a bucket store."""
+        if magnitudes.size == 0:
+            return
+        indices = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        buckets, counts = np.unique(indices, return_counts=True)
+        for bucket, count in zip(buckets.tolist(), counts.tolist()):
+            store[bucket] = store.get(bucket, 0) + count
+
+    def update(self, values: Iterable[float] | np.ndarray) -> None:
+        """
+        Add a chunk of values.
+
+        Args:
+            values: The values
+
+        """
+        chunk = _as_chunk(values)
+        small = np.abs(chunk) < MIN_INDEXABLE_VALUE
+        self.zero += int(small.sum())
+        self._add_buckets(self.positive, chunk[(chunk > 0) & ~small])
+        self._add_buckets(self.negative, -chunk[(chunk < 0) & ~small])
+
+    def merge(self, other: QuantileSketch) -> None:
+        """
+        Add the values counted by another sketch.
+
+        Args:
+            other: A sketch with the same relative accuracy
+
+        Raises:
+            ValueError: If the accuracies differ
+
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            msg = "Cannot merge sketches with different relative accuracies"
+            raise ValueError(msg)
+        for store, other_store in (
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ):
+            for bucket, count in other_store.items():
+                store[bucket] = store.get(bucket, 0) + count
+        self.zero += other.zero
+
+    def _value(self, bucket: int) -> float:
+        """Return the representative value of a bucket."""
+        return 2 * self.gamma**bucket / (self.gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: The quantile, between 0 and 1
+
+        Returns:
+            The estimate (NaN if the sketch is empty)
+
+        """
+        if not 0 <= q <= 1:
+            msg = f"Quantile must be between 0 and 1, got {q}"
+            raise ValueError(msg)
+        total = self.count
+        if total == 0:
+            return math.nan
+        rank = q * (total - 1)
+        seen = 0
+        for bucket in sorted(self.negative, reverse=True):
+            seen += self.negative[bucket]
+            if seen > rank:
+                return -self._value(bucket)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for bucket in sorted(self.positive):
+            seen += self.positive[bucket]
+            if seen > rank:
+                return self._value(bucket)
+        return self._value(max(self.positive))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the state as a JSON-serializable dictionary."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+            "zero": self.zero,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QuantileSketch:
+        """
+        Rebuild a sketch from :meth:`to_dict` output.
+
+        Args:
+            data: The state
+
+        Returns:
+            The sketch
+
+        """
+        return cls(
+            relative_accuracy=float(data["relative_accuracy"]),
+            positive={int(k): int(v) for k, v in data["positive"].items()},
+            negative={int(k): int(v) for k, v in data["negative"].items()},
+            zero=int(data["zero"]),
+        )
+
+
+@dataclass
+class StreamingStats:
+    """
+    Moments and quantiles of a stream, in constant memory.
+
+    Feed values in chunks with :meth:`update`; combine summaries built in
+    parallel (threads, processes or separate requests) with :meth:`merge`,
+    or from their :meth:`to_dict` state with :meth:`from_dict`.
+
+    Usage:
+        stats = StreamingStats()
+        for chunk in chunks:
+            stats.update(chunk)
+        stats.summary()
+
+    """
+
+    moments: RunningStats = field(default_factory=RunningStats)
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return self.moments.count
+
+    @property
+    def mean(self) -> float:
+        """Mean of the values added."""
+        return self.moments.mean
+
+    def update(self, values: Iterable[float] | np.ndarray) -> None:
+        """
+        Add a chunk of values.
+
+        Args:
+            values: The values
+
+        """
+        chunk = _as_chunk(values)
+        self.moments.update(chunk)
+        self.sketch.update(chunk)
+
+    def merge(self, other: StreamingStats) -> None:
+        """
+        Add the values summarized by another instance.
+
+        Args:
+            other: A partial summary
+
+        """
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile, clamped to the observed range.
+
+        Args:
+            q: The quantile, between 0 and 1
+
+        Returns:
+            The estimate (NaN if no values were added)
+
+        """
+        estimate = self.sketch.quantile(q)
+        if math.isnan(estimate):
+            return estimate
+        return min(max(estimate, self.moments.min), self.moments.max)
+
+    def summary(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> dict[str, Any]:
+        """
+        Summarize the values added.
+
+        Args:
+            quantiles: Quantiles to estimate
+
+        Returns:
+            count, mean, variance, std, min, max and the quantile estimates
+            (keyed "p50", "p90", ...); statistics are None when empty
+
+        """
+        empty = self.count == 0
+        moments = self.moments
+        return {
+            "count": self.count,
+            "mean": None if empty else moments.mean,
+            "variance": None if empty else moments.variance,
+            "std": None if empty else moments.std,
+            "min": None if empty else moments.min,
+            "max": None if empty else moments.max,
+            "quantiles": {
+                f"p{q * 100:g}": None if empty else self.quantile(q) for q in quantiles
+            },
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the state as a JSON-serializable dictionary."""
+        return {"moments": self.moments.to_dict(), "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StreamingStats:
+        """
+        Rebuild an instance from :meth:`to_dict` output.
+
+        Args:
+            data: The state
+
+        Returns:
+            The instance
+
+        """
+        return cls(
+            moments=RunningStats.from_dict(data["moments"]),
+            sketch=QuantileSketch.from_dict(data["sketch"]),
+        )
+
+
+def merge_stats(partials: Iterable[StreamingStats]) -> StreamingStats:
+    """
+    Merge partial summaries into one.
+
+    Args:
+        partials: Summaries of disjoint parts of a stream
+
+    Returns:
+        The summary of the whole stream
+
+    """
+    merged = StreamingStats()
+    for partial in partials:
+        merged.merge(partial)
+    return merged